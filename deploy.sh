@@ -16,6 +16,16 @@ STACK_NAME=${2:-nexus-$ENV}
 S3_BUCKET=${3:-nexus-sam-$ENV}
 REGION=${AWS_REGION:-us-east-1}
 
+# Pagination cursors are signed with this secret, keep it the same across deploys
+if [ -z "$CURSOR_SECRET" ]; then
+  echo "CURSOR_SECRET is not set. Export a random secret of at least 32 characters, e.g."
+  echo "  export CURSOR_SECRET=\$(openssl rand -hex 32)"
+  exit 1
+fi
+
+# Tasks table GSIs to deploy, an existing table gains one GSI per stack update
+TASK_INDEXES=${TASK_INDEXES:-9}
+
 echo "========================================"
 echo "Deploying Nexus to environment: $ENV"
 echo "Stack name: $STACK_NAME"
@@ -52,7 +62,7 @@ sam deploy \
   --stack-name "$STACK_NAME" \
   --s3-bucket "$S3_BUCKET" \
   --capabilities CAPABILITY_IAM CAPABILITY_NAMED_IAM CAPABILITY_AUTO_EXPAND \
-  --parameter-overrides "Environment=$ENV" \
+  --parameter-overrides "Environment=$ENV" "CursorSecret=$CURSOR_SECRET" "TaskIndexes=$TASK_INDEXES" \
   --region "$REGION" \
   --no-fail-on-empty-changeset
 
@@ -8,6 +8,7 @@ from datetime import datetime
 
 from ..common.utils import build_response, get_user_from_event, logger, accounts_table
 from ..common.models import create_account_item, validate_account_input, create_user_role_item
+from ..common.idempotency import run_idempotent
 
 def lambda_handler(event, context):
     """Main handler for account management events."""
@@ -31,6 +32,36 @@ def lambda_handler(event, context):
     # If no matching route found
     return build_response(400, {"error": "Invalid request path or method"})
 
+def save_account(user, body):
+    """Write a new account and its owner's admin role."""
+    # Create account item
+    account_item = create_account_item(
+        account_name=body["account_name"],
+        owner_id=user["user_id"],
+        owner_email=body.get("owner_email", user["email"])
+    )
+    
+    # Create admin role for the user
+    user_role_item = create_user_role_item(
+        account_id=account_item["account_id"],
+        workspace_id=None,  # Account-level role
+        user_id=user["user_id"],
+        email=user["email"],
+        role="ADMIN"
+    )
+    
+    # Write to DynamoDB
+    accounts_table.put_item(Item=account_item)
+    accounts_table.put_item(Item=user_role_item)
+    
+    logger.info(f"Account created: {account_item['account_id']}")
+    
+    return build_response(201, {
+        "message": "Account created successfully",
+        "account_id": account_item["account_id"],
+        "account_name": account_item["account_name"]
+    })
+
 def create_account(event, context):
     """Create a new account."""
     try:
@@ -45,33 +76,11 @@ def create_account(event, context):
         if not is_valid:
             return build_response(400, {"error": error_msg})
         
-        # Create account item
-        account_item = create_account_item(
-            account_name=body["account_name"],
-            owner_id=user["user_id"],
-            owner_email=body.get("owner_email", user["email"])
+        # Create the account once per Idempotency-Key
+        return run_idempotent(
+            accounts_table, event, f"{user['user_id']}#create_account", body,
+            lambda: save_account(user, body), logger
         )
-        
-        # Create admin role for the user
-        user_role_item = create_user_role_item(
-            account_id=account_item["account_id"],
-            workspace_id=None,  # Account-level role
-            user_id=user["user_id"],
-            email=user["email"],
-            role="ADMIN"
-        )
-        
-        # Write to DynamoDB
-        accounts_table.put_item(Item=account_item)
-        accounts_table.put_item(Item=user_role_item)
-        
-        logger.info(f"Account created: {account_item['account_id']}")
-        
-        return build_response(201, {
-            "message": "Account created successfully",
-            "account_id": account_item["account_id"],
-            "account_name": account_item["account_name"]
-        })
     
     except Exception as e:
         logger.error(f"Error creating account: {str(e)}")
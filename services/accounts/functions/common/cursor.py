@@ -0,0 +1,95 @@
+"""Opaque pagination cursors for Account Service list endpoints.
+
+A cursor is the query's LastEvaluatedKey, compressed and signed, then
+base64url-encoded. The signature also covers a scope string describing the
+query (tenant, index and filters), so a cursor only resumes the query that
+issued it and cannot be edited to point a query elsewhere. The scope itself is
+not stored in the cursor.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import zlib
+from decimal import Decimal
+
+# Secret used to sign cursors, required: an empty HMAC key would let anyone forge one
+CURSOR_SECRET = os.environ.get("CURSOR_SECRET", "")
+
+# Bytes of the HMAC-SHA256 digest kept in each cursor
+SIGNATURE_SIZE = 16
+
+# Longest cursor accepted, checked before any decoding work
+MAX_CURSOR_LENGTH = 1024
+
+
+def _default(value):
+    """Serialize DynamoDB numbers in keys."""
+    if isinstance(value, Decimal):
+        return int(value) if value % 1 == 0 else float(value)
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor")
+
+
+def _sign(scope, payload):
+    """Sign a compressed key together with the scope it belongs to.
+
+    Raises RuntimeError when no secret is configured, so cursors are neither
+    issued nor accepted.
+    """
+    if not CURSOR_SECRET:
+        raise RuntimeError("CURSOR_SECRET is not set, pagination cursors cannot be signed")
+    message = scope.encode("utf-8") + b"\0" + payload
+    return hmac.new(CURSOR_SECRET.encode("utf-8"), message, hashlib.sha256).digest()[:SIGNATURE_SIZE]
+
+
+def build_cursor_scope(*parts, **filters):
+    """Build the scope string a cursor is bound to.
+
+    parts identify the tenant and index; filters are the request parameters
+    that shape the query. Empty filters are left out.
+    """
+    scope = [str(part) for part in parts]
+    scope += [f"{name}={value}" for name, value in sorted(filters.items()) if value]
+    return "|".join(scope)
+
+
+def encode_cursor(last_evaluated_key, scope):
+    """Encode a LastEvaluatedKey as an opaque cursor bound to a scope."""
+    data = json.dumps(last_evaluated_key, separators=(",", ":"), sort_keys=True, default=_default)
+
+    # Raw deflate, without the zlib header and checksum; the signature covers integrity
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+    payload = compressor.compress(data.encode("utf-8")) + compressor.flush()
+
+    token = base64.urlsafe_b64encode(_sign(scope, payload) + payload)
+    return token.decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor, scope):
+    """Decode a cursor issued for a scope.
+
+    Returns a tuple of (last_evaluated_key, error).
+    """
+    if not cursor or len(cursor) > MAX_CURSOR_LENGTH:
+        return None, "Invalid pagination token"
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    except (ValueError, TypeError):
+        return None, "Invalid pagination token"
+
+    signature, payload = raw[:SIGNATURE_SIZE], raw[SIGNATURE_SIZE:]
+
+    # Reject tampered cursors and cursors from other queries before decompressing
+    if not payload or not hmac.compare_digest(signature, _sign(scope, payload)):
+        return None, "Invalid pagination token"
+
+    try:
+        data = zlib.decompress(payload, -15)
+        last_evaluated_key = json.loads(data, parse_float=Decimal)
+    except (zlib.error, ValueError):
+        return None, "Invalid pagination token"
+
+    return last_evaluated_key, None
@@ -1,12 +1,17 @@
 """Data models for Account Service."""
 
+import os
+import time
 import uuid
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 
 def generate_id(prefix=""):
-    """Generate a unique ID with optional prefix."""
-    return f"{prefix}{uuid.uuid4()}"
+    """Generate a unique ID with optional prefix, a UUIDv7 that sorts by creation time."""
+    data = bytearray((time.time_ns() // 1000000).to_bytes(6, "big") + os.urandom(10))
+    data[6] = 0x70 | data[6] & 0x0F  # version 7
+    data[8] = 0x80 | data[8] & 0x3F  # RFC 4122 variant
+    return f"{prefix}{uuid.UUID(bytes=bytes(data))}"
 
 def get_timestamp():
     """Get current timestamp in ISO format."""
@@ -46,7 +51,10 @@ def create_workspace_item(account_id: str, workspace_name: str, owner_id: str) -
         "status": "ACTIVE",
         "created_at": timestamp,
         "updated_at": timestamp,
-        "entity_type": "WORKSPACE"
+        "entity_type": "WORKSPACE",
+        # Lists the workspace under its account while it is active
+        "GSI2PK": f"ACCOUNT#{account_id}",
+        "GSI2SK": f"WORKSPACE#{workspace_id}"
     }
 
 def create_user_role_item(account_id: str, workspace_id: Optional[str], user_id: str, 
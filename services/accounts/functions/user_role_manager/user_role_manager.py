@@ -6,6 +6,7 @@ from botocore.exceptions import ClientError
 
 from ..common.utils import build_response, get_user_from_event, logger, accounts_table, validate_role
 from ..common.models import create_user_role_item
+from ..common.cursor import build_cursor_scope, encode_cursor, decode_cursor
 
 def lambda_handler(event, context):
     """Main handler for user role management events."""
@@ -277,14 +278,32 @@ def list_user_roles(event, context):
             pk = f"ACCOUNT#{account_id}"
             sk_prefix = "USER#"
         
-        # Query for all user roles
-        response = accounts_table.query(
-            KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
-            ExpressionAttributeValues={
+        query_params = event.get("queryStringParameters") or {}
+        query_args = {
+            "KeyConditionExpression": "PK = :pk AND begins_with(SK, :sk_prefix)",
+            "ExpressionAttributeValues": {
                 ":pk": pk,
                 ":sk_prefix": sk_prefix
             }
-        )
+        }
+        
+        # Set the page size
+        if "limit" in query_params:
+            try:
+                query_args["Limit"] = min(max(int(query_params["limit"]), 1), 100)
+            except ValueError:
+                return build_response(400, {"error": "Invalid limit parameter"})
+        
+        # Cursors only resume listings of the same account or workspace
+        cursor_scope = build_cursor_scope("user_roles", pk)
+        if query_params.get("next_token"):
+            exclusive_start_key, cursor_error = decode_cursor(query_params["next_token"], cursor_scope)
+            if cursor_error:
+                return build_response(400, {"error": cursor_error})
+            query_args["ExclusiveStartKey"] = exclusive_start_key
+        
+        # Query for all user roles
+        response = accounts_table.query(**query_args)
         
         # Extract user role details
         user_roles = []
@@ -297,17 +316,18 @@ def list_user_roles(event, context):
                 "updated_at": item.get("updated_at", item["created_at"])
             })
         
+        result = {
+            "account_id": account_id,
+            "user_roles": user_roles
+        }
         if workspace_id:
-            return build_response(200, {
-                "account_id": account_id,
-                "workspace_id": workspace_id,
-                "user_roles": user_roles
-            })
-        else:
-            return build_response(200, {
-                "account_id": account_id,
-                "user_roles": user_roles
-            })
+            result["workspace_id"] = workspace_id
+        
+        # Add pagination token if more results exist
+        if "LastEvaluatedKey" in response:
+            result["next_token"] = encode_cursor(response["LastEvaluatedKey"], cursor_scope)
+        
+        return build_response(200, result)
     
     except Exception as e:
         logger.error(f"Error listing user roles: {str(e)}")
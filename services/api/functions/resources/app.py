@@ -14,6 +14,8 @@ from aws_lambda_powertools.utilities.validation import validate_event
 import boto3
 from botocore.exceptions import ClientError
 
+from cursor import build_cursor_scope, encode_cursor, decode_cursor
+
 # Initialize utilities
 logger = Logger()
 tracer = Tracer()
@@ -38,8 +40,13 @@ def get_resources():
         "Limit": limit
     }
     
+    # Cursors are bound to this table, so they cannot be replayed elsewhere
+    cursor_scope = build_cursor_scope("resources", table_name)
     if next_token:
-        scan_params["ExclusiveStartKey"] = {"id": next_token}
+        exclusive_start_key, cursor_error = decode_cursor(next_token, cursor_scope)
+        if cursor_error:
+            return app.response_builder(400, {"message": cursor_error})
+        scan_params["ExclusiveStartKey"] = exclusive_start_key
     
     # Scan the table
     try:
@@ -54,7 +61,7 @@ def get_resources():
         
         # Add next token if available
         if "LastEvaluatedKey" in response:
-            result["next_token"] = response["LastEvaluatedKey"]["id"]
+            result["next_token"] = encode_cursor(response["LastEvaluatedKey"], cursor_scope)
         
         return result
     except ClientError as e:
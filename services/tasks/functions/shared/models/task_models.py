@@ -1,17 +1,357 @@
 """Data models for Tasks Service."""
 
+import os
+import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Dict, Optional, Any, Union
 
+VALID_STATUSES = ["BACKLOG", "TODO", "IN_PROGRESS", "DONE"]
+VALID_PRIORITIES = ["LOW", "MEDIUM", "HIGH", "URGENT"]
+
+# Numeric rank per priority so index sort keys order by urgency rather than by name
+PRIORITY_RANKS = {"LOW": 1, "MEDIUM": 2, "HIGH": 3, "URGENT": 4}
+
+# Sort key segment for tasks without a due date, orders after every date
+NO_DUE_DATE = "NONE"
+
+# Bounds for due date range queries, between them only dated tasks
+MIN_DUE_DATE_KEY = "DUE#0000-01-01"
+MAX_DUE_DATE_KEY = "DUE#9999-12-31#~"
+
+# Digits of fractional ranks, in ASCII order so ranks compare as plain strings
+RANK_DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+# Digits of ranks derived from creation times, microseconds since the epoch
+TIMESTAMP_RANK_WIDTH = 9
+
+# Moves into the same gap add about a digit each, longer ranks trigger a column rebalance
+MAX_RANK_LENGTH = 32
+
+# Levels a task hierarchy can have, an epic counting as the first
+MAX_TASK_DEPTH = 5
+
+# Task attributes that can be selected with the fields parameter
+TASK_FIELDS = [
+    "task_id", "title", "description", "workspace_id", "account_id", "status", "priority",
+    "assignee_id", "due_date", "tags", "rank", "parent_id", "created_at", "updated_at", "created_by", "updated_by", "version"
+]
+
+# Task fields that GSI key attributes are derived from
+INDEX_KEY_FIELDS = ["status", "priority", "assignee_id", "due_date", "rank", "created_at", "updated_at", "tree_path"]
+
+# Task fields each GSI's keys are derived from, besides workspace_id and task_id
+INDEX_KEY_SOURCES = {
+    "GSI1": ["status", "priority"],
+    "GSI2": ["assignee_id", "status"],
+    "GSI3": ["priority"],
+    "GSI4": ["due_date"],
+    "GSI6": ["updated_at"],
+    "GSI7": ["assignee_id", "due_date"],
+    "GSI8": ["status", "rank", "created_at"],
+    "GSI9": ["tree_path"]
+}
+
+# Task fields an update request can change
+UPDATABLE_FIELDS = ["title", "description", "status", "priority", "assignee_id", "due_date", "tags"]
+
+# Task fields the service writes on update, rank only changes when a task is moved
+# and updated_by is always the caller
+WRITABLE_FIELDS = UPDATABLE_FIELDS + ["rank", "updated_by"]
+
+# Task fields a bulk update can change
+BULK_PATCH_FIELDS = ["status", "priority", "assignee_id"]
+
+# GSI key attributes that are only written when the task has the source field
+SPARSE_INDEX_KEY_ATTRIBUTES = [
+    "GSI2PK", "GSI2SK", "GSI5PK", "GSI5SK", "GSI6PK", "GSI6SK", "GSI7PK", "GSI7SK", "GSI8PK", "GSI8SK"
+]
+
+# Every GSI key attribute a task can carry, all removed when the task is deleted
+INDEX_KEY_ATTRIBUTES = [f"GSI{index}{part}" for index in range(1, 10) for part in ("PK", "SK")]
+
+# Days a deleted task can be restored before its TTL lets DynamoDB purge it
+TOMBSTONE_RETENTION_DAYS = 30
+
+# Milliseconds a task ID's time may differ from its created_at, the two are read from the clock separately
+ID_CLOCK_SLACK_MS = 1000
+
+def time_ordered_uuid(timestamp_ns: Optional[int] = None) -> str:
+    """Generate a UUIDv7, whose leading bits are its creation time.
+    
+    The first 48 bits hold Unix milliseconds and the 12 after the version the
+    fraction of the millisecond, the rest is random. IDs therefore sort by
+    creation time as plain strings, and keep the form of the uuid4 IDs before them.
+    """
+    if timestamp_ns is None:
+        timestamp_ns = time.time_ns()
+    milliseconds, nanoseconds = divmod(timestamp_ns, 1000000)
+    fraction = nanoseconds * 4096 // 1000000
+    random_bits = int.from_bytes(os.urandom(8), "big") >> 2
+    
+    value = (milliseconds & 0xFFFFFFFFFFFF) << 80 | 0x7 << 76 | fraction << 64 | 0b10 << 62 | random_bits
+    return str(uuid.UUID(int=value))
+
 def generate_id(prefix="task-"):
-    """Generate a unique task ID with optional prefix."""
-    return f"{prefix}{uuid.uuid4()}"
+    """Generate a unique, time-ordered task ID with optional prefix."""
+    return f"{prefix}{time_ordered_uuid()}"
+
+def time_ordered_id_prefix(milliseconds: int) -> str:
+    """Get the leading characters shared by the UUIDv7s of one millisecond."""
+    digits = f"{milliseconds:012x}"
+    return f"{digits[:8]}-{digits[8:]}"
 
 def get_timestamp():
     """Get current timestamp in ISO format."""
     return datetime.utcnow().isoformat()
 
+def status_key_prefix(status: str, priority: Optional[str] = None) -> str:
+    """Get the GSI1 sort key prefix for tasks with a status and optional priority."""
+    prefix = f"STATUS#{status}#"
+    if priority:
+        prefix += f"PRIORITY#{PRIORITY_RANKS[priority]}#"
+    return prefix
+
+def priority_key_prefix(priority: str) -> str:
+    """Get the GSI3 sort key prefix for tasks with a priority."""
+    return f"PRIORITY#{PRIORITY_RANKS[priority]}#"
+
+def assignee_key_prefix(assignee_id: str, status: Optional[str] = None) -> str:
+    """Get the GSI2 sort key prefix for tasks assigned to a user, optionally with a status."""
+    prefix = f"ASSIGNEE#{assignee_id}#"
+    if status:
+        prefix += f"STATUS#{status}#"
+    return prefix
+
+def due_date_key_prefix(due_date: Optional[str]) -> str:
+    """Get the GSI4 sort key prefix for tasks due on a date."""
+    return f"DUE#{due_date or NO_DUE_DATE}#"
+
+def due_date_key_range(start: Optional[str] = None, end: Optional[str] = None) -> tuple[str, str]:
+    """Get inclusive GSI4 sort key bounds for tasks due between two dates.
+    
+    Matches due_date >= start and due_date <= end, and never includes undated tasks.
+    """
+    low = f"DUE#{start}" if start else MIN_DUE_DATE_KEY
+    high = f"DUE#{end}#~" if end else MAX_DUE_DATE_KEY
+    return low, high
+
+def assignee_due_date_key_range(
+    assignee_id: str, start: Optional[str] = None, end: Optional[str] = None
+) -> tuple[str, str]:
+    """Get inclusive GSI7 sort key bounds for a user's tasks due between two dates."""
+    prefix = assignee_key_prefix(assignee_id)
+    low, high = due_date_key_range(start, end)
+    return f"{prefix}{low}", f"{prefix}{high}"
+
+def created_key_range(start: Optional[str] = None, end: Optional[str] = None) -> tuple[str, str]:
+    """Get inclusive GSI5 sort key bounds for tasks created between two times.
+    
+    Times are in created_at's form, a date alone covers the whole day.
+    """
+    low = f"CREATED#{start}" if start else "CREATED#"
+    high = f"CREATED#{end}~" if end else "CREATED#~"
+    return low, high
+
+def task_id_key_range(start: str, end: str) -> tuple[str, str]:
+    """Get inclusive table sort key bounds for tasks with time-ordered IDs created between two times.
+    
+    The bounds are widened by ID_CLOCK_SLACK_MS, callers filter on created_at
+    for exact edges. Tasks with uuid4 IDs are only in the range by chance.
+    """
+    low = epoch_microseconds(start) // 1000 - ID_CLOCK_SLACK_MS
+    high = epoch_microseconds(end) // 1000 + ID_CLOCK_SLACK_MS
+    if len(end) == len("YYYY-MM-DD"):
+        high += 86400 * 1000
+    return f"TASK#task-{time_ordered_id_prefix(low)}", f"TASK#task-{time_ordered_id_prefix(high)}~"
+
+def rank_key_prefix(status: str) -> str:
+    """Get the GSI8 sort key prefix for the tasks in a status column."""
+    return f"STATUS#{status}#RANK#"
+
+def encode_rank(value: int, width: int) -> str:
+    """Encode an integer as a fixed-width rank, without trailing zero digits.
+    
+    Trailing zeros do not change a fractional rank's position, and without them
+    there is always room for a rank before it.
+    """
+    digits = []
+    for _ in range(width):
+        value, digit = divmod(value, len(RANK_DIGITS))
+        digits.append(RANK_DIGITS[digit])
+    return "".join(reversed(digits)).rstrip(RANK_DIGITS[0])
+
+def epoch_microseconds(timestamp: str) -> int:
+    """Convert an ISO timestamp, UTC unless it has an offset, to microseconds since the epoch."""
+    moment = datetime.fromisoformat(timestamp.rstrip("Z"))
+    if moment.tzinfo:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = moment - datetime(1970, 1, 1)
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+def timestamp_rank(timestamp: str) -> str:
+    """Derive a rank from an ISO timestamp, so tasks that were never moved keep creation order."""
+    return encode_rank(max(epoch_microseconds(timestamp), 1), TIMESTAMP_RANK_WIDTH)
+
+def task_rank(task: Dict[str, Any]) -> Optional[str]:
+    """Get a task's position in its status column.
+    
+    Tasks written before ranks existed are ordered by creation time.
+    """
+    if task.get("rank"):
+        return task["rank"]
+    if task.get("created_at"):
+        return timestamp_rank(task["created_at"])
+    return None
+
+def _rank_midpoint(low: str, high: Optional[str]) -> str:
+    """Find the shortest rank between low and high (None for no upper bound)."""
+    if high is not None:
+        # Keep the digits both bounds share, with low padded by zeros
+        common = 0
+        while common < len(high) and (low[common] if common < len(low) else RANK_DIGITS[0]) == high[common]:
+            common += 1
+        if common:
+            return high[:common] + _rank_midpoint(low[common:], high[common:])
+    
+    low_digit = RANK_DIGITS.index(low[0]) if low else 0
+    high_digit = RANK_DIGITS.index(high[0]) if high is not None else len(RANK_DIGITS)
+    
+    # A digit fits between the bounds' first digits
+    if high_digit - low_digit > 1:
+        return RANK_DIGITS[(low_digit + high_digit + 1) // 2]
+    
+    # high's first digit alone is already above low
+    if high is not None and len(high) > 1:
+        return high[:1]
+    
+    return RANK_DIGITS[low_digit] + _rank_midpoint(low[1:], None)
+
+def _rank_after(low: str) -> str:
+    """Find a short rank after low, stepping its first digit rather than halving the space left.
+    
+    Tasks added to the bottom of a column one after another then add a digit
+    every few dozen rather than every few.
+    """
+    if not low:
+        return _rank_midpoint("", None)
+    low_digit = RANK_DIGITS.index(low[0])
+    if low_digit + 1 < len(RANK_DIGITS):
+        return RANK_DIGITS[low_digit + 1]
+    return low[0] + _rank_after(low[1:])
+
+def rank_between(low: Optional[str], high: Optional[str]) -> str:
+    """Get a rank that sorts between two neighbouring ranks.
+    
+    low is None at the top of a column and high is None at the bottom. Only the
+    moved task's rank changes, however many tasks the column holds.
+    """
+    if low is not None and high is not None and low >= high:
+        raise ValueError(f"Rank {low} does not sort before {high}")
+    if high is None:
+        return _rank_after(low or "")
+    return _rank_midpoint(low or "", high)
+
+def spread_ranks(count: int) -> List[str]:
+    """Get count evenly spaced ranks, used to rebalance a column whose ranks grew long."""
+    width = 1
+    while len(RANK_DIGITS) ** width < (count + 1) * len(RANK_DIGITS):
+        width += 1
+    step = len(RANK_DIGITS) ** width // (count + 1)
+    return [encode_rank(step * (position + 1), width) for position in range(count)]
+
+def ranks_after(low: Optional[str], count: int) -> List[str]:
+    """Get count ordered ranks below low, for tasks added to the bottom of a column together.
+    
+    A single task takes rank_between(low, None), more share it as a prefix
+    followed by evenly spaced ranks, so a large import keeps its ranks short.
+    """
+    first = rank_between(low, None)
+    if count == 1:
+        return [first]
+    return [first + rank for rank in spread_ranks(count)]
+
+def task_tree_path(task: Dict[str, Any]) -> str:
+    """Get the IDs from a task's top-level ancestor down to the task, joined by '#'.
+    
+    Tasks without a parent are the root of their own tree.
+    """
+    return task.get("tree_path") or task["task_id"]
+
+def tree_key_prefix(tree_path: str) -> str:
+    """Get the GSI9 sort key prefix for a task and all of its subtasks."""
+    return f"PATH#{tree_path}"
+
+def tree_depth(tree_path: str) -> int:
+    """Get a task's level in its hierarchy from its tree path, 1 for a top-level task."""
+    return tree_path.count("#") + 1
+
+def build_index_keys(task: Dict[str, Any]) -> Dict[str, str]:
+    """Build the GSI key attributes for a task from its fields.
+    
+    - GSI1: tasks by status, then priority rank
+    - GSI2: tasks by assignee, then status (only for assigned tasks)
+    - GSI3: tasks by priority rank
+    - GSI4: tasks by due date, undated tasks last
+    - GSI5: tasks by creation time
+    - GSI6: tasks by last update time
+    - GSI7: tasks by assignee, then due date (only for assigned tasks)
+    - GSI8: tasks by status, then rank (the board's column order)
+    - GSI9: tasks by tree path, so a subtree shares a sort key prefix
+    """
+    workspace_key = f"WORKSPACE#{task['workspace_id']}"
+    task_id = task["task_id"]
+    status = task.get("status", "BACKLOG")
+    priority = task.get("priority", "MEDIUM")
+    
+    keys = {
+        "GSI1PK": workspace_key,
+        "GSI1SK": f"{status_key_prefix(status, priority)}TASK#{task_id}",
+        "GSI3PK": workspace_key,
+        "GSI3SK": f"{priority_key_prefix(priority)}TASK#{task_id}",
+        "GSI4PK": workspace_key,
+        "GSI4SK": f"{due_date_key_prefix(task.get('due_date'))}TASK#{task_id}",
+        "GSI9PK": workspace_key,
+        "GSI9SK": tree_key_prefix(task_tree_path(task))
+    }
+    
+    if task.get("assignee_id"):
+        assignee_prefix = assignee_key_prefix(task["assignee_id"])
+        keys["GSI2PK"] = workspace_key
+        keys["GSI2SK"] = f"{assignee_key_prefix(task['assignee_id'], status)}TASK#{task_id}"
+        keys["GSI7PK"] = workspace_key
+        keys["GSI7SK"] = f"{assignee_prefix}{due_date_key_prefix(task.get('due_date'))}TASK#{task_id}"
+    
+    if task.get("created_at"):
+        keys["GSI5PK"] = workspace_key
+        keys["GSI5SK"] = f"CREATED#{task['created_at']}#TASK#{task_id}"
+    
+    if task.get("updated_at"):
+        keys["GSI6PK"] = workspace_key
+        keys["GSI6SK"] = f"UPDATED#{task['updated_at']}#TASK#{task_id}"
+    
+    rank = task_rank(task)
+    if rank:
+        keys["GSI8PK"] = workspace_key
+        keys["GSI8SK"] = f"{rank_key_prefix(status)}{rank}#TASK#{task_id}"
+    
+    return keys
+
+def diff_index_keys(task: Dict[str, Any], index_keys: Dict[str, str]) -> tuple[Dict[str, str], List[str]]:
+    """Compare a task's stored GSI keys with freshly built ones.
+    
+    Returns the key attributes to set and the sparse key attributes to remove.
+    """
+    keys_to_set = {
+        attr: value for attr, value in index_keys.items()
+        if task.get(attr) != value
+    }
+    keys_to_remove = [
+        attr for attr in SPARSE_INDEX_KEY_ATTRIBUTES
+        if attr not in index_keys and attr in task
+    ]
+    return keys_to_set, keys_to_remove
+
 def create_task_item(
     workspace_id: str, 
     account_id: str,
@@ -23,9 +363,16 @@ def create_task_item(
     creator_id: str = "",
     creator_email: str = "",
     due_date: Optional[str] = None,
-    tags: Optional[List[str]] = None
+    tags: Optional[List[str]] = None,
+    parent: Optional[Dict[str, Any]] = None,
+    rank: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Create a DynamoDB item for a new task."""
+    """Create a DynamoDB item for a new task.
+    
+    parent is the stored parent task (task_id and tree_path) of a subtask. rank
+    places the task in its column, the handlers pass a rank after the column's
+    last card; without one the task is ordered by its creation time.
+    """
     task_id = generate_id()
     timestamp = get_timestamp()
     
@@ -44,9 +391,8 @@ def create_task_item(
             "user_id": creator_id,
             "email": creator_email
         },
-        "entity_type": "TASK",
-        "GSI1PK": f"WORKSPACE#{workspace_id}",  # For querying tasks by workspace
-        "GSI1SK": f"STATUS#{status}#PRIORITY#{priority}#TASK#{task_id}"  # For sorting
+        "version": 1,
+        "entity_type": "TASK"
     }
     
     # Add optional fields
@@ -55,8 +401,6 @@ def create_task_item(
     
     if assignee_id:
         item["assignee_id"] = assignee_id
-        item["GSI2PK"] = f"WORKSPACE#{workspace_id}"  # For querying tasks by assignee
-        item["GSI2SK"] = f"ASSIGNEE#{assignee_id}#TASK#{task_id}"
     
     if due_date:
         item["due_date"] = due_date
@@ -64,6 +408,16 @@ def create_task_item(
     if tags and len(tags) > 0:
         item["tags"] = tags
     
+    if rank:
+        item["rank"] = rank
+    
+    if parent:
+        item["parent_id"] = parent["task_id"]
+        item["tree_path"] = f"{task_tree_path(parent)}#{task_id}"
+    
+    # Add GSI keys for filtering and sorting
+    item.update(build_index_keys(item))
+    
     return item
 
 def validate_task_input(task_data: Dict[str, Any]) -> tuple[bool, Optional[str]]:
@@ -74,15 +428,22 @@ def validate_task_input(task_data: Dict[str, Any]) -> tuple[bool, Optional[str]]
     
     # Validate status if provided
     if "status" in task_data:
-        valid_statuses = ["BACKLOG", "TODO", "IN_PROGRESS", "DONE"]
-        if task_data["status"] not in valid_statuses:
-            return False, f"Invalid status value. Must be one of: {', '.join(valid_statuses)}"
+        if task_data["status"] not in VALID_STATUSES:
+            return False, f"Invalid status value. Must be one of: {', '.join(VALID_STATUSES)}"
     
     # Validate priority if provided
     if "priority" in task_data:
-        valid_priorities = ["LOW", "MEDIUM", "HIGH", "URGENT"]
-        if task_data["priority"] not in valid_priorities:
-            return False, f"Invalid priority value. Must be one of: {', '.join(valid_priorities)}"
+        if task_data["priority"] not in VALID_PRIORITIES:
+            return False, f"Invalid priority value. Must be one of: {', '.join(VALID_PRIORITIES)}"
+    
+    # Validate parent_id if provided
+    if "parent_id" in task_data and task_data["parent_id"] is not None:
+        if not isinstance(task_data["parent_id"], str) or not task_data["parent_id"]:
+            return False, "parent_id must be a task ID"
+    
+    # Ranks are only computed by moving a task
+    if "rank" in task_data:
+        return False, "rank cannot be set directly, move the task instead"
     
     # Validate tags if provided
     if "tags" in task_data:
@@ -95,59 +456,280 @@ def validate_task_input(task_data: Dict[str, Any]) -> tuple[bool, Optional[str]]
     
     return True, None
 
+def validate_task_patch(patch: Any) -> tuple[bool, Optional[str]]:
+    """Validate the patch of a bulk task update."""
+    if not isinstance(patch, dict) or not patch:
+        return False, f"Patch must be an object with one or more of: {', '.join(BULK_PATCH_FIELDS)}"
+    
+    for field in patch:
+        if field not in BULK_PATCH_FIELDS:
+            return False, f"Invalid patch field: {field}. Must be one of: {', '.join(BULK_PATCH_FIELDS)}"
+    
+    if "status" in patch and patch["status"] not in VALID_STATUSES:
+        return False, f"Invalid status value. Must be one of: {', '.join(VALID_STATUSES)}"
+    
+    if "priority" in patch and patch["priority"] not in VALID_PRIORITIES:
+        return False, f"Invalid priority value. Must be one of: {', '.join(VALID_PRIORITIES)}"
+    
+    if "assignee_id" in patch and patch["assignee_id"] is not None and not isinstance(patch["assignee_id"], str):
+        return False, "assignee_id must be a string or null"
+    
+    return True, None
+
+def parse_fields(value: Optional[str]) -> tuple[Optional[List[str]], Optional[str]]:
+    """Parse a comma-separated fields parameter against the task schema.
+    
+    task_id is always selected. Returns a tuple of (fields, error), or
+    (None, None) when no fields were requested.
+    """
+    if not value:
+        return None, None
+    
+    fields = ["task_id"]
+    for field in value.split(","):
+        field = field.strip()
+        if not field or field in fields:
+            continue
+        if field not in TASK_FIELDS:
+            return None, f"Invalid field: {field}. Must be one of: {', '.join(TASK_FIELDS)}"
+        fields.append(field)
+    
+    return fields, None
+
+def build_projection(attributes: List[str]) -> tuple[str, Dict[str, str]]:
+    """Build a ProjectionExpression and its attribute names for a list of attributes."""
+    attr_names = {f"#{attr}": attr for attr in attributes}
+    return ", ".join(attr_names), attr_names
+
+def select_fields(task: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    """Trim a task to the selected fields."""
+    return {field: task[field] for field in fields if field in task}
+
 def prepare_update_expression(task_data: Dict[str, Any]) -> tuple[str, Dict[str, Any], Dict[str, str]]:
     """Prepare DynamoDB update expression for task updates."""
     update_expression = "SET updated_at = :updated_at"
     expression_attr_values = {":updated_at": get_timestamp()}
     expression_attr_names = {}
     
-    # Map of field names to their DynamoDB attribute names
-    field_mappings = {
-        "title": "title",
-        "description": "description",
-        "status": "status",
-        "priority": "priority",
-        "assignee_id": "assignee_id",
-        "due_date": "due_date",
-        "tags": "tags"
-    }
-    
     # Add each field to the update expression
-    for field, attr_name in field_mappings.items():
+    for field in WRITABLE_FIELDS:
         if field in task_data:
             # If using an expression attribute name
-            expression_attr_names[f"#{attr_name}"] = attr_name
+            expression_attr_names[f"#{field}"] = field
             expression_attr_values[f":{field}"] = task_data[field]
-            update_expression += f", #{attr_name} = :{field}"
+            update_expression += f", #{field} = :{field}"
     
-    # Special handling for GSI sort keys if status or priority changes
-    if "status" in task_data or "priority" in task_data:
-        task = task_data.get("_existing_task", {})
+    # Rebuild GSI keys, updated_at changes on every write so its index always moves
+    task = task_data.get("_existing_task", {})
+    if task.get("task_id") and task.get("workspace_id"):
+        # Merge the changes over the current values
+        merged_task = dict(task)
+        for field in INDEX_KEY_FIELDS:
+            if field in task_data:
+                merged_task[field] = task_data[field]
+        merged_task["updated_at"] = expression_attr_values[":updated_at"]
         
-        # Get current or new values
-        status = task_data.get("status", task.get("status", "BACKLOG"))
-        priority = task_data.get("priority", task.get("priority", "MEDIUM"))
+        keys_to_set, keys_to_remove = diff_index_keys(task, build_index_keys(merged_task))
         
-        # Update GSI1SK
-        expression_attr_values[":gsi1sk"] = f"STATUS#{status}#PRIORITY#{priority}#TASK#{task.get('task_id', '')}"
-        expression_attr_names["#GSI1SK"] = "GSI1SK"
-        update_expression += ", #GSI1SK = :gsi1sk"
-    
-    # Special handling for assignee changes
-    if "assignee_id" in task_data:
-        task = task_data.get("_existing_task", {})
-        workspace_id = task.get("workspace_id", "")
-        task_id = task.get("task_id", "")
+        for attr, value in keys_to_set.items():
+            expression_attr_names[f"#{attr}"] = attr
+            expression_attr_values[f":{attr.lower()}"] = value
+            update_expression += f", #{attr} = :{attr.lower()}"
         
-        if task_data["assignee_id"]:
-            # Add or update GSI2 keys for assignee lookup
-            expression_attr_values[":gsi2pk"] = f"WORKSPACE#{workspace_id}"
-            expression_attr_values[":gsi2sk"] = f"ASSIGNEE#{task_data['assignee_id']}#TASK#{task_id}"
-            expression_attr_names["#GSI2PK"] = "GSI2PK"
-            expression_attr_names["#GSI2SK"] = "GSI2SK"
-            update_expression += ", #GSI2PK = :gsi2pk, #GSI2SK = :gsi2sk"
-        elif "GSI2PK" in task and "GSI2SK" in task:
-            # Remove GSI2 keys if assignee is being removed
-            update_expression += " REMOVE GSI2PK, GSI2SK"
-    
-    return update_expression, expression_attr_values, expression_attr_names 
\ No newline at end of file
+        if keys_to_remove:
+            update_expression += f" REMOVE {', '.join(keys_to_remove)}"
+    
+    return update_expression, expression_attr_values, expression_attr_names
+
+def writable_changes(task_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the fields an update may write.
+    
+    Index keys are chosen from the changed fields, so a stray tree_path or
+    created_at in a request must not count as a change.
+    """
+    return {field: task_data[field] for field in WRITABLE_FIELDS if field in task_data}
+
+def changed_indexes(task_data: Dict[str, Any]) -> List[str]:
+    """List the GSIs whose keys an update moves. updated_at changes on every write."""
+    task_data = writable_changes(task_data)
+    changed = {field for field in INDEX_KEY_FIELDS if field in task_data} | {"updated_at"}
+    return [index for index, sources in INDEX_KEY_SOURCES.items() if changed & set(sources)]
+
+def index_key_read_fields(task_data: Dict[str, Any]) -> List[str]:
+    """List the stored fields needed to rebuild the GSI keys an update moves.
+    
+    A status change needs the current priority and assignee, for example, while
+    title, description and tag edits need nothing. Empty when the update can be
+    written without reading the task.
+    """
+    task_data = writable_changes(task_data)
+    unassigned = "assignee_id" in task_data and not task_data["assignee_id"]
+    
+    needed = set()
+    for index in changed_indexes(task_data):
+        # Unassigning removes the assignee indexes' keys instead of rebuilding them
+        if unassigned and "assignee_id" in INDEX_KEY_SOURCES[index]:
+            continue
+        needed.update(INDEX_KEY_SOURCES[index])
+    
+    # created_at only stands in for a rank the task never had
+    if task_data.get("rank"):
+        needed.discard("created_at")
+    
+    return [field for field in INDEX_KEY_FIELDS if field in needed and field not in task_data and field != "updated_at"]
+
+def version_condition(
+    expected_version: int,
+    expression_attr_values: Dict[str, Any],
+    expression_attr_names: Dict[str, str]
+) -> str:
+    """Build a condition that the stored task is at an expected version.
+    
+    Tasks written before versioning have no version attribute and count as version 0.
+    """
+    expression_attr_names["#version"] = "version"
+    if expected_version == 0:
+        return "attribute_not_exists(#version)"
+    
+    expression_attr_values[":expected_version"] = expected_version
+    return "#version = :expected_version"
+
+def prepare_conditional_update(
+    workspace_id: str,
+    task_id: str,
+    task_data: Dict[str, Any],
+    current_fields: Optional[Dict[str, Any]] = None,
+    expected_version: Optional[int] = None
+) -> tuple[str, Dict[str, Any], Dict[str, str], str]:
+    """Prepare a task update that does not need the whole stored task.
+    
+    Only the GSI keys derived from the changed fields are rebuilt. current_fields
+    holds the stored values of index_key_read_fields(task_data), if any. The
+    condition only matches an existing, undeleted task whose read fields are
+    unchanged, so keys are never built from stale values, and, when
+    expected_version is given, whose version is still that one. Every update
+    increments the version.
+    
+    Returns (update_expression, attribute_values, attribute_names, condition).
+    """
+    current_fields = current_fields or {}
+    changes = writable_changes(task_data)
+    update_expression, expression_attr_values, expression_attr_names = prepare_update_expression(changes)
+    
+    expression_attr_names["#version"] = "version"
+    expression_attr_values[":zero"] = 0
+    expression_attr_values[":one"] = 1
+    update_expression += ", #version = if_not_exists(#version, :zero) + :one"
+    
+    merged_task = {"workspace_id": workspace_id, "task_id": task_id, **current_fields, **changes}
+    merged_task["updated_at"] = expression_attr_values[":updated_at"]
+    index_keys = build_index_keys(merged_task)
+    
+    keys_to_remove = []
+    for index in changed_indexes(task_data):
+        for attr in (f"{index}PK", f"{index}SK"):
+            if attr in index_keys:
+                expression_attr_names[f"#{attr}"] = attr
+                expression_attr_values[f":{attr.lower()}"] = index_keys[attr]
+                update_expression += f", #{attr} = :{attr.lower()}"
+            else:
+                keys_to_remove.append(attr)
+    
+    if keys_to_remove:
+        update_expression += f" REMOVE {', '.join(keys_to_remove)}"
+    
+    conditions = ["attribute_exists(PK)", "attribute_not_exists(deleted_at)"]
+    for field in index_key_read_fields(task_data):
+        expression_attr_names[f"#{field}"] = field
+        if field in current_fields:
+            expression_attr_values[f":current_{field}"] = current_fields[field]
+            conditions.append(f"#{field} = :current_{field}")
+        else:
+            conditions.append(f"attribute_not_exists(#{field})")
+    
+    if expected_version is not None:
+        conditions.append(version_condition(expected_version, expression_attr_values, expression_attr_names))
+    
+    return update_expression, expression_attr_values, expression_attr_names, " AND ".join(conditions)
+
+def apply_task_update(task: Dict[str, Any], task_data: Dict[str, Any], updated_at: str) -> Dict[str, Any]:
+    """Apply an update's field changes to a copy of the stored task."""
+    updated_task = dict(task)
+    updated_task.update(writable_changes(task_data))
+    updated_task["updated_at"] = updated_at
+    updated_task["version"] = task.get("version", 0) + 1
+    return updated_task
+
+def is_deleted(task: Optional[Dict[str, Any]]) -> bool:
+    """Check whether a stored task is a tombstone left by a delete."""
+    return bool(task) and "deleted_at" in task
+
+def prepare_soft_delete(
+    deleted_by: str,
+    expected_version: Optional[int] = None
+) -> tuple[str, Dict[str, Any], Dict[str, str], str]:
+    """Prepare the update that turns a task into a tombstone.
+    
+    Every GSI key is removed, so the tombstone drops out of all list, board and
+    sort queries, and expires_at lets DynamoDB TTL purge it once the retention
+    window ends. The condition only matches a live task, at expected_version
+    when one is given.
+    
+    Returns (update_expression, attribute_values, attribute_names, condition).
+    """
+    timestamp = get_timestamp()
+    expression_attr_names = {"#version": "version"}
+    expression_attr_values = {
+        ":deleted_at": timestamp,
+        ":deleted_by": deleted_by,
+        ":expires_at": int(time.time()) + TOMBSTONE_RETENTION_DAYS * 24 * 60 * 60,
+        ":updated_at": timestamp,
+        ":zero": 0,
+        ":one": 1
+    }
+    update_expression = (
+        "SET deleted_at = :deleted_at, deleted_by = :deleted_by, expires_at = :expires_at, "
+        "updated_at = :updated_at, #version = if_not_exists(#version, :zero) + :one "
+        f"REMOVE {', '.join(INDEX_KEY_ATTRIBUTES)}"
+    )
+    
+    conditions = ["attribute_exists(PK)", "attribute_not_exists(deleted_at)"]
+    if expected_version is not None:
+        conditions.append(version_condition(expected_version, expression_attr_values, expression_attr_names))
+    
+    return update_expression, expression_attr_values, expression_attr_names, " AND ".join(conditions)
+
+def prepare_restore(task: Dict[str, Any], restored_by: str) -> tuple[str, Dict[str, Any], Dict[str, str], str]:
+    """Prepare the update that brings a tombstoned task back.
+    
+    The GSI keys are rebuilt from the tombstone's fields, its tree_path
+    rewritten (the caller passes the current one) and the deletion attributes
+    removed. The condition only matches the same tombstone, so a concurrent
+    restore applies once.
+    
+    Returns (update_expression, attribute_values, attribute_names, condition).
+    """
+    timestamp = get_timestamp()
+    index_keys = build_index_keys({**task, "updated_at": timestamp})
+    
+    expression_attr_names = {"#version": "version"}
+    expression_attr_values = {
+        ":updated_at": timestamp,
+        ":updated_by": restored_by,
+        ":deleted_at": task["deleted_at"],
+        ":zero": 0,
+        ":one": 1
+    }
+    set_clauses = ["updated_at = :updated_at", "updated_by = :updated_by", "#version = if_not_exists(#version, :zero) + :one"]
+    if task.get("tree_path"):
+        expression_attr_names["#tree_path"] = "tree_path"
+        expression_attr_values[":tree_path"] = task["tree_path"]
+        set_clauses.append("#tree_path = :tree_path")
+    for attr, value in index_keys.items():
+        expression_attr_names[f"#{attr}"] = attr
+        expression_attr_values[f":{attr.lower()}"] = value
+        set_clauses.append(f"#{attr} = :{attr.lower()}")
+    
+    update_expression = f"SET {', '.join(set_clauses)} REMOVE deleted_at, deleted_by, expires_at"
+    
+    return update_expression, expression_attr_values, expression_attr_names, "deleted_at = :deleted_at"
@@ -0,0 +1,83 @@
+"""Batched reads for the Tasks Service.
+
+Keys are fetched in 100-key BatchGetItem chunks issued in parallel. Keys
+DynamoDB leaves unprocessed under throttling are retried with exponential
+backoff and jitter.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from ..models.task_models import build_projection, is_deleted
+from .batch_writes import backoff
+
+# BatchGetItem accepts at most 100 keys per request
+BATCH_GET_SIZE = 100
+
+# Retries for keys DynamoDB leaves unprocessed under throttling
+MAX_BATCH_GET_RETRIES = 3
+
+# Chunks in flight at once, the pool is kept across warm invocations.
+# The table's low-level client is thread-safe, unlike the resource.
+executor = ThreadPoolExecutor(max_workers=8)
+
+
+def _get_chunk(client, table_name, request):
+    """Fetch one chunk of keys, retrying unprocessed keys.
+
+    Returns a tuple of (items, unprocessed_keys).
+    """
+    items = []
+    request_items = {table_name: request}
+
+    for attempt in range(MAX_BATCH_GET_RETRIES + 1):
+        backoff(attempt)
+
+        response = client.batch_get_item(RequestItems=request_items)
+        items.extend(response.get("Responses", {}).get(table_name, []))
+
+        request_items = response.get("UnprocessedKeys")
+        if not request_items:
+            return items, []
+
+    return items, request_items[table_name]["Keys"]
+
+
+def batch_get_items(table, keys, attributes=None):
+    """Fetch items by primary key in parallel BatchGetItem chunks.
+
+    attributes limits the read to those attributes (the sort key is always
+    read). Tombstones of deleted tasks are left out. Returns a tuple of
+    (items_by_sk, unprocessed_keys) where unprocessed_keys were still throttled
+    after every retry.
+    """
+    projection = {}
+    if attributes:
+        expression, attr_names = build_projection(
+            ["SK", "deleted_at"] + [attr for attr in attributes if attr not in ("SK", "deleted_at")]
+        )
+        projection = {"ProjectionExpression": expression, "ExpressionAttributeNames": attr_names}
+
+    futures = [
+        executor.submit(_get_chunk, table.meta.client, table.name,
+                        {"Keys": keys[start:start + BATCH_GET_SIZE], **projection})
+        for start in range(0, len(keys), BATCH_GET_SIZE)
+    ]
+
+    items_by_sk = {}
+    unprocessed_keys = []
+    for future in futures:
+        items, unprocessed = future.result()
+        items_by_sk.update((item["SK"], item) for item in items if not is_deleted(item))
+        unprocessed_keys.extend(unprocessed)
+
+    return items_by_sk, unprocessed_keys
+
+
+def batch_get_tasks(table, keys, attributes=None):
+    """Fetch tasks by primary key, in the order the keys were given.
+
+    attributes limits the read to those attributes (the sort key is always read).
+    Returns a tuple of (tasks, unprocessed_keys), so callers can tell tasks that
+    were throttled from tasks that do not exist.
+    """
+    tasks_by_sk, unprocessed_keys = batch_get_items(table, keys, attributes)
+    return [tasks_by_sk[key["SK"]] for key in keys if key["SK"] in tasks_by_sk], unprocessed_keys
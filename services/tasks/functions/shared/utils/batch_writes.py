@@ -0,0 +1,152 @@
+"""Batched writes for the Tasks Service.
+
+Write requests go out in 25-request BatchWriteItem chunks, sent concurrently.
+Requests DynamoDB leaves unprocessed under throttling are retried with
+exponential backoff and jitter. Conditional writes go out the same way in
+TransactWriteItems chunks, or one chunk after another when their order matters.
+"""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from botocore.exceptions import ClientError
+
+# BatchWriteItem accepts at most 25 requests per call
+BATCH_WRITE_SIZE = 25
+
+# TransactWriteItems accepts at most 100 actions per call
+TRANSACT_WRITE_SIZE = 100
+
+# Cancellation reason of a transaction action whose condition failed
+CONDITION_FAILED = "ConditionalCheckFailed"
+
+# Retries for requests DynamoDB leaves unprocessed
+MAX_BATCH_WRITE_RETRIES = 5
+
+# First backoff delay in seconds, doubled on every retry
+BATCH_WRITE_BASE_DELAY = 0.05
+
+# Chunks in flight at once, the pool is kept across warm invocations.
+# The table's low-level client is thread-safe, unlike the resource.
+executor = ThreadPoolExecutor(max_workers=8)
+
+
+def request_key(request):
+    """Get the primary key a PutRequest or DeleteRequest writes."""
+    if "PutRequest" in request:
+        item = request["PutRequest"]["Item"]
+        return {"PK": item["PK"], "SK": item["SK"]}
+    return request["DeleteRequest"]["Key"]
+
+
+def backoff(attempt):
+    """Sleep before a retry, exponentially longer with jitter."""
+    if attempt:
+        time.sleep(BATCH_WRITE_BASE_DELAY * 2 ** (attempt - 1) * (1 + random.random()))
+
+
+def _write_chunk(client, table_name, requests):
+    """Write one chunk, retrying unprocessed requests.
+
+    Returns a list of (request, error) for the requests that were not written.
+    """
+    for attempt in range(MAX_BATCH_WRITE_RETRIES + 1):
+        backoff(attempt)
+
+        try:
+            response = client.batch_write_item(RequestItems={table_name: requests})
+        except ClientError as e:
+            return [(request, e.response["Error"]["Message"]) for request in requests]
+
+        requests = response.get("UnprocessedItems", {}).get(table_name, [])
+        if not requests:
+            return []
+
+    return [(request, "Write throttled, retries exhausted") for request in requests]
+
+
+def batch_write(table, requests):
+    """Send PutRequest/DeleteRequest items in concurrent BatchWriteItem chunks.
+
+    A chunk must not write the same key twice. Returns a list of
+    (request, error) for the requests that could not be written.
+    """
+    chunks = [requests[start:start + BATCH_WRITE_SIZE] for start in range(0, len(requests), BATCH_WRITE_SIZE)]
+    futures = [executor.submit(_write_chunk, table.meta.client, table.name, chunk) for chunk in chunks]
+
+    failed = []
+    for future in futures:
+        failed.extend(future.result())
+    return failed
+
+
+def batch_put_items(table, items):
+    """Put items in concurrent BatchWriteItem chunks.
+
+    Returns a list of (item, error) for the items that could not be written.
+    """
+    failed = batch_write(table, [{"PutRequest": {"Item": item}} for item in items])
+    return [(request["PutRequest"]["Item"], error) for request, error in failed]
+
+
+def _transact_chunk(client, actions):
+    """Write one chunk of actions as a transaction.
+
+    Actions whose condition fails are dropped and the rest retried, so one
+    stale item does not hold back the others. Returns a list of (index, error)
+    for the actions not written, indexes being positions in the chunk.
+    """
+    pending = list(range(len(actions)))
+    failed = []
+
+    for attempt in range(MAX_BATCH_WRITE_RETRIES + 1):
+        if not pending:
+            return failed
+        backoff(attempt)
+
+        try:
+            client.transact_write_items(TransactItems=[actions[index] for index in pending])
+            return failed
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "TransactionCanceledException":
+                return failed + [(index, e.response["Error"]["Message"]) for index in pending]
+            reasons = e.response.get("CancellationReasons") or [{}] * len(pending)
+
+        # Conflicts with other transactions and throttling are retried as they are
+        failed += [(index, CONDITION_FAILED) for index, reason in zip(pending, reasons)
+                   if reason.get("Code") == CONDITION_FAILED]
+        pending = [index for index, reason in zip(pending, reasons) if reason.get("Code") != CONDITION_FAILED]
+
+    return failed + [(index, "Transaction conflicts, retries exhausted") for index in pending]
+
+
+def transact_write(table, actions):
+    """Send TransactWriteItems actions in concurrent chunks of up to 100.
+
+    Each chunk is atomic apart from actions dropped for a failed condition.
+    Returns a list of (index, error) for the actions not written, with
+    CONDITION_FAILED as the error for failed conditions.
+    """
+    starts = range(0, len(actions), TRANSACT_WRITE_SIZE)
+    futures = [
+        executor.submit(_transact_chunk, table.meta.client, actions[start:start + TRANSACT_WRITE_SIZE])
+        for start in starts
+    ]
+
+    failed = []
+    for start, future in zip(starts, futures):
+        failed.extend((start + index, error) for index, error in future.result())
+    return failed
+
+
+def ordered_transact_write(table, actions):
+    """Send TransactWriteItems actions in chunks of up to 100, one chunk after another.
+
+    Readers see the actions applied in list order, a chunk at a time. Returns
+    the same (index, error) list as transact_write.
+    """
+    failed = []
+    for start in range(0, len(actions), TRANSACT_WRITE_SIZE):
+        chunk_failed = _transact_chunk(table.meta.client, actions[start:start + TRANSACT_WRITE_SIZE])
+        failed.extend((start + index, error) for index, error in chunk_failed)
+    return failed
@@ -0,0 +1,39 @@
+"""Ranks for tasks created at the bottom of a board column.
+
+New tasks take a rank after the column's last card, read from GSI8, so
+creates and moves share one rank scheme. GSI8 reads are eventually
+consistent: two tasks created at the same moment may get the same rank, and
+their task IDs, which are part of the sort key, keep them in creation order.
+"""
+
+from collections import Counter
+from boto3.dynamodb.conditions import Key
+from ..models.task_models import rank_key_prefix, task_rank, ranks_after
+
+
+def last_column_rank(table, workspace_id, status):
+    """Read the rank of the last card in a column, None for an empty column."""
+    response = table.query(
+        IndexName="GSI8",
+        KeyConditionExpression=Key("GSI8PK").eq(f"WORKSPACE#{workspace_id}") &
+                               Key("GSI8SK").begins_with(rank_key_prefix(status)),
+        ScanIndexForward=False,
+        Limit=1,
+        ProjectionExpression="#rank, created_at",
+        ExpressionAttributeNames={"#rank": "rank"}
+    )
+    items = response.get("Items", [])
+    return task_rank(items[0]) if items else None
+
+
+def column_end_ranks(table, workspace_id, statuses):
+    """Get ranks for new tasks at the bottom of their columns.
+
+    statuses holds each new task's column. Returns a rank per entry, in the
+    same order, with each column read once.
+    """
+    ranks = {
+        status: iter(ranks_after(last_column_rank(table, workspace_id, status), count))
+        for status, count in Counter(statuses).items()
+    }
+    return [next(ranks[status]) for status in statuses]
@@ -0,0 +1,184 @@
+"""Idempotency keys for Tasks Service create endpoints.
+
+A client may send an Idempotency-Key header with a create request. The first
+request claims the key with a conditional put of an IN_PROGRESS record
+(PK IDEMPOTENCY#{hash}, SK REQUEST), runs, and stores its response on the
+record. A retry with the same key gets the stored response back without the
+tasks being created again. Records hold a hash of the request rather than the
+request itself, so a key reused for a different request is rejected, and they
+expire through the table's TTL.
+"""
+
+import hashlib
+import json
+import time
+import zlib
+from decimal import Decimal
+from botocore.exceptions import ClientError
+from .utils import build_response, get_header
+
+# Request header carrying the client's key
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+# Response header set on a replayed response
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+
+# Longest key accepted
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+
+# How long a completed request is remembered
+IDEMPOTENCY_TTL_SECONDS = 24 * 60 * 60
+
+# How long a claim blocks retries, longer than the API Gateway timeout, so a
+# request that died mid-way can be retried
+IN_PROGRESS_TIMEOUT_SECONDS = 60
+
+
+def _default(value):
+    """Serialize DynamoDB numbers in request bodies."""
+    if isinstance(value, Decimal):
+        return int(value) if value % 1 == 0 else float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def parse_idempotency_key(event):
+    """Read the Idempotency-Key header.
+
+    Returns a tuple of (key, error), with key None when the header is absent.
+    """
+    key = get_header(event, IDEMPOTENCY_KEY_HEADER)
+    if key is None:
+        return None, None
+    if not key.strip() or len(key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+        return None, f"{IDEMPOTENCY_KEY_HEADER} must be 1 to {MAX_IDEMPOTENCY_KEY_LENGTH} characters"
+    return key, None
+
+
+def hash_request(payload):
+    """Hash a parsed request body, ignoring key order and whitespace."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=_default)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def idempotency_record_key(scope, key):
+    """Primary key of the record for a key used in a scope.
+
+    The scope names the caller and endpoint, so two callers (or two endpoints)
+    never share a record for the same key.
+    """
+    digest = hashlib.sha256(f"{scope}\n{key}".encode("utf-8")).hexdigest()
+    return {"PK": f"IDEMPOTENCY#{digest}", "SK": "REQUEST"}
+
+
+def claim_request(table, record_key, request_hash):
+    """Claim a key with an IN_PROGRESS record.
+
+    An expired record that TTL has not removed yet, or a claim whose request
+    timed out, is taken over. Returns None when the claim succeeds, otherwise
+    the existing record.
+    """
+    now = int(time.time())
+    try:
+        table.put_item(
+            Item={
+                **record_key,
+                "entity_type": "IDEMPOTENCY",
+                "status": "IN_PROGRESS",
+                "request_hash": request_hash,
+                "locked_until": now + IN_PROGRESS_TIMEOUT_SECONDS,
+                "expires_at": now + IDEMPOTENCY_TTL_SECONDS
+            },
+            ConditionExpression="attribute_not_exists(PK) OR expires_at < :now OR "
+                                "(#status = :in_progress AND locked_until < :now)",
+            ExpressionAttributeNames={"#status": "status"},
+            ExpressionAttributeValues={":now": now, ":in_progress": "IN_PROGRESS"}
+        )
+        return None
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+            raise
+
+    record = table.get_item(Key=record_key, ConsistentRead=True).get("Item")
+    # The holder released the key between the put and the read
+    return record or claim_request(table, record_key, request_hash)
+
+
+def save_response(table, record_key, response):
+    """Store a finished request's response on its record.
+
+    The body is compressed, a bulk create's results compress well.
+    """
+    table.update_item(
+        Key=record_key,
+        UpdateExpression="SET #status = :completed, status_code = :status_code, "
+                         "response_body = :body, response_headers = :headers REMOVE locked_until",
+        ExpressionAttributeNames={"#status": "status"},
+        ExpressionAttributeValues={
+            ":completed": "COMPLETED",
+            ":status_code": response["statusCode"],
+            ":body": zlib.compress(response["body"].encode("utf-8")),
+            ":headers": response.get("headers", {})
+        }
+    )
+
+
+def release_request(table, record_key):
+    """Delete a claim so the request can be retried."""
+    table.delete_item(Key=record_key)
+
+
+def replay_response(record):
+    """Rebuild the stored response of a completed record."""
+    return {
+        "statusCode": int(record["status_code"]),
+        "body": zlib.decompress(bytes(record["response_body"])).decode("utf-8"),
+        "headers": {**record.get("response_headers", {}), IDEMPOTENT_REPLAYED_HEADER: "true"}
+    }
+
+
+def run_idempotent(table, event, scope, payload, execute, logger):
+    """Run a create request at most once per Idempotency-Key.
+
+    execute() performs the request and returns its response. Without the
+    header it simply runs. With it, a retry of a completed request gets the
+    stored response, a retry while the first attempt runs gets 409 and a key
+    reused with a different body gets 422. Server errors and conflicts (a
+    subtask's parent moving meanwhile) release the key so the client can retry
+    them.
+    """
+    key, key_error = parse_idempotency_key(event)
+    if key_error:
+        return build_response(400, {"message": key_error})
+    if key is None:
+        return execute()
+
+    record_key = idempotency_record_key(scope, key)
+    request_hash = hash_request(payload)
+
+    record = claim_request(table, record_key, request_hash)
+    if record:
+        if record.get("request_hash") != request_hash:
+            return build_response(422, {"message": f"{IDEMPOTENCY_KEY_HEADER} was already used with a different request"})
+        if record.get("status") == "COMPLETED":
+            logger.info("Replaying stored response for idempotency key")
+            return replay_response(record)
+        return build_response(409, {"message": f"A request with this {IDEMPOTENCY_KEY_HEADER} is still in progress"})
+
+    try:
+        response = execute()
+    except Exception:
+        release_request(table, record_key)
+        raise
+
+    if response["statusCode"] >= 500 or response["statusCode"] == 409:
+        release_request(table, record_key)
+        return response
+
+    try:
+        save_response(table, record_key, response)
+    except ClientError:
+        # The request went through, a retry after this creates its tasks again
+        logger.exception("Failed to store response for idempotency key")
+        release_request(table, record_key)
+
+    return response
@@ -0,0 +1,99 @@
+"""Pagination helpers for Tasks Service queries."""
+
+# Key attributes for the base table and each GSI, used to rebuild resume keys
+TABLE_KEY_ATTRIBUTES = ("PK", "SK")
+INDEX_KEY_ATTRIBUTES = {
+    "GSI1": ("GSI1PK", "GSI1SK"),
+    "GSI2": ("GSI2PK", "GSI2SK"),
+    "GSI3": ("GSI3PK", "GSI3SK"),
+    "GSI4": ("GSI4PK", "GSI4SK"),
+    "GSI5": ("GSI5PK", "GSI5SK"),
+    "GSI6": ("GSI6PK", "GSI6SK"),
+    "GSI7": ("GSI7PK", "GSI7SK"),
+    "GSI8": ("GSI8PK", "GSI8SK"),
+}
+
+# Read capacity budget (in RCUs) for a single fill-page request
+DEFAULT_READ_CAPACITY_BUDGET = 25
+MAX_READ_CAPACITY_BUDGET = 100
+
+# Items evaluated per query when a filter expression discards results
+FILL_PAGE_SCAN_SIZE = 100
+
+
+def parse_capacity_budget(value):
+    """Parse a read capacity budget query parameter, falling back to the default."""
+    if value is None:
+        return DEFAULT_READ_CAPACITY_BUDGET
+
+    try:
+        budget = float(value)
+    except (TypeError, ValueError):
+        return DEFAULT_READ_CAPACITY_BUDGET
+
+    if budget <= 0:
+        return DEFAULT_READ_CAPACITY_BUDGET
+
+    return min(budget, MAX_READ_CAPACITY_BUDGET)
+
+
+def key_from_item(item, index_name=None):
+    """Build the ExclusiveStartKey that resumes a query right after an item."""
+    key_attributes = TABLE_KEY_ATTRIBUTES
+    if index_name:
+        key_attributes = key_attributes + INDEX_KEY_ATTRIBUTES[index_name]
+
+    return {attr: item[attr] for attr in key_attributes if attr in item}
+
+
+def query_fill_page(table, query_args, page_size, capacity_budget=DEFAULT_READ_CAPACITY_BUDGET):
+    """Query until the page is full, the results run out, or the capacity budget is spent.
+
+    FilterExpression is applied after Limit, so a single query over a sparse
+    filter can return a short or empty page. This keeps following
+    LastEvaluatedKey server-side instead of handing that loop to the client.
+
+    Returns a tuple of (items, last_evaluated_key, stats) where stats reports
+    the number of queries issued, items scanned and read capacity consumed.
+    """
+    args = dict(query_args)
+    args["ReturnConsumedCapacity"] = "TOTAL"
+    index_name = args.get("IndexName")
+    has_filter = "FilterExpression" in args
+
+    items = []
+    last_evaluated_key = None
+    stats = {"query_count": 0, "scanned_count": 0, "consumed_capacity": 0.0}
+
+    while True:
+        remaining = page_size - len(items)
+
+        # With a filter most evaluated items are discarded, so read ahead
+        args["Limit"] = max(remaining, FILL_PAGE_SCAN_SIZE) if has_filter else remaining
+
+        response = table.query(**args)
+        stats["query_count"] += 1
+        stats["scanned_count"] += response.get("ScannedCount", 0)
+        stats["consumed_capacity"] += float(
+            response.get("ConsumedCapacity", {}).get("CapacityUnits", 0)
+        )
+
+        page_items = response.get("Items", [])
+        last_evaluated_key = response.get("LastEvaluatedKey")
+
+        if len(page_items) > remaining:
+            # Read-ahead overshot the page; resume right after the last item kept
+            page_items = page_items[:remaining]
+            last_evaluated_key = key_from_item(page_items[-1], index_name)
+
+        items.extend(page_items)
+
+        if len(items) >= page_size or not last_evaluated_key:
+            break
+
+        if stats["consumed_capacity"] >= capacity_budget:
+            break
+
+        args["ExclusiveStartKey"] = last_evaluated_key
+
+    return items, last_evaluated_key, stats
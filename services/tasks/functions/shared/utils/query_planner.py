@@ -0,0 +1,332 @@
+"""Query planning for task list requests.
+
+Picks the index whose sort key can serve the most selective filters as a key
+condition, and leaves the remaining filters to a FilterExpression.
+"""
+
+import os
+import re
+from datetime import datetime, timezone
+from boto3.dynamodb.conditions import Key
+from ..models.task_models import (
+    VALID_STATUSES,
+    VALID_PRIORITIES,
+    status_key_prefix,
+    priority_key_prefix,
+    assignee_key_prefix,
+    due_date_key_range,
+    assignee_due_date_key_range,
+    rank_key_prefix,
+    created_key_range,
+    task_id_key_range,
+    get_timestamp,
+    build_projection
+)
+from .pagination import TABLE_KEY_ATTRIBUTES, INDEX_KEY_ATTRIBUTES
+from .cursor import build_cursor_scope
+
+# Due dates are ISO 8601 dates, optionally with a time
+DUE_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+# Query parameters that shape a task query, a cursor is only valid for the same values
+CURSOR_SCOPE_PARAMS = [
+    "status", "priority", "assignee_id", "tag", "due_date_start", "due_date_end", "created_start", "created_end", "sort"
+]
+
+# Date from which every new task has a time-ordered ID, set once the rollout has
+# finished. Creation windows from then on are read from the table's own keys.
+TIME_ORDERED_IDS_SINCE = os.environ.get("TIME_ORDERED_IDS_SINCE", "")
+
+# Index whose sort key orders tasks by each sortable field
+SORT_INDEXES = {
+    "priority": "GSI3",
+    "due_date": "GSI4",
+    "created_at": "GSI5",
+    "updated_at": "GSI6",
+    "rank": "GSI8",
+}
+
+def parse_sort(value):
+    """Parse a sort parameter such as 'due_date' or '-due_date' (descending).
+
+    Returns a tuple of ((field, descending), error).
+    """
+    if not value:
+        return None, None
+
+    descending = value.startswith('-')
+    field = value[1:] if descending else value
+
+    if field not in SORT_INDEXES:
+        return None, f"Invalid sort value. Must be one of: {', '.join(SORT_INDEXES)} (prefix with '-' for descending)"
+
+    return (field, descending), None
+
+def parse_due_date_range(query_params):
+    """Parse the due_date_start/due_date_end parameters.
+
+    Returns a tuple of ((start, end), error), or (None, None) when neither is given.
+    """
+    start = query_params.get('due_date_start') or None
+    end = query_params.get('due_date_end') or None
+
+    if not start and not end:
+        return None, None
+
+    for name, value in (('due_date_start', start), ('due_date_end', end)):
+        if value and not DUE_DATE_PATTERN.match(value):
+            return None, f"Invalid {name}. Must be an ISO 8601 date (YYYY-MM-DD)"
+
+    if start and end and start > end:
+        return None, "due_date_start must not be after due_date_end"
+
+    return (start, end), None
+
+def _normalize_timestamp(value):
+    """Bring an ISO date or time to created_at's form, a naive UTC time.
+
+    Returns None for values that are not ISO 8601.
+    """
+    try:
+        moment = datetime.fromisoformat(value.rstrip("Z"))
+    except ValueError:
+        return None
+    if len(value) == len("YYYY-MM-DD"):
+        return value
+    if moment.tzinfo:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment.isoformat()
+
+def parse_created_range(query_params):
+    """Parse the created_start/created_end parameters.
+
+    Returns a tuple of ((start, end), error) with both in created_at's form,
+    or (None, None) when neither is given.
+    """
+    created_range = []
+    for name in ('created_start', 'created_end'):
+        value = query_params.get(name) or None
+        if value:
+            value = _normalize_timestamp(value)
+            if not value:
+                return None, f"Invalid {name}. Must be an ISO 8601 date or time"
+        created_range.append(value)
+
+    start, end = created_range
+    if not start and not end:
+        return None, None
+
+    if start and end and start > end:
+        return None, "created_start must not be after created_end"
+
+    return (start, end), None
+
+def _index_query(index_name, workspace_key, sort_key_prefix=None):
+    """Build Query arguments for a workspace-partitioned GSI."""
+    key_condition = Key(f"{index_name}PK").eq(workspace_key)
+    if sort_key_prefix:
+        key_condition = key_condition & Key(f"{index_name}SK").begins_with(sort_key_prefix)
+
+    return {
+        'IndexName': index_name,
+        'KeyConditionExpression': key_condition
+    }
+
+def _due_date_range_query(workspace_key, due_range, assignee_id=None):
+    """Build Query arguments for tasks due within a date range.
+
+    Uses GSI7 for one assignee's tasks and GSI4 for the whole workspace.
+    """
+    if assignee_id:
+        index_name = 'GSI7'
+        low, high = assignee_due_date_key_range(assignee_id, *due_range)
+    else:
+        index_name = 'GSI4'
+        low, high = due_date_key_range(*due_range)
+
+    return {
+        'IndexName': index_name,
+        'KeyConditionExpression': Key(f"{index_name}PK").eq(workspace_key) &
+                                  Key(f"{index_name}SK").between(low, high)
+    }
+
+def _created_range_query(workspace_key, created_range):
+    """Build Query arguments for tasks created within a time range.
+
+    Windows that start once every new task had a time-ordered ID are a key
+    range on the table itself, whose TASK#{task_id} sort keys are in creation
+    order. Earlier windows may hold uuid4 IDs and read GSI5.
+    """
+    start, end = created_range
+    if TIME_ORDERED_IDS_SINCE and start and start >= TIME_ORDERED_IDS_SINCE:
+        low, high = task_id_key_range(start, end or get_timestamp())
+        return {
+            'KeyConditionExpression': Key('PK').eq(workspace_key) & Key('SK').between(low, high)
+        }
+
+    low, high = created_key_range(start, end)
+    return {
+        'IndexName': 'GSI5',
+        'KeyConditionExpression': Key('GSI5PK').eq(workspace_key) & Key('GSI5SK').between(low, high)
+    }
+
+def plan_task_query(workspace_id, query_params, sort=None, due_range=None, created_range=None):
+    """Build Query arguments for listing tasks in a workspace.
+
+    sort is a (field, descending) tuple from parse_sort. When given, the index
+    is chosen for its ordering and filters it cannot serve become filter
+    expressions. due_range is a (start, end) tuple from parse_due_date_range
+    and is served by the due date index unless another sort order is requested.
+    created_range from parse_created_range is served the same way, newest first
+    unless sorted otherwise.
+    """
+    workspace_key = f"WORKSPACE#{workspace_id}"
+
+    status = (query_params.get('status') or '').upper()
+    if status not in VALID_STATUSES:
+        status = None
+
+    priority = (query_params.get('priority') or '').upper()
+    if priority not in VALID_PRIORITIES:
+        priority = None
+
+    assignee_id = query_params.get('assignee_id') or None
+
+    # Filters not yet served by the key condition
+    attribute_filters = {"status": status, "priority": priority, "assignee_id": assignee_id}
+    due_range_served = False
+    created_range_served = False
+
+    if sort:
+        sort_field, descending = sort
+
+        if sort_field == "due_date" and due_range:
+            query_args = _due_date_range_query(workspace_key, due_range, assignee_id)
+            attribute_filters.update(assignee_id=None)
+            due_range_served = True
+        elif sort_field == "created_at" and created_range:
+            query_args = _created_range_query(workspace_key, created_range)
+            created_range_served = True
+        elif sort_field == "due_date" and assignee_id:
+            # GSI7 orders each assignee's tasks by due date
+            query_args = _index_query('GSI7', workspace_key, assignee_key_prefix(assignee_id))
+            attribute_filters.update(assignee_id=None)
+        elif sort_field == "priority" and status:
+            # GSI1 orders each status by priority rank
+            query_args = _index_query('GSI1', workspace_key, status_key_prefix(status, priority))
+            attribute_filters.update(status=None, priority=None)
+        elif sort_field == "priority":
+            query_args = _index_query('GSI3', workspace_key, priority and priority_key_prefix(priority))
+            attribute_filters.update(priority=None)
+        elif sort_field == "rank" and status:
+            # GSI8 orders each status column by rank, the board's order
+            query_args = _index_query('GSI8', workspace_key, rank_key_prefix(status))
+            attribute_filters.update(status=None)
+        else:
+            query_args = _index_query(SORT_INDEXES[sort_field], workspace_key)
+
+        query_args['ScanIndexForward'] = not descending
+    elif due_range:
+        # GSI4/GSI7: due date range as a key condition, earliest first
+        query_args = _due_date_range_query(workspace_key, due_range, assignee_id)
+        attribute_filters.update(assignee_id=None)
+        due_range_served = True
+    elif created_range:
+        # Table or GSI5: creation window as a key condition, newest first
+        query_args = _created_range_query(workspace_key, created_range)
+        query_args['ScanIndexForward'] = False
+        created_range_served = True
+    elif assignee_id:
+        # GSI2: tasks by assignee, or assignee and status, as a sort key prefix
+        query_args = _index_query('GSI2', workspace_key, assignee_key_prefix(assignee_id, status))
+        attribute_filters.update(assignee_id=None, status=None)
+    elif status:
+        # GSI1: status, or status and priority, as a sort key prefix
+        query_args = _index_query('GSI1', workspace_key, status_key_prefix(status, priority))
+        attribute_filters.update(status=None, priority=None)
+    elif priority:
+        # GSI3: priority as a sort key prefix
+        query_args = _index_query('GSI3', workspace_key, priority_key_prefix(priority))
+        attribute_filters.update(priority=None)
+    else:
+        # GSI1: all tasks in the workspace
+        query_args = _index_query('GSI1', workspace_key)
+
+    filter_conditions = []
+    expression_attr_names = {}
+    expression_attr_values = {}
+
+    # Filter on whatever the key condition could not serve
+    for field, value in attribute_filters.items():
+        if value:
+            filter_conditions.append(f"#{field} = :{field}")
+            expression_attr_names[f"#{field}"] = field
+            expression_attr_values[f":{field}"] = value
+
+    # Filter by tags (if present)
+    if 'tag' in query_params:
+        filter_conditions.append("contains(#tags, :tag)")
+        expression_attr_names["#tags"] = "tags"
+        expression_attr_values[":tag"] = query_params['tag']
+
+    # Filter by due date range when another sort order took the key condition
+    if due_range and not due_range_served:
+        due_date_start, due_date_end = due_range
+
+        if due_date_start:
+            filter_conditions.append("#due_date >= :due_date_start")
+            expression_attr_names["#due_date"] = "due_date"
+            expression_attr_values[":due_date_start"] = due_date_start
+
+        if due_date_end:
+            filter_conditions.append("#due_date <= :due_date_end")
+            expression_attr_names["#due_date"] = "due_date"
+            expression_attr_values[":due_date_end"] = due_date_end
+
+    # Creation windows on the table are widened for clock slack, created_at sets
+    # their exact edges, and the table also holds deleted tasks
+    if created_range and (not created_range_served or 'IndexName' not in query_args):
+        created_start, created_end = created_range
+
+        if created_start:
+            filter_conditions.append("#created_at >= :created_start")
+            expression_attr_names["#created_at"] = "created_at"
+            expression_attr_values[":created_start"] = created_start
+
+        if created_end:
+            filter_conditions.append("#created_at <= :created_end")
+            expression_attr_names["#created_at"] = "created_at"
+            expression_attr_values[":created_end"] = f"{created_end}~"
+
+    if 'IndexName' not in query_args:
+        filter_conditions.append("attribute_not_exists(deleted_at)")
+
+    # Combine filter conditions if any exist
+    if filter_conditions:
+        query_args['FilterExpression'] = " AND ".join(filter_conditions)
+        query_args['ExpressionAttributeNames'] = expression_attr_names
+        query_args['ExpressionAttributeValues'] = expression_attr_values
+
+    return query_args
+
+def add_projection(query_args, fields):
+    """Read only the selected fields, plus the keys needed to resume the query."""
+    attributes = list(fields) + list(TABLE_KEY_ATTRIBUTES)
+    if query_args.get('IndexName'):
+        attributes += INDEX_KEY_ATTRIBUTES[query_args['IndexName']]
+
+    projection, attr_names = build_projection(attributes)
+    query_args['ProjectionExpression'] = projection
+    query_args['ExpressionAttributeNames'] = {
+        **query_args.get('ExpressionAttributeNames', {}),
+        **attr_names
+    }
+
+    return query_args
+
+def task_cursor_scope(workspace_id, index_name, query_params):
+    """Scope that binds a task list cursor to its workspace, index and filters."""
+    return build_cursor_scope(
+        "tasks", workspace_id, index_name,
+        **{param: query_params.get(param) for param in CURSOR_SCOPE_PARAMS}
+    )
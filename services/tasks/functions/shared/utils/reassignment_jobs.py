@@ -0,0 +1,206 @@
+"""Bulk reassignment jobs for the Tasks Service.
+
+A job moves every task assigned to one user in a workspace to another user,
+or unassigns them. The job item lives in the workspace partition (SK
+JOB#{job_id}) and records how far the walk over the user's GSI2 range got, so
+a run that stops early resumes where it left off.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from boto3.dynamodb.conditions import Key
+from botocore.exceptions import ClientError
+from ..models.task_models import (
+    assignee_key_prefix,
+    prepare_conditional_update,
+    generate_id,
+    get_timestamp
+)
+
+# Sort key prefix of job items in a workspace partition
+JOB_KEY_PREFIX = "JOB#"
+
+JOB_STATUSES = ["PENDING", "RUNNING", "COMPLETED", "FAILED"]
+
+# Job attributes returned by the job status endpoint
+JOB_FIELDS = [
+    "job_id", "workspace_id", "status", "from_assignee_id", "to_assignee_id",
+    "processed", "reassigned", "skipped", "created_at", "updated_at", "completed_at",
+    "created_by", "error"
+]
+
+# Updates in flight at once, the pool is kept across warm invocations.
+# The table's low-level client is thread-safe, unlike the resource.
+executor = ThreadPoolExecutor(max_workers=8)
+
+
+def job_key(workspace_id, job_id):
+    """Primary key of a job item."""
+    return {"PK": f"WORKSPACE#{workspace_id}", "SK": f"{JOB_KEY_PREFIX}{job_id}"}
+
+
+def create_job_item(workspace_id, from_assignee_id, to_assignee_id, creator_id):
+    """Create a DynamoDB item for a new reassignment job."""
+    job_id = generate_id(prefix="job-")
+    timestamp = get_timestamp()
+
+    return {
+        **job_key(workspace_id, job_id),
+        "job_id": job_id,
+        "workspace_id": workspace_id,
+        "job_type": "REASSIGN_TASKS",
+        "status": "PENDING",
+        "from_assignee_id": from_assignee_id,
+        "to_assignee_id": to_assignee_id,
+        "processed": 0,
+        "reassigned": 0,
+        "skipped": 0,
+        "created_at": timestamp,
+        "updated_at": timestamp,
+        "created_by": creator_id,
+        "entity_type": "JOB"
+    }
+
+
+def get_job(table, workspace_id, job_id):
+    """Read a job item with a strongly consistent GetItem."""
+    response = table.get_item(Key=job_key(workspace_id, job_id), ConsistentRead=True)
+    return response.get("Item")
+
+
+def save_job_progress(table, job, status, last_evaluated_key=None, stats=None, error=None):
+    """Persist a job's status, resume key and running totals.
+
+    stats holds counts to add to the job's processed, reassigned and skipped totals.
+    """
+    timestamp = get_timestamp()
+    expression_attr_names = {"#status": "status"}
+    expression_attr_values = {":status": status, ":updated_at": timestamp}
+    set_clauses = ["#status = :status", "updated_at = :updated_at"]
+    add_clauses = []
+    remove_clauses = []
+
+    if last_evaluated_key:
+        expression_attr_values[":last_evaluated_key"] = last_evaluated_key
+        set_clauses.append("last_evaluated_key = :last_evaluated_key")
+    else:
+        remove_clauses.append("last_evaluated_key")
+
+    if status == "COMPLETED":
+        expression_attr_values[":completed_at"] = timestamp
+        set_clauses.append("completed_at = :completed_at")
+
+    if error:
+        expression_attr_values[":error"] = error
+        set_clauses.append("#error = :error")
+        expression_attr_names["#error"] = "error"
+
+    for counter, value in (stats or {}).items():
+        if value:
+            expression_attr_names[f"#{counter}"] = counter
+            expression_attr_values[f":{counter}"] = value
+            add_clauses.append(f"#{counter} :{counter}")
+
+    update_expression = f"SET {', '.join(set_clauses)}"
+    if add_clauses:
+        update_expression += f" ADD {', '.join(add_clauses)}"
+    if remove_clauses:
+        update_expression += f" REMOVE {', '.join(remove_clauses)}"
+
+    table.update_item(
+        Key={"PK": job["PK"], "SK": job["SK"]},
+        UpdateExpression=update_expression,
+        ExpressionAttributeNames=expression_attr_names,
+        ExpressionAttributeValues=expression_attr_values
+    )
+
+
+def query_assigned_page(table, job, page_size):
+    """Read the next page of the job's source assignee's tasks from GSI2.
+
+    Returns a tuple of (tasks, last_evaluated_key, consumed_capacity).
+    """
+    query_args = {
+        "IndexName": "GSI2",
+        "KeyConditionExpression": Key("GSI2PK").eq(f"WORKSPACE#{job['workspace_id']}") &
+                                  Key("GSI2SK").begins_with(assignee_key_prefix(job["from_assignee_id"])),
+        "Limit": page_size,
+        "ReturnConsumedCapacity": "TOTAL"
+    }
+    if job.get("last_evaluated_key"):
+        query_args["ExclusiveStartKey"] = job["last_evaluated_key"]
+
+    response = table.query(**query_args)
+    consumed = float(response.get("ConsumedCapacity", {}).get("CapacityUnits", 0))
+
+    return response.get("Items", []), response.get("LastEvaluatedKey"), consumed
+
+
+def build_reassign_update(job, task):
+    """Build the update moving one task to the job's target assignee.
+
+    The GSI2 projection already carries the status and due date the new keys
+    are built from, so no read is needed. The update only applies while the
+    task is still assigned to the source user and those fields are unchanged.
+    """
+    update_expr, expr_attr_values, expr_attr_names, condition = prepare_conditional_update(
+        job["workspace_id"], task["task_id"], {"assignee_id": job.get("to_assignee_id"), "updated_by": job["created_by"]},
+        {field: task[field] for field in ("status", "due_date") if field in task}
+    )
+
+    expr_attr_values[":from_assignee_id"] = job["from_assignee_id"]
+
+    return {
+        "Key": {"PK": task["PK"], "SK": task["SK"]},
+        "UpdateExpression": update_expr,
+        "ConditionExpression": f"{condition} AND #assignee_id = :from_assignee_id",
+        "ExpressionAttributeNames": expr_attr_names,
+        "ExpressionAttributeValues": expr_attr_values,
+        "ReturnConsumedCapacity": "TOTAL"
+    }
+
+
+def _reassign_task(client, table_name, update_args):
+    """Apply one reassignment update.
+
+    Returns a tuple of (reassigned, consumed_capacity).
+    """
+    try:
+        response = client.update_item(TableName=table_name, **update_args)
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+            raise
+        # Reassigned, edited or deleted since the index was read, a failed
+        # condition still costs a write unit
+        return False, 1.0
+
+    return True, float(response.get("ConsumedCapacity", {}).get("CapacityUnits", 0))
+
+
+def reassign_tasks(table, job, tasks):
+    """Reassign a page of tasks with concurrent conditional updates.
+
+    Returns a tuple of (reassigned_tasks, consumed_capacity).
+    """
+    futures = [
+        executor.submit(_reassign_task, table.meta.client, table.name, build_reassign_update(job, task))
+        for task in tasks
+    ]
+
+    reassigned_tasks = []
+    consumed = 0.0
+    for task, future in zip(tasks, futures):
+        reassigned, units = future.result()
+        consumed += units
+        if reassigned:
+            reassigned_tasks.append(task)
+
+    return reassigned_tasks, consumed
+
+
+def pace(consumed_capacity, started_at, capacity_per_second):
+    """Sleep until the capacity consumed since started_at is within the rate limit."""
+    earliest = started_at + consumed_capacity / capacity_per_second
+    delay = earliest - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
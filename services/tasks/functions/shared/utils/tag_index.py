@@ -0,0 +1,147 @@
+"""Tag index for the Tasks Service.
+
+Each tagged task has a reference item per tag in its workspace partition
+(SK TAG#{tag}#TASK#{task_id}), so a tag query reads only the matching tasks.
+A counter item per tag (SK TAGCOUNT#{tag}) tracks how many tasks use it, for
+autocomplete.
+"""
+
+from boto3.dynamodb.conditions import Key
+from ..models.task_models import VALID_STATUSES, VALID_PRIORITIES
+from .batch_reads import batch_get_tasks
+
+
+def tag_key_prefix(tag):
+    """Sort key prefix for the tasks carrying a tag."""
+    return f"TAG#{tag}#TASK#"
+
+
+def tag_count_key(tag):
+    """Sort key of the counter item for a tag."""
+    return f"TAGCOUNT#{tag}"
+
+
+def build_tag_item(workspace_id, task_id, tag):
+    """Build the reference item linking a tag to a task."""
+    return {
+        "PK": f"WORKSPACE#{workspace_id}",
+        "SK": f"{tag_key_prefix(tag)}{task_id}",
+        "entity_type": "TAG",
+        "workspace_id": workspace_id,
+        "task_id": task_id,
+        "tag": tag
+    }
+
+
+def sync_task_tags(table, workspace_id, task_id, old_tags=None, new_tags=None):
+    """Write tag references and counters for a change in a task's tags.
+
+    Pass old_tags=None for a new task and new_tags=None for a deleted one.
+    """
+    old_tags = set(old_tags or [])
+    new_tags = set(new_tags or [])
+    added = new_tags - old_tags
+    removed = old_tags - new_tags
+
+    if not added and not removed:
+        return
+
+    workspace_key = f"WORKSPACE#{workspace_id}"
+
+    with table.batch_writer() as batch:
+        for tag in added:
+            batch.put_item(Item=build_tag_item(workspace_id, task_id, tag))
+        for tag in removed:
+            batch.delete_item(Key={"PK": workspace_key, "SK": f"{tag_key_prefix(tag)}{task_id}"})
+
+    deltas = {tag: 1 for tag in added}
+    deltas.update({tag: -1 for tag in removed})
+    apply_tag_count_deltas(table, workspace_id, deltas)
+
+
+def apply_tag_count_deltas(table, workspace_id, deltas):
+    """Add changes to tag counters, given as a dict of tag to delta."""
+    # Counters are atomic adds, so concurrent writers do not lose updates
+    for tag, delta in deltas.items():
+        if not delta:
+            continue
+        table.update_item(
+            Key={"PK": f"WORKSPACE#{workspace_id}", "SK": tag_count_key(tag)},
+            UpdateExpression="SET entity_type = :entity_type, tag = :tag ADD task_count :delta",
+            ExpressionAttributeValues={":entity_type": "TAG_COUNT", ":tag": tag, ":delta": delta}
+        )
+
+
+def _matches_filters(task, query_params):
+    """Apply the list_tasks attribute filters to a task."""
+    status = (query_params.get("status") or "").upper()
+    if status in VALID_STATUSES and task.get("status") != status:
+        return False
+
+    priority = (query_params.get("priority") or "").upper()
+    if priority in VALID_PRIORITIES and task.get("priority") != priority:
+        return False
+
+    assignee_id = query_params.get("assignee_id")
+    if assignee_id and task.get("assignee_id") != assignee_id:
+        return False
+
+    return True
+
+
+def query_tagged_tasks(table, workspace_id, tag, query_params, page_size,
+                       exclusive_start_key=None, fields=None):
+    """List a page of tasks carrying a tag.
+
+    Reads the tag's reference items, then fetches only those tasks. Status,
+    priority and assignee filters apply to the fetched tasks, so like a
+    FilterExpression they can return a short page with a resume key.
+    fields limits the attributes read from each task.
+
+    Returns a tuple of (tasks, last_evaluated_key, unprocessed_keys), where
+    unprocessed_keys holds tasks left unread by throttling.
+    """
+    query_args = {
+        "KeyConditionExpression": Key("PK").eq(f"WORKSPACE#{workspace_id}") &
+                                  Key("SK").begins_with(tag_key_prefix(tag)),
+        "ProjectionExpression": "PK, task_id",
+        "Limit": page_size
+    }
+    if exclusive_start_key:
+        query_args["ExclusiveStartKey"] = exclusive_start_key
+
+    response = table.query(**query_args)
+
+    keys = [
+        {"PK": ref["PK"], "SK": f"TASK#{ref['task_id']}"}
+        for ref in response.get("Items", [])
+    ]
+    attributes = fields and list(fields) + ["status", "priority", "assignee_id"]
+    fetched, unprocessed_keys = batch_get_tasks(table, keys, attributes)
+    tasks = [task for task in fetched if _matches_filters(task, query_params)]
+
+    return tasks, response.get("LastEvaluatedKey"), unprocessed_keys
+
+
+def list_tag_counts(table, workspace_id, prefix="", limit=10):
+    """List the most used tags in a workspace, optionally by name prefix."""
+    query_args = {
+        "KeyConditionExpression": Key("PK").eq(f"WORKSPACE#{workspace_id}") &
+                                  Key("SK").begins_with(tag_count_key(prefix))
+    }
+
+    counts = []
+    while True:
+        response = table.query(**query_args)
+        counts.extend(
+            {"tag": item["tag"], "count": int(item["task_count"])}
+            for item in response.get("Items", [])
+            if item.get("task_count", 0) > 0
+        )
+
+        if "LastEvaluatedKey" not in response:
+            break
+        query_args["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    counts.sort(key=lambda entry: (-entry["count"], entry["tag"]))
+    return counts[:limit]
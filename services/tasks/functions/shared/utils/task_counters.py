@@ -0,0 +1,213 @@
+"""Per-workspace task counters for the Tasks Service.
+
+Each workspace has one counts item (SK COUNTS) with a flat counter attribute
+per bucket: TOTAL, STATUS#{status}, PRIORITY#{priority} and ASSIGNEE#{user}.
+The tasks table stream folds the difference between each task's old and new
+buckets into the item with an ADD, and records the stream position it folded
+up to, so a retried batch is not counted twice. A daily recount repairs drift
+in workspaces with no recent changes. Every ADD also bumps the item's
+counter_revision, so a recount only replaces counters that did not change
+while it ran.
+"""
+
+from boto3.dynamodb.conditions import Key
+from botocore.exceptions import ClientError
+from ..models.task_models import VALID_STATUSES, VALID_PRIORITIES, get_timestamp
+
+# Sort key of the counts item in each workspace partition
+COUNTS_SK = "COUNTS"
+
+TOTAL_COUNTER = "TOTAL"
+
+# Attribute every counter change increments
+REVISION_ATTRIBUTE = "counter_revision"
+
+# Attribute holding the last stream position folded into the counters
+STREAM_POSITION_ATTRIBUTE = "stream_position"
+
+# Stream sequence numbers are up to 40 digits, padded so positions compare as strings
+STREAM_POSITION_DIGITS = 40
+
+# Recounts of a workspace whose counters keep changing before giving up until the next run
+MAX_RECONCILE_ATTEMPTS = 3
+
+
+def task_buckets(task):
+    """List the counter attributes a task counts towards."""
+    if not task:
+        return []
+
+    buckets = [
+        TOTAL_COUNTER,
+        f"STATUS#{task.get('status', 'BACKLOG')}",
+        f"PRIORITY#{task.get('priority', 'MEDIUM')}"
+    ]
+    if task.get("assignee_id"):
+        buckets.append(f"ASSIGNEE#{task['assignee_id']}")
+    return buckets
+
+
+def counter_deltas(old_task=None, new_task=None):
+    """Compute counter changes for a task moving from old_task to new_task.
+
+    Pass old_task=None for a created task and new_task=None for a deleted one.
+    Buckets the task stays in are left out.
+    """
+    deltas = {}
+    for bucket in task_buckets(old_task):
+        deltas[bucket] = deltas.get(bucket, 0) - 1
+    for bucket in task_buckets(new_task):
+        deltas[bucket] = deltas.get(bucket, 0) + 1
+
+    return {bucket: delta for bucket, delta in deltas.items() if delta}
+
+
+def stream_position(sequence_number):
+    """Pad a stream record's sequence number so positions compare in order."""
+    return sequence_number.rjust(STREAM_POSITION_DIGITS, "0")
+
+
+def apply_counter_deltas(table, workspace_id, deltas, positions=None):
+    """Atomically add counter changes to a workspace's counts item.
+
+    positions is the (first, last) stream position the changes were folded
+    from. The write is skipped if the counters already include the first one,
+    as when the stream retries a batch. Returns True if the changes were added.
+    """
+    if not deltas:
+        return False
+
+    expression_attr_names = {"#revision": REVISION_ATTRIBUTE}
+    expression_attr_values = {":entity_type": "TASK_COUNTS", ":one": 1}
+    set_clauses = ["entity_type = :entity_type"]
+    add_clauses = ["#revision :one"]
+
+    for i, (bucket, delta) in enumerate(sorted(deltas.items())):
+        expression_attr_names[f"#c{i}"] = bucket
+        expression_attr_values[f":c{i}"] = delta
+        add_clauses.append(f"#c{i} :c{i}")
+
+    update_args = {}
+    if positions:
+        expression_attr_names["#position"] = STREAM_POSITION_ATTRIBUTE
+        expression_attr_values[":first"], expression_attr_values[":last"] = positions
+        set_clauses.append("#position = :last")
+        update_args["ConditionExpression"] = "attribute_not_exists(#position) OR #position < :first"
+
+    try:
+        table.update_item(
+            Key={"PK": f"WORKSPACE#{workspace_id}", "SK": COUNTS_SK},
+            UpdateExpression=f"SET {', '.join(set_clauses)} ADD {', '.join(add_clauses)}",
+            ExpressionAttributeNames=expression_attr_names,
+            ExpressionAttributeValues=expression_attr_values,
+            **update_args
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+            raise
+        return False
+
+    return True
+
+
+def group_counts(item):
+    """Group a counts item into totals by status, priority and assignee."""
+    item = item or {}
+    counts = {
+        "total": int(item.get(TOTAL_COUNTER, 0)),
+        "by_status": {status: int(item.get(f"STATUS#{status}", 0)) for status in VALID_STATUSES},
+        "by_priority": {priority: int(item.get(f"PRIORITY#{priority}", 0)) for priority in VALID_PRIORITIES},
+        "by_assignee": {}
+    }
+
+    for attr, value in item.items():
+        if attr.startswith("ASSIGNEE#") and value > 0:
+            counts["by_assignee"][attr[len("ASSIGNEE#"):]] = int(value)
+
+    return counts
+
+
+def get_task_counts(table, workspace_id):
+    """Read a workspace's task counts with a single GetItem."""
+    response = table.get_item(Key={"PK": f"WORKSPACE#{workspace_id}", "SK": COUNTS_SK})
+    return group_counts(response.get("Item"))
+
+
+def count_tasks(table, workspace_id):
+    """Recount a workspace's tasks from the task items themselves.
+
+    Returns a tuple of (counters, last_updated_at), the latest write to any
+    of the tasks, deleted ones included.
+    """
+    query_args = {
+        "KeyConditionExpression": Key("PK").eq(f"WORKSPACE#{workspace_id}") &
+                                  Key("SK").begins_with("TASK#"),
+        "ProjectionExpression": "#status, #priority, #assignee_id, deleted_at, updated_at",
+        "ExpressionAttributeNames": {"#status": "status", "#priority": "priority", "#assignee_id": "assignee_id"},
+        "ConsistentRead": True
+    }
+
+    counters = {}
+    last_updated_at = ""
+    while True:
+        response = table.query(**query_args)
+        for task in response.get("Items", []):
+            last_updated_at = max(last_updated_at, task.get("updated_at", ""))
+            # Tombstones of deleted tasks are no longer counted
+            if "deleted_at" in task:
+                continue
+            for bucket in task_buckets(task):
+                counters[bucket] = counters.get(bucket, 0) + 1
+
+        if "LastEvaluatedKey" not in response:
+            break
+        query_args["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    return counters, last_updated_at
+
+
+def reconcile_task_counts(table, workspace_id, changed_before=None):
+    """Replace a workspace's counts item with a fresh count of its tasks.
+
+    The put is conditional on the counter revision read before the recount, so
+    counter changes made while the tasks were counted are not overwritten; the
+    recount is retried instead. A task written at or after changed_before may
+    not be folded into the counters yet, and counting it now would count it
+    twice, so such a workspace is left alone. Returns the recounted counters,
+    or None if the workspace changed too recently or kept changing.
+    """
+    key = {"PK": f"WORKSPACE#{workspace_id}", "SK": COUNTS_SK}
+
+    for _ in range(MAX_RECONCILE_ATTEMPTS):
+        stored = table.get_item(Key=key, ConsistentRead=True).get("Item") or {}
+        revision = stored.get(REVISION_ATTRIBUTE)
+        counters, last_updated_at = count_tasks(table, workspace_id)
+        if changed_before and last_updated_at >= changed_before:
+            return None
+
+        condition_args = {"ConditionExpression": f"attribute_not_exists({REVISION_ATTRIBUTE})"}
+        if revision is not None:
+            condition_args = {
+                "ConditionExpression": f"{REVISION_ATTRIBUTE} = :revision",
+                "ExpressionAttributeValues": {":revision": revision}
+            }
+
+        item = {
+            **key,
+            "entity_type": "TASK_COUNTS",
+            "reconciled_at": get_timestamp(),
+            REVISION_ATTRIBUTE: (revision or 0) + 1,
+            **counters
+        }
+        # Keep the fold position, so batches already folded stay skipped
+        if STREAM_POSITION_ATTRIBUTE in stored:
+            item[STREAM_POSITION_ATTRIBUTE] = stored[STREAM_POSITION_ATTRIBUTE]
+
+        try:
+            table.put_item(Item=item, **condition_args)
+            return counters
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+
+    return None
@@ -0,0 +1,380 @@
+"""Task dependencies for the Tasks Service.
+
+A "blocked by" link is stored as two items in the workspace partition:
+BLOCKEDBY#{task_id}#BLOCKER#{blocker_id} lists a task's blockers and
+BLOCKS#{blocker_id}#TASK#{task_id} the tasks a blocker holds up. A graph item
+(SK DEPGRAPH#VERSION) carries a version that every link change increments,
+and the plan computed from the graph (topological order and critical path)
+is cached under DEPGRAPH#PLAN for the version it was computed at.
+"""
+
+import json
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from boto3.dynamodb.conditions import Key
+from botocore.exceptions import ClientError
+from ..models.task_models import get_timestamp
+from .batch_writes import batch_write, CONDITION_FAILED
+
+# Sort keys of the graph version and cached plan items
+GRAPH_KEY_PREFIX = "DEPGRAPH#"
+GRAPH_VERSION_SK = "DEPGRAPH#VERSION"
+GRAPH_PLAN_SK = "DEPGRAPH#PLAN"
+
+# Attempts at adding a link while other links in the workspace change
+MAX_GRAPH_WRITE_ATTEMPTS = 3
+
+# Largest compressed plan cached, items are limited to 400 KB
+MAX_CACHED_PLAN_BYTES = 350_000
+
+# Errors returned when a link cannot be added
+CYCLE = "CYCLE"
+LINK_EXISTS = "LINK_EXISTS"
+TASK_NOT_FOUND = "TASK_NOT_FOUND"
+GRAPH_CHANGED = "GRAPH_CHANGED"
+
+# Queries in flight at once, the pool is kept across warm invocations.
+# The table's low-level client is thread-safe, unlike the resource.
+executor = ThreadPoolExecutor(max_workers=8)
+
+
+def blockers_key_prefix(task_id):
+    """Sort key prefix of the links to a task's blockers."""
+    return f"BLOCKEDBY#{task_id}#BLOCKER#"
+
+
+def dependents_key_prefix(blocker_id):
+    """Sort key prefix of the links to the tasks a blocker holds up."""
+    return f"BLOCKS#{blocker_id}#TASK#"
+
+
+def link_keys(workspace_id, task_id, blocker_id):
+    """Primary keys of both items of a link, blocked-by item first."""
+    workspace_key = f"WORKSPACE#{workspace_id}"
+    return [
+        {"PK": workspace_key, "SK": f"{blockers_key_prefix(task_id)}{blocker_id}"},
+        {"PK": workspace_key, "SK": f"{dependents_key_prefix(blocker_id)}{task_id}"}
+    ]
+
+
+def build_link_items(workspace_id, task_id, blocker_id, creator_id):
+    """Build both items of a link, blocked-by item first."""
+    link = {
+        "entity_type": "DEPENDENCY",
+        "workspace_id": workspace_id,
+        "task_id": task_id,
+        "blocker_id": blocker_id,
+        "created_at": get_timestamp(),
+        "created_by": creator_id
+    }
+    return [{**key, **link} for key in link_keys(workspace_id, task_id, blocker_id)]
+
+
+def _graph_key(workspace_id, sort_key):
+    """Primary key of a graph item."""
+    return {"PK": f"WORKSPACE#{workspace_id}", "SK": sort_key}
+
+
+def get_graph_version(table, workspace_id):
+    """Read a workspace's dependency graph version, 0 before its first link."""
+    response = table.get_item(
+        Key=_graph_key(workspace_id, GRAPH_VERSION_SK),
+        ProjectionExpression="graph_version",
+        ConsistentRead=True
+    )
+    return int(response.get("Item", {}).get("graph_version", 0))
+
+
+def _version_update(table_name, workspace_id, expected_version=None):
+    """Build the update that increments the graph version.
+
+    With expected_version the action only applies while the graph is still
+    at that version, so links checked against it are written atomically.
+    """
+    action = {
+        "TableName": table_name,
+        "Key": _graph_key(workspace_id, GRAPH_VERSION_SK),
+        "UpdateExpression": "SET entity_type = :entity_type, updated_at = :updated_at ADD graph_version :one",
+        "ExpressionAttributeValues": {
+            ":entity_type": "DEPENDENCY_GRAPH",
+            ":updated_at": get_timestamp(),
+            ":one": 1
+        }
+    }
+    if expected_version is not None:
+        if expected_version:
+            action["ConditionExpression"] = "graph_version = :version"
+            action["ExpressionAttributeValues"][":version"] = expected_version
+        else:
+            action["ConditionExpression"] = "attribute_not_exists(graph_version)"
+    return action
+
+
+def _query_dependents(client, table_name, workspace_id, blocker_id):
+    """Read the IDs of the tasks a blocker holds up."""
+    query_args = {
+        "TableName": table_name,
+        "KeyConditionExpression": "PK = :pk AND begins_with(SK, :prefix)",
+        "ExpressionAttributeValues": {
+            ":pk": f"WORKSPACE#{workspace_id}",
+            ":prefix": dependents_key_prefix(blocker_id)
+        },
+        "ProjectionExpression": "task_id",
+        "ConsistentRead": True
+    }
+
+    task_ids = []
+    while True:
+        response = client.query(**query_args)
+        task_ids.extend(item["task_id"] for item in response.get("Items", []))
+        if "LastEvaluatedKey" not in response:
+            return task_ids
+        query_args["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def creates_cycle(table, workspace_id, task_id, blocker_id):
+    """Check whether blocking task_id on blocker_id would close a cycle.
+
+    It does exactly when task_id already holds up blocker_id, directly or
+    through other tasks. Only the tasks downstream of task_id are searched,
+    breadth first, with each level's queries in parallel, so the cost
+    follows the size of that region rather than of the workspace graph.
+    """
+    if task_id == blocker_id:
+        return True
+
+    visited = {task_id}
+    frontier = [task_id]
+    while frontier:
+        futures = [
+            executor.submit(_query_dependents, table.meta.client, table.name, workspace_id, node)
+            for node in frontier
+        ]
+        frontier = []
+        for future in futures:
+            for dependent_id in future.result():
+                if dependent_id == blocker_id:
+                    return True
+                if dependent_id not in visited:
+                    visited.add(dependent_id)
+                    frontier.append(dependent_id)
+
+    return False
+
+
+def add_link(table, workspace_id, task_id, blocker_id, creator_id):
+    """Record that task_id is blocked by blocker_id.
+
+    The cycle check and the write are tied together by the graph version:
+    the write only applies if no link changed since the check, and is
+    checked again otherwise. Returns a tuple of (link, error) with error one
+    of CYCLE, LINK_EXISTS, TASK_NOT_FOUND or GRAPH_CHANGED.
+    """
+    items = build_link_items(workspace_id, task_id, blocker_id, creator_id)
+    workspace_key = f"WORKSPACE#{workspace_id}"
+
+    for _ in range(MAX_GRAPH_WRITE_ATTEMPTS):
+        version = get_graph_version(table, workspace_id)
+        if creates_cycle(table, workspace_id, task_id, blocker_id):
+            return None, CYCLE
+
+        actions = [
+            {"Put": {"TableName": table.name, "Item": items[0],
+                     "ConditionExpression": "attribute_not_exists(PK)"}},
+            {"Put": {"TableName": table.name, "Item": items[1]}},
+            # Both tasks must exist and not be deleted
+            *[
+                {"ConditionCheck": {
+                    "TableName": table.name,
+                    "Key": {"PK": workspace_key, "SK": f"TASK#{linked_id}"},
+                    "ConditionExpression": "attribute_exists(PK) AND attribute_not_exists(deleted_at)"
+                }}
+                for linked_id in (task_id, blocker_id)
+            ],
+            {"Update": _version_update(table.name, workspace_id, version)}
+        ]
+
+        try:
+            table.meta.client.transact_write_items(TransactItems=actions)
+            return items[0], None
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "TransactionCanceledException":
+                raise
+            reasons = [reason.get("Code") for reason in e.response.get("CancellationReasons", [])]
+
+        if reasons and reasons[0] == CONDITION_FAILED:
+            return None, LINK_EXISTS
+        if CONDITION_FAILED in reasons[2:4]:
+            return None, TASK_NOT_FOUND
+        # Another link changed the graph since it was checked, check again
+
+    return None, GRAPH_CHANGED
+
+
+def remove_link(table, workspace_id, task_id, blocker_id):
+    """Remove the link blocking task_id on blocker_id.
+
+    Returns False if there was no such link.
+    """
+    keys = link_keys(workspace_id, task_id, blocker_id)
+    try:
+        table.meta.client.transact_write_items(TransactItems=[
+            {"Delete": {"TableName": table.name, "Key": keys[0],
+                        "ConditionExpression": "attribute_exists(PK)"}},
+            {"Delete": {"TableName": table.name, "Key": keys[1]}},
+            # Removing a link cannot close a cycle, so the version is bumped unconditionally
+            {"Update": _version_update(table.name, workspace_id)}
+        ])
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "TransactionCanceledException":
+            raise
+        return False
+
+    return True
+
+
+def _query_links(table, workspace_id, sort_key_prefix):
+    """Read the link items under a sort key prefix."""
+    query_args = {
+        "KeyConditionExpression": Key("PK").eq(f"WORKSPACE#{workspace_id}") &
+                                  Key("SK").begins_with(sort_key_prefix),
+        "ProjectionExpression": "task_id, blocker_id",
+        "ConsistentRead": True
+    }
+
+    links = []
+    while True:
+        response = table.query(**query_args)
+        links.extend(response.get("Items", []))
+        if "LastEvaluatedKey" not in response:
+            return links
+        query_args["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def read_graph_links(table, workspace_id):
+    """Read every link in a workspace as (blocker_id, task_id) pairs."""
+    return [(link["blocker_id"], link["task_id"]) for link in _query_links(table, workspace_id, "BLOCKS#")]
+
+
+def remove_task_links(table, workspace_id, task_id):
+    """Remove every link to or from a task, returning the number of links removed."""
+    links = _query_links(table, workspace_id, blockers_key_prefix(task_id))
+    links += _query_links(table, workspace_id, dependents_key_prefix(task_id))
+    if not links:
+        return 0
+
+    requests = [
+        {"DeleteRequest": {"Key": key}}
+        for link in links
+        for key in link_keys(workspace_id, link["task_id"], link["blocker_id"])
+    ]
+    failed = batch_write(table, requests)
+    if failed:
+        raise RuntimeError(f"Failed to remove {len(failed)} dependency items: {failed[0][1]}")
+
+    table.meta.client.update_item(**_version_update(table.name, workspace_id))
+    return len(links)
+
+
+def compute_plan(links):
+    """Order a dependency graph topologically and find its critical path.
+
+    links are (blocker_id, task_id) pairs. Kahn's algorithm visits every task
+    and link once, extending each task's longest chain of blockers as its
+    blockers are visited, so the plan takes O(tasks + links). The critical
+    path is the longest chain of tasks, each blocked by the one before.
+    Raises ValueError if the graph has a cycle.
+    """
+    dependents = {}
+    blocked_by = {}
+    in_degree = {}
+    for blocker_id, task_id in links:
+        dependents.setdefault(blocker_id, []).append(task_id)
+        dependents.setdefault(task_id, [])
+        blocked_by.setdefault(task_id, []).append(blocker_id)
+        in_degree[task_id] = in_degree.get(task_id, 0) + 1
+        in_degree.setdefault(blocker_id, 0)
+
+    ready = deque(task_id for task_id in dependents if not in_degree[task_id])
+    chain_length = {task_id: 1 for task_id in ready}
+    previous = {}
+    order = []
+
+    while ready:
+        task_id = ready.popleft()
+        order.append(task_id)
+        for dependent_id in dependents[task_id]:
+            if chain_length[task_id] + 1 > chain_length.get(dependent_id, 0):
+                chain_length[dependent_id] = chain_length[task_id] + 1
+                previous[dependent_id] = task_id
+            in_degree[dependent_id] -= 1
+            if not in_degree[dependent_id]:
+                ready.append(dependent_id)
+
+    if len(order) < len(dependents):
+        raise ValueError("Dependency graph has a cycle")
+
+    critical_path = []
+    task_id = max(order, key=chain_length.get) if order else None
+    while task_id:
+        critical_path.append(task_id)
+        task_id = previous.get(task_id)
+    critical_path.reverse()
+
+    return {"order": order, "critical_path": critical_path, "blocked_by": blocked_by}
+
+
+def get_plan(table, workspace_id):
+    """Get a workspace's dependency plan, computing it if the graph changed.
+
+    The version and cached plan are read with one Query. A stale plan is
+    recomputed from the links and cached, conditional on the version it was
+    computed at still being current. Returns a tuple of (plan, graph_version,
+    cached).
+    """
+    response = table.query(
+        KeyConditionExpression=Key("PK").eq(f"WORKSPACE#{workspace_id}") &
+                               Key("SK").begins_with(GRAPH_KEY_PREFIX),
+        ConsistentRead=True
+    )
+    items = {item["SK"]: item for item in response.get("Items", [])}
+    version = int(items.get(GRAPH_VERSION_SK, {}).get("graph_version", 0))
+
+    cached_plan = items.get(GRAPH_PLAN_SK)
+    if cached_plan and int(cached_plan["graph_version"]) == version:
+        return json.loads(zlib.decompress(cached_plan["plan"].value)), version, True
+
+    plan = compute_plan(read_graph_links(table, workspace_id))
+
+    payload = zlib.compress(json.dumps(plan, separators=(",", ":")).encode("utf-8"))
+    if len(payload) > MAX_CACHED_PLAN_BYTES:
+        return plan, version, False
+
+    # Only cache the plan while the graph is still at the version it was computed from
+    version_check = {
+        "TableName": table.name,
+        "Key": _graph_key(workspace_id, GRAPH_VERSION_SK),
+        "ConditionExpression": "attribute_not_exists(graph_version)"
+    }
+    if version:
+        version_check["ConditionExpression"] = "graph_version = :version"
+        version_check["ExpressionAttributeValues"] = {":version": version}
+
+    try:
+        table.meta.client.transact_write_items(TransactItems=[
+            {"ConditionCheck": version_check},
+            {"Put": {"TableName": table.name, "Item": {
+                **_graph_key(workspace_id, GRAPH_PLAN_SK),
+                "entity_type": "DEPENDENCY_PLAN",
+                "graph_version": version,
+                "plan": payload,
+                "computed_at": get_timestamp()
+            }}}
+        ])
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "TransactionCanceledException":
+            raise
+        # The graph changed while the plan was computed, the next read recomputes it
+
+    return plan, version, False
@@ -0,0 +1,120 @@
+"""Task history for the Tasks Service.
+
+The record-task-history function turns task stream records into compact
+history entries stored under each task (PK WORKSPACE#{workspace_id}#TASK#{task_id},
+SK HISTORY#{timestamp}#{sequence_number}), so a task's changes are read newest
+first with one Query and writes never wait on them.
+"""
+
+from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer
+
+# Sort key prefix of history entries in a task's history partition
+HISTORY_KEY_PREFIX = "HISTORY#"
+
+# Task fields whose changes are recorded
+HISTORY_FIELDS = ["title", "description", "status", "priority", "assignee_id", "due_date", "tags", "parent_id"]
+
+# Longer text values are cut short, entries record what changed rather than full copies
+MAX_HISTORY_VALUE_LENGTH = 200
+
+# Entry attributes returned by the history endpoint
+HISTORY_ENTRY_FIELDS = ["action", "actor", "at", "version", "changes"]
+
+_deserializer = TypeDeserializer()
+
+
+def history_partition_key(workspace_id, task_id):
+    """Partition key of a task's history entries."""
+    return f"WORKSPACE#{workspace_id}#TASK#{task_id}"
+
+
+def _image(record, name):
+    """Deserialize a stream record image into a plain item."""
+    image = record.get("dynamodb", {}).get(name) or {}
+    return {attr: _deserializer.deserialize(value) for attr, value in image.items()}
+
+
+def _compact(value):
+    """Cut long text values short."""
+    if isinstance(value, str) and len(value) > MAX_HISTORY_VALUE_LENGTH:
+        return value[:MAX_HISTORY_VALUE_LENGTH] + "..."
+    return value
+
+
+def diff_task(old_task, new_task):
+    """List the recorded fields that differ between two versions of a task.
+
+    Returns a dict of field to {"from": old, "to": new}.
+    """
+    return {
+        field: {"from": _compact(old_task.get(field)), "to": _compact(new_task.get(field))}
+        for field in HISTORY_FIELDS
+        if old_task.get(field) != new_task.get(field)
+    }
+
+
+def build_history_item(record):
+    """Build the history entry for one task stream record.
+
+    Returns None for records that are not a user's change to a task: writes
+    that leave the version alone (rank rebalancing, index backfills), edits
+    to untracked fields only (a move within a column) and TTL purges.
+    """
+    old_task = _image(record, "OldImage")
+    new_task = _image(record, "NewImage")
+    if new_task.get("entity_type") != "TASK":
+        return None
+
+    if record.get("eventName") == "INSERT":
+        # created_by also carries the creator's email
+        action, actor, at = "CREATED", (new_task.get("created_by") or {}).get("user_id"), new_task.get("created_at")
+        changes = diff_task({}, new_task)
+    elif record.get("eventName") == "MODIFY":
+        if old_task.get("version", 0) == new_task.get("version", 0):
+            return None
+        if "deleted_at" in new_task and "deleted_at" not in old_task:
+            action, actor, at = "DELETED", new_task.get("deleted_by"), new_task["deleted_at"]
+            changes = {}
+        else:
+            action = "RESTORED" if "deleted_at" in old_task and "deleted_at" not in new_task else "UPDATED"
+            actor, at = new_task.get("updated_by"), new_task.get("updated_at")
+            changes = diff_task(old_task, new_task)
+            if action == "UPDATED" and not changes:
+                return None
+    else:
+        return None
+
+    # The sequence number keeps entries written at the same instant apart,
+    # and makes a redelivered record overwrite its own entry
+    sequence_number = record["dynamodb"]["SequenceNumber"]
+    return {
+        "PK": history_partition_key(new_task["workspace_id"], new_task["task_id"]),
+        "SK": f"{HISTORY_KEY_PREFIX}{at}#{sequence_number}",
+        "entity_type": "TASK_HISTORY",
+        "workspace_id": new_task["workspace_id"],
+        "task_id": new_task["task_id"],
+        "action": action,
+        "actor": actor,
+        "at": at,
+        "version": new_task.get("version", 0),
+        "changes": changes
+    }
+
+
+def query_task_history(table, workspace_id, task_id, limit, exclusive_start_key=None):
+    """Read a page of a task's history, newest first.
+
+    Returns a tuple of (entries, last_evaluated_key).
+    """
+    query_args = {
+        "KeyConditionExpression": Key("PK").eq(history_partition_key(workspace_id, task_id)) &
+                                  Key("SK").begins_with(HISTORY_KEY_PREFIX),
+        "ScanIndexForward": False,
+        "Limit": limit
+    }
+    if exclusive_start_key:
+        query_args["ExclusiveStartKey"] = exclusive_start_key
+
+    response = table.query(**query_args)
+    return response.get("Items", []), response.get("LastEvaluatedKey")
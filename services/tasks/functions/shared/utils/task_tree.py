@@ -0,0 +1,291 @@
+"""Task hierarchies for the Tasks Service.
+
+Subtasks record their parent_id and a tree_path, the IDs from their top-level
+ancestor down to themselves. The path is the GSI9 sort key (PATH#{tree_path}),
+an adjacency list in which every subtree shares its root's key prefix, so a
+whole subtree is read with one begins_with Query.
+
+GSI9 is eventually consistent, so every task also keeps a subtask_count of its
+live direct subtasks, changed in the same transaction as each subtask create,
+move and restore (and right after each delete). A move only goes ahead when
+the query found at least the counted subtasks of every task it read, and it
+is conditioned on those counts, so a subtask the index has not caught up with
+cancels the move instead of being left at its old path.
+"""
+
+from collections import Counter
+from boto3.dynamodb.conditions import Key
+from botocore.exceptions import ClientError
+from ..models.task_models import (
+    TASK_FIELDS,
+    task_tree_path,
+    tree_key_prefix,
+    tree_depth,
+    get_timestamp,
+    select_fields,
+    version_condition
+)
+
+# A subtree is moved in one transaction, which holds at most 100 actions,
+# two of them the count updates on the old and new parents
+MAX_MOVED_SUBTREE_SIZE = 98
+
+# Attributes read from a parent to count a subtask under it and extend its path
+TREE_NODE_FIELDS = ["task_id", "parent_id", "tree_path", "subtask_count", "deleted_at"]
+
+
+def query_subtree(table, workspace_id, tree_path):
+    """Read a task and all of its subtasks from GSI9.
+
+    Returns the tasks in path order, so every parent comes before its subtasks.
+    """
+    query_args = {
+        "IndexName": "GSI9",
+        "KeyConditionExpression": Key("GSI9PK").eq(f"WORKSPACE#{workspace_id}") &
+                                  Key("GSI9SK").begins_with(tree_key_prefix(tree_path))
+    }
+
+    tasks = []
+    while True:
+        response = table.query(**query_args)
+        tasks.extend(
+            task for task in response.get("Items", [])
+            # PATH#{id} is also a prefix of a sibling's path when one ID prefixes another
+            if task_tree_path(task) == tree_path or task_tree_path(task).startswith(f"{tree_path}#")
+        )
+        if "LastEvaluatedKey" not in response:
+            return tasks
+        query_args["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def read_tree_node(table, workspace_id, task_id):
+    """Read a task's place in its tree, tombstone or not, or None once it is purged."""
+    response = table.get_item(
+        Key={"PK": f"WORKSPACE#{workspace_id}", "SK": f"TASK#{task_id}"},
+        ProjectionExpression=", ".join(f"#{field}" for field in TREE_NODE_FIELDS),
+        ExpressionAttributeNames={f"#{field}": field for field in TREE_NODE_FIELDS},
+        ConsistentRead=True
+    )
+    return response.get("Item")
+
+
+def current_tree_path(table, workspace_id, task):
+    """Work out where a task belongs now, from its parent's current path.
+
+    A tombstone keeps the path it was deleted with, which goes stale when an
+    ancestor is moved meanwhile. Its parent's current path is worked out the
+    same way when the parent is deleted too. A purged parent leaves the
+    recorded path as the best one known.
+
+    Returns (tree_path, parent), parent being the stored parent's tree node or
+    None for a top-level task or a purged parent.
+    """
+    parent_id = task.get("parent_id")
+    if not parent_id:
+        return task["task_id"], None
+
+    parent = read_tree_node(table, workspace_id, parent_id)
+    if not parent:
+        return task_tree_path(task), None
+
+    parent_path = task_tree_path(parent)
+    if "deleted_at" in parent:
+        parent_path, _ = current_tree_path(table, workspace_id, parent)
+    return f"{parent_path}#{task['task_id']}", parent
+
+
+def subtree_complete(subtree):
+    """Check that a subtree read from GSI9 holds every counted subtask.
+
+    The index may not have caught up with a subtask created or moved in just
+    before the read. Subtasks of a deleted task are not checked, the tombstone
+    is not in the index.
+    """
+    found = Counter(task.get("parent_id") for task in subtree)
+    return all(found[task["task_id"]] >= task.get("subtask_count", 0) for task in subtree)
+
+
+def _path_conditions(task, expression_attr_values, prefix=""):
+    """Build the conditions that a task is still at the path it was read with."""
+    if task.get("tree_path"):
+        expression_attr_values[f":{prefix}tree_path"] = task["tree_path"]
+        return [f"#tree_path = :{prefix}tree_path"]
+    return ["attribute_exists(PK)", "attribute_not_exists(#tree_path)"]
+
+
+def subtask_count_action(table_name, workspace_id, parent, delta, live=True):
+    """Build the transaction action that counts a subtask in or out of its parent.
+
+    The parent must still be at the path it was read with, so the subtask's
+    path extends the parent's current one, and, when live is set, not deleted.
+    """
+    expression_attr_values = {":delta": delta}
+    conditions = _path_conditions(parent, expression_attr_values)
+    if live:
+        conditions.append("attribute_not_exists(deleted_at)")
+
+    return {
+        "Update": {
+            "TableName": table_name,
+            "Key": {"PK": f"WORKSPACE#{workspace_id}", "SK": f"TASK#{parent['task_id']}"},
+            "UpdateExpression": "ADD subtask_count :delta",
+            "ConditionExpression": " AND ".join(conditions),
+            "ExpressionAttributeNames": {"#tree_path": "tree_path"},
+            "ExpressionAttributeValues": expression_attr_values
+        }
+    }
+
+
+def uncount_subtask(table, workspace_id, parent_id):
+    """Count a deleted subtask out of its parent, unless the parent is purged.
+
+    This follows the delete rather than joining it, the delete reads nothing
+    first. A count left too high by a failure in between only makes moves of
+    the parent refuse, never miss a subtask.
+    """
+    try:
+        table.update_item(
+            Key={"PK": f"WORKSPACE#{workspace_id}", "SK": f"TASK#{parent_id}"},
+            UpdateExpression="ADD subtask_count :minus_one",
+            ConditionExpression="attribute_exists(PK)",
+            ExpressionAttributeValues={":minus_one": -1}
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+            raise
+
+
+def _rollup(node):
+    """Add child counts and progress to a tree node from its subtasks' rollups."""
+    descendants = 0
+    done = 0
+    for child in node["subtasks"]:
+        descendants += 1 + child["rollup"]["descendants"]
+        done += (child.get("status") == "DONE") + child["rollup"]["done"]
+
+    node["rollup"] = {
+        "subtasks": len(node["subtasks"]),
+        "descendants": descendants,
+        "done": done,
+        "progress": round(done / descendants, 4) if descendants else None
+    }
+
+
+def build_task_tree(tasks, root_id):
+    """Nest a subtree's tasks under their parents, with rolled-up counts.
+
+    Each node carries its subtasks (oldest first) and a rollup of its direct
+    subtask count, descendant count, done descendants and progress (the done
+    share of descendants). A subtask whose parent was deleted is attached to
+    its nearest remaining ancestor.
+    """
+    nodes = {
+        task["task_id"]: {**select_fields(task, TASK_FIELDS), "subtasks": []}
+        for task in tasks
+    }
+    if root_id not in nodes:
+        return None
+
+    # Path order puts every ancestor before its subtasks
+    for task in tasks:
+        if task["task_id"] == root_id:
+            continue
+        ancestors = task_tree_path(task).split("#")[:-1]
+        parent_id = next((ancestor for ancestor in reversed(ancestors) if ancestor in nodes), None)
+        if parent_id:
+            nodes[parent_id]["subtasks"].append(nodes[task["task_id"]])
+
+    # Roll counts up from the deepest tasks
+    for task in sorted(tasks, key=lambda task: tree_depth(task_tree_path(task)), reverse=True):
+        node = nodes[task["task_id"]]
+        node["subtasks"].sort(key=lambda child: child.get("created_at", ""))
+        _rollup(node)
+
+    return nodes[root_id]
+
+
+def build_reparent_actions(table_name, task, subtree, parent, updated_by, expected_version=None, old_parent=None):
+    """Build the transaction that moves a task and its subtasks under a new parent.
+
+    parent is the new parent task (task_id and tree_path), or None to make the
+    task top-level, and old_parent the tree node of the current one, if it is
+    still stored. Every subtask's path is rewritten, each conditional on the
+    path and subtask count it was read with, so a concurrent move of any part
+    of the subtree, or a subtask created in it, cancels the transaction. The
+    task is counted out of its old parent and into the new one, which is
+    checked against the path it was read with too: the cycle check ran on that
+    path, and a concurrent move of the parent (under one of these subtasks,
+    say) would make it stale. Only the moved task's version changes.
+    """
+    old_path = task_tree_path(task)
+    new_path = f"{task_tree_path(parent)}#{task['task_id']}" if parent else task["task_id"]
+    timestamp = get_timestamp()
+
+    actions = []
+    for item in subtree:
+        item_path = new_path + task_tree_path(item)[len(old_path):]
+        expression_attr_names = {"#tree_path": "tree_path"}
+        expression_attr_values = {
+            ":tree_path": item_path,
+            ":gsi9sk": tree_key_prefix(item_path)
+        }
+        set_clauses = ["#tree_path = :tree_path", "GSI9SK = :gsi9sk"]
+        remove_clauses = []
+
+        conditions = _path_conditions(item, expression_attr_values, "old_")
+        conditions.append("attribute_not_exists(deleted_at)")
+        if "subtask_count" in item:
+            expression_attr_values[":subtask_count"] = item["subtask_count"]
+            conditions.append("subtask_count = :subtask_count")
+        else:
+            conditions.append("attribute_not_exists(subtask_count)")
+
+        if item["task_id"] == task["task_id"]:
+            expression_attr_names["#version"] = "version"
+            expression_attr_values.update({
+                ":updated_at": timestamp,
+                ":updated_by": updated_by,
+                ":gsi6sk": f"UPDATED#{timestamp}#TASK#{task['task_id']}",
+                ":zero": 0,
+                ":one": 1
+            })
+            set_clauses += [
+                "updated_at = :updated_at",
+                "updated_by = :updated_by",
+                "GSI6SK = :gsi6sk",
+                "#version = if_not_exists(#version, :zero) + :one"
+            ]
+            if parent:
+                expression_attr_values[":parent_id"] = parent["task_id"]
+                set_clauses.append("parent_id = :parent_id")
+            else:
+                remove_clauses.append("parent_id")
+            if expected_version is not None:
+                conditions.append(version_condition(expected_version, expression_attr_values, expression_attr_names))
+
+        update_expression = f"SET {', '.join(set_clauses)}"
+        if remove_clauses:
+            update_expression += f" REMOVE {', '.join(remove_clauses)}"
+
+        actions.append({
+            "Update": {
+                "TableName": table_name,
+                "Key": {"PK": item["PK"], "SK": item["SK"]},
+                "UpdateExpression": update_expression,
+                "ConditionExpression": " AND ".join(conditions),
+                "ExpressionAttributeNames": expression_attr_names,
+                "ExpressionAttributeValues": expression_attr_values
+            }
+        })
+
+    workspace_id = task["workspace_id"]
+    if old_parent and parent and old_parent["task_id"] == parent["task_id"]:
+        # Staying under the same parent, which only needs to stay in place
+        actions.append(subtask_count_action(table_name, workspace_id, parent, 0))
+        return actions
+    if old_parent:
+        actions.append(subtask_count_action(table_name, workspace_id, old_parent, -1, live=False))
+    if parent:
+        actions.append(subtask_count_action(table_name, workspace_id, parent, 1))
+
+    return actions
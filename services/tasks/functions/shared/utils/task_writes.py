@@ -0,0 +1,89 @@
+"""Conditional task writes for the Tasks Service.
+
+Updates go straight to UpdateItem with a condition that the task exists, so
+a missing task is detected by the write itself rather than by a prior read.
+The previous item comes back with ReturnValues=ALL_OLD for counters and tags.
+"""
+
+from botocore.exceptions import ClientError
+from ..models.task_models import (
+    index_key_read_fields,
+    prepare_conditional_update,
+    apply_task_update,
+    build_projection,
+    is_deleted
+)
+
+# Attempts at an update whose index key inputs change between its read and write
+MAX_UPDATE_ATTEMPTS = 3
+
+
+def _read_fields(table, key, fields):
+    """Read a few fields of a task with a strongly consistent GetItem.
+    
+    Returns None for a missing or deleted task.
+    """
+    projection, attr_names = build_projection(fields + ["deleted_at"])
+    response = table.get_item(
+        Key=key,
+        ProjectionExpression=projection,
+        ExpressionAttributeNames=attr_names,
+        ConsistentRead=True
+    )
+    task = response.get("Item")
+    return None if is_deleted(task) else task
+
+
+def update_task_item(table, workspace_id, task_id, changes, expected_version=None):
+    """Apply field changes to a task in a single conditional write.
+
+    The task is only read when a changed field feeds an index key that also
+    depends on an unchanged field (a status change needs the priority, for
+    example), and then only those fields. The write is conditional on them, and
+    retried with a fresh read if another writer changed them in between.
+    expected_version (from If-Match) makes the write conditional on the task's
+    version as well.
+
+    Returns a tuple of (old_task, updated_task), or (None, None) when the task
+    does not exist, is deleted or is not at the expected version.
+    """
+    key = {"PK": f"WORKSPACE#{workspace_id}", "SK": f"TASK#{task_id}"}
+    read_fields = index_key_read_fields(changes)
+    if read_fields and expected_version is not None:
+        read_fields = read_fields + ["version"]
+
+    for attempt in range(MAX_UPDATE_ATTEMPTS):
+        current_fields = None
+        if read_fields:
+            current_fields = _read_fields(table, key, read_fields)
+            if current_fields is None:
+                return None, None
+            # No point writing when the version already moved on
+            if expected_version is not None and current_fields.get("version", 0) != expected_version:
+                return None, None
+
+        update_expr, expr_attr_values, expr_attr_names, condition = prepare_conditional_update(
+            workspace_id, task_id, changes, current_fields, expected_version
+        )
+
+        try:
+            response = table.update_item(
+                Key=key,
+                UpdateExpression=update_expr,
+                ConditionExpression=condition,
+                ExpressionAttributeValues=expr_attr_values,
+                ExpressionAttributeNames=expr_attr_names,
+                ReturnValues="ALL_OLD"
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+            # Without read fields the task is missing or at another version
+            if not read_fields:
+                return None, None
+            if attempt == MAX_UPDATE_ATTEMPTS - 1:
+                raise
+            continue
+
+        old_task = response.get("Attributes", {})
+        return old_task, apply_task_update(old_task, changes, expr_attr_values[":updated_at"])
@@ -2,10 +2,12 @@
 
 import json
 import os
+import time
 import boto3
 from aws_lambda_powertools import Logger
 from decimal import Decimal
 from boto3.dynamodb.conditions import Key
+from ..models.task_models import TASK_FIELDS, build_projection, select_fields, is_deleted
 
 # Initialize shared resources
 logger = Logger()
@@ -49,8 +51,8 @@ def get_user_from_event(event):
         "tenant_id": "test-tenant-id"
     }
 
-def build_response(status_code, body):
-    """Build a standard API response."""
+def build_response(status_code, body, headers=None):
+    """Build a standard API response, with optional extra headers."""
     return {
         "statusCode": status_code,
         "body": json.dumps(body, cls=DecimalEncoder),
@@ -58,26 +60,121 @@ def build_response(status_code, body):
             "Content-Type": "application/json",
             "Access-Control-Allow-Origin": "*",
             "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
-            "Access-Control-Allow-Headers": "Content-Type,Authorization"
+            "Access-Control-Allow-Headers": "Content-Type,Authorization,If-Match,Idempotency-Key",
+            "Access-Control-Expose-Headers": "ETag,Location,Idempotent-Replayed",
+            **(headers or {})
         }
     }
 
-def get_task_by_id(task_id):
-    """Get task details by ID."""
+def get_header(event, name):
+    """Get a request header, ignoring the case of its name."""
+    for header, value in (event.get("headers") or {}).items():
+        if header.lower() == name.lower():
+            return value
+    return None
+
+def task_etag(task):
+    """Build the ETag for a task from its version, 0 for tasks written before versioning."""
+    return f'"{int(task.get("version", 0))}"'
+
+def parse_if_match(event):
+    """Parse the If-Match header into the task version a write expects.
+    
+    Returns a tuple of (version, error). The version is None when the header is
+    absent or '*', which any existing task matches.
+    """
+    value = (get_header(event, "If-Match") or "").strip()
+    if not value or value == "*":
+        return None, None
+    
+    if len(value) < 3 or value[0] != '"' or value[-1] != '"' or not value[1:-1].isdigit():
+        return None, "Invalid If-Match header. Must be an ETag returned for the task"
+    
+    return int(value[1:-1]), None
+
+def task_conflict_response(workspace_id, task_id, expected_version):
+    """Respond to a conditional task write that matched no task.
+    
+    Returns 412 with the current task when it exists at another version than
+    If-Match named, and 404 otherwise.
+    """
+    current_task = get_task_by_id(workspace_id, task_id) if expected_version is not None else None
+    if not current_task:
+        return build_response(404, {"message": f"Task with ID {task_id} not found"})
+    
+    return build_response(
+        412,
+        {"message": "Task has been modified since it was read", "task": select_fields(current_task, TASK_FIELDS)},
+        {"ETag": task_etag(current_task)}
+    )
+
+def get_task_by_id(workspace_id, task_id, fields=None):
+    """Get task details by workspace and task ID.
+    
+    Uses a strongly consistent GetItem on the task's primary key, so a task
+    written earlier in the same request flow is always visible. fields limits
+    the attributes read. Deleted tasks are not returned.
+    """
+    get_args = {
+        "Key": {
+            "PK": f"WORKSPACE#{workspace_id}",
+            "SK": f"TASK#{task_id}"
+        },
+        "ConsistentRead": True
+    }
+    
+    if fields:
+        get_args["ProjectionExpression"], get_args["ExpressionAttributeNames"] = build_projection(fields + ["deleted_at"])
+    
+    try:
+        response = tasks_table.get_item(**get_args)
+        task = response.get("Item")
+        return None if is_deleted(task) else task
+    except Exception as e:
+        logger.error(f"Error retrieving task: {str(e)}")
+        return None
+
+def get_deleted_task(workspace_id, task_id):
+    """Get a deleted task's tombstone while it can still be restored.
+    
+    DynamoDB TTL purges expired items lazily, so tombstones past expires_at
+    are treated as gone even if they are still stored.
+    """
+    try:
+        response = tasks_table.get_item(
+            Key={"PK": f"WORKSPACE#{workspace_id}", "SK": f"TASK#{task_id}"},
+            ConsistentRead=True
+        )
+    except Exception as e:
+        logger.error(f"Error retrieving deleted task: {str(e)}")
+        return None
+    
+    task = response.get("Item")
+    if not is_deleted(task) or task["expires_at"] <= time.time():
+        return None
+    return task
+
+def find_task_by_id(task_id):
+    """Get task details by task ID alone, when the workspace is not known.
+    
+    Looks up the task's key on the TaskIdIndex GSI, then reads the task with
+    get_task_by_id. Prefer get_task_by_id whenever the workspace is known.
+    """
     try:
         response = tasks_table.query(
             IndexName="TaskIdIndex",
             KeyConditionExpression=Key("task_id").eq(task_id)
         )
-        
-        items = response.get("Items", [])
-        if not items:
-            return None
-        
-        return items[0]
     except Exception as e:
-        logger.error(f"Error retrieving task: {str(e)}")
+        logger.error(f"Error finding task: {str(e)}")
         return None
+    
+    # Tag references also carry task_id, only the task item itself is wanted
+    for item in response.get("Items", []):
+        if item["SK"] == f"TASK#{task_id}":
+            return get_task_by_id(item["PK"][len("WORKSPACE#"):], task_id)
+    
+    return None
 
 def get_workspace_by_id(workspace_id):
     """Get workspace details by ID."""
@@ -100,22 +197,37 @@ def get_workspace_by_id(workspace_id):
         logger.error(f"Error retrieving workspace: {str(e)}")
         return None
 
-def validate_workspace_access(workspace_id, user_id):
-    """Validate a user has access to a workspace."""
-    # This is a simplified validation that would need to be expanded
-    # In production, we'd check if the user has appropriate roles/permissions
+def get_account_workspace(account_id, workspace_id):
+    """Get a workspace item by its owning account and workspace ID."""
+    response = accounts_table.get_item(
+        Key={
+            "PK": f"ACCOUNT#{account_id}",
+            "SK": f"WORKSPACE#{workspace_id}"
+        }
+    )
+    return response.get("Item")
+
+def validate_workspace_access(account_id, workspace_id):
+    """Validate that an account has access to a workspace.
+    
+    Returns a tuple of (has_access, error), with error explaining a denial.
+    Deleted workspaces are inactive, so their tasks cannot be reached.
+    """
     if not accounts_table:
         logger.warning("ACCOUNTS_TABLE not configured, skipping access validation")
-        return True
-        
+        return True, None
+    
     try:
-        # Check if user has a role in this workspace
-        response = accounts_table.query(
-            KeyConditionExpression=Key("PK").eq(f"WORKSPACE#{workspace_id}") & 
-                                  Key("SK").eq(f"USER#{user_id}")
-        )
-        
-        return len(response.get("Items", [])) > 0
+        workspace = get_account_workspace(account_id, workspace_id)
     except Exception as e:
         logger.error(f"Error validating workspace access: {str(e)}")
-        return False 
\ No newline at end of file
+        return False, "Unable to validate workspace access"
+    
+    if not workspace:
+        return False, f"Workspace {workspace_id} not found"
+    if workspace.get("account_id") != account_id:
+        return False, f"Account has no access to workspace {workspace_id}"
+    if workspace.get("status") != "ACTIVE":
+        return False, f"Workspace {workspace_id} is inactive"
+    
+    return True, None
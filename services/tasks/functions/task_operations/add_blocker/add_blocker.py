@@ -0,0 +1,93 @@
+"""Lambda function to mark a task as blocked by another task."""
+
+import json
+import os
+from aws_lambda_powertools import Logger
+from ...shared.utils.utils import build_response, get_user_from_event, validate_workspace_access
+from ...shared.models.task_models import select_fields
+from ...shared.utils.task_dependencies import add_link, CYCLE, LINK_EXISTS, TASK_NOT_FOUND
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+
+# Link attributes returned to the client
+LINK_FIELDS = ["task_id", "blocker_id", "workspace_id", "created_at", "created_by"]
+
+@logger.inject_lambda_context(log_event=True)
+def handler(event, context):
+    """Handle add blocker request.
+    
+    A link that would make the task, through its blockers, wait on itself is
+    rejected with 409.
+    """
+    logger.info("Add blocker request received")
+    
+    try:
+        # Extract user information from the event context
+        user = get_user_from_event(event)
+        if not user:
+            return build_response(401, {"message": "Unauthorized: User not authenticated"})
+        
+        # Parse the body from the event
+        if 'body' not in event or not event['body']:
+            return build_response(400, {"message": "Missing request body"})
+        
+        try:
+            body = json.loads(event['body'])
+        except json.JSONDecodeError:
+            return build_response(400, {"message": "Invalid JSON in request body"})
+        
+        if not isinstance(body, dict) or not isinstance(body.get("blocker_id"), str) or not body["blocker_id"]:
+            return build_response(400, {"message": "Missing required field: blocker_id"})
+        blocker_id = body["blocker_id"]
+        
+        # Extract path parameters
+        if 'pathParameters' not in event or not event['pathParameters']:
+            return build_response(400, {"message": "Missing path parameters"})
+        
+        path_params = event['pathParameters']
+        
+        # Check for workspace_id
+        if 'workspaceId' not in path_params or not path_params['workspaceId']:
+            return build_response(400, {"message": "Missing workspace ID"})
+        workspace_id = path_params['workspaceId']
+        
+        # Check for task_id
+        if 'taskId' not in path_params or not path_params['taskId']:
+            return build_response(400, {"message": "Missing task ID"})
+        task_id = path_params['taskId']
+        
+        if blocker_id == task_id:
+            return build_response(400, {"message": "A task cannot block itself"})
+        
+        # Validate workspace access
+        has_access, access_error = validate_workspace_access(user["account_id"], workspace_id)
+        if not has_access:
+            return build_response(403, {"message": access_error or "Access denied to workspace"})
+        
+        link, link_error = add_link(tasks_table, workspace_id, task_id, blocker_id, user["user_id"])
+        if link_error == CYCLE:
+            return build_response(409, {"message": f"Task with ID {blocker_id} already waits on task {task_id}, the link would create a cycle"})
+        if link_error == LINK_EXISTS:
+            return build_response(409, {"message": f"Task with ID {task_id} is already blocked by task {blocker_id}"})
+        if link_error == TASK_NOT_FOUND:
+            return build_response(404, {"message": f"Task with ID {task_id} or {blocker_id} not found"})
+        if link_error:
+            return build_response(409, {"message": "Dependencies in the workspace are changing, retry the request"})
+        
+        return build_response(201, {
+            "message": "Blocker added successfully",
+            "dependency": select_fields(link, LINK_FIELDS)
+        })
+    
+    except Exception as e:
+        logger.exception("Error adding blocker")
+        return build_response(500, {"message": f"Internal server error: {str(e)}"})
@@ -3,8 +3,11 @@
 import json
 import os
 from aws_lambda_powertools import Logger
-from ...shared.utils.utils import build_response, get_user_from_event, get_task_by_id, validate_workspace_access
-from ...shared.models.task_models import get_timestamp
+from ...shared.utils.utils import (
+    build_response, get_user_from_event, validate_workspace_access,
+    parse_if_match, task_etag, task_conflict_response
+)
+from ...shared.utils.task_writes import update_task_item
 
 # Initialize logger
 logger = Logger(service="TasksService")
@@ -64,41 +67,17 @@ def handler(event, context):
         if not has_access:
             return build_response(403, {"message": access_error or "Access denied to workspace"})
         
-        # Get the existing task
-        existing_task = get_task_by_id(workspace_id, task_id)
-        if not existing_task:
-            return build_response(404, {"message": f"Task with ID {task_id} not found"})
+        # Only overwrite the version the client read, if it sent one
+        expected_version, if_match_error = parse_if_match(event)
+        if if_match_error:
+            return build_response(400, {"message": if_match_error})
         
-        # Prepare update expression for DynamoDB
-        update_expression = "SET updated_at = :updated_at, assignee_id = :assignee_id"
-        expression_attr_values = {
-            ":updated_at": get_timestamp(),
-            ":assignee_id": assignee_id
-        }
-        
-        # Handle GSI2 for assignee lookup
-        if assignee_id:
-            # Add or update GSI2 keys for assignee lookup
-            update_expression += ", GSI2PK = :gsi2pk, GSI2SK = :gsi2sk"
-            expression_attr_values[":gsi2pk"] = f"WORKSPACE#{workspace_id}"
-            expression_attr_values[":gsi2sk"] = f"ASSIGNEE#{assignee_id}#TASK#{task_id}"
-        elif "GSI2PK" in existing_task and "GSI2SK" in existing_task:
-            # Remove GSI2 keys if assignee is being removed
-            update_expression += " REMOVE GSI2PK, GSI2SK"
-        
-        # Update the task in DynamoDB
-        update_response = tasks_table.update_item(
-            Key={
-                "PK": f"WORKSPACE#{workspace_id}",
-                "SK": f"TASK#{task_id}"
-            },
-            UpdateExpression=update_expression,
-            ExpressionAttributeValues=expression_attr_values,
-            ReturnValues="ALL_NEW"
+        # Update the task in DynamoDB, keeping the assignee indexes in sync
+        existing_task, updated_task = update_task_item(
+            tasks_table, workspace_id, task_id, {"assignee_id": assignee_id, "updated_by": user["user_id"]}, expected_version
         )
-        
-        # Get the updated task
-        updated_task = update_response.get('Attributes', {})
+        if existing_task is None:
+            return task_conflict_response(workspace_id, task_id, expected_version)
         
         # Prepare response
         response_data = {
@@ -110,11 +89,12 @@ def handler(event, context):
                 "status": updated_task.get("status"),
                 "priority": updated_task.get("priority"),
                 "assignee_id": updated_task.get("assignee_id"),
-                "updated_at": updated_task.get("updated_at")
+                "updated_at": updated_task.get("updated_at"),
+                "version": updated_task.get("version")
             }
         }
         
-        return build_response(200, response_data)
+        return build_response(200, response_data, {"ETag": task_etag(updated_task)})
         
     except Exception as e:
         logger.exception("Error assigning task")
@@ -0,0 +1,97 @@
+"""Lambda function to get many tasks of a workspace by ID."""
+
+import json
+import os
+from aws_lambda_powertools import Logger
+from ...shared.utils.utils import build_response, get_user_from_event, validate_workspace_access
+from ...shared.models.task_models import TASK_FIELDS, parse_fields, select_fields
+from ...shared.utils.batch_reads import batch_get_items
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Most task IDs accepted in one request
+MAX_BATCH_GET_TASKS = 500
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+
+@logger.inject_lambda_context(log_event=True)
+def handler(event, context):
+    """Handle batch get tasks request."""
+    logger.info("Batch get tasks request received")
+    
+    try:
+        # Extract user information from the event context
+        user = get_user_from_event(event)
+        if not user:
+            return build_response(401, {"message": "Unauthorized: User not authenticated"})
+        
+        # Parse the body from the event
+        if 'body' not in event or not event['body']:
+            return build_response(400, {"message": "Missing request body"})
+        
+        try:
+            body = json.loads(event['body'])
+        except json.JSONDecodeError:
+            return build_response(400, {"message": "Invalid JSON in request body"})
+        
+        if not isinstance(body, dict):
+            return build_response(400, {"message": "Request body must be an object"})
+        
+        # Check the task IDs, each task is returned once however often it is listed
+        task_ids = body.get("task_ids")
+        if not isinstance(task_ids, list) or not task_ids or not all(isinstance(task_id, str) and task_id for task_id in task_ids):
+            return build_response(400, {"message": "Request body must contain a non-empty task_ids array of strings"})
+        task_ids = list(dict.fromkeys(task_ids))
+        
+        if len(task_ids) > MAX_BATCH_GET_TASKS:
+            return build_response(400, {"message": f"At most {MAX_BATCH_GET_TASKS} tasks can be fetched per request"})
+        
+        # Validate the selected fields, the same comma-separated list get_task accepts
+        fields, fields_error = parse_fields(body.get("fields"))
+        if fields_error:
+            return build_response(400, {"message": fields_error})
+        
+        # Extract the workspace_id from path parameters
+        if 'pathParameters' not in event or not event['pathParameters'] or 'workspaceId' not in event['pathParameters']:
+            return build_response(400, {"message": "Missing workspace ID"})
+        workspace_id = event['pathParameters']['workspaceId']
+        
+        # Validate workspace access once for every task
+        has_access, access_error = validate_workspace_access(user["account_id"], workspace_id)
+        if not has_access:
+            return build_response(403, {"message": access_error or "Access denied to workspace"})
+        
+        # Fetch the tasks in parallel BatchGetItem chunks
+        keys = [{"PK": f"WORKSPACE#{workspace_id}", "SK": f"TASK#{task_id}"} for task_id in task_ids]
+        tasks_by_sk, unprocessed_keys = batch_get_items(tasks_table, keys, fields)
+        
+        unprocessed_ids = [key["SK"][len("TASK#"):] for key in unprocessed_keys]
+        tasks = [
+            select_fields(tasks_by_sk[key["SK"]], fields or TASK_FIELDS)
+            for key in keys if key["SK"] in tasks_by_sk
+        ]
+        
+        response_data = {
+            "tasks": tasks,
+            "not_found": [
+                task_id for task_id in task_ids
+                if f"TASK#{task_id}" not in tasks_by_sk and task_id not in unprocessed_ids
+            ]
+        }
+        
+        # Keys still throttled after retries can be requested again
+        if unprocessed_ids:
+            response_data["unprocessed"] = unprocessed_ids
+        
+        return build_response(200, response_data)
+        
+    except Exception as e:
+        logger.exception("Error getting tasks")
+        return build_response(500, {"message": f"Internal server error: {str(e)}"})
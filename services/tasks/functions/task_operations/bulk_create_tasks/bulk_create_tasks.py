@@ -0,0 +1,164 @@
+"""Lambda function to create many tasks in a workspace at once."""
+
+import json
+import os
+from aws_lambda_powertools import Logger
+from ...shared.utils.utils import build_response, get_user_from_event, validate_workspace_access
+from ...shared.models.task_models import create_task_item, validate_task_input
+from ...shared.utils.batch_writes import batch_put_items
+from ...shared.utils.tag_index import build_tag_item, apply_tag_count_deltas
+from ...shared.utils.idempotency import run_idempotent
+from ...shared.utils.column_ranks import column_end_ranks
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Most tasks accepted in one request, larger imports are split by the client
+MAX_BULK_TASKS = 1000
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+
+def build_task_items(workspace_id, user, task_inputs):
+    """Validate each task input and build the items for the valid ones.
+    
+    Returns a tuple of (task_items, results): task_items maps each valid input's
+    index to its item, results holds an entry per input in request order.
+    """
+    valid_inputs = {}
+    results = []
+    
+    for index, task_input in enumerate(task_inputs):
+        if not isinstance(task_input, dict):
+            results.append({"index": index, "status": "invalid", "error": "Task must be an object"})
+            continue
+        
+        is_valid, validation_error = validate_task_input(task_input)
+        if not is_valid:
+            results.append({"index": index, "status": "invalid", "error": validation_error})
+            continue
+        
+        # Parents are read one at a time, so subtasks are created individually
+        if task_input.get("parent_id"):
+            results.append({"index": index, "status": "invalid", "error": "parent_id is not supported in bulk imports"})
+            continue
+        
+        valid_inputs[index] = task_input
+        results.append({"index": index, "status": "created"})
+    
+    # The tasks join the bottom of their columns in request order
+    statuses = [task_input.get("status", "BACKLOG") for task_input in valid_inputs.values()]
+    ranks = column_end_ranks(tasks_table, workspace_id, statuses)
+    
+    task_items = {}
+    for (index, task_input), status, rank in zip(valid_inputs.items(), statuses, ranks):
+        task_items[index] = create_task_item(
+            workspace_id=workspace_id,
+            account_id=user["account_id"],
+            title=task_input.get("title"),
+            description=task_input.get("description"),
+            status=status,
+            priority=task_input.get("priority", "MEDIUM"),
+            assignee_id=task_input.get("assignee_id"),
+            creator_id=user["user_id"],
+            creator_email=user["email"],
+            due_date=task_input.get("due_date"),
+            tags=task_input.get("tags"),
+            rank=rank
+        )
+    
+    for result in results:
+        if result["index"] in task_items:
+            result["task_id"] = task_items[result["index"]]["task_id"]
+    
+    return task_items, results
+
+def create_tasks(workspace_id, user, task_inputs):
+    """Create the valid tasks, index their tags and count them, returning the per-task results."""
+    # Validate every input and build the items for the valid ones
+    task_items, results = build_task_items(workspace_id, user, task_inputs)
+    
+    # Write the tasks in concurrent BatchWriteItem chunks
+    failed = {item["task_id"]: error for item, error in batch_put_items(tasks_table, list(task_items.values()))}
+    for result in results:
+        if result.get("task_id") in failed:
+            result.update(status="failed", error=failed.pop(result["task_id"]))
+            del result["task_id"]
+    
+    created_tasks = [task_items[result["index"]] for result in results if result["status"] == "created"]
+    
+    # Index the created tasks under their tags, only once each task exists
+    tag_items = [
+        build_tag_item(workspace_id, task["task_id"], tag)
+        for task in created_tasks
+        for tag in set(task.get("tags", []))
+    ]
+    for tag_item, error in batch_put_items(tasks_table, tag_items):
+        logger.warning(f"Failed to index task {tag_item['task_id']} under tag {tag_item['tag']}: {error}")
+    
+    # Count the created tasks under their tags with one update per tag
+    tag_deltas = {}
+    for task in created_tasks:
+        for tag in set(task.get("tags", [])):
+            tag_deltas[tag] = tag_deltas.get(tag, 0) + 1
+    
+    apply_tag_count_deltas(tasks_table, workspace_id, tag_deltas)
+    
+    return build_response(200, {
+        "message": f"Created {len(created_tasks)} of {len(task_inputs)} tasks",
+        "created": len(created_tasks),
+        "failed": len(task_inputs) - len(created_tasks),
+        "results": results
+    })
+
+@logger.inject_lambda_context(log_event=True)
+def handler(event, context):
+    """Handle bulk task creation request."""
+    logger.info("Bulk create tasks request received")
+    
+    try:
+        # Extract user information from the event context
+        user = get_user_from_event(event)
+        if not user:
+            return build_response(401, {"message": "Unauthorized: User not authenticated"})
+        
+        # Parse the body from the event
+        if 'body' not in event or not event['body']:
+            return build_response(400, {"message": "Missing request body"})
+        
+        try:
+            body = json.loads(event['body'])
+        except json.JSONDecodeError:
+            return build_response(400, {"message": "Invalid JSON in request body"})
+        
+        task_inputs = body.get("tasks") if isinstance(body, dict) else None
+        if not isinstance(task_inputs, list) or not task_inputs:
+            return build_response(400, {"message": "Request body must contain a non-empty tasks array"})
+        
+        if len(task_inputs) > MAX_BULK_TASKS:
+            return build_response(400, {"message": f"At most {MAX_BULK_TASKS} tasks can be created per request"})
+        
+        # Extract the workspace_id from path parameters
+        if 'pathParameters' not in event or not event['pathParameters'] or 'workspaceId' not in event['pathParameters']:
+            return build_response(400, {"message": "Missing workspace ID"})
+        workspace_id = event['pathParameters']['workspaceId']
+        
+        # Validate workspace access once for the whole import
+        has_access, access_error = validate_workspace_access(user["account_id"], workspace_id)
+        if not has_access:
+            return build_response(403, {"message": access_error or "Access denied to workspace"})
+        
+        # Run the import once per Idempotency-Key
+        return run_idempotent(
+            tasks_table, event, f"{workspace_id}#{user['user_id']}#bulk_create_tasks", body,
+            lambda: create_tasks(workspace_id, user, task_inputs), logger
+        )
+    
+    except Exception as e:
+        logger.exception("Error creating tasks in bulk")
+        return build_response(500, {"message": f"Internal server error: {str(e)}"})
@@ -0,0 +1,140 @@
+"""Lambda function to update the status, priority or assignee of many tasks at once."""
+
+import json
+import os
+from aws_lambda_powertools import Logger
+from ...shared.utils.utils import build_response, get_user_from_event, validate_workspace_access
+from ...shared.models.task_models import (
+    validate_task_patch,
+    index_key_read_fields,
+    prepare_conditional_update
+)
+from ...shared.utils.batch_writes import transact_write, CONDITION_FAILED
+from ...shared.utils.batch_reads import batch_get_tasks
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Most tasks accepted in one request
+MAX_BULK_TASKS = 1000
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+
+def build_update_actions(workspace_id, tasks, patch):
+    """Build a conditional Update action for each task.
+    
+    Each action is conditional on the fields its index keys were built from,
+    like a single update_task. Returns a list of (task, action).
+    """
+    read_fields = index_key_read_fields(patch)
+    actions = []
+    
+    for task in tasks:
+        current_fields = {field: task[field] for field in read_fields if field in task}
+        update_expr, expr_attr_values, expr_attr_names, condition = prepare_conditional_update(
+            workspace_id, task["task_id"], patch, current_fields
+        )
+        
+        actions.append((task, {
+            "Update": {
+                "TableName": tasks_table.name,
+                "Key": {"PK": f"WORKSPACE#{workspace_id}", "SK": f"TASK#{task['task_id']}"},
+                "UpdateExpression": update_expr,
+                "ConditionExpression": condition,
+                "ExpressionAttributeNames": expr_attr_names,
+                "ExpressionAttributeValues": expr_attr_values
+            }
+        }))
+    
+    return actions
+
+@logger.inject_lambda_context(log_event=True)
+def handler(event, context):
+    """Handle bulk task update request."""
+    logger.info("Bulk update tasks request received")
+    
+    try:
+        # Extract user information from the event context
+        user = get_user_from_event(event)
+        if not user:
+            return build_response(401, {"message": "Unauthorized: User not authenticated"})
+        
+        # Parse the body from the event
+        if 'body' not in event or not event['body']:
+            return build_response(400, {"message": "Missing request body"})
+        
+        try:
+            body = json.loads(event['body'])
+        except json.JSONDecodeError:
+            return build_response(400, {"message": "Invalid JSON in request body"})
+        
+        if not isinstance(body, dict):
+            return build_response(400, {"message": "Request body must be an object"})
+        
+        # Check the task IDs, each task is updated once however often it is listed
+        task_ids = body.get("task_ids")
+        if not isinstance(task_ids, list) or not task_ids or not all(isinstance(task_id, str) and task_id for task_id in task_ids):
+            return build_response(400, {"message": "Request body must contain a non-empty task_ids array of strings"})
+        task_ids = list(dict.fromkeys(task_ids))
+        
+        if len(task_ids) > MAX_BULK_TASKS:
+            return build_response(400, {"message": f"At most {MAX_BULK_TASKS} tasks can be updated per request"})
+        
+        # Validate the patch applied to every task
+        patch = body.get("patch")
+        is_valid, validation_error = validate_task_patch(patch)
+        if not is_valid:
+            return build_response(400, {"message": validation_error})
+        
+        # Extract the workspace_id from path parameters
+        if 'pathParameters' not in event or not event['pathParameters'] or 'workspaceId' not in event['pathParameters']:
+            return build_response(400, {"message": "Missing workspace ID"})
+        workspace_id = event['pathParameters']['workspaceId']
+        
+        # Validate workspace access once for every task
+        has_access, access_error = validate_workspace_access(user["account_id"], workspace_id)
+        if not has_access:
+            return build_response(403, {"message": access_error or "Access denied to workspace"})
+        
+        # Read only the fields needed to rebuild index keys
+        keys = [{"PK": f"WORKSPACE#{workspace_id}", "SK": f"TASK#{task_id}"} for task_id in task_ids]
+        attributes = ["task_id"] + index_key_read_fields(patch)
+        tasks, unprocessed = batch_get_tasks(tasks_table, keys, attributes)
+        
+        # Write the updates in concurrent transactional chunks
+        actions = build_update_actions(workspace_id, tasks, {**patch, "updated_by": user["user_id"]})
+        failed = dict(transact_write(tasks_table, [action for _, action in actions]))
+        
+        results = {task_id: {"task_id": task_id, "status": "not_found"} for task_id in task_ids}
+        
+        # Tasks left unread by throttling may exist, so they are not reported missing
+        for key in unprocessed:
+            results[key["SK"][len("TASK#"):]].update(status="failed", error="Read throttled, retries exhausted")
+        
+        for index, (task, _) in enumerate(actions):
+            error = failed.get(index)
+            if error == CONDITION_FAILED:
+                results[task["task_id"]].update(status="conflict", error="Task was changed or deleted during the update")
+            elif error:
+                results[task["task_id"]].update(status="failed", error=error)
+            else:
+                results[task["task_id"]]["status"] = "updated"
+        
+        updated_count = sum(1 for result in results.values() if result["status"] == "updated")
+        
+        return build_response(200, {
+            "message": f"Updated {updated_count} of {len(task_ids)} tasks",
+            "updated": updated_count,
+            "failed": len(task_ids) - updated_count,
+            "results": [results[task_id] for task_id in task_ids]
+        })
+        
+    except Exception as e:
+        logger.exception("Error updating tasks in bulk")
+        return build_response(500, {"message": f"Internal server error: {str(e)}"})
@@ -3,8 +3,17 @@
 import json
 import os
 from aws_lambda_powertools import Logger
-from ...shared.utils.utils import build_response, get_user_from_event, validate_workspace_access
-from ...shared.models.task_models import create_task_item, validate_task_input
+from botocore.exceptions import ClientError
+from ...shared.utils.utils import (
+    build_response, get_user_from_event, validate_workspace_access, task_etag, get_task_by_id
+)
+from ...shared.models.task_models import (
+    MAX_TASK_DEPTH, create_task_item, validate_task_input, task_tree_path, tree_depth, rank_between
+)
+from ...shared.utils.tag_index import sync_task_tags
+from ...shared.utils.idempotency import run_idempotent
+from ...shared.utils.column_ranks import last_column_rank
+from ...shared.utils.task_tree import subtask_count_action
 
 # Initialize logger
 logger = Logger(service="TasksService")
@@ -17,6 +26,79 @@ import boto3
 dynamodb = boto3.resource('dynamodb')
 tasks_table = dynamodb.Table(TASKS_TABLE)
 
+def save_task(workspace_id, user, body, parent):
+    """Create the task and index its tags, returning the 201 response."""
+    # New tasks go to the bottom of their column, after its last card
+    status = body.get("status", "BACKLOG")
+    rank = rank_between(last_column_rank(tasks_table, workspace_id, status), None)
+    
+    # Create the task item for DynamoDB
+    task_item = create_task_item(
+        workspace_id=workspace_id,
+        account_id=user["account_id"],
+        title=body.get("title"),
+        description=body.get("description"),
+        status=status,
+        priority=body.get("priority", "MEDIUM"),
+        assignee_id=body.get("assignee_id"),
+        creator_id=user["user_id"],
+        creator_email=user["email"],
+        due_date=body.get("due_date"),
+        tags=body.get("tags"),
+        parent=parent,
+        rank=rank
+    )
+    
+    # Save the task to DynamoDB, a subtask together with its parent's count
+    if parent:
+        try:
+            tasks_table.meta.client.transact_write_items(TransactItems=[
+                {"Put": {"TableName": tasks_table.name, "Item": task_item}},
+                subtask_count_action(tasks_table.name, workspace_id, parent, 1)
+            ])
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "TransactionCanceledException":
+                raise
+            return build_response(409, {"message": "The parent task was moved or deleted meanwhile, retry the request"})
+    else:
+        tasks_table.put_item(Item=task_item)
+    
+    # Index the task under each of its tags
+    sync_task_tags(tasks_table, workspace_id, task_item["task_id"], new_tags=task_item.get("tags"))
+    
+    # Prepare the response
+    response_data = {
+        "message": "Task created successfully",
+        "task": {
+            "task_id": task_item["task_id"],
+            "title": task_item["title"],
+            "workspace_id": task_item["workspace_id"],
+            "status": task_item["status"],
+            "priority": task_item["priority"],
+            "created_at": task_item["created_at"],
+            "updated_at": task_item["updated_at"],
+            "version": task_item["version"]
+        }
+    }
+    
+    # Add optional fields to response if they exist
+    if "description" in task_item:
+        response_data["task"]["description"] = task_item["description"]
+    
+    if "assignee_id" in task_item:
+        response_data["task"]["assignee_id"] = task_item["assignee_id"]
+    
+    if "due_date" in task_item:
+        response_data["task"]["due_date"] = task_item["due_date"]
+    
+    if "tags" in task_item:
+        response_data["task"]["tags"] = task_item["tags"]
+    
+    if "parent_id" in task_item:
+        response_data["task"]["parent_id"] = task_item["parent_id"]
+    
+    return build_response(201, response_data, {"ETag": task_etag(task_item)})
+
 @logger.inject_lambda_context(log_event=True)
 def handler(event, context):
     """Handle task creation request."""
@@ -27,7 +109,7 @@ def handler(event, context):
         user = get_user_from_event(event)
         if not user:
             return build_response(401, {"message": "Unauthorized: User not authenticated"})
-
+        
         # Parse the body from the event
         if 'body' not in event or not event['body']:
             return build_response(400, {"message": "Missing request body"})
@@ -52,53 +134,21 @@ def handler(event, context):
         if not is_valid:
             return build_response(400, {"message": validation_error})
         
-        # Create the task item for DynamoDB
-        task_item = create_task_item(
-            workspace_id=workspace_id,
-            account_id=user["account_id"],
-            title=body.get("title"),
-            description=body.get("description"),
-            status=body.get("status", "BACKLOG"),
-            priority=body.get("priority", "MEDIUM"),
-            assignee_id=body.get("assignee_id"),
-            creator_id=user["user_id"],
-            creator_email=user["email"],
-            due_date=body.get("due_date"),
-            tags=body.get("tags")
-        )
-        
-        # Save the task to DynamoDB
-        tasks_table.put_item(Item=task_item)
-        
-        # Prepare the response
-        response_data = {
-            "message": "Task created successfully",
-            "task": {
-                "task_id": task_item["task_id"],
-                "title": task_item["title"],
-                "workspace_id": task_item["workspace_id"],
-                "status": task_item["status"],
-                "priority": task_item["priority"],
-                "created_at": task_item["created_at"],
-                "updated_at": task_item["updated_at"],
-            }
-        }
-        
-        # Add optional fields to response if they exist
-        if "description" in task_item:
-            response_data["task"]["description"] = task_item["description"]
-        
-        if "assignee_id" in task_item:
-            response_data["task"]["assignee_id"] = task_item["assignee_id"]
-        
-        if "due_date" in task_item:
-            response_data["task"]["due_date"] = task_item["due_date"]
-        
-        if "tags" in task_item:
-            response_data["task"]["tags"] = task_item["tags"]
-        
-        return build_response(201, response_data)
+        # A subtask extends its parent's tree path
+        parent = None
+        if body.get("parent_id"):
+            parent = get_task_by_id(workspace_id, body["parent_id"], ["task_id", "tree_path"])
+            if not parent:
+                return build_response(400, {"message": f"Parent task with ID {body['parent_id']} not found"})
+            if tree_depth(task_tree_path(parent)) >= MAX_TASK_DEPTH:
+                return build_response(400, {"message": f"Subtasks can be nested at most {MAX_TASK_DEPTH} levels deep"})
         
+        # Create the task once per Idempotency-Key
+        return run_idempotent(
+            tasks_table, event, f"{workspace_id}#{user['user_id']}#create_task", body,
+            lambda: save_task(workspace_id, user, body, parent), logger
+        )
+    
     except Exception as e:
         logger.exception("Error creating task")
         return build_response(500, {"message": f"Internal server error: {str(e)}"}) 
\ No newline at end of file
@@ -1,8 +1,17 @@
 """Lambda function to delete a task."""
 
 import os
+from datetime import datetime
 from aws_lambda_powertools import Logger
-from ...shared.utils.utils import build_response, get_user_from_event, get_task_by_id, validate_workspace_access
+from botocore.exceptions import ClientError
+from ...shared.utils.utils import (
+    build_response, get_user_from_event, validate_workspace_access,
+    parse_if_match, task_conflict_response
+)
+from ...shared.models.task_models import prepare_soft_delete
+from ...shared.utils.tag_index import sync_task_tags
+from ...shared.utils.task_dependencies import remove_task_links
+from ...shared.utils.task_tree import uncount_subtask
 
 # Initialize logger
 logger = Logger(service="TasksService")
@@ -47,26 +56,53 @@ def handler(event, context):
         if not has_access:
             return build_response(403, {"message": access_error or "Access denied to workspace"})
         
-        # Get the task to ensure it exists and belongs to the workspace
-        existing_task = get_task_by_id(workspace_id, task_id)
-        if not existing_task:
-            return build_response(404, {"message": f"Task with ID {task_id} not found"})
+        # Only delete the version the client read, if it sent one
+        expected_version, if_match_error = parse_if_match(event)
+        if if_match_error:
+            return build_response(400, {"message": if_match_error})
         
-        # Delete the task from DynamoDB
-        tasks_table.delete_item(
-            Key={
-                "PK": f"WORKSPACE#{workspace_id}",
-                "SK": f"TASK#{task_id}"
-            }
-        )
+        update_expr, expr_attr_values, expr_attr_names, condition = prepare_soft_delete(user["user_id"], expected_version)
+        
+        # Tombstone the task in one conditional write, failing if it is missing,
+        # already deleted or at another version. The old item comes back for tag
+        # upkeep, so no prior read is needed.
+        try:
+            response = tasks_table.update_item(
+                Key={
+                    "PK": f"WORKSPACE#{workspace_id}",
+                    "SK": f"TASK#{task_id}"
+                },
+                UpdateExpression=update_expr,
+                ConditionExpression=condition,
+                ExpressionAttributeValues=expr_attr_values,
+                ExpressionAttributeNames=expr_attr_names,
+                ReturnValues="ALL_OLD"
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+            return task_conflict_response(workspace_id, task_id, expected_version)
+        existing_task = response["Attributes"]
+        
+        # Drop the task from the tag index
+        sync_task_tags(tasks_table, workspace_id, task_id, old_tags=existing_task.get("tags"))
+        
+        # A subtask no longer counts towards its parent
+        if existing_task.get("parent_id"):
+            uncount_subtask(tasks_table, workspace_id, existing_task["parent_id"])
+        
+        # Drop the task's links, which bumps the graph version so the cached
+        # plan is rebuilt without it. New links to a deleted task are refused.
+        remove_task_links(tasks_table, workspace_id, task_id)
         
         # Return success response
         return build_response(200, {
             "message": "Task deleted successfully",
             "task_id": task_id,
-            "workspace_id": workspace_id
+            "workspace_id": workspace_id,
+            "restorable_until": datetime.utcfromtimestamp(int(expr_attr_values[":expires_at"])).isoformat()
         })
-        
+    
     except Exception as e:
         logger.exception("Error deleting task")
         return build_response(500, {"message": f"Internal server error: {str(e)}"}) 
\ No newline at end of file
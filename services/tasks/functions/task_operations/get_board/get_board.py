@@ -0,0 +1,124 @@
+"""Lambda function to get the kanban board for a workspace."""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from aws_lambda_powertools import Logger
+from ...shared.utils.utils import build_response, get_user_from_event, validate_workspace_access
+from ...shared.utils.cursor import encode_cursor
+from ...shared.utils.query_planner import plan_task_query, add_projection, task_cursor_scope
+from ...shared.models.task_models import VALID_STATUSES, parse_fields, select_fields
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Initialize DynamoDB resource
+import boto3
+
+# Columns are in the order tasks were moved into, the same as list_tasks with sort=rank,
+# so a column cursor can be passed to list_tasks to load more of that column
+COLUMN_SORT = "rank"
+
+# boto3 resources are not thread-safe, so each worker thread gets its own table
+_worker = threading.local()
+
+def _init_worker():
+    """Create the DynamoDB table resource for a worker thread."""
+    _worker.tasks_table = boto3.session.Session().resource('dynamodb').Table(TASKS_TABLE)
+
+# One worker per column, kept across warm invocations
+executor = ThreadPoolExecutor(max_workers=len(VALID_STATUSES), initializer=_init_worker)
+
+def query_column(workspace_id, status, filters, page_size, fields):
+    """Query the first page of one status column."""
+    column_params = {**filters, "status": status, "sort": COLUMN_SORT}
+    query_args = plan_task_query(workspace_id, column_params, ("rank", False))
+    query_args['Limit'] = page_size
+    
+    if fields:
+        add_projection(query_args, fields)
+    
+    response = _worker.tasks_table.query(**query_args)
+    tasks = response.get('Items', [])
+    
+    if fields:
+        tasks = [select_fields(task, fields) for task in tasks]
+    
+    column = {
+        "status": status,
+        "tasks": tasks,
+        "count": len(tasks)
+    }
+    
+    # Add a column cursor if more tasks exist
+    if response.get('LastEvaluatedKey'):
+        cursor_scope = task_cursor_scope(workspace_id, query_args['IndexName'], column_params)
+        column["next_token"] = encode_cursor(response['LastEvaluatedKey'], cursor_scope)
+    
+    return column
+
+@logger.inject_lambda_context(log_event=True)
+def handler(event, context):
+    """Handle get board request."""
+    logger.info("Get board request received")
+    
+    try:
+        # Extract user information from the event context
+        user = get_user_from_event(event)
+        if not user:
+            return build_response(401, {"message": "Unauthorized: User not authenticated"})
+        
+        # Extract path parameters
+        if 'pathParameters' not in event or not event['pathParameters']:
+            return build_response(400, {"message": "Missing path parameters"})
+        
+        path_params = event['pathParameters']
+        
+        # Check for workspace_id
+        if 'workspaceId' not in path_params or not path_params['workspaceId']:
+            return build_response(400, {"message": "Missing workspace ID"})
+        workspace_id = path_params['workspaceId']
+        
+        # Validate workspace access
+        has_access, access_error = validate_workspace_access(user["account_id"], workspace_id)
+        if not has_access:
+            return build_response(403, {"message": access_error or "Access denied to workspace"})
+        
+        query_params = event.get('queryStringParameters', {}) or {}
+        
+        # Validate the selected fields
+        fields, fields_error = parse_fields(query_params.get('fields'))
+        if fields_error:
+            return build_response(400, {"message": fields_error})
+        
+        # Set the page size for each column
+        page_size = 20  # Default page size
+        if 'limit' in query_params:
+            try:
+                page_size = int(query_params['limit'])
+                if page_size < 1 or page_size > 100:
+                    page_size = 20  # Reset to default if out of bounds
+            except ValueError:
+                pass  # Use default if conversion fails
+        
+        # Filters applied within every column
+        filters = {"assignee_id": query_params.get('assignee_id')}
+        
+        # Query all columns concurrently, latency is the slowest column rather than the sum
+        futures = [
+            executor.submit(query_column, workspace_id, status, filters, page_size, fields)
+            for status in VALID_STATUSES
+        ]
+        columns = [future.result() for future in futures]
+        
+        return build_response(200, {
+            "workspace_id": workspace_id,
+            "columns": columns
+        })
+        
+    except Exception as e:
+        logger.exception("Error getting board")
+        return build_response(500, {"message": f"Internal server error: {str(e)}"})
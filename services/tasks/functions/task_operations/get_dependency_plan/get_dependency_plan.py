@@ -0,0 +1,63 @@
+"""Lambda function to get the dependency plan of a workspace."""
+
+import os
+from aws_lambda_powertools import Logger
+from ...shared.utils.utils import build_response, get_user_from_event, validate_workspace_access
+from ...shared.utils.task_dependencies import get_plan
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+
+@logger.inject_lambda_context(log_event=True)
+def handler(event, context):
+    """Handle get dependency plan request.
+    
+    Returns the workspace's linked tasks in topological order, the critical
+    path and each blocked task's blockers. The plan is recomputed only when a
+    link changed since it was last cached.
+    """
+    logger.info("Get dependency plan request received")
+    
+    try:
+        # Extract user information from the event context
+        user = get_user_from_event(event)
+        if not user:
+            return build_response(401, {"message": "Unauthorized: User not authenticated"})
+        
+        # Extract the workspace_id from path parameters
+        if 'pathParameters' not in event or not event['pathParameters'] or 'workspaceId' not in event['pathParameters']:
+            return build_response(400, {"message": "Missing workspace ID"})
+        workspace_id = event['pathParameters']['workspaceId']
+        
+        # Validate workspace access
+        has_access, access_error = validate_workspace_access(user["account_id"], workspace_id)
+        if not has_access:
+            return build_response(403, {"message": access_error or "Access denied to workspace"})
+        
+        try:
+            plan, graph_version, cached = get_plan(tasks_table, workspace_id)
+        except ValueError:
+            # Links are checked for cycles as they are added, so this means a bug or manual edits
+            logger.error("Dependency graph has a cycle", extra={"workspace_id": workspace_id})
+            return build_response(409, {"message": "Dependency graph has a cycle"})
+        
+        return build_response(200, {
+            "workspace_id": workspace_id,
+            "graph_version": graph_version,
+            "order": plan["order"],
+            "critical_path": plan["critical_path"],
+            "blocked": plan["blocked_by"],
+            "cached": cached
+        })
+    
+    except Exception as e:
+        logger.exception("Error getting dependency plan")
+        return build_response(500, {"message": f"Internal server error: {str(e)}"})
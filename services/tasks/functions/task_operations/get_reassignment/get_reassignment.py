@@ -0,0 +1,54 @@
+"""Lambda function to retrieve the status of a reassignment job."""
+
+import os
+from aws_lambda_powertools import Logger
+from ...shared.utils.utils import build_response, get_user_from_event, validate_workspace_access
+from ...shared.models.task_models import select_fields
+from ...shared.utils.reassignment_jobs import get_job, JOB_FIELDS
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+
+@logger.inject_lambda_context(log_event=True)
+def handler(event, context):
+    """Handle get reassignment request."""
+    logger.info("Get reassignment request received")
+    
+    try:
+        # Extract user information from the event context
+        user = get_user_from_event(event)
+        if not user:
+            return build_response(401, {"message": "Unauthorized: User not authenticated"})
+        
+        # Extract path parameters
+        path_params = event.get('pathParameters') or {}
+        if not path_params.get('workspaceId'):
+            return build_response(400, {"message": "Missing workspace ID"})
+        workspace_id = path_params['workspaceId']
+        
+        if not path_params.get('jobId'):
+            return build_response(400, {"message": "Missing job ID"})
+        job_id = path_params['jobId']
+        
+        # Validate workspace access
+        has_access, access_error = validate_workspace_access(user["account_id"], workspace_id)
+        if not has_access:
+            return build_response(403, {"message": access_error or "Access denied to workspace"})
+        
+        job = get_job(tasks_table, workspace_id, job_id)
+        if not job:
+            return build_response(404, {"message": f"Reassignment job with ID {job_id} not found"})
+        
+        return build_response(200, {"job": select_fields(job, JOB_FIELDS)})
+    
+    except Exception as e:
+        logger.exception("Error retrieving reassignment")
+        return build_response(500, {"message": f"Internal server error: {str(e)}"})
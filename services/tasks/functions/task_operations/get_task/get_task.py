@@ -3,7 +3,8 @@
 import json
 import os
 from aws_lambda_powertools import Logger
-from ...shared.utils.utils import build_response, get_user_from_event, get_task_by_id, validate_workspace_access
+from ...shared.utils.utils import build_response, get_user_from_event, get_task_by_id, validate_workspace_access, task_etag
+from ...shared.models.task_models import parse_fields, select_fields
 
 # Initialize logger
 logger = Logger(service="TasksService")
@@ -40,15 +41,20 @@ def handler(event, context):
         if not has_access:
             return build_response(403, {"message": access_error or "Access denied to workspace"})
         
-        # Get the task from DynamoDB
-        task = get_task_by_id(workspace_id, task_id)
+        # Validate the selected fields
+        query_params = event.get('queryStringParameters', {}) or {}
+        fields, fields_error = parse_fields(query_params.get('fields'))
+        if fields_error:
+            return build_response(400, {"message": fields_error})
+        
+        # Get the task from DynamoDB, reading only the selected fields (and the version for the ETag) if any
+        task = get_task_by_id(workspace_id, task_id, fields and fields + ["version"])
         
         if not task:
             return build_response(404, {"message": f"Task with ID {task_id} not found"})
         
-        # Verify that the task belongs to the specified workspace
-        if task.get("workspace_id") != workspace_id:
-            return build_response(404, {"message": f"Task with ID {task_id} not found in workspace {workspace_id}"})
+        if fields:
+            return build_response(200, {"task": select_fields(task, fields)}, {"ETag": task_etag(task)})
         
         # Prepare response with task details
         response_data = {
@@ -60,7 +66,8 @@ def handler(event, context):
                 "priority": task["priority"],
                 "created_at": task["created_at"],
                 "updated_at": task["updated_at"],
-                "created_by": task["created_by"]
+                "created_by": task["created_by"],
+                "version": task.get("version", 0)
             }
         }
         
@@ -70,7 +77,7 @@ def handler(event, context):
             if field in task:
                 response_data["task"][field] = task[field]
         
-        return build_response(200, response_data)
+        return build_response(200, response_data, {"ETag": task_etag(task)})
         
     except Exception as e:
         logger.exception("Error retrieving task")
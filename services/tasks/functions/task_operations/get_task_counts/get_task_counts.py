@@ -0,0 +1,57 @@
+"""Lambda function to get task counts for a workspace."""
+
+import os
+from aws_lambda_powertools import Logger
+from ...shared.utils.utils import build_response, get_user_from_event, validate_workspace_access
+from ...shared.utils.task_counters import get_task_counts
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+
+@logger.inject_lambda_context(log_event=True)
+def handler(event, context):
+    """Handle get task counts request."""
+    logger.info("Get task counts request received")
+    
+    try:
+        # Extract user information from the event context
+        user = get_user_from_event(event)
+        if not user:
+            return build_response(401, {"message": "Unauthorized: User not authenticated"})
+        
+        # Extract path parameters
+        if 'pathParameters' not in event or not event['pathParameters']:
+            return build_response(400, {"message": "Missing path parameters"})
+        
+        path_params = event['pathParameters']
+        
+        # Check for workspace_id
+        if 'workspaceId' not in path_params or not path_params['workspaceId']:
+            return build_response(400, {"message": "Missing workspace ID"})
+        workspace_id = path_params['workspaceId']
+        
+        # Validate workspace access
+        has_access, access_error = validate_workspace_access(user["account_id"], workspace_id)
+        if not has_access:
+            return build_response(403, {"message": access_error or "Access denied to workspace"})
+        
+        # Read the workspace counters item
+        counts = get_task_counts(tasks_table, workspace_id)
+        
+        return build_response(200, {
+            "workspace_id": workspace_id,
+            **counts,
+            "assigned_to_me": counts["by_assignee"].get(user["user_id"], 0)
+        })
+        
+    except Exception as e:
+        logger.exception("Error getting task counts")
+        return build_response(500, {"message": f"Internal server error: {str(e)}"})
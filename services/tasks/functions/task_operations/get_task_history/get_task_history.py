@@ -0,0 +1,100 @@
+"""Lambda function to list the history of a task."""
+
+import os
+from aws_lambda_powertools import Logger
+from ...shared.utils.utils import build_response, get_user_from_event, validate_workspace_access, get_task_by_id
+from ...shared.utils.cursor import build_cursor_scope, encode_cursor, decode_cursor
+from ...shared.utils.task_history import HISTORY_ENTRY_FIELDS, query_task_history
+from ...shared.models.task_models import select_fields
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+
+@logger.inject_lambda_context(log_event=True)
+def handler(event, context):
+    """Handle task history request.
+    
+    Entries are returned newest first. A deleted task's history is hidden
+    until the task is restored, and removed when its tombstone is purged.
+    """
+    logger.info("Get task history request received")
+    
+    try:
+        # Extract user information from the event context
+        user = get_user_from_event(event)
+        if not user:
+            return build_response(401, {"message": "Unauthorized: User not authenticated"})
+        
+        # Extract path parameters
+        if 'pathParameters' not in event or not event['pathParameters']:
+            return build_response(400, {"message": "Missing path parameters"})
+        
+        path_params = event['pathParameters']
+        
+        # Check for workspace_id
+        if 'workspaceId' not in path_params or not path_params['workspaceId']:
+            return build_response(400, {"message": "Missing workspace ID"})
+        workspace_id = path_params['workspaceId']
+        
+        # Check for task_id
+        if 'taskId' not in path_params or not path_params['taskId']:
+            return build_response(400, {"message": "Missing task ID"})
+        task_id = path_params['taskId']
+        
+        # Validate workspace access
+        has_access, access_error = validate_workspace_access(user["account_id"], workspace_id)
+        if not has_access:
+            return build_response(403, {"message": access_error or "Access denied to workspace"})
+        
+        query_params = event.get('queryStringParameters', {}) or {}
+        
+        # Cursors only resume this task's history
+        cursor_scope = build_cursor_scope(workspace_id, "HISTORY", task_id)
+        exclusive_start_key = None
+        if 'next_token' in query_params:
+            exclusive_start_key, cursor_error = decode_cursor(query_params['next_token'], cursor_scope)
+            if cursor_error:
+                return build_response(400, {"message": cursor_error})
+        
+        # Set the page size
+        page_size = 20  # Default page size
+        if 'limit' in query_params:
+            try:
+                page_size = int(query_params['limit'])
+                if page_size < 1 or page_size > 100:
+                    page_size = 20  # Reset to default if out of bounds
+            except ValueError:
+                pass  # Use default if conversion fails
+        
+        # History is only read for tasks that exist
+        if not get_task_by_id(workspace_id, task_id, ["task_id"]):
+            return build_response(404, {"message": f"Task with ID {task_id} not found"})
+        
+        entries, last_evaluated_key = query_task_history(
+            tasks_table, workspace_id, task_id, page_size, exclusive_start_key
+        )
+        
+        response_data = {
+            "workspace_id": workspace_id,
+            "task_id": task_id,
+            "history": [select_fields(entry, HISTORY_ENTRY_FIELDS) for entry in entries],
+            "count": len(entries)
+        }
+        
+        # Add a cursor if more entries exist
+        if last_evaluated_key:
+            response_data["next_token"] = encode_cursor(last_evaluated_key, cursor_scope)
+        
+        return build_response(200, response_data)
+    
+    except Exception as e:
+        logger.exception("Error retrieving task history")
+        return build_response(500, {"message": f"Internal server error: {str(e)}"})
@@ -0,0 +1,71 @@
+"""Lambda function to retrieve a task with all of its subtasks as a tree."""
+
+import os
+from aws_lambda_powertools import Logger
+from ...shared.utils.utils import build_response, get_user_from_event, get_task_by_id, validate_workspace_access
+from ...shared.models.task_models import task_tree_path
+from ...shared.utils.task_tree import query_subtree, build_task_tree
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+
+@logger.inject_lambda_context(log_event=True)
+def handler(event, context):
+    """Handle get task tree request.
+    
+    The task's subtree shares its GSI9 key prefix, so every level below the
+    task is read with one Query and nested in memory.
+    """
+    logger.info("Get task tree request received")
+    
+    try:
+        # Extract user information from the event context
+        user = get_user_from_event(event)
+        if not user:
+            return build_response(401, {"message": "Unauthorized: User not authenticated"})
+        
+        # Extract path parameters
+        if 'pathParameters' not in event or not event['pathParameters']:
+            return build_response(400, {"message": "Missing path parameters"})
+        
+        path_params = event['pathParameters']
+        
+        # Check for workspace_id
+        if 'workspaceId' not in path_params or not path_params['workspaceId']:
+            return build_response(400, {"message": "Missing workspace ID"})
+        workspace_id = path_params['workspaceId']
+        
+        # Check for task_id
+        if 'taskId' not in path_params or not path_params['taskId']:
+            return build_response(400, {"message": "Missing task ID"})
+        task_id = path_params['taskId']
+        
+        # Validate workspace access
+        has_access, access_error = validate_workspace_access(user["account_id"], workspace_id)
+        if not has_access:
+            return build_response(403, {"message": access_error or "Access denied to workspace"})
+        
+        # The root's path is the key prefix of its whole subtree
+        root = get_task_by_id(workspace_id, task_id)
+        if not root:
+            return build_response(404, {"message": f"Task with ID {task_id} not found"})
+        
+        tasks = query_subtree(tasks_table, workspace_id, task_tree_path(root))
+        
+        # The index is eventually consistent, the root read above is not
+        tasks = [root] + [task for task in tasks if task["task_id"] != task_id]
+        tree = build_task_tree(tasks, task_id)
+        
+        return build_response(200, {"workspace_id": workspace_id, "task": tree})
+    
+    except Exception as e:
+        logger.exception("Error retrieving task tree")
+        return build_response(500, {"message": f"Internal server error: {str(e)}"})
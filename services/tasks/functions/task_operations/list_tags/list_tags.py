@@ -0,0 +1,70 @@
+"""Lambda function to list the most used tags in a workspace."""
+
+import os
+from aws_lambda_powertools import Logger
+from ...shared.utils.utils import build_response, get_user_from_event, validate_workspace_access
+from ...shared.utils.tag_index import list_tag_counts
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+
+@logger.inject_lambda_context(log_event=True)
+def handler(event, context):
+    """Handle list tags request."""
+    logger.info("List tags request received")
+    
+    try:
+        # Extract user information from the event context
+        user = get_user_from_event(event)
+        if not user:
+            return build_response(401, {"message": "Unauthorized: User not authenticated"})
+        
+        # Extract path parameters
+        if 'pathParameters' not in event or not event['pathParameters']:
+            return build_response(400, {"message": "Missing path parameters"})
+        
+        path_params = event['pathParameters']
+        
+        # Check for workspace_id
+        if 'workspaceId' not in path_params or not path_params['workspaceId']:
+            return build_response(400, {"message": "Missing workspace ID"})
+        workspace_id = path_params['workspaceId']
+        
+        # Validate workspace access
+        has_access, access_error = validate_workspace_access(user["account_id"], workspace_id)
+        if not has_access:
+            return build_response(403, {"message": access_error or "Access denied to workspace"})
+        
+        query_params = event.get('queryStringParameters', {}) or {}
+        prefix = query_params.get('prefix', '')
+        
+        # Set the number of tags to return
+        limit = 10  # Default limit
+        if 'limit' in query_params:
+            try:
+                limit = int(query_params['limit'])
+                if limit < 1 or limit > 50:
+                    limit = 10  # Reset to default if out of bounds
+            except ValueError:
+                pass  # Use default if conversion fails
+        
+        # Read the tag counters, most used first
+        tags = list_tag_counts(tasks_table, workspace_id, prefix, limit)
+        
+        return build_response(200, {
+            "tags": tags,
+            "count": len(tags),
+            "workspace_id": workspace_id
+        })
+        
+    except Exception as e:
+        logger.exception("Error listing tags")
+        return build_response(500, {"message": f"Internal server error: {str(e)}"})
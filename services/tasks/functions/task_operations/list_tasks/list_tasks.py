@@ -1,10 +1,20 @@
 """Lambda function to list tasks for a workspace."""
 
-import json
 import os
-from boto3.dynamodb.conditions import Key
 from aws_lambda_powertools import Logger
-from ...shared.utils.utils import build_response, get_user_from_event, validate_workspace_access, DecimalEncoder
+from ...shared.utils.utils import build_response, get_user_from_event, validate_workspace_access
+from ...shared.utils.cursor import encode_cursor, decode_cursor
+from ...shared.utils.pagination import query_fill_page, parse_capacity_budget
+from ...shared.utils.query_planner import (
+    plan_task_query,
+    parse_sort,
+    parse_due_date_range,
+    parse_created_range,
+    add_projection,
+    task_cursor_scope
+)
+from ...shared.models.task_models import parse_fields, select_fields
+from ...shared.utils.tag_index import query_tagged_tasks
 
 # Initialize logger
 logger = Logger(service="TasksService")
@@ -47,82 +57,47 @@ def handler(event, context):
         # Extract query parameters for filtering
         query_params = event.get('queryStringParameters', {}) or {}
         
-        # Initialize query parameters
-        filter_expression = None
-        expression_attr_values = {}
-        expression_attr_names = {}
+        # Validate the requested sort order
+        sort, sort_error = parse_sort(query_params.get('sort'))
+        if sort_error:
+            return build_response(400, {"message": sort_error})
         
-        # Set up base query to get all tasks for a workspace
-        query_args = {
-            'IndexName': 'GSI1',
-            'KeyConditionExpression': Key('GSI1PK').eq(f"WORKSPACE#{workspace_id}")
-        }
+        # Validate the due date range
+        due_range, due_range_error = parse_due_date_range(query_params)
+        if due_range_error:
+            return build_response(400, {"message": due_range_error})
         
-        # Add filters based on query parameters
-        filter_conditions = []
+        # Validate the creation window
+        created_range, created_range_error = parse_created_range(query_params)
+        if created_range_error:
+            return build_response(400, {"message": created_range_error})
         
-        # Filter by status
-        if 'status' in query_params:
-            status = query_params['status'].upper()
-            valid_statuses = ["BACKLOG", "TODO", "IN_PROGRESS", "DONE"]
-            
-            if status in valid_statuses:
-                # For status, we can optimize by starting the key condition with the status prefix
-                query_args['KeyConditionExpression'] = Key('GSI1PK').eq(f"WORKSPACE#{workspace_id}") & \
-                                                    Key('GSI1SK').begins_with(f"STATUS#{status}")
-        
-        # Filter by assignee
-        if 'assignee_id' in query_params and query_params['assignee_id']:
-            assignee_id = query_params['assignee_id']
-            
-            # Use GSI2 when filtering by assignee for more efficient queries
-            query_args = {
-                'IndexName': 'GSI2',
-                'KeyConditionExpression': Key('GSI2PK').eq(f"WORKSPACE#{workspace_id}") & \
-                                        Key('GSI2SK').begins_with(f"ASSIGNEE#{assignee_id}")
-            }
-        
-        # Filter by priority
-        if 'priority' in query_params:
-            priority = query_params['priority'].upper()
-            valid_priorities = ["LOW", "MEDIUM", "HIGH", "URGENT"]
-            
-            if priority in valid_priorities:
-                filter_conditions.append("contains(#GSI1SK, :priority)")
-                expression_attr_names["#GSI1SK"] = "GSI1SK"
-                expression_attr_values[":priority"] = f"PRIORITY#{priority}"
-        
-        # Filter by tags (if present)
-        if 'tag' in query_params:
-            tag = query_params['tag']
-            filter_conditions.append("contains(#tags, :tag)")
-            expression_attr_names["#tags"] = "tags"
-            expression_attr_values[":tag"] = tag
-        
-        # Filter by due date range
-        if 'due_date_start' in query_params:
-            filter_conditions.append("#due_date >= :due_date_start")
-            expression_attr_names["#due_date"] = "due_date"
-            expression_attr_values[":due_date_start"] = query_params['due_date_start']
-            
-        if 'due_date_end' in query_params:
-            filter_conditions.append("#due_date <= :due_date_end")
-            expression_attr_names["#due_date"] = "due_date"
-            expression_attr_values[":due_date_end"] = query_params['due_date_end']
+        # Validate the selected fields
+        fields, fields_error = parse_fields(query_params.get('fields'))
+        if fields_error:
+            return build_response(400, {"message": fields_error})
+        
+        # Pick the index and key condition that serve the filters and sort order
+        query_args = plan_task_query(workspace_id, query_params, sort, due_range, created_range)
+        
+        # Read only the selected fields
+        if fields:
+            add_projection(query_args, fields)
+        
+        # Tag filters read the tag index unless a sort, due date or creation window key is needed
+        use_tag_index = query_params.get('tag') and not sort and not due_range and not created_range
         
-        # Combine filter conditions if any exist
-        if filter_conditions:
-            query_args['FilterExpression'] = " AND ".join(filter_conditions)
-            query_args['ExpressionAttributeNames'] = expression_attr_names
-            query_args['ExpressionAttributeValues'] = expression_attr_values
+        # Cursors only resume the same query in the same workspace
+        cursor_scope = task_cursor_scope(
+            workspace_id, "TAG" if use_tag_index else query_args.get('IndexName', "TABLE"), query_params
+        )
         
         # Get pagination token if provided
         if 'next_token' in query_params:
-            try:
-                exclusive_start_key = json.loads(query_params['next_token'])
-                query_args['ExclusiveStartKey'] = exclusive_start_key
-            except (json.JSONDecodeError, TypeError):
-                return build_response(400, {"message": "Invalid pagination token"})
+            exclusive_start_key, cursor_error = decode_cursor(query_params['next_token'], cursor_scope)
+            if cursor_error:
+                return build_response(400, {"message": cursor_error})
+            query_args['ExclusiveStartKey'] = exclusive_start_key
         
         # Set the page size
         page_size = 20  # Default page size
@@ -134,13 +109,35 @@ def handler(event, context):
             except ValueError:
                 pass  # Use default if conversion fails
         
-        query_args['Limit'] = page_size
+        # Fill-page mode keeps querying until the page is full or the budget runs out
+        fill_page = query_params.get('fill_page', '').lower() == 'true'
         
-        # Execute the query
-        response = tasks_table.query(**query_args)
+        if use_tag_index:
+            fill_page = False
+            tasks, last_evaluated_key, unprocessed = query_tagged_tasks(
+                tasks_table, workspace_id, query_params['tag'], query_params,
+                page_size, query_args.get('ExclusiveStartKey'), fields
+            )
+            if unprocessed:
+                return build_response(503, {"message": "Tagged tasks could not be read, retry the request"})
+        elif fill_page:
+            capacity_budget = parse_capacity_budget(query_params.get('max_read_units'))
+            tasks, last_evaluated_key, stats = query_fill_page(
+                tasks_table, query_args, page_size, capacity_budget
+            )
+        else:
+            query_args['Limit'] = page_size
+            
+            # Execute the query
+            response = tasks_table.query(**query_args)
+            
+            # Process the results
+            tasks = response.get('Items', [])
+            last_evaluated_key = response.get('LastEvaluatedKey')
         
-        # Process the results
-        tasks = response.get('Items', [])
+        # Drop the key attributes read alongside the selected fields
+        if fields:
+            tasks = [select_fields(task, fields) for task in tasks]
         
         # Format response
         response_data = {
@@ -149,12 +146,14 @@ def handler(event, context):
             "workspace_id": workspace_id
         }
         
+        # Report how much was read to fill the page
+        if fill_page:
+            response_data["scanned_count"] = stats["scanned_count"]
+            response_data["consumed_capacity"] = stats["consumed_capacity"]
+        
         # Add pagination token if more results exist
-        if 'LastEvaluatedKey' in response:
-            response_data["next_token"] = json.dumps(
-                response['LastEvaluatedKey'],
-                cls=DecimalEncoder
-            )
+        if last_evaluated_key:
+            response_data["next_token"] = encode_cursor(last_evaluated_key, cursor_scope)
         
         return build_response(200, response_data)
         
@@ -0,0 +1,164 @@
+"""Lambda function to move a task within or between board columns."""
+
+import json
+import os
+from aws_lambda_powertools import Logger
+from ...shared.utils.utils import (
+    build_response, get_user_from_event, validate_workspace_access,
+    parse_if_match, task_etag, task_conflict_response
+)
+from ...shared.models.task_models import (
+    VALID_STATUSES, MAX_RANK_LENGTH, TASK_FIELDS, task_rank, rank_between, select_fields
+)
+from ...shared.utils.batch_reads import batch_get_items
+from ...shared.utils.task_writes import update_task_item
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table and worker function names from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+REBALANCE_COLUMN_FUNCTION = os.environ.get('REBALANCE_COLUMN_FUNCTION', 'rebalance-column')
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+lambda_client = boto3.client('lambda')
+
+# Neighbour fields needed to place a task between them
+NEIGHBOUR_FIELDS = ["task_id", "status", "rank", "created_at"]
+
+def validate_move_input(body, task_id):
+    """Validate a move request body."""
+    if body.get("status") not in VALID_STATUSES:
+        return False, f"Invalid status value. Must be one of: {', '.join(VALID_STATUSES)}"
+    
+    for field in ("after_task_id", "before_task_id"):
+        neighbour_id = body.get(field)
+        if neighbour_id is not None and (not isinstance(neighbour_id, str) or not neighbour_id):
+            return False, f"{field} must be a task ID or null"
+        if neighbour_id == task_id:
+            return False, f"{field} must be another task"
+    
+    if body.get("after_task_id") and body.get("after_task_id") == body.get("before_task_id"):
+        return False, "after_task_id and before_task_id must be different tasks"
+    
+    return True, None
+
+def request_rebalance(workspace_id, status):
+    """Respread a column's ranks in the background."""
+    lambda_client.invoke(
+        FunctionName=REBALANCE_COLUMN_FUNCTION,
+        InvocationType="Event",
+        Payload=json.dumps({"workspace_id": workspace_id, "status": status})
+    )
+
+@logger.inject_lambda_context(log_event=True)
+def handler(event, context):
+    """Handle task move request.
+    
+    The task takes a rank between the two cards it was dropped between
+    (after_task_id above it, before_task_id below it, either null at the ends
+    of the column), so a move writes only the moved task.
+    """
+    logger.info("Move task request received")
+    
+    try:
+        # Extract user information from the event context
+        user = get_user_from_event(event)
+        if not user:
+            return build_response(401, {"message": "Unauthorized: User not authenticated"})
+        
+        # Parse the body from the event
+        if 'body' not in event or not event['body']:
+            return build_response(400, {"message": "Missing request body"})
+        
+        try:
+            body = json.loads(event['body'])
+        except json.JSONDecodeError:
+            return build_response(400, {"message": "Invalid JSON in request body"})
+        
+        if not isinstance(body, dict):
+            return build_response(400, {"message": "Request body must be an object"})
+        
+        # Extract path parameters
+        if 'pathParameters' not in event or not event['pathParameters']:
+            return build_response(400, {"message": "Missing path parameters"})
+        
+        path_params = event['pathParameters']
+        
+        # Check for workspace_id
+        if 'workspaceId' not in path_params or not path_params['workspaceId']:
+            return build_response(400, {"message": "Missing workspace ID"})
+        workspace_id = path_params['workspaceId']
+        
+        # Check for task_id
+        if 'taskId' not in path_params or not path_params['taskId']:
+            return build_response(400, {"message": "Missing task ID"})
+        task_id = path_params['taskId']
+        
+        is_valid, validation_error = validate_move_input(body, task_id)
+        if not is_valid:
+            return build_response(400, {"message": validation_error})
+        status = body["status"]
+        
+        # Validate workspace access
+        has_access, access_error = validate_workspace_access(user["account_id"], workspace_id)
+        if not has_access:
+            return build_response(403, {"message": access_error or "Access denied to workspace"})
+        
+        # Only move the version the client read, if it sent one
+        expected_version, if_match_error = parse_if_match(event)
+        if if_match_error:
+            return build_response(400, {"message": if_match_error})
+        
+        # Read both neighbours' ranks in one request
+        neighbour_ids = [body.get("after_task_id"), body.get("before_task_id")]
+        keys = [
+            {"PK": f"WORKSPACE#{workspace_id}", "SK": f"TASK#{neighbour_id}"}
+            for neighbour_id in neighbour_ids if neighbour_id
+        ]
+        neighbours, unprocessed = batch_get_items(tasks_table, keys, NEIGHBOUR_FIELDS) if keys else ({}, [])
+        if unprocessed:
+            return build_response(503, {"message": "Neighbour tasks could not be read, retry the move"})
+        
+        ranks = []
+        for neighbour_id in neighbour_ids:
+            if not neighbour_id:
+                ranks.append(None)
+                continue
+            neighbour = neighbours.get(f"TASK#{neighbour_id}")
+            if not neighbour:
+                return build_response(404, {"message": f"Task with ID {neighbour_id} not found"})
+            if neighbour.get("status") != status:
+                return build_response(409, {"message": f"Task with ID {neighbour_id} is not in column {status}"})
+            ranks.append(task_rank(neighbour))
+        
+        # Neighbours out of order mean the client's column is stale, or two tasks
+        # share a rank and the column needs spreading out
+        try:
+            rank = rank_between(*ranks)
+        except ValueError:
+            request_rebalance(workspace_id, status)
+            return build_response(409, {"message": "Column order has changed, reload the column and retry the move"})
+        
+        # One conditional write places the task, moving its other index keys if its status changes
+        existing_task, moved_task = update_task_item(
+            tasks_table, workspace_id, task_id, {"status": status, "rank": rank, "updated_by": user["user_id"]}, expected_version
+        )
+        if existing_task is None:
+            return task_conflict_response(workspace_id, task_id, expected_version)
+        
+        # Ranks grow with repeated moves into the same gap, shorten them again
+        if len(rank) > MAX_RANK_LENGTH:
+            request_rebalance(workspace_id, status)
+        
+        return build_response(200, {
+            "message": "Task moved successfully",
+            "task": select_fields(moved_task, TASK_FIELDS)
+        }, {"ETag": task_etag(moved_task)})
+    
+    except Exception as e:
+        logger.exception("Error moving task")
+        return build_response(500, {"message": f"Internal server error: {str(e)}"})
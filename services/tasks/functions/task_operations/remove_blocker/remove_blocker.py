@@ -0,0 +1,63 @@
+"""Lambda function to remove a blocker from a task."""
+
+import os
+from aws_lambda_powertools import Logger
+from ...shared.utils.utils import build_response, get_user_from_event, validate_workspace_access
+from ...shared.utils.task_dependencies import remove_link
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+
+@logger.inject_lambda_context(log_event=True)
+def handler(event, context):
+    """Handle remove blocker request."""
+    logger.info("Remove blocker request received")
+    
+    try:
+        # Extract user information from the event context
+        user = get_user_from_event(event)
+        if not user:
+            return build_response(401, {"message": "Unauthorized: User not authenticated"})
+        
+        # Extract path parameters
+        if 'pathParameters' not in event or not event['pathParameters']:
+            return build_response(400, {"message": "Missing path parameters"})
+        
+        path_params = event['pathParameters']
+        
+        # Check for workspace_id
+        if 'workspaceId' not in path_params or not path_params['workspaceId']:
+            return build_response(400, {"message": "Missing workspace ID"})
+        workspace_id = path_params['workspaceId']
+        
+        # Check for task_id
+        if 'taskId' not in path_params or not path_params['taskId']:
+            return build_response(400, {"message": "Missing task ID"})
+        task_id = path_params['taskId']
+        
+        # Check for blocker_id
+        if 'blockerId' not in path_params or not path_params['blockerId']:
+            return build_response(400, {"message": "Missing blocker ID"})
+        blocker_id = path_params['blockerId']
+        
+        # Validate workspace access
+        has_access, access_error = validate_workspace_access(user["account_id"], workspace_id)
+        if not has_access:
+            return build_response(403, {"message": access_error or "Access denied to workspace"})
+        
+        if not remove_link(tasks_table, workspace_id, task_id, blocker_id):
+            return build_response(404, {"message": f"Task with ID {task_id} is not blocked by task {blocker_id}"})
+        
+        return build_response(200, {"message": "Blocker removed successfully"})
+    
+    except Exception as e:
+        logger.exception("Error removing blocker")
+        return build_response(500, {"message": f"Internal server error: {str(e)}"})
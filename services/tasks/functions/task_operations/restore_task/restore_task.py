@@ -0,0 +1,119 @@
+"""Lambda function to restore a deleted task."""
+
+import os
+from aws_lambda_powertools import Logger
+from botocore.exceptions import ClientError
+from ...shared.utils.utils import (
+    build_response, get_user_from_event, validate_workspace_access,
+    get_deleted_task, get_task_by_id, task_etag
+)
+from ...shared.models.task_models import TASK_FIELDS, prepare_restore, select_fields
+from ...shared.utils.tag_index import sync_task_tags
+from ...shared.utils.task_tree import current_tree_path, subtask_count_action
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+
+@logger.inject_lambda_context(log_event=True)
+def handler(event, context):
+    """Handle task restore request.
+    
+    A subtask goes back under its parent's current path, which a move may have
+    changed while it was deleted, and counts towards the parent again.
+    """
+    logger.info("Restore task request received")
+    
+    try:
+        # Extract user information from the event context
+        user = get_user_from_event(event)
+        if not user:
+            return build_response(401, {"message": "Unauthorized: User not authenticated"})
+        
+        # Extract path parameters
+        if 'pathParameters' not in event or not event['pathParameters']:
+            return build_response(400, {"message": "Missing path parameters"})
+        
+        path_params = event['pathParameters']
+        
+        # Check for workspace_id
+        if 'workspaceId' not in path_params or not path_params['workspaceId']:
+            return build_response(400, {"message": "Missing workspace ID"})
+        workspace_id = path_params['workspaceId']
+        
+        # Check for task_id
+        if 'taskId' not in path_params or not path_params['taskId']:
+            return build_response(400, {"message": "Missing task ID"})
+        task_id = path_params['taskId']
+        
+        # Validate workspace access
+        has_access, access_error = validate_workspace_access(user["account_id"], workspace_id)
+        if not has_access:
+            return build_response(403, {"message": access_error or "Access denied to workspace"})
+        
+        # Only tombstones still inside the retention window can be restored
+        deleted_task = get_deleted_task(workspace_id, task_id)
+        if not deleted_task:
+            return build_response(404, {"message": f"No deleted task with ID {task_id} to restore"})
+        
+        tree_path, parent = current_tree_path(tasks_table, workspace_id, deleted_task)
+        if deleted_task.get("parent_id"):
+            deleted_task = {**deleted_task, "tree_path": tree_path}
+        
+        update_expr, expr_attr_values, expr_attr_names, condition = prepare_restore(deleted_task, user["user_id"])
+        restore = {
+            "Key": {
+                "PK": f"WORKSPACE#{workspace_id}",
+                "SK": f"TASK#{task_id}"
+            },
+            "UpdateExpression": update_expr,
+            "ConditionExpression": condition,
+            "ExpressionAttributeValues": expr_attr_values,
+            "ExpressionAttributeNames": expr_attr_names
+        }
+        
+        # Bring the task back into its indexes, unless another request already did
+        if not parent:
+            try:
+                response = tasks_table.update_item(**restore, ReturnValues="ALL_NEW")
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise
+                return build_response(409, {"message": f"Task with ID {task_id} was restored or purged meanwhile"})
+            restored_task = response["Attributes"]
+        else:
+            try:
+                tasks_table.meta.client.transact_write_items(TransactItems=[
+                    {"Update": {"TableName": tasks_table.name, **restore}},
+                    subtask_count_action(tasks_table.name, workspace_id, parent, 1, live=False)
+                ])
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "TransactionCanceledException":
+                    raise
+                reasons = e.response.get("CancellationReasons", [])
+                if reasons and reasons[0].get("Code") == "ConditionalCheckFailed":
+                    return build_response(409, {"message": f"Task with ID {task_id} was restored or purged meanwhile"})
+                return build_response(409, {"message": "The parent task was moved meanwhile, retry the restore"})
+            
+            restored_task = get_task_by_id(workspace_id, task_id)
+            if not restored_task:
+                return build_response(404, {"message": f"Task with ID {task_id} not found"})
+        
+        # Put the task back under its tags
+        sync_task_tags(tasks_table, workspace_id, task_id, new_tags=restored_task.get("tags"))
+        
+        return build_response(200, {
+            "message": "Task restored successfully",
+            "task": select_fields(restored_task, TASK_FIELDS)
+        }, {"ETag": task_etag(restored_task)})
+    
+    except Exception as e:
+        logger.exception("Error restoring task")
+        return build_response(500, {"message": f"Internal server error: {str(e)}"})
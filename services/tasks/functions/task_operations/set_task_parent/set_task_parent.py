@@ -0,0 +1,147 @@
+"""Lambda function to move a task and its subtasks under another parent."""
+
+import json
+import os
+from aws_lambda_powertools import Logger
+from botocore.exceptions import ClientError
+from ...shared.utils.utils import (
+    build_response, get_user_from_event, validate_workspace_access, get_task_by_id,
+    parse_if_match, task_etag, task_conflict_response
+)
+from ...shared.models.task_models import MAX_TASK_DEPTH, TASK_FIELDS, task_tree_path, tree_depth, select_fields
+from ...shared.utils.task_tree import (
+    MAX_MOVED_SUBTREE_SIZE, query_subtree, read_tree_node, subtree_complete, build_reparent_actions
+)
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+
+@logger.inject_lambda_context(log_event=True)
+def handler(event, context):
+    """Handle set task parent request.
+    
+    The body names the new parent_id, or null to make the task top-level. The
+    task's whole subtree is rewritten to the new path in one transaction, which
+    also moves the task's count from its old parent to the new one.
+    """
+    logger.info("Set task parent request received")
+    
+    try:
+        # Extract user information from the event context
+        user = get_user_from_event(event)
+        if not user:
+            return build_response(401, {"message": "Unauthorized: User not authenticated"})
+        
+        # Parse the body from the event
+        if 'body' not in event or not event['body']:
+            return build_response(400, {"message": "Missing request body"})
+        
+        try:
+            body = json.loads(event['body'])
+        except json.JSONDecodeError:
+            return build_response(400, {"message": "Invalid JSON in request body"})
+        
+        if not isinstance(body, dict) or "parent_id" not in body:
+            return build_response(400, {"message": "Missing parent_id"})
+        parent_id = body["parent_id"]
+        if parent_id is not None and (not isinstance(parent_id, str) or not parent_id):
+            return build_response(400, {"message": "parent_id must be a task ID or null"})
+        
+        # Extract path parameters
+        if 'pathParameters' not in event or not event['pathParameters']:
+            return build_response(400, {"message": "Missing path parameters"})
+        
+        path_params = event['pathParameters']
+        
+        # Check for workspace_id
+        if 'workspaceId' not in path_params or not path_params['workspaceId']:
+            return build_response(400, {"message": "Missing workspace ID"})
+        workspace_id = path_params['workspaceId']
+        
+        # Check for task_id
+        if 'taskId' not in path_params or not path_params['taskId']:
+            return build_response(400, {"message": "Missing task ID"})
+        task_id = path_params['taskId']
+        
+        if parent_id == task_id:
+            return build_response(400, {"message": "A task cannot be its own parent"})
+        
+        # Validate workspace access
+        has_access, access_error = validate_workspace_access(user["account_id"], workspace_id)
+        if not has_access:
+            return build_response(403, {"message": access_error or "Access denied to workspace"})
+        
+        # Only move the version the client read, if it sent one
+        expected_version, if_match_error = parse_if_match(event)
+        if if_match_error:
+            return build_response(400, {"message": if_match_error})
+        
+        task = get_task_by_id(workspace_id, task_id)
+        if not task:
+            return build_response(404, {"message": f"Task with ID {task_id} not found"})
+        
+        parent = None
+        if parent_id:
+            parent = get_task_by_id(workspace_id, parent_id, ["task_id", "tree_path"])
+            if not parent:
+                return build_response(404, {"message": f"Parent task with ID {parent_id} not found"})
+            # A task cannot move under one of its own subtasks
+            if task_id in task_tree_path(parent).split("#"):
+                return build_response(400, {"message": "A task cannot be moved under one of its subtasks"})
+        
+        # The whole subtree moves in one transaction
+        old_path = task_tree_path(task)
+        subtree = [item for item in query_subtree(tasks_table, workspace_id, old_path) if item["task_id"] != task_id]
+        subtree.insert(0, task)
+        if len(subtree) > MAX_MOVED_SUBTREE_SIZE:
+            return build_response(409, {
+                "message": f"Subtrees of more than {MAX_MOVED_SUBTREE_SIZE} tasks cannot be moved at once"
+            })
+        
+        # GSI9 may not have caught up with a subtask created or moved in just now
+        if not subtree_complete(subtree):
+            return build_response(409, {"message": "Subtasks of the task changed while moving it, retry the move"})
+        
+        # The deepest subtask must stay within the depth limit
+        subtree_depth = max(tree_depth(task_tree_path(item)) for item in subtree) - tree_depth(old_path) + 1
+        parent_depth = tree_depth(task_tree_path(parent)) if parent else 0
+        if parent_depth + subtree_depth > MAX_TASK_DEPTH:
+            return build_response(400, {"message": f"Subtasks can be nested at most {MAX_TASK_DEPTH} levels deep"})
+        
+        old_parent = read_tree_node(tasks_table, workspace_id, task["parent_id"]) if task.get("parent_id") else None
+        
+        try:
+            tasks_table.meta.client.transact_write_items(
+                TransactItems=build_reparent_actions(
+                    tasks_table.name, task, subtree, parent, user["user_id"], expected_version, old_parent
+                )
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "TransactionCanceledException":
+                raise
+            reasons = e.response.get("CancellationReasons", [])
+            # The first action is the moved task itself
+            if reasons and reasons[0].get("Code") == "ConditionalCheckFailed" and expected_version is not None:
+                return task_conflict_response(workspace_id, task_id, expected_version)
+            return build_response(409, {"message": "Tasks in the subtree or the new parent changed while moving it, retry the move"})
+        
+        moved_task = get_task_by_id(workspace_id, task_id)
+        if not moved_task:
+            return build_response(404, {"message": f"Task with ID {task_id} not found"})
+        
+        return build_response(200, {
+            "message": "Task parent updated successfully",
+            "task": select_fields(moved_task, TASK_FIELDS)
+        }, {"ETag": task_etag(moved_task)})
+    
+    except Exception as e:
+        logger.exception("Error setting task parent")
+        return build_response(500, {"message": f"Internal server error: {str(e)}"})
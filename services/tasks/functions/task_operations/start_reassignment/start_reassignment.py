@@ -0,0 +1,93 @@
+"""Lambda function to start reassigning all of a user's tasks in a workspace."""
+
+import json
+import os
+from aws_lambda_powertools import Logger
+from ...shared.utils.utils import build_response, get_user_from_event, validate_workspace_access
+from ...shared.models.task_models import select_fields
+from ...shared.utils.reassignment_jobs import create_job_item, JOB_FIELDS
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table and worker function names from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+REASSIGN_TASKS_FUNCTION = os.environ.get('REASSIGN_TASKS_FUNCTION', 'reassign-tasks')
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+lambda_client = boto3.client('lambda')
+
+def validate_reassignment_input(body):
+    """Validate a reassignment request body."""
+    from_assignee_id = body.get("from_assignee_id")
+    if not isinstance(from_assignee_id, str) or not from_assignee_id:
+        return False, "from_assignee_id is required"
+    
+    to_assignee_id = body.get("to_assignee_id")
+    if to_assignee_id is not None and (not isinstance(to_assignee_id, str) or not to_assignee_id):
+        return False, "to_assignee_id must be a user ID or null to unassign"
+    
+    if to_assignee_id == from_assignee_id:
+        return False, "to_assignee_id must differ from from_assignee_id"
+    
+    return True, None
+
+@logger.inject_lambda_context(log_event=True)
+def handler(event, context):
+    """Handle start reassignment request."""
+    logger.info("Start reassignment request received")
+    
+    try:
+        # Extract user information from the event context
+        user = get_user_from_event(event)
+        if not user:
+            return build_response(401, {"message": "Unauthorized: User not authenticated"})
+        
+        # Parse the body from the event
+        if 'body' not in event or not event['body']:
+            return build_response(400, {"message": "Missing request body"})
+        
+        try:
+            body = json.loads(event['body'])
+        except json.JSONDecodeError:
+            return build_response(400, {"message": "Invalid JSON in request body"})
+        
+        if not isinstance(body, dict):
+            return build_response(400, {"message": "Request body must be an object"})
+        
+        is_valid, validation_error = validate_reassignment_input(body)
+        if not is_valid:
+            return build_response(400, {"message": validation_error})
+        
+        # Extract the workspace_id from path parameters
+        if 'pathParameters' not in event or not event['pathParameters'] or 'workspaceId' not in event['pathParameters']:
+            return build_response(400, {"message": "Missing workspace ID"})
+        workspace_id = event['pathParameters']['workspaceId']
+        
+        # Validate workspace access
+        has_access, access_error = validate_workspace_access(user["account_id"], workspace_id)
+        if not has_access:
+            return build_response(403, {"message": access_error or "Access denied to workspace"})
+        
+        # Record the job before starting it so its status can always be read
+        job = create_job_item(workspace_id, body["from_assignee_id"], body.get("to_assignee_id"), user["user_id"])
+        tasks_table.put_item(Item=job)
+        
+        # Run the job in the background, the worker records its progress on the job
+        lambda_client.invoke(
+            FunctionName=REASSIGN_TASKS_FUNCTION,
+            InvocationType="Event",
+            Payload=json.dumps({"workspace_id": workspace_id, "job_id": job["job_id"]})
+        )
+        
+        return build_response(202, {
+            "message": "Reassignment started",
+            "job": select_fields(job, JOB_FIELDS)
+        }, {"Location": f"/workspaces/{workspace_id}/reassignments/{job['job_id']}"})
+    
+    except Exception as e:
+        logger.exception("Error starting reassignment")
+        return build_response(500, {"message": f"Internal server error: {str(e)}"})
@@ -3,8 +3,13 @@
 import json
 import os
 from aws_lambda_powertools import Logger
-from ...shared.utils.utils import build_response, get_user_from_event, get_task_by_id, validate_workspace_access
-from ...shared.models.task_models import validate_task_input, prepare_update_expression
+from ...shared.utils.utils import (
+    build_response, get_user_from_event, validate_workspace_access,
+    parse_if_match, task_etag, task_conflict_response
+)
+from ...shared.models.task_models import UPDATABLE_FIELDS, validate_task_input
+from ...shared.utils.task_writes import update_task_item
+from ...shared.utils.tag_index import sync_task_tags
 
 # Initialize logger
 logger = Logger(service="TasksService")
@@ -58,36 +63,33 @@ def handler(event, context):
         if not has_access:
             return build_response(403, {"message": access_error or "Access denied to workspace"})
         
-        # Get the existing task
-        existing_task = get_task_by_id(workspace_id, task_id)
-        if not existing_task:
-            return build_response(404, {"message": f"Task with ID {task_id} not found"})
-        
         # Validate task update data
         is_valid, validation_error = validate_task_input(body)
         if not is_valid:
             return build_response(400, {"message": validation_error})
         
-        # Store existing task in body for update expression preparation
-        body["_existing_task"] = existing_task
+        # Reparenting rewrites the whole subtree, it has its own endpoint
+        if "parent_id" in body:
+            return build_response(400, {"message": "parent_id cannot be updated here, set the task's parent instead"})
+        
+        # Only overwrite the version the client read, if it sent one
+        expected_version, if_match_error = parse_if_match(event)
+        if if_match_error:
+            return build_response(400, {"message": if_match_error})
         
-        # Prepare update expression for DynamoDB
-        update_expr, expr_attr_values, expr_attr_names = prepare_update_expression(body)
+        # Only client-editable fields, rank and tree paths have their own endpoints
+        changes = {field: body[field] for field in UPDATABLE_FIELDS if field in body}
+        changes["updated_by"] = user["user_id"]
         
-        # Update the task in DynamoDB
-        update_response = tasks_table.update_item(
-            Key={
-                "PK": f"WORKSPACE#{workspace_id}",
-                "SK": f"TASK#{task_id}"
-            },
-            UpdateExpression=update_expr,
-            ExpressionAttributeValues=expr_attr_values,
-            ExpressionAttributeNames=expr_attr_names,
-            ReturnValues="ALL_NEW"
-        )
+        # Update the task in DynamoDB, the write itself fails if the task does not exist
+        existing_task, updated_task = update_task_item(tasks_table, workspace_id, task_id, changes, expected_version)
+        if existing_task is None:
+            return task_conflict_response(workspace_id, task_id, expected_version)
         
-        # Get the updated task
-        updated_task = update_response.get('Attributes', {})
+        # Move the task between tag index entries if its tags changed
+        if "tags" in body:
+            sync_task_tags(tasks_table, workspace_id, task_id,
+                           existing_task.get("tags"), updated_task.get("tags"))
         
         # Prepare response with updated task details
         response_data = {
@@ -100,7 +102,8 @@ def handler(event, context):
                 "priority": updated_task.get("priority"),
                 "created_at": updated_task.get("created_at"),
                 "updated_at": updated_task.get("updated_at"),
-                "created_by": updated_task.get("created_by")
+                "created_by": updated_task.get("created_by"),
+                "version": updated_task.get("version")
             }
         }
         
@@ -110,7 +113,7 @@ def handler(event, context):
             if field in updated_task:
                 response_data["task"][field] = updated_task[field]
         
-        return build_response(200, response_data)
+        return build_response(200, response_data, {"ETag": task_etag(updated_task)})
         
     except Exception as e:
         logger.exception("Error updating task")
@@ -0,0 +1,123 @@
+"""Lambda function to backfill GSI key attributes on existing tasks."""
+
+import os
+from boto3.dynamodb.conditions import Key, Attr
+from botocore.exceptions import ClientError
+from aws_lambda_powertools import Logger
+from ...shared.models.task_models import build_index_keys, diff_index_keys
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+
+# Stop reading new pages when less time than this remains in the invocation
+MIN_REMAINING_TIME_MS = 10000
+
+def backfill_task(task):
+    """Rewrite a task's GSI keys if they differ from the current key layout.
+    
+    Returns True if the task was updated.
+    """
+    # Deleted tasks stay out of every index until restored
+    if "deleted_at" in task:
+        return False
+    
+    keys_to_set, keys_to_remove = diff_index_keys(task, build_index_keys(task))
+    if not keys_to_set and not keys_to_remove:
+        return False
+    
+    expression_attr_names = {}
+    expression_attr_values = {":updated_at": task.get("updated_at")}
+    update_expression = ""
+    
+    if keys_to_set:
+        set_clauses = []
+        for attr, value in keys_to_set.items():
+            expression_attr_names[f"#{attr}"] = attr
+            expression_attr_values[f":{attr.lower()}"] = value
+            set_clauses.append(f"#{attr} = :{attr.lower()}")
+        update_expression += f"SET {', '.join(set_clauses)}"
+    
+    if keys_to_remove:
+        update_expression += f" REMOVE {', '.join(keys_to_remove)}"
+    
+    update_args = {
+        "Key": {"PK": task["PK"], "SK": task["SK"]},
+        "UpdateExpression": update_expression.strip(),
+        # Skip tasks changed since they were read, their keys are rebuilt on write
+        "ConditionExpression": "attribute_exists(PK) AND updated_at = :updated_at",
+        "ExpressionAttributeValues": expression_attr_values
+    }
+    if expression_attr_names:
+        update_args["ExpressionAttributeNames"] = expression_attr_names
+    
+    tasks_table.update_item(**update_args)
+    return True
+
+@logger.inject_lambda_context
+def handler(event, context):
+    """Handle a backfill run.
+    
+    Runs over one workspace (workspace_id) or one parallel scan segment of the
+    table (segment/total_segments). Returns last_evaluated_key when the run
+    stops early so the next invocation can resume from it.
+    """
+    event = event or {}
+    logger.info("Backfill index keys request received")
+    
+    workspace_id = event.get("workspace_id")
+    if workspace_id:
+        read_args = {
+            "KeyConditionExpression": Key("PK").eq(f"WORKSPACE#{workspace_id}") &
+                                      Key("SK").begins_with("TASK#")
+        }
+        read = tasks_table.query
+    else:
+        read_args = {"FilterExpression": Attr("entity_type").eq("TASK")}
+        if "total_segments" in event:
+            read_args["Segment"] = int(event.get("segment", 0))
+            read_args["TotalSegments"] = int(event["total_segments"])
+        read = tasks_table.scan
+    
+    if event.get("exclusive_start_key"):
+        read_args["ExclusiveStartKey"] = event["exclusive_start_key"]
+    
+    stats = {"scanned": 0, "updated": 0, "conflicts": 0}
+    last_evaluated_key = None
+    
+    while True:
+        response = read(**read_args)
+        
+        for task in response.get("Items", []):
+            stats["scanned"] += 1
+            try:
+                if backfill_task(task):
+                    stats["updated"] += 1
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise
+                stats["conflicts"] += 1
+        
+        last_evaluated_key = response.get("LastEvaluatedKey")
+        if not last_evaluated_key:
+            break
+        
+        if context.get_remaining_time_in_millis() < MIN_REMAINING_TIME_MS:
+            break
+        
+        read_args["ExclusiveStartKey"] = last_evaluated_key
+    
+    logger.info("Backfill index keys run finished", extra=stats)
+    
+    result = dict(stats)
+    if last_evaluated_key:
+        result["last_evaluated_key"] = last_evaluated_key
+    
+    return result
@@ -0,0 +1,124 @@
+"""Stream processor that removes deleted tasks' comments, time entries, links and history, run by process-task-stream."""
+
+import os
+from boto3.dynamodb.conditions import Key
+from aws_lambda_powertools import Logger
+from ...shared.utils.batch_writes import batch_write
+from ...shared.utils.task_dependencies import remove_task_links
+from ...shared.utils.task_history import history_partition_key
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table names from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+COMMENTS_TABLE = os.environ.get('COMMENTS_TABLE', 'Comments')
+TIME_ENTRIES_TABLE = os.environ.get('TIME_ENTRIES_TABLE', 'TimeEntries')
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+comments_table = dynamodb.Table(COMMENTS_TABLE)
+time_entries_table = dynamodb.Table(TIME_ENTRIES_TABLE)
+
+def _task_identity(image):
+    """Read (workspace_id, task_id, account_id) from a task's stream image."""
+    return (
+        image["workspace_id"]["S"],
+        image["task_id"]["S"],
+        image.get("account_id", {}).get("S")
+    )
+
+def deleted_tasks(records):
+    """Collect the tasks deleted and purged in a batch of stream records.
+    
+    A delete tombstones the task, a MODIFY that sets deleted_at, and TTL
+    removes the tombstone later with a REMOVE. A task removed without a
+    tombstone, as when its workspace is purged, is deleted and purged at once.
+    Returns a tuple of (deleted, purged), lists of (workspace_id, task_id,
+    account_id) from the stream images.
+    """
+    deleted = []
+    purged = []
+    for record in records:
+        old_image = record.get("dynamodb", {}).get("OldImage", {})
+        new_image = record.get("dynamodb", {}).get("NewImage", {})
+        if old_image.get("entity_type", {}).get("S") != "TASK":
+            continue
+        
+        task = _task_identity(old_image)
+        was_deleted = "deleted_at" in old_image
+        if record.get("eventName") == "MODIFY" and "deleted_at" in new_image and not was_deleted:
+            deleted.append(task)
+        elif record.get("eventName") == "REMOVE":
+            purged.append(task)
+            if not was_deleted:
+                deleted.append(task)
+    return deleted, purged
+
+def partition_keys(table, partition_key):
+    """Read the primary keys of every item in a partition."""
+    query_args = {
+        "KeyConditionExpression": Key("PK").eq(partition_key),
+        "ProjectionExpression": "PK, SK"
+    }
+    
+    keys = []
+    while True:
+        response = table.query(**query_args)
+        keys.extend(response.get("Items", []))
+        if "LastEvaluatedKey" not in response:
+            return keys
+        query_args["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+def delete_partitions(table, partition_keys_to_delete):
+    """Delete every item in the given partitions with batched deletes.
+    
+    Returns the number of items deleted.
+    """
+    requests = [
+        {"DeleteRequest": {"Key": key}}
+        for partition_key in partition_keys_to_delete
+        for key in partition_keys(table, partition_key)
+    ]
+    
+    failed = batch_write(table, requests)
+    if failed:
+        # Fail the batch so the stream retries it, deletes are idempotent
+        raise RuntimeError(f"Failed to delete {len(failed)} items from {table.name}: {failed[0][1]}")
+    
+    return len(requests)
+
+def process_records(records):
+    """Remove the dependents of tasks deleted in a batch of task table stream records.
+    
+    When a task is deleted its comments (TENANT#{account_id}#TASK#{task_id}),
+    time entries (WORKSPACE#{workspace_id}#TASK#{task_id}) and blocked-by
+    links are removed, one batched pass per table for the whole stream batch,
+    so they do not outlive the task while its tombstone waits for TTL. Its
+    history is hidden while the task is deleted and kept for a restore, then
+    removed once the tombstone is purged.
+    """
+    deleted, purged = deleted_tasks(records)
+    if not deleted and not purged:
+        return {"tasks": 0, "comments": 0, "time_entries": 0, "history": 0, "dependencies": 0}
+    
+    stats = {
+        "tasks": len(set(deleted + purged)),
+        "comments": delete_partitions(comments_table, [
+            f"TENANT#{account_id}#TASK#{task_id}" for _, task_id, account_id in deleted if account_id
+        ]),
+        "time_entries": delete_partitions(time_entries_table, [
+            f"WORKSPACE#{workspace_id}#TASK#{task_id}" for workspace_id, task_id, _ in deleted
+        ]),
+        "history": delete_partitions(tasks_table, [
+            history_partition_key(workspace_id, task_id) for workspace_id, task_id, _ in purged
+        ]),
+        "dependencies": sum(
+            remove_task_links(tasks_table, workspace_id, task_id) for workspace_id, task_id, _ in deleted
+        )
+    }
+    
+    logger.info("Deleted tasks' dependents removed", extra=stats)
+    return stats
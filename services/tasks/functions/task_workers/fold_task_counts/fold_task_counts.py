@@ -0,0 +1,78 @@
+"""Stream processor that folds task changes into per-workspace task counters, run by process-task-stream."""
+
+import os
+from boto3.dynamodb.types import TypeDeserializer
+from aws_lambda_powertools import Logger
+from ...shared.utils.task_counters import counter_deltas, apply_counter_deltas, stream_position
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+
+_deserializer = TypeDeserializer()
+
+# Task attributes that decide which counters a task is in
+COUNTED_FIELDS = ["workspace_id", "status", "priority", "assignee_id"]
+
+def counted_task(image):
+    """Read the counted fields of a task from a stream image.
+    
+    Returns None unless the image is of a task that is counted, so deleted
+    tasks and other items count towards nothing.
+    """
+    if image.get("entity_type", {}).get("S") != "TASK" or "deleted_at" in image:
+        return None
+    return {field: _deserializer.deserialize(image[field]) for field in COUNTED_FIELDS if field in image}
+
+def workspace_deltas(records):
+    """Sum the counter changes in a batch of stream records per workspace.
+    
+    Returns a dict of workspace_id to (deltas, (first, last)), the stream
+    positions of the workspace's first and last counted change.
+    """
+    workspaces = {}
+    for record in records:
+        # Live tasks are only removed with their workspace, whose counters go too
+        if record.get("eventName") == "REMOVE":
+            continue
+        
+        data = record.get("dynamodb", {})
+        old_task = counted_task(data.get("OldImage", {}))
+        new_task = counted_task(data.get("NewImage", {}))
+        deltas = counter_deltas(old_task, new_task)
+        if not deltas:
+            continue
+        
+        workspace_id = (new_task or old_task)["workspace_id"]
+        position = stream_position(data["SequenceNumber"])
+        summed, (first, _) = workspaces.get(workspace_id, ({}, (position, position)))
+        for bucket, delta in deltas.items():
+            summed[bucket] = summed.get(bucket, 0) + delta
+        workspaces[workspace_id] = (summed, (first, position))
+    
+    return workspaces
+
+def process_records(records):
+    """Fold the task changes in a batch of task table stream records into the counters.
+    
+    Each workspace's changes are summed into one ADD, which also records the
+    last stream position folded. A retried batch starts at or before that
+    position, so the changes it already added are skipped.
+    """
+    workspaces = workspace_deltas(records)
+    
+    stats = {"workspaces": len(workspaces), "folded": 0}
+    for workspace_id, (deltas, positions) in sorted(workspaces.items()):
+        deltas = {bucket: delta for bucket, delta in deltas.items() if delta}
+        if apply_counter_deltas(tasks_table, workspace_id, deltas, positions):
+            stats["folded"] += 1
+    
+    logger.info("Task counter changes folded", extra=stats)
+    return stats
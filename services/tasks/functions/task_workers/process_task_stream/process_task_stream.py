@@ -0,0 +1,36 @@
+"""Lambda function that runs every consumer of the tasks table stream."""
+
+from aws_lambda_powertools import Logger
+from ..record_task_history import record_task_history
+from ..cascade_task_deletes import cascade_task_deletes
+from ..fold_task_counts import fold_task_counts
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Each processor is idempotent, so a retried batch can safely run all of them again
+STREAM_PROCESSORS = (
+    ("history", record_task_history.process_records),
+    ("cascade", cascade_task_deletes.process_records),
+    ("counters", fold_task_counts.process_records),
+)
+
+@logger.inject_lambda_context
+def handler(event, context):
+    """Handle a batch of task table stream records.
+    
+    A DynamoDB stream shard serves at most two readers, so the history,
+    cascade and counter processors share this one consumer. Each sees the
+    whole batch and picks the records it needs. An error fails the batch,
+    which the event source mapping retries a bounded number of times,
+    bisecting to isolate a bad record, before sending it to the failures
+    queue.
+    """
+    records = event.get("Records", [])
+    
+    stats = {"records": len(records)}
+    for name, process_records in STREAM_PROCESSORS:
+        stats[name] = process_records(records)
+    
+    logger.info("Task stream batch processed", extra={"records": len(records)})
+    return stats
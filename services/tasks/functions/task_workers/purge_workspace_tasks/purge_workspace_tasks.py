@@ -0,0 +1,84 @@
+"""Lambda function to delete a purged workspace's tasks from the accounts table stream."""
+
+import os
+from boto3.dynamodb.conditions import Key
+from aws_lambda_powertools import Logger
+from ...shared.utils.batch_writes import batch_write
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+
+# Stop reading new pages when less time than this remains in the invocation
+MIN_REMAINING_TIME_MS = 30000
+
+def purged_workspaces(records):
+    """Collect the IDs of the workspaces removed in a batch of stream records."""
+    workspace_ids = []
+    for record in records:
+        if record.get("eventName") != "REMOVE":
+            continue
+        old_image = record.get("dynamodb", {}).get("OldImage", {})
+        if old_image.get("entity_type", {}).get("S") == "WORKSPACE":
+            workspace_ids.append(old_image["workspace_id"]["S"])
+    return workspace_ids
+
+def delete_workspace_partition(workspace_id, context):
+    """Delete every item in a workspace's partition, a page at a time.
+    
+    Returns a tuple of (items deleted, finished), with finished False when the
+    invocation ran low on time first.
+    """
+    query_args = {
+        "KeyConditionExpression": Key("PK").eq(f"WORKSPACE#{workspace_id}"),
+        "ProjectionExpression": "PK, SK"
+    }
+    
+    deleted = 0
+    while True:
+        response = tasks_table.query(**query_args)
+        requests = [{"DeleteRequest": {"Key": key}} for key in response.get("Items", [])]
+        
+        failed = batch_write(tasks_table, requests)
+        if failed:
+            raise RuntimeError(f"Failed to delete {len(failed)} items of workspace {workspace_id}: {failed[0][1]}")
+        deleted += len(requests)
+        
+        if "LastEvaluatedKey" not in response:
+            return deleted, True
+        if context.get_remaining_time_in_millis() < MIN_REMAINING_TIME_MS:
+            return deleted, False
+        query_args["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+@logger.inject_lambda_context
+def handler(event, context):
+    """Handle a batch of accounts table stream records.
+    
+    A deleted workspace is a tombstone that TTL removes once it can no longer
+    be restored. Its partition of the tasks table is then deleted: links, the
+    dependency graph and counters sort before the tasks and go first, then
+    the tasks and their tag references. Each task delete reaches
+    cascade-task-deletes as a REMOVE, which removes the task's comments, time
+    entries and history. A workspace too large for one invocation fails the
+    batch, and the retry carries on with the items that are left.
+    """
+    workspace_ids = purged_workspaces(event.get("Records", []))
+    
+    stats = {"workspaces": len(workspace_ids), "items": 0}
+    
+    for workspace_id in workspace_ids:
+        deleted, finished = delete_workspace_partition(workspace_id, context)
+        stats["items"] += deleted
+        if not finished:
+            logger.warning("Workspace purge ran out of time, retrying the batch", extra=stats)
+            raise RuntimeError(f"Tasks of workspace {workspace_id} are not all deleted yet")
+    
+    logger.info("Purged workspaces' tasks deleted", extra=stats)
+    return stats
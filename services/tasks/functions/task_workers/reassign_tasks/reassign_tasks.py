@@ -0,0 +1,107 @@
+"""Lambda function to run a bulk reassignment job."""
+
+import json
+import os
+import time
+from aws_lambda_powertools import Logger
+from ...shared.utils.reassignment_jobs import (
+    get_job,
+    save_job_progress,
+    query_assigned_page,
+    reassign_tasks,
+    pace
+)
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Capacity units per second the job may consume, reads and writes together
+CAPACITY_PER_SECOND = float(os.environ.get('REASSIGN_CAPACITY_PER_SECOND', '50'))
+
+# Tasks read from the assignee index and reassigned per batch
+PAGE_SIZE = int(os.environ.get('REASSIGN_PAGE_SIZE', '100'))
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+lambda_client = boto3.client('lambda')
+
+# Stop starting new batches when less time than this remains in the invocation
+MIN_REMAINING_TIME_MS = 30000
+
+def run_batch(job):
+    """Reassign the next page of the job's tasks and record the progress.
+    
+    Returns a tuple of (last_evaluated_key, consumed_capacity).
+    """
+    tasks, last_evaluated_key, consumed = query_assigned_page(tasks_table, job, PAGE_SIZE)
+    
+    reassigned_tasks, write_capacity = reassign_tasks(tasks_table, job, tasks)
+    
+    stats = {
+        "processed": len(tasks),
+        "reassigned": len(reassigned_tasks),
+        "skipped": len(tasks) - len(reassigned_tasks)
+    }
+    status = "RUNNING" if last_evaluated_key else "COMPLETED"
+    save_job_progress(tasks_table, job, status, last_evaluated_key, stats)
+    
+    job["last_evaluated_key"] = last_evaluated_key
+    return last_evaluated_key, consumed + write_capacity
+
+@logger.inject_lambda_context
+def handler(event, context):
+    """Handle a reassignment job run.
+    
+    Works through the job's tasks in batches, pacing them to the capacity
+    budget, and records the resume point after every batch. When the
+    invocation runs short of time it invokes itself again to carry on.
+    """
+    event = event or {}
+    logger.info("Reassign tasks request received")
+    
+    job = get_job(tasks_table, event.get("workspace_id"), event.get("job_id"))
+    if not job:
+        logger.warning(f"Reassignment job {event.get('job_id')} not found")
+        return {"status": "NOT_FOUND"}
+    
+    if job["status"] in ("COMPLETED", "FAILED"):
+        return {"status": job["status"]}
+    
+    save_job_progress(tasks_table, job, "RUNNING", job.get("last_evaluated_key"))
+    
+    started_at = time.monotonic()
+    consumed = 0.0
+    
+    try:
+        while True:
+            last_evaluated_key, batch_capacity = run_batch(job)
+            if not last_evaluated_key:
+                logger.info(f"Reassignment job {job['job_id']} completed")
+                return {"status": "COMPLETED"}
+            
+            if context.get_remaining_time_in_millis() < MIN_REMAINING_TIME_MS:
+                break
+            
+            # Hold the next batch back until the job is within its capacity budget
+            consumed += batch_capacity
+            pace(consumed, started_at, CAPACITY_PER_SECOND)
+    
+    except Exception as e:
+        logger.exception(f"Reassignment job {job['job_id']} failed")
+        save_job_progress(tasks_table, job, "FAILED", job.get("last_evaluated_key"), error=str(e))
+        raise
+    
+    # Carry on from the saved position in a fresh invocation
+    lambda_client.invoke(
+        FunctionName=context.function_name,
+        InvocationType="Event",
+        Payload=json.dumps({"workspace_id": job["workspace_id"], "job_id": job["job_id"]})
+    )
+    logger.info(f"Reassignment job {job['job_id']} continued in a new invocation")
+    
+    return {"status": "RUNNING"}
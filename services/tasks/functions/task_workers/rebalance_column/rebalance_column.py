@@ -0,0 +1,153 @@
+"""Lambda function to respread the ranks of a board column."""
+
+import os
+from bisect import bisect_right
+from boto3.dynamodb.conditions import Key
+from aws_lambda_powertools import Logger
+from ...shared.models.task_models import VALID_STATUSES, rank_key_prefix, rank_between, ranks_after, task_rank
+from ...shared.utils.batch_writes import ordered_transact_write
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+
+# Passes over tasks moved into the part of the column not yet rebalanced
+MAX_RELOCATE_PASSES = 5
+
+def read_column(workspace_id, status, below=None):
+    """Read a column's tasks in rank order from GSI8, only those ranked before below if given.
+    
+    Returns a list of (key, current rank attribute or None, rank in the column) tuples.
+    """
+    prefix = rank_key_prefix(status)
+    sort_key = Key("GSI8SK").between(prefix, f"{prefix}{below}") if below else Key("GSI8SK").begins_with(prefix)
+    query_args = {
+        "IndexName": "GSI8",
+        "KeyConditionExpression": Key("GSI8PK").eq(f"WORKSPACE#{workspace_id}") & sort_key,
+        "ProjectionExpression": "PK, SK, #rank, created_at",
+        "ExpressionAttributeNames": {"#rank": "rank"}
+    }
+    
+    column = []
+    while True:
+        response = tasks_table.query(**query_args)
+        column.extend(
+            ({"PK": item["PK"], "SK": item["SK"]}, item.get("rank"), task_rank(item))
+            for item in response.get("Items", [])
+        )
+        if "LastEvaluatedKey" not in response:
+            return column
+        query_args["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+def rerank_action(status, key, old_rank, new_rank):
+    """Build the transaction action giving one task a new rank.
+    
+    The action's condition fails if the task was moved, edited into another
+    column or deleted since the column was read.
+    """
+    task_id = key["SK"][len("TASK#"):]
+    expression_attr_values = {
+        ":rank": new_rank,
+        ":gsi8sk": f"{rank_key_prefix(status)}{new_rank}#TASK#{task_id}",
+        ":status": status
+    }
+    condition = "attribute_not_exists(deleted_at) AND #status = :status"
+    if old_rank:
+        expression_attr_values[":old_rank"] = old_rank
+        condition += " AND #rank = :old_rank"
+    else:
+        condition += " AND attribute_not_exists(#rank)"
+    
+    return {
+        "Update": {
+            "TableName": tasks_table.name,
+            "Key": key,
+            # Only the column order changes, so neither the version nor updated_at moves
+            "UpdateExpression": "SET #rank = :rank, GSI8SK = :gsi8sk",
+            "ConditionExpression": condition,
+            "ExpressionAttributeNames": {"#rank": "rank", "#status": "status"},
+            "ExpressionAttributeValues": expression_attr_values
+        }
+    }
+
+def write_ranks(status, tasks, new_ranks):
+    """Write new ranks for (key, rank attribute, rank) tasks, in list order.
+    
+    Returns the number of tasks that were moved, edited or deleted since they
+    were read and so kept their rank.
+    """
+    actions = [rerank_action(status, key, old_rank, new_rank) for (key, old_rank, _), new_rank in zip(tasks, new_ranks)]
+    failed = ordered_transact_write(tasks_table, actions)
+    for index, error in failed:
+        logger.info(f"Task {tasks[index][0]['SK']} not reranked: {error}")
+    return len(failed)
+
+def relocation_ranks(stragglers, old_ranks, new_ranks):
+    """Get ranks placing tasks left among the old ranks at the same spot among the new ones.
+    
+    A task moved between two cards before they were rebalanced goes between
+    the same two cards' new ranks, after any other task placed in that gap.
+    """
+    ranks = []
+    previous_gap, previous_rank = None, None
+    for _, _, rank in stragglers:
+        gap = bisect_right(old_ranks, rank)
+        low = previous_rank if gap == previous_gap else (new_ranks[gap - 1] if gap else None)
+        high = new_ranks[gap] if gap < len(new_ranks) else None
+        previous_gap, previous_rank = gap, rank_between(low, high)
+        ranks.append(previous_rank)
+    return ranks
+
+@logger.inject_lambda_context
+def handler(event, context):
+    """Handle a column rebalance.
+    
+    Moves into the same gap lengthen ranks by about a digit each, so once a
+    move produces a long rank the column is given evenly spaced short ranks
+    again, keeping its order.
+    
+    The new ranks all sort after the column's current last card and are
+    written from the bottom of the column up, in transactions of up to 100
+    tasks, so the rewritten tasks always sit below the rest in their final
+    order and the column never shows out of order. Tasks moved among the cards
+    not yet rewritten are then left above the new ranks; they are placed
+    between the new ranks of the cards they were dropped between, repeating
+    until no task is left behind.
+    """
+    event = event or {}
+    workspace_id = event.get("workspace_id")
+    status = event.get("status")
+    if not workspace_id or status not in VALID_STATUSES:
+        logger.warning("Rebalance requested without a workspace ID and valid status")
+        return {"tasks": 0, "reranked": 0, "relocated": 0, "skipped": 0}
+    
+    column = read_column(workspace_id, status)
+    if not column:
+        return {"tasks": 0, "reranked": 0, "relocated": 0, "skipped": 0}
+    
+    old_ranks = [rank for _, _, rank in column]
+    new_ranks = ranks_after(old_ranks[-1], len(column))
+    skipped = write_ranks(status, column[::-1], new_ranks[::-1])
+    stats = {"tasks": len(column), "reranked": len(column) - skipped, "relocated": 0, "skipped": 0}
+    
+    for _ in range(MAX_RELOCATE_PASSES):
+        stragglers = read_column(workspace_id, status, below=new_ranks[0])
+        if not stragglers:
+            break
+        failed = write_ranks(status, stragglers, relocation_ranks(stragglers, old_ranks, new_ranks))
+        stats["relocated"] += len(stragglers) - failed
+    else:
+        stats["skipped"] = len(read_column(workspace_id, status, below=new_ranks[0]))
+    
+    if stats["skipped"]:
+        logger.warning(f"Column {status} of workspace {workspace_id} kept changing during its rebalance", extra=stats)
+    else:
+        logger.info(f"Column {status} of workspace {workspace_id} rebalanced", extra=stats)
+    return stats
@@ -0,0 +1,89 @@
+"""Lambda function to repair drift in per-workspace task counters on a schedule."""
+
+import json
+import os
+from datetime import datetime, timedelta
+from aws_lambda_powertools import Logger
+from ...shared.utils.task_counters import reconcile_task_counts
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table names from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+ACCOUNTS_TABLE = os.environ.get('ACCOUNTS_TABLE', 'Accounts')
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+accounts_table = dynamodb.Table(ACCOUNTS_TABLE)
+lambda_client = boto3.client('lambda')
+
+# Workspaces with a task written more recently than this are left for the next run,
+# the stream may not have folded the write into their counters yet
+QUIET_PERIOD = timedelta(minutes=int(os.environ.get('RECONCILE_QUIET_MINUTES', '15')))
+
+# Stop starting new recounts when less time than this remains in the invocation
+MIN_REMAINING_TIME_MS = 30000
+
+def active_workspaces_page(exclusive_start_key=None):
+    """Read a page of active workspace IDs from the accounts table.
+    
+    Only active workspaces carry GSI2 keys, so the sparse index lists just
+    those. Returns a tuple of (workspace_ids, last_evaluated_key).
+    """
+    scan_args = {"IndexName": "GSI2", "ProjectionExpression": "workspace_id"}
+    if exclusive_start_key:
+        scan_args["ExclusiveStartKey"] = exclusive_start_key
+    
+    response = accounts_table.scan(**scan_args)
+    workspace_ids = [item["workspace_id"] for item in response.get("Items", [])]
+    return workspace_ids, response.get("LastEvaluatedKey")
+
+@logger.inject_lambda_context
+def handler(event, context):
+    """Handle a recount run.
+    
+    The stream keeps the counters current, so this only repairs drift, such
+    as from batches that exhausted their retries. Recounts one workspace
+    (workspace_id) or, on the daily schedule, every active workspace. When
+    the invocation runs short of time it invokes itself again to carry on
+    from exclusive_start_key.
+    """
+    event = event or {}
+    logger.info("Reconcile task counts request received")
+    
+    changed_before = (datetime.utcnow() - QUIET_PERIOD).isoformat()
+    stats = {"workspaces": 0, "reconciled": 0}
+    
+    if event.get("workspace_id"):
+        stats["workspaces"] = 1
+        if reconcile_task_counts(tasks_table, event["workspace_id"], changed_before) is not None:
+            stats["reconciled"] = 1
+        return stats
+    
+    exclusive_start_key = event.get("exclusive_start_key")
+    while True:
+        workspace_ids, exclusive_start_key = active_workspaces_page(exclusive_start_key)
+        for workspace_id in workspace_ids:
+            stats["workspaces"] += 1
+            if reconcile_task_counts(tasks_table, workspace_id, changed_before) is not None:
+                stats["reconciled"] += 1
+        
+        if not exclusive_start_key:
+            logger.info("Task counters reconciled", extra=stats)
+            return stats
+        
+        if context.get_remaining_time_in_millis() < MIN_REMAINING_TIME_MS:
+            break
+    
+    # Carry on from the next page in a fresh invocation
+    lambda_client.invoke(
+        FunctionName=context.function_name,
+        InvocationType="Event",
+        Payload=json.dumps({"exclusive_start_key": exclusive_start_key})
+    )
+    logger.info("Task counter recount continued in a new invocation", extra=stats)
+    
+    return {**stats, "exclusive_start_key": exclusive_start_key}
@@ -0,0 +1,35 @@
+"""Stream processor that records task history, run by process-task-stream."""
+
+import os
+from aws_lambda_powertools import Logger
+from ...shared.utils.batch_writes import batch_write
+from ...shared.utils.task_history import build_history_item
+
+# Initialize logger
+logger = Logger(service="TasksService")
+
+# Get the table name from environment variables
+TASKS_TABLE = os.environ.get('TASKS_TABLE', 'Tasks')
+
+# Initialize DynamoDB resource
+import boto3
+dynamodb = boto3.resource('dynamodb')
+tasks_table = dynamodb.Table(TASKS_TABLE)
+
+def process_records(records):
+    """Record history entries for a batch of task table stream records.
+    
+    Each create, update, delete and restore of a task is diffed from the
+    record's old and new images into a history entry under the task, so
+    the handlers that make the change do no extra writes.
+    """
+    items = [item for item in map(build_history_item, records) if item]
+    
+    failed = batch_write(tasks_table, [{"PutRequest": {"Item": item}} for item in items])
+    if failed:
+        # Fail the batch so the stream retries it, entries are keyed by sequence number
+        raise RuntimeError(f"Failed to write {len(failed)} history entries: {failed[0][1]}")
+    
+    stats = {"records": len(records), "entries": len(items)}
+    logger.info("Task history recorded", extra=stats)
+    return stats
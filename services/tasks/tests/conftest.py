@@ -5,11 +5,15 @@ import json
 import uuid
 import pytest
 import boto3
-from moto import mock_dynamodb
+from contextlib import ExitStack
+from unittest.mock import patch
+from moto import mock_dynamodb, mock_dynamodbstreams
+from ..functions.shared.models.task_models import TASK_FIELDS
 
 # Set environment variables for tests
 os.environ["TASKS_TABLE"] = "TasksTable-Test"
 os.environ["ACCOUNTS_TABLE"] = "AccountsTable-Test"
+os.environ["CURSOR_SECRET"] = "test-cursor-secret"
 
 @pytest.fixture
 def aws_credentials():
@@ -31,7 +35,7 @@ def dynamodb_client(aws_credentials):
 @pytest.fixture
 def dynamodb_resource(aws_credentials):
     """Create a mocked DynamoDB resource."""
-    with mock_dynamodb():
+    with mock_dynamodb(), mock_dynamodbstreams():
         yield boto3.resource("dynamodb", region_name="us-east-1")
 
 
@@ -51,6 +55,21 @@ def tasks_table(dynamodb_resource):
             {"AttributeName": "GSI1SK", "AttributeType": "S"},
             {"AttributeName": "GSI2PK", "AttributeType": "S"},
             {"AttributeName": "GSI2SK", "AttributeType": "S"},
+            {"AttributeName": "GSI3PK", "AttributeType": "S"},
+            {"AttributeName": "GSI3SK", "AttributeType": "S"},
+            {"AttributeName": "GSI4PK", "AttributeType": "S"},
+            {"AttributeName": "GSI4SK", "AttributeType": "S"},
+            {"AttributeName": "GSI5PK", "AttributeType": "S"},
+            {"AttributeName": "GSI5SK", "AttributeType": "S"},
+            {"AttributeName": "GSI6PK", "AttributeType": "S"},
+            {"AttributeName": "GSI6SK", "AttributeType": "S"},
+            {"AttributeName": "GSI7PK", "AttributeType": "S"},
+            {"AttributeName": "GSI7SK", "AttributeType": "S"},
+            {"AttributeName": "GSI8PK", "AttributeType": "S"},
+            {"AttributeName": "GSI8SK", "AttributeType": "S"},
+            {"AttributeName": "GSI9PK", "AttributeType": "S"},
+            {"AttributeName": "GSI9SK", "AttributeType": "S"},
+            {"AttributeName": "task_id", "AttributeType": "S"},
         ],
         GlobalSecondaryIndexes=[
             {
@@ -69,8 +88,72 @@ def tasks_table(dynamodb_resource):
                 ],
                 "Projection": {"ProjectionType": "ALL"},
             },
+            {
+                "IndexName": "GSI3",
+                "KeySchema": [
+                    {"AttributeName": "GSI3PK", "KeyType": "HASH"},
+                    {"AttributeName": "GSI3SK", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+            {
+                "IndexName": "GSI4",
+                "KeySchema": [
+                    {"AttributeName": "GSI4PK", "KeyType": "HASH"},
+                    {"AttributeName": "GSI4SK", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+            {
+                "IndexName": "GSI5",
+                "KeySchema": [
+                    {"AttributeName": "GSI5PK", "KeyType": "HASH"},
+                    {"AttributeName": "GSI5SK", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "INCLUDE", "NonKeyAttributes": TASK_FIELDS},
+            },
+            {
+                "IndexName": "GSI6",
+                "KeySchema": [
+                    {"AttributeName": "GSI6PK", "KeyType": "HASH"},
+                    {"AttributeName": "GSI6SK", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "INCLUDE", "NonKeyAttributes": TASK_FIELDS},
+            },
+            {
+                "IndexName": "GSI7",
+                "KeySchema": [
+                    {"AttributeName": "GSI7PK", "KeyType": "HASH"},
+                    {"AttributeName": "GSI7SK", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+            {
+                "IndexName": "GSI8",
+                "KeySchema": [
+                    {"AttributeName": "GSI8PK", "KeyType": "HASH"},
+                    {"AttributeName": "GSI8SK", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+            {
+                "IndexName": "GSI9",
+                "KeySchema": [
+                    {"AttributeName": "GSI9PK", "KeyType": "HASH"},
+                    {"AttributeName": "GSI9SK", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+            {
+                "IndexName": "TaskIdIndex",
+                "KeySchema": [
+                    {"AttributeName": "task_id", "KeyType": "HASH"},
+                ],
+                "Projection": {"ProjectionType": "KEYS_ONLY"},
+            },
         ],
         BillingMode="PAY_PER_REQUEST",
+        StreamSpecification={"StreamEnabled": True, "StreamViewType": "NEW_AND_OLD_IMAGES"},
     )
     
     # Wait until the table exists
@@ -78,6 +161,26 @@ def tasks_table(dynamodb_resource):
     return table
 
 
+@pytest.fixture
+def fold_task_stream(tasks_table):
+    """Fold the task changes written to the table stream so far into the counters."""
+    from ..functions.task_workers.fold_task_counts import fold_task_counts
+    streams = boto3.client("dynamodbstreams", region_name="us-east-1")
+    stream_arn = tasks_table.latest_stream_arn
+    shard_id = streams.describe_stream(StreamArn=stream_arn)["StreamDescription"]["Shards"][0]["ShardId"]
+    shard_iterator = streams.get_shard_iterator(
+        StreamArn=stream_arn, ShardId=shard_id, ShardIteratorType="TRIM_HORIZON"
+    )["ShardIterator"]
+    
+    def _fold():
+        nonlocal shard_iterator
+        response = streams.get_records(ShardIterator=shard_iterator)
+        shard_iterator = response["NextShardIterator"]
+        return fold_task_counts.process_records(response["Records"])
+    
+    return _fold
+
+
 @pytest.fixture
 def accounts_table(dynamodb_resource):
     """Create a mocked Accounts table with workspace data."""
@@ -90,6 +193,18 @@ def accounts_table(dynamodb_resource):
         AttributeDefinitions=[
             {"AttributeName": "PK", "AttributeType": "S"},
             {"AttributeName": "SK", "AttributeType": "S"},
+            {"AttributeName": "GSI2PK", "AttributeType": "S"},
+            {"AttributeName": "GSI2SK", "AttributeType": "S"},
+        ],
+        GlobalSecondaryIndexes=[
+            {
+                "IndexName": "GSI2",
+                "KeySchema": [
+                    {"AttributeName": "GSI2PK", "KeyType": "HASH"},
+                    {"AttributeName": "GSI2SK", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            },
         ],
         BillingMode="PAY_PER_REQUEST",
     )
@@ -126,7 +241,9 @@ def accounts_table(dynamodb_resource):
             "description": "Test Workspace Description",
             "status": "ACTIVE",
             "created_at": "2023-01-01T00:00:00Z",
-            "entity_type": "WORKSPACE"
+            "entity_type": "WORKSPACE",
+            "GSI2PK": f"ACCOUNT#{account_id}",
+            "GSI2SK": f"WORKSPACE#{workspace_id}"
         }
     )
     
@@ -162,9 +279,13 @@ def sample_task():
         "tags": ["test", "sample"],
         "entity_type": "TASK",
         "GSI1PK": f"WORKSPACE#{workspace_id}",
-        "GSI1SK": f"STATUS#BACKLOG#PRIORITY#MEDIUM#TASK#{task_id}",
+        "GSI1SK": f"STATUS#BACKLOG#PRIORITY#2#TASK#{task_id}",
         "GSI2PK": f"WORKSPACE#{workspace_id}",
-        "GSI2SK": f"ASSIGNEE#user-456#TASK#{task_id}"
+        "GSI2SK": f"ASSIGNEE#user-456#STATUS#BACKLOG#TASK#{task_id}",
+        "GSI3PK": f"WORKSPACE#{workspace_id}",
+        "GSI3SK": f"PRIORITY#2#TASK#{task_id}",
+        "GSI7PK": f"WORKSPACE#{workspace_id}",
+        "GSI7SK": f"ASSIGNEE#user-456#DUE#2023-02-01#TASK#{task_id}"
     }
 
 
@@ -272,4 +393,45 @@ def list_tasks_event(api_gateway_event_template):
         "status": "BACKLOG",
         "limit": "10"
     }
-    return event 
\ No newline at end of file
+    return event
+
+
+@pytest.fixture
+def lambda_context():
+    """Create a mock Lambda context object."""
+    class LambdaContext:
+        def __init__(self):
+            self.function_name = "test-function"
+            self.memory_limit_in_mb = 128
+            self.invoked_function_arn = "arn:aws:lambda:us-east-1:123456789012:function:test-function"
+            self.aws_request_id = "request-id"
+        
+        def get_remaining_time_in_millis(self):
+            return 300000
+    
+    return LambdaContext()
+
+
+@pytest.fixture
+def authorize():
+    """Patch a handler module so requests are authenticated with workspace access."""
+    # Imported here, the table names are only set once this module has loaded
+    from ..functions.shared.utils import utils
+    stack = ExitStack()
+    
+    def _authorize(module):
+        stack.enter_context(patch.object(module, "get_user_from_event", return_value={
+            "user_id": "user-123",
+            "email": "user@example.com",
+            "account_id": "test-account-123"
+        }))
+    
+    # Access is still checked by validate_workspace_access, against an active
+    # workspace owned by the caller's account
+    stack.enter_context(patch.object(utils, "get_account_workspace", side_effect=lambda account_id, workspace_id: {
+        "workspace_id": workspace_id,
+        "account_id": account_id,
+        "status": "ACTIVE"
+    }))
+    yield _authorize
+    stack.close()
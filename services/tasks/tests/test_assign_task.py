@@ -42,7 +42,7 @@ def test_assign_task_success(get_task_event, populated_tasks_table, sample_task)
     
     # Verify GSI2 was updated
     assert saved_task["GSI2PK"] == f"WORKSPACE#{sample_task['workspace_id']}"
-    assert saved_task["GSI2SK"].startswith(f"ASSIGNEE#new-assignee-123#TASK#{sample_task['task_id']}")
+    assert saved_task["GSI2SK"].startswith(f"ASSIGNEE#new-assignee-123#STATUS#BACKLOG#TASK#{sample_task['task_id']}")
 
 
 def test_remove_assignee(get_task_event, populated_tasks_table, sample_task):
@@ -0,0 +1,27 @@
+"""Tests for the backfill_index_keys Lambda function."""
+
+from ..functions.task_workers.backfill_index_keys.backfill_index_keys import handler
+
+
+def test_backfill_index_keys(tasks_table, sample_task, lambda_context):
+    """Test that legacy tasks get the current GSI keys."""
+    # A task written before the priority index existed
+    legacy_task = dict(sample_task)
+    del legacy_task["GSI3PK"]
+    del legacy_task["GSI3SK"]
+    tasks_table.put_item(Item=legacy_task)
+    
+    result = handler({}, lambda_context)
+    
+    assert result["scanned"] == 1
+    assert result["updated"] == 1
+    assert "last_evaluated_key" not in result
+    
+    item = tasks_table.get_item(Key={"PK": sample_task["PK"], "SK": sample_task["SK"]})["Item"]
+    assert item["GSI3PK"] == "WORKSPACE#test-workspace-123"
+    assert item["GSI3SK"] == f"PRIORITY#2#TASK#{sample_task['task_id']}"
+    
+    # A second run finds nothing to change
+    result = handler({"workspace_id": "test-workspace-123"}, lambda_context)
+    assert result["scanned"] == 1
+    assert result["updated"] == 0
@@ -0,0 +1,93 @@
+"""Tests for the batch_get_tasks Lambda function."""
+
+import json
+from unittest.mock import patch
+from ..functions.task_operations.batch_get_tasks import batch_get_tasks
+from ..functions.task_operations.batch_get_tasks.batch_get_tasks import handler
+from ..functions.shared.models.task_models import create_task_item
+from ..functions.shared.utils import batch_reads
+
+
+def batch_get_event(api_gateway_event_template, task_ids, fields=None):
+    """Create a batch get event for the test workspace."""
+    event = api_gateway_event_template.copy()
+    event["httpMethod"] = "POST"
+    event["pathParameters"] = {"workspaceId": "test-workspace-123"}
+    event["body"] = json.dumps({"task_ids": task_ids, "fields": fields})
+    return event
+
+
+def save_tasks(tasks_table, count):
+    """Save tasks in the test workspace."""
+    tasks = []
+    for i in range(count):
+        task = create_task_item(
+            workspace_id="test-workspace-123",
+            account_id="test-account-123",
+            title=f"Task {i}",
+            description="Long description",
+            creator_id="user-123",
+            creator_email="user@example.com"
+        )
+        tasks_table.put_item(Item=task)
+        tasks.append(task)
+    return tasks
+
+
+def test_batch_get_tasks(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test fetching tasks across chunks, in request order."""
+    authorize(batch_get_tasks)
+    tasks = save_tasks(tasks_table, 150)
+    task_ids = [task["task_id"] for task in reversed(tasks)] + ["task-missing"]
+    
+    client = batch_get_tasks.tasks_table.meta.client
+    with patch.object(client, "batch_get_item", wraps=client.batch_get_item) as batch_get_item:
+        response = handler(batch_get_event(api_gateway_event_template, task_ids), lambda_context)
+    
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert [task["task_id"] for task in body["tasks"]] == task_ids[:-1]
+    assert body["not_found"] == ["task-missing"]
+    assert "unprocessed" not in body
+    assert "PK" not in body["tasks"][0]
+    assert batch_get_item.call_count == 2
+
+
+def test_batch_get_tasks_fields(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that fields limits the attributes read and returned."""
+    authorize(batch_get_tasks)
+    tasks = save_tasks(tasks_table, 2)
+    
+    event = batch_get_event(api_gateway_event_template, [task["task_id"] for task in tasks], "title,status")
+    body = json.loads(handler(event, lambda_context)["body"])
+    
+    assert body["tasks"] == [
+        {"task_id": task["task_id"], "title": task["title"], "status": task["status"]} for task in tasks
+    ]
+    
+    event = batch_get_event(api_gateway_event_template, ["task-1"], "title,PK")
+    assert handler(event, lambda_context)["statusCode"] == 400
+
+
+@patch.object(batch_reads, "MAX_BATCH_GET_RETRIES", 1)
+def test_batch_get_items_unprocessed_keys(tasks_table):
+    """Test that unprocessed keys are retried and reported when still throttled."""
+    key = {"PK": "WORKSPACE#ws-1", "SK": "TASK#t-1"}
+    tasks_table.put_item(Item={**key, "task_id": "t-1"})
+    throttled = {"UnprocessedKeys": {tasks_table.name: {"Keys": [key]}}}
+    
+    with patch.object(batch_reads, "backoff"), \
+         patch.object(tasks_table.meta.client, "batch_get_item", side_effect=[throttled, throttled]):
+        items_by_sk, unprocessed = batch_reads.batch_get_items(tasks_table, [key])
+    
+    assert items_by_sk == {}
+    assert unprocessed == [key]
+    
+    with patch.object(batch_reads, "backoff"), \
+         patch.object(tasks_table.meta.client, "batch_get_item",
+                      side_effect=[throttled, tasks_table.meta.client.batch_get_item(
+                          RequestItems={tasks_table.name: {"Keys": [key]}})]):
+        items_by_sk, unprocessed = batch_reads.batch_get_items(tasks_table, [key])
+    
+    assert items_by_sk["TASK#t-1"]["task_id"] == "t-1"
+    assert unprocessed == []
@@ -0,0 +1,45 @@
+"""Tests for the batched write helpers."""
+
+from unittest.mock import MagicMock, patch
+from ..functions.shared.utils import batch_writes
+from ..functions.shared.utils.batch_writes import batch_put_items
+
+
+def put(sk):
+    """Build a PutRequest for a test item."""
+    return {"PutRequest": {"Item": {"PK": "WORKSPACE#ws-1", "SK": sk}}}
+
+
+def test_batch_put_items_chunks(tasks_table):
+    """Test that items are written in 25-item chunks."""
+    items = [{"PK": "WORKSPACE#ws-1", "SK": f"TASK#t-{i}", "entity_type": "TASK"} for i in range(60)]
+    
+    with patch.object(tasks_table.meta.client, "batch_write_item",
+                      wraps=tasks_table.meta.client.batch_write_item) as batch_write_item:
+        assert batch_put_items(tasks_table, items) == []
+    
+    assert sorted(len(call.kwargs["RequestItems"][tasks_table.name]) for call in batch_write_item.call_args_list) == [10, 25, 25]
+    assert tasks_table.scan(Select="COUNT")["Count"] == 60
+
+
+@patch.object(batch_writes, "BATCH_WRITE_BASE_DELAY", 0)
+def test_batch_write_retries_unprocessed_items():
+    """Test that unprocessed requests are retried until written or out of retries."""
+    table = MagicMock()
+    table.name = "Tasks"
+    table.meta.client.batch_write_item.side_effect = [
+        {"UnprocessedItems": {"Tasks": [put("TASK#b")]}},
+        {"UnprocessedItems": {}}
+    ]
+    
+    assert batch_writes.batch_write(table, [put("TASK#a"), put("TASK#b")]) == []
+    retry = table.meta.client.batch_write_item.call_args_list[1]
+    assert retry.kwargs["RequestItems"] == {"Tasks": [put("TASK#b")]}
+    
+    # Requests still unprocessed after every retry are reported
+    table.meta.client.batch_write_item.side_effect = None
+    table.meta.client.batch_write_item.return_value = {"UnprocessedItems": {"Tasks": [put("TASK#c")]}}
+    
+    failed = batch_writes.batch_write(table, [put("TASK#c")])
+    assert failed == [(put("TASK#c"), "Write throttled, retries exhausted")]
+    assert table.meta.client.batch_write_item.call_count == 2 + batch_writes.MAX_BATCH_WRITE_RETRIES + 1
@@ -0,0 +1,71 @@
+"""Tests for the bulk_create_tasks Lambda function."""
+
+import json
+from boto3.dynamodb.conditions import Key
+from ..functions.task_operations.bulk_create_tasks import bulk_create_tasks
+from ..functions.task_operations.bulk_create_tasks.bulk_create_tasks import handler
+from ..functions.shared.utils.task_counters import get_task_counts
+from ..functions.shared.utils.tag_index import list_tag_counts
+
+
+def bulk_event(api_gateway_event_template, tasks):
+    """Create a bulk create event for the test workspace."""
+    event = api_gateway_event_template.copy()
+    event["httpMethod"] = "POST"
+    event["pathParameters"] = {"workspaceId": "test-workspace-123"}
+    event["body"] = json.dumps({"tasks": tasks})
+    return event
+
+
+def test_bulk_create_tasks(api_gateway_event_template, tasks_table, lambda_context, authorize, fold_task_stream):
+    """Test that valid tasks are written across chunks and invalid ones reported."""
+    authorize(bulk_create_tasks)
+    
+    tasks = [{"title": f"Imported {i}", "status": "TODO", "tags": ["import"]} for i in range(60)]
+    tasks[10] = {"title": "Bad status", "status": "NOPE"}
+    tasks[20] = "not a task"
+    
+    response = handler(bulk_event(api_gateway_event_template, tasks), lambda_context)
+    
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert body["created"] == 58
+    assert body["failed"] == 2
+    assert [result["index"] for result in body["results"]] == list(range(60))
+    assert body["results"][10]["status"] == "invalid"
+    assert "Invalid status" in body["results"][10]["error"]
+    assert body["results"][20]["status"] == "invalid"
+    
+    # Every created task is stored, tagged and counted
+    stored = tasks_table.query(
+        KeyConditionExpression=Key("PK").eq("WORKSPACE#test-workspace-123") & Key("SK").begins_with("TASK#")
+    )["Items"]
+    created_ids = {result["task_id"] for result in body["results"] if result["status"] == "created"}
+    assert {task["task_id"] for task in stored} == created_ids
+    
+    # The tasks join their column in request order
+    column = tasks_table.query(
+        IndexName="GSI8",
+        KeyConditionExpression=Key("GSI8PK").eq("WORKSPACE#test-workspace-123") & Key("GSI8SK").begins_with("STATUS#TODO#")
+    )["Items"]
+    assert [task["task_id"] for task in column] == [
+        result["task_id"] for result in body["results"] if result["status"] == "created"
+    ]
+    
+    assert list_tag_counts(tasks_table, "test-workspace-123") == [{"tag": "import", "count": 58}]
+    fold_task_stream()
+    counts = get_task_counts(tasks_table, "test-workspace-123")
+    assert counts["total"] == 58
+    assert counts["by_status"]["TODO"] == 58
+
+
+def test_bulk_create_tasks_invalid_body(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that a missing or oversized tasks array is rejected."""
+    authorize(bulk_create_tasks)
+    
+    response = handler(bulk_event(api_gateway_event_template, []), lambda_context)
+    assert response["statusCode"] == 400
+    
+    tasks = [{"title": "Task"}] * (bulk_create_tasks.MAX_BULK_TASKS + 1)
+    response = handler(bulk_event(api_gateway_event_template, tasks), lambda_context)
+    assert response["statusCode"] == 400
@@ -0,0 +1,127 @@
+"""Tests for the bulk_update_tasks Lambda function."""
+
+import json
+from unittest.mock import patch
+from ..functions.task_operations.bulk_update_tasks import bulk_update_tasks
+from ..functions.task_operations.bulk_update_tasks.bulk_update_tasks import handler
+from ..functions.shared.models.task_models import create_task_item
+from ..functions.shared.utils.task_counters import get_task_counts
+
+
+def bulk_event(api_gateway_event_template, task_ids, patch):
+    """Create a bulk update event for the test workspace."""
+    event = api_gateway_event_template.copy()
+    event["httpMethod"] = "PATCH"
+    event["pathParameters"] = {"workspaceId": "test-workspace-123"}
+    event["body"] = json.dumps({"task_ids": task_ids, "patch": patch})
+    return event
+
+
+def save_tasks(tasks_table, count):
+    """Save counted tasks in the test workspace."""
+    tasks = []
+    for i in range(count):
+        task = create_task_item(
+            workspace_id="test-workspace-123",
+            account_id="test-account-123",
+            title=f"Sprint task {i}",
+            status="IN_PROGRESS",
+            priority="HIGH",
+            assignee_id="user-1" if i % 2 else None,
+            creator_id="user-123",
+            creator_email="user@example.com"
+        )
+        tasks_table.put_item(Item=task)
+        tasks.append(task)
+    return tasks
+
+
+def test_bulk_update_tasks(api_gateway_event_template, tasks_table, lambda_context, authorize, fold_task_stream):
+    """Test closing a sprint across several transaction chunks."""
+    authorize(bulk_update_tasks)
+    tasks = save_tasks(tasks_table, 120)
+    task_ids = [task["task_id"] for task in tasks] + ["task-missing"]
+    
+    response = handler(bulk_event(api_gateway_event_template, task_ids, {"status": "DONE"}), lambda_context)
+    
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert body["updated"] == 120
+    assert body["results"][-1] == {"task_id": "task-missing", "status": "not_found"}
+    
+    # Index keys are rebuilt from each task's own priority and assignee
+    stored = tasks_table.get_item(Key={"PK": tasks[1]["PK"], "SK": tasks[1]["SK"]})["Item"]
+    assert stored["status"] == "DONE"
+    assert stored["version"] == 2
+    assert stored["GSI1SK"] == f"STATUS#DONE#PRIORITY#3#TASK#{tasks[1]['task_id']}"
+    assert stored["GSI2SK"] == f"ASSIGNEE#user-1#STATUS#DONE#TASK#{tasks[1]['task_id']}"
+    
+    stored = tasks_table.get_item(Key={"PK": tasks[0]["PK"], "SK": tasks[0]["SK"]})["Item"]
+    assert "GSI2SK" not in stored
+    
+    fold_task_stream()
+    counts = get_task_counts(tasks_table, "test-workspace-123")
+    assert counts["by_status"]["DONE"] == 120
+    assert counts["by_status"]["IN_PROGRESS"] == 0
+
+
+def test_bulk_update_tasks_conflict(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that a task changed after the read is reported without failing the others."""
+    authorize(bulk_update_tasks)
+    tasks = save_tasks(tasks_table, 3)
+    
+    # Another writer changes a task's priority between the read and the write
+    build_update_actions = bulk_update_tasks.build_update_actions
+    
+    def change_then_build(workspace_id, read_tasks, patch):
+        tasks_table.update_item(
+            Key={"PK": tasks[1]["PK"], "SK": tasks[1]["SK"]},
+            UpdateExpression="SET priority = :priority",
+            ExpressionAttributeValues={":priority": "LOW"}
+        )
+        return build_update_actions(workspace_id, read_tasks, patch)
+    
+    event = bulk_event(api_gateway_event_template, [task["task_id"] for task in tasks], {"status": "DONE"})
+    with patch.object(bulk_update_tasks, "build_update_actions", side_effect=change_then_build):
+        body = json.loads(handler(event, lambda_context)["body"])
+    
+    assert [result["status"] for result in body["results"]] == ["updated", "conflict", "updated"]
+    stored = tasks_table.get_item(Key={"PK": tasks[1]["PK"], "SK": tasks[1]["SK"]})["Item"]
+    assert stored["status"] == "IN_PROGRESS"
+
+
+def test_bulk_update_tasks_invalid_patch(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that only status, priority and assignee can be patched."""
+    authorize(bulk_update_tasks)
+    
+    response = handler(bulk_event(api_gateway_event_template, ["task-1"], {"title": "Renamed"}), lambda_context)
+    assert response["statusCode"] == 400
+    assert "Invalid patch field: title" in json.loads(response["body"])["message"]
+    
+    response = handler(bulk_event(api_gateway_event_template, [], {"status": "DONE"}), lambda_context)
+    assert response["statusCode"] == 400
+
+
+def test_bulk_update_tasks_throttled_read(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that a task left unread by throttling is reported failed, not missing."""
+    authorize(bulk_update_tasks)
+    tasks = save_tasks(tasks_table, 2)
+    batch_get_tasks = bulk_update_tasks.batch_get_tasks
+    
+    # The second task stays unprocessed after the read retries
+    def throttle_second(table, keys, attributes=None):
+        read_tasks, _ = batch_get_tasks(table, keys[:1], attributes)
+        return read_tasks, keys[1:]
+    
+    event = bulk_event(api_gateway_event_template, [task["task_id"] for task in tasks], {"status": "DONE"})
+    with patch.object(bulk_update_tasks, "batch_get_tasks", side_effect=throttle_second):
+        body = json.loads(handler(event, lambda_context)["body"])
+    
+    assert body["updated"] == 1
+    assert body["results"][1] == {
+        "task_id": tasks[1]["task_id"],
+        "status": "failed",
+        "error": "Read throttled, retries exhausted"
+    }
+    stored = tasks_table.get_item(Key={"PK": tasks[1]["PK"], "SK": tasks[1]["SK"]})["Item"]
+    assert stored["status"] == "IN_PROGRESS"
@@ -0,0 +1,113 @@
+"""Tests for the cascade_task_deletes Lambda function."""
+
+from ..functions.task_workers.cascade_task_deletes import cascade_task_deletes
+from ..functions.task_workers.cascade_task_deletes.cascade_task_deletes import process_records
+from ..functions.shared.utils.task_dependencies import build_link_items, read_graph_links, get_graph_version
+
+
+def task_image(workspace_id, task_id, account_id, entity_type="TASK", deleted=False):
+    """Build a minimal stream image of an item."""
+    image = {
+        "workspace_id": {"S": workspace_id},
+        "task_id": {"S": task_id},
+        "account_id": {"S": account_id},
+        "entity_type": {"S": entity_type}
+    }
+    if deleted:
+        image["deleted_at"] = {"S": "2024-05-01T00:00:00Z"}
+    return image
+
+
+def remove_record(workspace_id, task_id, account_id, entity_type="TASK", deleted=False):
+    """Build a minimal stream record for a removed item."""
+    return {"eventName": "REMOVE", "dynamodb": {
+        "OldImage": task_image(workspace_id, task_id, account_id, entity_type, deleted)
+    }}
+
+
+def delete_record(workspace_id, task_id, account_id):
+    """Build a minimal stream record for a task being tombstoned."""
+    return {"eventName": "MODIFY", "dynamodb": {
+        "OldImage": task_image(workspace_id, task_id, account_id),
+        "NewImage": task_image(workspace_id, task_id, account_id, deleted=True)
+    }}
+
+
+def create_dependents_table(dynamodb_resource, name):
+    """Create a mocked comments or time entries table."""
+    return dynamodb_resource.create_table(
+        TableName=name,
+        KeySchema=[
+            {"AttributeName": "PK", "KeyType": "HASH"},
+            {"AttributeName": "SK", "KeyType": "RANGE"}
+        ],
+        AttributeDefinitions=[
+            {"AttributeName": "PK", "AttributeType": "S"},
+            {"AttributeName": "SK", "AttributeType": "S"}
+        ],
+        BillingMode="PAY_PER_REQUEST"
+    )
+
+
+def test_cascade_task_deletes(dynamodb_resource, tasks_table):
+    """Test that a deleted task's comments, time entries and links are removed."""
+    comments = create_dependents_table(dynamodb_resource, cascade_task_deletes.COMMENTS_TABLE)
+    time_entries = create_dependents_table(dynamodb_resource, cascade_task_deletes.TIME_ENTRIES_TABLE)
+    
+    for i in range(30):
+        comments.put_item(Item={"PK": "TENANT#account-1#TASK#task-1", "SK": f"COMMENT#{i:03}"})
+        time_entries.put_item(Item={"PK": "WORKSPACE#ws-1#TASK#task-1", "SK": f"TIMEENTRY#{i:03}"})
+    # Another task's history is kept
+    comments.put_item(Item={"PK": "TENANT#account-1#TASK#task-2", "SK": "COMMENT#001"})
+    for item in build_link_items("ws-1", "task-1", "task-3", "user-1"):
+        tasks_table.put_item(Item=item)
+    for i in range(3):
+        tasks_table.put_item(Item={"PK": "WORKSPACE#ws-1#TASK#task-1", "SK": f"HISTORY#2024-01-0{i + 1}#{i}"})
+    
+    event = {"Records": [
+        remove_record("ws-1", "task-1", "account-1"),
+        # Tag references removed along with the task are ignored
+        remove_record("ws-1", "task-1", "account-1", entity_type="TAG"),
+        {"eventName": "MODIFY", "dynamodb": {}}
+    ]}
+    
+    assert process_records(event["Records"]) == {
+        "tasks": 1, "comments": 30, "time_entries": 30, "history": 3, "dependencies": 1
+    }
+    assert comments.scan()["Count"] == 1
+    assert time_entries.scan()["Count"] == 0
+    assert tasks_table.scan()["Count"] == 1  # The graph version item
+    assert read_graph_links(tasks_table, "ws-1") == []
+    assert get_graph_version(tasks_table, "ws-1") == 1
+
+
+def test_cascade_task_deletes_on_delete_and_purge(dynamodb_resource, tasks_table):
+    """Test that dependents go when a task is deleted and its history when it is purged."""
+    comments = create_dependents_table(dynamodb_resource, cascade_task_deletes.COMMENTS_TABLE)
+    time_entries = create_dependents_table(dynamodb_resource, cascade_task_deletes.TIME_ENTRIES_TABLE)
+    
+    comments.put_item(Item={"PK": "TENANT#account-1#TASK#task-1", "SK": "COMMENT#001"})
+    time_entries.put_item(Item={"PK": "WORKSPACE#ws-1#TASK#task-1", "SK": "TIMEENTRY#001"})
+    for item in build_link_items("ws-1", "task-1", "task-3", "user-1"):
+        tasks_table.put_item(Item=item)
+    tasks_table.put_item(Item={"PK": "WORKSPACE#ws-1#TASK#task-1", "SK": "HISTORY#2024-01-01#1"})
+    
+    # The delete removes comments, time entries and links but keeps history for a restore
+    assert process_records([delete_record("ws-1", "task-1", "account-1")]) == {
+        "tasks": 1, "comments": 1, "time_entries": 1, "history": 0, "dependencies": 1
+    }
+    assert comments.scan()["Count"] == 0
+    assert time_entries.scan()["Count"] == 0
+    assert read_graph_links(tasks_table, "ws-1") == []
+    
+    # Updates to a task already deleted are ignored
+    redeleted = delete_record("ws-1", "task-1", "account-1")
+    redeleted["dynamodb"]["OldImage"] = redeleted["dynamodb"]["NewImage"]
+    assert process_records([redeleted])["tasks"] == 0
+    
+    # Purging the tombstone only removes the history left behind
+    purge = remove_record("ws-1", "task-1", "account-1", deleted=True)
+    assert process_records([purge]) == {
+        "tasks": 1, "comments": 0, "time_entries": 0, "history": 1, "dependencies": 0
+    }
+    assert tasks_table.scan()["Count"] == 1  # The graph version item
@@ -48,7 +48,7 @@ def test_create_task_success(create_task_event, tasks_table, accounts_table):
     assert saved_task["title"] == "New Test Task"
     assert saved_task["status"] == "TODO"
     assert saved_task["priority"] == "HIGH"
-    assert saved_task["GSI1SK"].startswith("STATUS#TODO#PRIORITY#HIGH")
+    assert saved_task["GSI1SK"].startswith("STATUS#TODO#PRIORITY#3#")
     assert saved_task["GSI2SK"].startswith("ASSIGNEE#user-789")
 
 
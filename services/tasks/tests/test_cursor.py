@@ -0,0 +1,77 @@
+"""Tests for the pagination cursor codec."""
+
+import json
+from decimal import Decimal
+import pytest
+from ..functions.shared.utils import cursor as cursor_module
+from ..functions.shared.utils.cursor import build_cursor_scope, encode_cursor, decode_cursor
+
+
+LAST_EVALUATED_KEY = {
+    "PK": "WORKSPACE#ws-1",
+    "SK": "TASK#task-0f8c5a9e-3b1d-4c3e-9a57-2d6f1b8e4c70",
+    "GSI1PK": "WORKSPACE#ws-1",
+    "GSI1SK": "STATUS#TODO#PRIORITY#3#TASK#task-0f8c5a9e-3b1d-4c3e-9a57-2d6f1b8e4c70"
+}
+
+
+def test_build_cursor_scope():
+    """Test that scopes are stable and skip empty filters."""
+    scope = build_cursor_scope("tasks", "ws-1", "GSI1", status="TODO", tag=None, priority="HIGH")
+    assert scope == "tasks|ws-1|GSI1|priority=HIGH|status=TODO"
+
+
+def test_cursor_round_trip():
+    """Test that a cursor decodes to the key it was issued for."""
+    scope = build_cursor_scope("tasks", "ws-1", "GSI1")
+    cursor = encode_cursor(LAST_EVALUATED_KEY, scope)
+
+    assert decode_cursor(cursor, scope) == (LAST_EVALUATED_KEY, None)
+
+    # Opaque, URL-safe and shorter than the raw JSON key
+    assert "WORKSPACE" not in cursor
+    assert all(c.isalnum() or c in "-_" for c in cursor)
+    assert len(cursor) < len(json.dumps(LAST_EVALUATED_KEY))
+
+
+def test_cursor_numbers_round_trip():
+    """Test that numeric key attributes come back as Decimals."""
+    scope = build_cursor_scope("resources")
+    key = {"id": "r-1", "version": Decimal("3"), "score": Decimal("1.5")}
+
+    decoded, error = decode_cursor(encode_cursor(key, scope), scope)
+    assert error is None
+    assert decoded == key
+    assert isinstance(decoded["score"], Decimal)
+
+
+def test_cursor_rejects_other_scopes():
+    """Test that a cursor cannot resume a different tenant, index or filter."""
+    cursor = encode_cursor(LAST_EVALUATED_KEY, build_cursor_scope("tasks", "ws-1", "GSI1"))
+
+    for scope in [build_cursor_scope("tasks", "ws-2", "GSI1"),
+                  build_cursor_scope("tasks", "ws-1", "GSI2"),
+                  build_cursor_scope("tasks", "ws-1", "GSI1", status="DONE")]:
+        assert decode_cursor(cursor, scope) == (None, "Invalid pagination token")
+
+
+def test_cursor_rejects_tampering():
+    """Test that edited, truncated or foreign tokens are rejected."""
+    scope = build_cursor_scope("tasks", "ws-1", "GSI1")
+    cursor = encode_cursor(LAST_EVALUATED_KEY, scope)
+    tampered = cursor[:-2] + ("AA" if cursor[-2:] != "AA" else "BB")
+
+    for token in [tampered, cursor[:20], json.dumps(LAST_EVALUATED_KEY), "", "x" * 5000]:
+        assert decode_cursor(token, scope) == (None, "Invalid pagination token")
+
+
+def test_cursor_requires_secret(monkeypatch):
+    """Test that cursors are neither issued nor accepted without a secret."""
+    scope = build_cursor_scope("tasks", "ws-1", "GSI1")
+    cursor = encode_cursor(LAST_EVALUATED_KEY, scope)
+    monkeypatch.setattr(cursor_module, "CURSOR_SECRET", "")
+
+    with pytest.raises(RuntimeError):
+        encode_cursor(LAST_EVALUATED_KEY, scope)
+    with pytest.raises(RuntimeError):
+        decode_cursor(cursor, scope)
@@ -3,7 +3,9 @@
 import json
 from unittest.mock import patch
 import pytest
+from ..functions.task_operations.delete_task import delete_task
 from ..functions.task_operations.delete_task.delete_task import handler
+from ..functions.shared.utils.task_counters import get_task_counts
 
 
 def test_delete_task_success(delete_task_event, populated_tasks_table, sample_task):
@@ -23,7 +25,7 @@ def test_delete_task_success(delete_task_event, populated_tasks_table, sample_ta
     assert body["task_id"] == sample_task["task_id"]
     assert body["workspace_id"] == sample_task["workspace_id"]
     
-    # Verify the task was actually deleted from DynamoDB
+    # Verify the task was tombstoned in DynamoDB
     response = populated_tasks_table.get_item(
         Key={
             "PK": f"WORKSPACE#{sample_task['workspace_id']}",
@@ -31,8 +33,10 @@ def test_delete_task_success(delete_task_event, populated_tasks_table, sample_ta
         }
     )
     
-    # Should not have an Item in the response if deleted
-    assert "Item" not in response
+    # The tombstone keeps the task but leaves every index
+    assert "deleted_at" in response["Item"]
+    assert "expires_at" in response["Item"]
+    assert "GSI1PK" not in response["Item"]
 
 
 def test_delete_task_not_found(delete_task_event, tasks_table):
@@ -108,4 +112,26 @@ def test_delete_task_no_workspace_access(delete_task_event):
         assert response["statusCode"] == 403
         body = json.loads(response["body"])
         assert "message" in body
-        assert "Access denied" in body["message"] 
\ No newline at end of file
+        assert "Access denied" in body["message"] 
+
+def test_delete_task_single_write(api_gateway_event_template, tasks_table, sample_task, lambda_context, authorize,
+                                  fold_task_stream):
+    """Test that a delete is one conditional write and its tombstone leaves the counters."""
+    authorize(delete_task)
+    tasks_table.put_item(Item=sample_task)
+    
+    event = api_gateway_event_template.copy()
+    event["httpMethod"] = "DELETE"
+    event["pathParameters"] = {"workspaceId": sample_task["workspace_id"], "taskId": sample_task["task_id"]}
+    
+    client = delete_task.tasks_table.meta.client
+    with patch.object(client, "get_item", wraps=client.get_item) as get_item:
+        response = handler(event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    get_item.assert_not_called()
+    fold_task_stream()
+    assert get_task_counts(tasks_table, sample_task["workspace_id"])["total"] == 0
+    
+    # Deleting it again finds nothing
+    assert handler(event, lambda_context)["statusCode"] == 404
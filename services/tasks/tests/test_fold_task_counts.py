@@ -0,0 +1,71 @@
+"""Tests for the fold_task_counts stream processor."""
+
+from ..functions.task_workers.fold_task_counts.fold_task_counts import process_records
+from ..functions.shared.utils.task_counters import get_task_counts
+from ..functions.shared.models.task_models import create_task_item, apply_task_update
+
+
+def new_task(**fields):
+    """Build a task item in the test workspace."""
+    return create_task_item(
+        workspace_id="test-workspace-123",
+        account_id="test-account-123",
+        title="Fix login",
+        creator_id="user-123",
+        creator_email="user@example.com",
+        **fields
+    )
+
+
+def test_fold_task_counts(tasks_table, fold_task_stream):
+    """Test that task writes reach the counters through the stream."""
+    task = new_task(status="TODO", priority="HIGH", assignee_id="user-1")
+    other = new_task(status="TODO")
+    tasks_table.put_item(Item=task)
+    tasks_table.put_item(Item=other)
+    moved = apply_task_update(task, {"status": "DONE", "updated_by": "user-123"}, "2024-05-01T00:00:00Z")
+    tasks_table.put_item(Item=moved)
+    tasks_table.put_item(Item={**other, "deleted_at": "2024-05-01T00:00:00Z"})
+    # Writes to other items count towards nothing
+    tasks_table.put_item(Item={"PK": task["PK"], "SK": "TAG#x#TASK#t-1", "entity_type": "TAG"})
+    
+    assert fold_task_stream() == {"workspaces": 1, "folded": 1}
+    
+    counts = get_task_counts(tasks_table, "test-workspace-123")
+    assert counts["total"] == 1
+    assert counts["by_status"]["TODO"] == 0
+    assert counts["by_status"]["DONE"] == 1
+    assert counts["by_priority"]["HIGH"] == 1
+    assert counts["by_assignee"] == {"user-1": 1}
+    
+    # Restoring the tombstone counts the task again, purging a tombstone changes nothing
+    tasks_table.put_item(Item=other)
+    tasks_table.put_item(Item={**other, "deleted_at": "2024-05-02T00:00:00Z"})
+    tasks_table.delete_item(Key={"PK": other["PK"], "SK": other["SK"]})
+    tasks_table.put_item(Item=new_task(status="BACKLOG"))
+    assert fold_task_stream() == {"workspaces": 1, "folded": 1}
+    assert get_task_counts(tasks_table, "test-workspace-123")["total"] == 2
+
+
+def test_fold_task_counts_retried_batch(tasks_table, sample_task):
+    """Test that a batch the stream retries is only counted once."""
+    record = {"eventName": "INSERT", "dynamodb": {
+        "NewImage": {
+            "entity_type": {"S": "TASK"},
+            "workspace_id": {"S": sample_task["workspace_id"]},
+            "status": {"S": "TODO"},
+            "priority": {"S": "LOW"}
+        },
+        "SequenceNumber": "300"
+    }}
+    
+    assert process_records([record]) == {"workspaces": 1, "folded": 1}
+    assert process_records([record]) == {"workspaces": 1, "folded": 0}
+    
+    # Removing a live task only happens with its workspace, whose counters go too
+    removed = {"eventName": "REMOVE", "dynamodb": {"OldImage": record["dynamodb"]["NewImage"], "SequenceNumber": "400"}}
+    assert process_records([removed]) == {"workspaces": 0, "folded": 0}
+    
+    counts = get_task_counts(tasks_table, sample_task["workspace_id"])
+    assert counts["total"] == 1
+    assert counts["by_priority"]["LOW"] == 1
@@ -0,0 +1,51 @@
+"""Tests for the get_board Lambda function."""
+
+import json
+from ..functions.task_operations.get_board import get_board
+from ..functions.task_operations.get_board.get_board import handler
+from ..functions.task_operations.list_tasks import list_tasks
+from .test_list_tasks import create_multiple_tasks
+
+
+def test_get_board(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that every status column comes back with its own page and cursor."""
+    authorize(get_board)
+    create_multiple_tasks(tasks_table, count=10)
+    
+    event = api_gateway_event_template
+    event["queryStringParameters"] = {"limit": "2", "fields": "title,status,priority"}
+    
+    response = handler(event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    columns = json.loads(response["body"])["columns"]
+    assert [column["status"] for column in columns] == ["BACKLOG", "TODO", "IN_PROGRESS", "DONE"]
+    
+    # Statuses cycle, so BACKLOG and TODO have 3 tasks and IN_PROGRESS and DONE have 2
+    for column in columns:
+        assert column["count"] == 2
+        assert all(task["status"] == column["status"] for task in column["tasks"])
+        assert set(column["tasks"][0]) == {"task_id", "title", "status", "priority"}
+    assert "next_token" in columns[0]
+    
+    # A column cursor loads more of that column through list_tasks
+    authorize(list_tasks)
+    event["queryStringParameters"] = {
+        "status": "BACKLOG",
+        "sort": "rank",
+        "next_token": columns[0]["next_token"]
+    }
+    body = json.loads(list_tasks.handler(event, lambda_context)["body"])
+    assert body["count"] == 1
+    assert body["tasks"][0]["task_id"] not in {task["task_id"] for task in columns[0]["tasks"]}
+
+
+def test_get_board_missing_workspace_id(api_gateway_event_template, lambda_context, authorize):
+    """Test getting a board without a workspace ID."""
+    authorize(get_board)
+    event = api_gateway_event_template
+    event["pathParameters"] = {}
+    
+    response = handler(event, lambda_context)
+    
+    assert response["statusCode"] == 400
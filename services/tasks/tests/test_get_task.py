@@ -3,6 +3,7 @@
 import json
 from unittest.mock import patch
 import pytest
+from ..functions.task_operations.get_task import get_task
 from ..functions.task_operations.get_task.get_task import handler
 
 
@@ -121,4 +122,30 @@ def test_get_task_wrong_workspace(get_task_event, populated_tasks_table, sample_
     assert response["statusCode"] == 404
     body = json.loads(response["body"])
     assert "message" in body
-    assert "not found in workspace" in body["message"] 
\ No newline at end of file
+    assert "not found in workspace" in body["message"] 
+
+def test_get_task_selected_fields(get_task_event, populated_tasks_table, sample_task,
+                                  lambda_context, authorize):
+    """Test retrieving only the selected fields of a task."""
+    authorize(get_task)
+    get_task_event["queryStringParameters"] = {"fields": "title,status"}
+    
+    response = handler(get_task_event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["task"] == {
+        "task_id": sample_task["task_id"],
+        "title": sample_task["title"],
+        "status": sample_task["status"]
+    }
+
+
+def test_get_task_invalid_fields(get_task_event, lambda_context, authorize):
+    """Test retrieving a task with a field outside the task schema."""
+    authorize(get_task)
+    get_task_event["queryStringParameters"] = {"fields": "title,GSI1SK"}
+    
+    response = handler(get_task_event, lambda_context)
+    
+    assert response["statusCode"] == 400
+    assert "Invalid field: GSI1SK" in json.loads(response["body"])["message"]
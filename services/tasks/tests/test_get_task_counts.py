@@ -0,0 +1,42 @@
+"""Tests for the get_task_counts Lambda function."""
+
+import json
+from ..functions.task_operations.get_task_counts import get_task_counts
+from ..functions.task_operations.get_task_counts.get_task_counts import handler
+from ..functions.task_operations.create_task import create_task
+from ..functions.task_operations.delete_task import delete_task
+
+
+def test_get_task_counts(create_task_event, api_gateway_event_template, tasks_table,
+                         lambda_context, authorize, fold_task_stream):
+    """Test that counts follow tasks created and deleted through the handlers."""
+    authorize(create_task)
+    authorize(get_task_counts)
+    
+    # The fixture task is TODO, HIGH and assigned to user-789
+    body = json.loads(create_task.handler(create_task_event, lambda_context)["body"])
+    create_task.handler(create_task_event, lambda_context)
+    fold_task_stream()
+    
+    event = api_gateway_event_template
+    response = handler(event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    counts = json.loads(response["body"])
+    assert counts["total"] == 2
+    assert counts["by_status"]["TODO"] == 2
+    assert counts["by_priority"]["HIGH"] == 2
+    assert counts["by_assignee"] == {"user-789": 2}
+    assert counts["assigned_to_me"] == 0
+    
+    # Deleting a task takes it out of every bucket
+    authorize(delete_task)
+    task = tasks_table.get_item(Key={"PK": "WORKSPACE#test-workspace-123",
+                                     "SK": f"TASK#{body['task']['task_id']}"})["Item"]
+    delete_event = {"pathParameters": {"workspaceId": "test-workspace-123", "taskId": task["task_id"]}}
+    assert delete_task.handler(delete_event, lambda_context)["statusCode"] == 200
+    fold_task_stream()
+    
+    counts = json.loads(handler(event, lambda_context)["body"])
+    assert counts["total"] == 1
+    assert counts["by_assignee"] == {"user-789": 1}
@@ -0,0 +1,102 @@
+"""Tests for idempotency keys on the create endpoints."""
+
+import json
+import time
+from boto3.dynamodb.conditions import Key
+from ..functions.task_operations.create_task import create_task
+from ..functions.task_operations.bulk_create_tasks import bulk_create_tasks
+from ..functions.shared.utils.idempotency import (
+    idempotency_record_key,
+    hash_request,
+    claim_request
+)
+
+
+def keyed_event(api_gateway_event_template, body, key=None):
+    """Create a POST event for the test workspace, with an optional Idempotency-Key."""
+    event = api_gateway_event_template.copy()
+    event["httpMethod"] = "POST"
+    event["headers"] = {**event["headers"]}
+    if key is not None:
+        event["headers"]["idempotency-key"] = key
+    event["body"] = json.dumps(body)
+    return event
+
+
+def stored_tasks(tasks_table):
+    """Read every task in the test workspace."""
+    return tasks_table.query(
+        KeyConditionExpression=Key("PK").eq("WORKSPACE#test-workspace-123") & Key("SK").begins_with("TASK#")
+    )["Items"]
+
+
+def test_create_task_replays_response(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that a retried create returns the stored response without a second task."""
+    authorize(create_task)
+    
+    event = keyed_event(api_gateway_event_template, {"title": "Write report"}, key="retry-1")
+    first = create_task.handler(event, lambda_context)
+    second = create_task.handler(event, lambda_context)
+    
+    assert first["statusCode"] == 201
+    assert second["statusCode"] == 201
+    assert json.loads(second["body"]) == json.loads(first["body"])
+    assert second["headers"]["ETag"] == first["headers"]["ETag"]
+    assert second["headers"]["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first["headers"]
+    assert len(stored_tasks(tasks_table)) == 1
+    
+    # Without a key every request creates a task
+    response = create_task.handler(keyed_event(api_gateway_event_template, {"title": "Write report"}), lambda_context)
+    assert response["statusCode"] == 201
+    assert len(stored_tasks(tasks_table)) == 2
+
+
+def test_create_task_key_reused_with_different_body(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that a key sent with a different request is rejected."""
+    authorize(create_task)
+    
+    create_task.handler(keyed_event(api_gateway_event_template, {"title": "First"}, key="reused"), lambda_context)
+    response = create_task.handler(keyed_event(api_gateway_event_template, {"title": "Second"}, key="reused"), lambda_context)
+    
+    assert response["statusCode"] == 422
+    assert [task["title"] for task in stored_tasks(tasks_table)] == ["First"]
+    
+    # Key order and whitespace do not change the request hash
+    assert hash_request({"a": 1, "b": [1, 2]}) == hash_request(json.loads('{ "b": [1, 2], "a": 1 }'))
+    
+    response = create_task.handler(keyed_event(api_gateway_event_template, {"title": "First"}, key="x" * 256), lambda_context)
+    assert response["statusCode"] == 400
+
+
+def test_bulk_create_tasks_in_progress_and_timeout(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that a retry during the first attempt is refused until its claim times out."""
+    authorize(bulk_create_tasks)
+    
+    body = {"tasks": [{"title": f"Imported {i}"} for i in range(3)]}
+    record_key = idempotency_record_key("test-workspace-123#user-123#bulk_create_tasks", "import-1")
+    assert claim_request(tasks_table, record_key, hash_request(body)) is None
+    
+    event = keyed_event(api_gateway_event_template, body, key="import-1")
+    response = bulk_create_tasks.handler(event, lambda_context)
+    assert response["statusCode"] == 409
+    assert stored_tasks(tasks_table) == []
+    
+    # A claim whose request died is taken over
+    tasks_table.update_item(
+        Key=record_key,
+        UpdateExpression="SET locked_until = :past",
+        ExpressionAttributeValues={":past": int(time.time()) - 1}
+    )
+    response = bulk_create_tasks.handler(event, lambda_context)
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["created"] == 3
+    
+    replayed = bulk_create_tasks.handler(event, lambda_context)
+    assert replayed["statusCode"] == 200
+    assert replayed["body"] == response["body"]
+    assert len(stored_tasks(tasks_table)) == 3
+    
+    record = tasks_table.get_item(Key=record_key)["Item"]
+    assert record["status"] == "COMPLETED"
+    assert record["expires_at"] > time.time()
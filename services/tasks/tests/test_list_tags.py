@@ -0,0 +1,34 @@
+"""Tests for the list_tags Lambda function."""
+
+import json
+from ..functions.task_operations.list_tags import list_tags
+from ..functions.task_operations.list_tags.list_tags import handler
+from ..functions.shared.utils.tag_index import sync_task_tags
+
+
+def test_list_tags(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test listing tags by prefix, most used first."""
+    authorize(list_tags)
+    sync_task_tags(tasks_table, "test-workspace-123", "task-1", new_tags=["bug", "backend"])
+    sync_task_tags(tasks_table, "test-workspace-123", "task-2", new_tags=["bug", "docs"])
+    
+    event = api_gateway_event_template
+    event["queryStringParameters"] = {"prefix": "b"}
+    
+    response = handler(event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert body["tags"] == [{"tag": "bug", "count": 2}, {"tag": "backend", "count": 1}]
+    assert body["count"] == 2
+
+
+def test_list_tags_missing_workspace_id(api_gateway_event_template, lambda_context, authorize):
+    """Test listing tags without a workspace ID."""
+    authorize(list_tags)
+    event = api_gateway_event_template
+    event["pathParameters"] = {}
+    
+    response = handler(event, lambda_context)
+    
+    assert response["statusCode"] == 400
@@ -1,10 +1,16 @@
 """Tests for the list_tasks Lambda function."""
 
 import json
+import time
+from datetime import datetime, timedelta
 from unittest.mock import patch
 import pytest
 from boto3.dynamodb.conditions import Key
+from ..functions.task_operations.list_tasks import list_tasks
 from ..functions.task_operations.list_tasks.list_tasks import handler
+from ..functions.shared.models.task_models import build_index_keys, create_task_item, time_ordered_uuid
+from ..functions.shared.utils import query_planner
+from ..functions.shared.utils.tag_index import sync_task_tags
 
 
 def create_multiple_tasks(tasks_table, workspace_id="test-workspace-123", count=5):
@@ -38,17 +44,12 @@ def create_multiple_tasks(tasks_table, workspace_id="test-workspace-123", count=
             "created_by": {
                 "user_id": "user-123",
                 "email": "user@example.com"
-            },
-            "GSI1PK": f"WORKSPACE#{workspace_id}",
-            "GSI1SK": f"STATUS#{status}#PRIORITY#{priority}#TASK#{task_id}"
+            }
         }
         
         # Add assignee to some tasks
         if i % 2 == 0:
-            assignee_id = f"user-{i+100}"
-            task["assignee_id"] = assignee_id
-            task["GSI2PK"] = f"WORKSPACE#{workspace_id}"
-            task["GSI2SK"] = f"ASSIGNEE#{assignee_id}#TASK#{task_id}"
+            task["assignee_id"] = f"user-{i+100}"
         
         # Add tags to some tasks
         if i % 3 == 0:
@@ -58,7 +59,9 @@ def create_multiple_tasks(tasks_table, workspace_id="test-workspace-123", count=
         if i % 2 == 1:
             task["due_date"] = f"2023-{(i % 12) + 1:02d}-15"
         
+        task.update(build_index_keys(task))
         tasks_table.put_item(Item=task)
+        sync_task_tags(tasks_table, workspace_id, task_id, new_tags=task.get("tags"))
         tasks.append(task)
     
     return tasks
@@ -241,4 +244,237 @@ def test_list_tasks_no_workspace_access(list_tasks_event):
         assert response["statusCode"] == 403
         body = json.loads(response["body"])
         assert "message" in body
-        assert "Access denied" in body["message"] 
\ No newline at end of file
+        assert "Access denied" in body["message"]
+
+
+def test_list_tasks_fill_page(list_tasks_event, tasks_table, lambda_context, authorize):
+    """Test that fill-page mode returns a full page for sparse filters."""
+    authorize(list_tasks)
+    create_multiple_tasks(tasks_table, count=40)
+    
+    # Only every fourth task is URGENT, so a plain limited query comes back short
+    list_tasks_event["queryStringParameters"] = {
+        "priority": "URGENT",
+        "limit": "5",
+        "fill_page": "true"
+    }
+    
+    response = handler(list_tasks_event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert body["count"] == 5
+    assert all(task["priority"] == "URGENT" for task in body["tasks"])
+    assert body["scanned_count"] >= body["count"]
+    assert "consumed_capacity" in body
+    
+    assert "next_token" in body
+
+
+def test_list_tasks_sorted_by_priority(list_tasks_event, tasks_table, lambda_context, authorize):
+    """Test listing tasks in priority rank order."""
+    authorize(list_tasks)
+    create_multiple_tasks(tasks_table, count=8)
+    
+    list_tasks_event["queryStringParameters"] = {"sort": "-priority"}
+    
+    response = handler(list_tasks_event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    priorities = [task["priority"] for task in body["tasks"]]
+    assert priorities == ["URGENT", "URGENT", "HIGH", "HIGH", "MEDIUM", "MEDIUM", "LOW", "LOW"]
+
+
+def test_list_tasks_sorted_by_updated_at(list_tasks_event, tasks_table, lambda_context, authorize):
+    """Test that the update time sort returns the task fields its index projects."""
+    authorize(list_tasks)
+    tasks = create_multiple_tasks(tasks_table, count=3)
+    
+    list_tasks_event["queryStringParameters"] = {"sort": "-updated_at"}
+    
+    response = handler(list_tasks_event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert sorted(task["task_id"] for task in body["tasks"]) == sorted(task["task_id"] for task in tasks)
+    assert body["tasks"][0]["description"].startswith("This is test task")
+    # Other indexes' keys are not copied into GSI6
+    assert "GSI1SK" not in body["tasks"][0]
+
+
+def test_list_tasks_invalid_sort(list_tasks_event, lambda_context, authorize):
+    """Test listing tasks with an unsupported sort field."""
+    authorize(list_tasks)
+    list_tasks_event["queryStringParameters"] = {"sort": "title"}
+    
+    response = handler(list_tasks_event, lambda_context)
+    
+    assert response["statusCode"] == 400
+    assert "Invalid sort value" in json.loads(response["body"])["message"]
+
+
+def test_list_tasks_due_date_range(list_tasks_event, tasks_table, lambda_context, authorize):
+    """Test listing tasks due within a date range, earliest first."""
+    authorize(list_tasks)
+    create_multiple_tasks(tasks_table, count=12)
+    
+    list_tasks_event["queryStringParameters"] = {
+        "due_date_start": "2023-04-01",
+        "due_date_end": "2023-08-15"
+    }
+    
+    response = handler(list_tasks_event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    due_dates = [task["due_date"] for task in body["tasks"]]
+    assert due_dates == ["2023-04-15", "2023-06-15", "2023-08-15"]
+
+
+def test_list_tasks_invalid_due_date_range(list_tasks_event, lambda_context, authorize):
+    """Test listing tasks with a reversed due date range."""
+    authorize(list_tasks)
+    list_tasks_event["queryStringParameters"] = {
+        "due_date_start": "2023-08-01",
+        "due_date_end": "2023-04-01"
+    }
+    
+    response = handler(list_tasks_event, lambda_context)
+    
+    assert response["statusCode"] == 400
+
+
+def test_list_tasks_by_tag_index(list_tasks_event, tasks_table, lambda_context, authorize):
+    """Test that tag filters read only the tagged tasks from the tag index."""
+    authorize(list_tasks)
+    tasks = create_multiple_tasks(tasks_table, count=12)
+    
+    list_tasks_event["queryStringParameters"] = {"tag": "test", "status": "BACKLOG"}
+    
+    with patch.object(list_tasks.tasks_table, "query", wraps=list_tasks.tasks_table.query) as query:
+        response = handler(list_tasks_event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    expected = {t["task_id"] for t in tasks if "test" in t.get("tags", []) and t["status"] == "BACKLOG"}
+    assert {task["task_id"] for task in body["tasks"]} == expected
+    
+    # One query over the tag references, no GSI read of the workspace
+    assert query.call_count == 1
+    assert "IndexName" not in query.call_args.kwargs
+
+
+def test_list_tasks_by_assignee_and_status(list_tasks_event, tasks_table, lambda_context, authorize):
+    """Test that assignee and status are served by one key-conditioned query."""
+    authorize(list_tasks)
+    tasks = create_multiple_tasks(tasks_table, count=12)
+    
+    # Tasks 0, 4 and 8 are BACKLOG, only task 0 is assigned to user-100
+    list_tasks_event["queryStringParameters"] = {"assignee_id": "user-100", "status": "BACKLOG"}
+    
+    with patch.object(list_tasks.tasks_table, "query", wraps=list_tasks.tasks_table.query) as query:
+        response = handler(list_tasks_event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert [task["task_id"] for task in body["tasks"]] == [tasks[0]["task_id"]]
+    assert query.call_args.kwargs["IndexName"] == "GSI2"
+    assert "FilterExpression" not in query.call_args.kwargs
+
+
+def test_list_tasks_selected_fields(list_tasks_event, tasks_table, lambda_context, authorize):
+    """Test listing kanban cards with only the selected fields."""
+    authorize(list_tasks)
+    create_multiple_tasks(tasks_table, count=8)
+    
+    list_tasks_event["queryStringParameters"] = {
+        "status": "TODO",
+        "limit": "1",
+        "fields": "title,status,priority,assignee_id"
+    }
+    
+    with patch.object(list_tasks.tasks_table, "query", wraps=list_tasks.tasks_table.query) as query:
+        response = handler(list_tasks_event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert set(body["tasks"][0]) == {"task_id", "title", "status", "priority"}
+    assert "#description" not in query.call_args.kwargs["ExpressionAttributeNames"]
+    
+    # The projected index keys still resume the query
+    list_tasks_event["queryStringParameters"]["next_token"] = body["next_token"]
+    response = handler(list_tasks_event, lambda_context)
+    assert json.loads(response["body"])["tasks"][0]["task_id"] != body["tasks"][0]["task_id"]
+
+
+def test_list_tasks_cursor_bound_to_filters(list_tasks_event, tasks_table, lambda_context, authorize):
+    """Test that a cursor cannot be replayed against a different filter."""
+    authorize(list_tasks)
+    create_multiple_tasks(tasks_table, count=12)
+    
+    list_tasks_event["queryStringParameters"] = {"status": "BACKLOG", "limit": "1"}
+    body = json.loads(handler(list_tasks_event, lambda_context)["body"])
+    assert "WORKSPACE" not in body["next_token"]
+    
+    # Same filters resume the listing
+    list_tasks_event["queryStringParameters"]["next_token"] = body["next_token"]
+    assert handler(list_tasks_event, lambda_context)["statusCode"] == 200
+    
+    # Different filters reject the cursor
+    list_tasks_event["queryStringParameters"]["status"] = "DONE"
+    response = handler(list_tasks_event, lambda_context)
+    assert response["statusCode"] == 400
+    assert "Invalid pagination token" in json.loads(response["body"])["message"]
+
+
+def test_list_tasks_created_window_newest_first(list_tasks_event, tasks_table, lambda_context, authorize, monkeypatch):
+    """Test that a creation window is a reverse key range on the table's time-ordered task IDs."""
+    authorize(list_tasks)
+    monkeypatch.setattr(query_planner, "TIME_ORDERED_IDS_SINCE", "2020-01-01")
+    
+    # Tasks created a day apart get IDs a day apart
+    yesterday = datetime.utcnow() - timedelta(days=1)
+    old_task = create_task_item("test-workspace-123", "test-account-123", "Yesterday", creator_id="user-123")
+    old_task["task_id"] = f"task-{time_ordered_uuid(time.time_ns() - 86400 * 10**9)}"
+    old_task.update(SK=f"TASK#{old_task['task_id']}", created_at=yesterday.isoformat())
+    tasks_table.put_item(Item=old_task)
+    
+    created = []
+    for i in range(3):
+        task = create_task_item("test-workspace-123", "test-account-123", f"Today {i}", creator_id="user-123")
+        tasks_table.put_item(Item=task)
+        created.append(task["task_id"])
+    
+    deleted = create_task_item("test-workspace-123", "test-account-123", "Deleted", creator_id="user-123")
+    deleted["deleted_at"] = deleted["created_at"]
+    tasks_table.put_item(Item=deleted)
+    
+    list_tasks_event["queryStringParameters"] = {"created_start": datetime.utcnow().date().isoformat()}
+    
+    with patch.object(list_tasks.tasks_table, "query", wraps=list_tasks.tasks_table.query) as query:
+        response = handler(list_tasks_event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    assert "IndexName" not in query.call_args.kwargs
+    body = json.loads(response["body"])
+    assert [task["task_id"] for task in body["tasks"]] == list(reversed(created))
+
+
+def test_list_tasks_created_window_before_time_ordered_ids(list_tasks_event, tasks_table, lambda_context, authorize, monkeypatch):
+    """Test that windows reaching back before time-ordered IDs read GSI5."""
+    authorize(list_tasks)
+    monkeypatch.setattr(query_planner, "TIME_ORDERED_IDS_SINCE", "2999-01-01")
+    tasks = create_multiple_tasks(tasks_table, count=3)
+    
+    list_tasks_event["queryStringParameters"] = {"created_start": "2020-01-01", "sort": "created_at"}
+    
+    response = handler(list_tasks_event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert [task["task_id"] for task in body["tasks"]] == [task["task_id"] for task in tasks]
+    
+    list_tasks_event["queryStringParameters"] = {"created_start": "yesterday"}
+    response = handler(list_tasks_event, lambda_context)
+    assert response["statusCode"] == 400
@@ -0,0 +1,207 @@
+"""Tests for moving tasks on the board and rebalancing columns."""
+
+import json
+from unittest.mock import patch
+from boto3.dynamodb.conditions import Key
+from ..functions.task_operations.move_task import move_task
+from ..functions.task_operations.create_task import create_task
+from ..functions.task_workers.rebalance_column import rebalance_column
+from ..functions.shared.models.task_models import create_task_item, rank_between
+from ..functions.shared.utils.task_counters import get_task_counts
+
+
+def save_column(tasks_table, count, status="TODO"):
+    """Save counted tasks in one column, in creation order."""
+    tasks = []
+    rank = None
+    for i in range(count):
+        rank = rank_between(rank, None)
+        task = create_task_item(
+            workspace_id="test-workspace-123",
+            account_id="test-account-123",
+            title=f"Card {i}",
+            status=status,
+            creator_id="user-123",
+            creator_email="user@example.com",
+            rank=rank
+        )
+        tasks_table.put_item(Item=task)
+        tasks.append(task)
+    return tasks
+
+
+def column_order(tasks_table, status):
+    """Read a column's task IDs in board order."""
+    response = tasks_table.query(
+        IndexName="GSI8",
+        KeyConditionExpression=Key("GSI8PK").eq("WORKSPACE#test-workspace-123") &
+                               Key("GSI8SK").begins_with(f"STATUS#{status}#")
+    )
+    return [item["task_id"] for item in response["Items"]]
+
+
+def move_event(api_gateway_event_template, task_id, body):
+    """Build a move request for one task."""
+    event = api_gateway_event_template.copy()
+    event["httpMethod"] = "POST"
+    event["pathParameters"] = {"workspaceId": "test-workspace-123", "taskId": task_id}
+    event["body"] = json.dumps(body)
+    return event
+
+
+def test_move_task_within_column(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that a move writes only the moved task and reorders the column."""
+    authorize(move_task)
+    tasks = save_column(tasks_table, 4)
+    ids = [task["task_id"] for task in tasks]
+    assert column_order(tasks_table, "TODO") == ids
+    
+    # Drop the last card between the first two
+    event = move_event(api_gateway_event_template, ids[3], {
+        "status": "TODO", "after_task_id": ids[0], "before_task_id": ids[1]
+    })
+    client = tasks_table.meta.client
+    with patch.object(client, "put_item", wraps=client.put_item) as put_item:
+        response = move_task.handler(event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    put_item.assert_not_called()
+    task = json.loads(response["body"])["task"]
+    assert tasks[0]["rank"] < task["rank"] < tasks[1]["rank"]
+    assert response["headers"]["ETag"] == '"2"'
+    assert column_order(tasks_table, "TODO") == [ids[0], ids[3], ids[1], ids[2]]
+    
+    # Moving to the top needs only the card below
+    event = move_event(api_gateway_event_template, ids[2], {"status": "TODO", "before_task_id": ids[0]})
+    assert move_task.handler(event, lambda_context)["statusCode"] == 200
+    assert column_order(tasks_table, "TODO") == [ids[2], ids[0], ids[3], ids[1]]
+
+
+def test_created_task_joins_bottom(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that a new task is ranked after the column's last card, even one moved there."""
+    authorize(move_task)
+    authorize(create_task)
+    ids = [task["task_id"] for task in save_column(tasks_table, 3)]
+    
+    event = move_event(api_gateway_event_template, ids[0], {"status": "TODO", "after_task_id": ids[2]})
+    assert move_task.handler(event, lambda_context)["statusCode"] == 200
+    
+    event = api_gateway_event_template.copy()
+    event["httpMethod"] = "POST"
+    event["body"] = json.dumps({"title": "New card", "status": "TODO"})
+    response = create_task.handler(event, lambda_context)
+    assert response["statusCode"] == 201
+    
+    new_id = json.loads(response["body"])["task"]["task_id"]
+    assert column_order(tasks_table, "TODO") == [ids[1], ids[2], ids[0], new_id]
+    
+    stored = tasks_table.get_item(Key={"PK": "WORKSPACE#test-workspace-123", "SK": f"TASK#{new_id}"})["Item"]
+    assert len(stored["rank"]) == 1
+
+
+def test_move_task_between_columns(api_gateway_event_template, tasks_table, lambda_context, authorize, fold_task_stream):
+    """Test that moving to another column changes the status and its counters."""
+    authorize(move_task)
+    todo = save_column(tasks_table, 2, "TODO")
+    done = save_column(tasks_table, 2, "DONE")
+    
+    event = move_event(api_gateway_event_template, todo[0]["task_id"], {
+        "status": "DONE", "after_task_id": done[0]["task_id"], "before_task_id": done[1]["task_id"]
+    })
+    response = move_task.handler(event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["task"]["status"] == "DONE"
+    assert column_order(tasks_table, "TODO") == [todo[1]["task_id"]]
+    assert column_order(tasks_table, "DONE") == [done[0]["task_id"], todo[0]["task_id"], done[1]["task_id"]]
+    
+    stored = tasks_table.get_item(Key={"PK": todo[0]["PK"], "SK": todo[0]["SK"]})["Item"]
+    assert stored["GSI1SK"].startswith("STATUS#DONE#")
+    
+    fold_task_stream()
+    counts = get_task_counts(tasks_table, "test-workspace-123")
+    assert counts["by_status"]["TODO"] == 1
+    assert counts["by_status"]["DONE"] == 3
+
+
+def test_move_task_stale_neighbours(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that neighbours from another column or out of order are refused."""
+    authorize(move_task)
+    tasks = save_column(tasks_table, 3)
+    other = save_column(tasks_table, 1, "DONE")
+    
+    event = move_event(api_gateway_event_template, tasks[0]["task_id"], {
+        "status": "TODO", "after_task_id": other[0]["task_id"]
+    })
+    assert move_task.handler(event, lambda_context)["statusCode"] == 409
+    
+    # Neighbours given the wrong way round
+    event = move_event(api_gateway_event_template, tasks[0]["task_id"], {
+        "status": "TODO", "after_task_id": tasks[2]["task_id"], "before_task_id": tasks[1]["task_id"]
+    })
+    with patch.object(move_task, "lambda_client") as lambda_client:
+        assert move_task.handler(event, lambda_context)["statusCode"] == 409
+    lambda_client.invoke.assert_called_once()
+    
+    event = move_event(api_gateway_event_template, tasks[0]["task_id"], {"status": "TODO", "after_task_id": "task-missing"})
+    assert move_task.handler(event, lambda_context)["statusCode"] == 404
+    
+    event = move_event(api_gateway_event_template, tasks[0]["task_id"], {"status": "ARCHIVED"})
+    assert move_task.handler(event, lambda_context)["statusCode"] == 400
+
+
+def test_rebalance_column(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that long ranks trigger a rebalance that keeps the column order."""
+    authorize(move_task)
+    first, second, third = [task["task_id"] for task in save_column(tasks_table, 3)]
+    
+    # Keep dropping the outer cards into the shrinking gap right above the middle one
+    above, mover = first, third
+    with patch.object(move_task, "MAX_RANK_LENGTH", 4), patch.object(move_task, "lambda_client") as lambda_client:
+        for _ in range(60):
+            event = move_event(api_gateway_event_template, mover, {
+                "status": "TODO", "after_task_id": above, "before_task_id": second
+            })
+            assert move_task.handler(event, lambda_context)["statusCode"] == 200
+            if lambda_client.invoke.called:
+                break
+            above, mover = mover, above
+    
+    invoke_args = lambda_client.invoke.call_args.kwargs
+    assert json.loads(invoke_args["Payload"]) == {"workspace_id": "test-workspace-123", "status": "TODO"}
+    
+    order = column_order(tasks_table, "TODO")
+    assert order[-1] == second
+    result = rebalance_column.handler(json.loads(invoke_args["Payload"]), lambda_context)
+    
+    assert result == {"tasks": 3, "reranked": 3, "relocated": 0, "skipped": 0}
+    assert column_order(tasks_table, "TODO") == order
+    
+    # Only the order moved, not the version
+    stored = tasks_table.get_item(Key={"PK": "WORKSPACE#test-workspace-123", "SK": f"TASK#{second}"})["Item"]
+    assert len(stored["rank"]) <= 3
+    assert stored["version"] == 1
+
+
+def test_rebalance_column_with_concurrent_move(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that a task moved among the cards not yet rebalanced keeps its place."""
+    authorize(move_task)
+    ids = [task["task_id"] for task in save_column(tasks_table, 5)]
+    
+    # Drop the last card between the first two just as the rebalance starts writing
+    write = rebalance_column.ordered_transact_write
+    def move_then_write(table, actions):
+        if not move_then_write.moved:
+            event = move_event(api_gateway_event_template, ids[4], {
+                "status": "TODO", "after_task_id": ids[0], "before_task_id": ids[1]
+            })
+            assert move_task.handler(event, lambda_context)["statusCode"] == 200
+            move_then_write.moved = True
+        return write(table, actions)
+    move_then_write.moved = False
+    
+    with patch.object(rebalance_column, "ordered_transact_write", side_effect=move_then_write):
+        result = rebalance_column.handler({"workspace_id": "test-workspace-123", "status": "TODO"}, lambda_context)
+    
+    assert result == {"tasks": 5, "reranked": 4, "relocated": 1, "skipped": 0}
+    assert column_order(tasks_table, "TODO") == [ids[0], ids[4], ids[1], ids[2], ids[3]]
@@ -0,0 +1,124 @@
+"""Tests for the pagination helpers."""
+
+from unittest.mock import MagicMock
+from ..functions.shared.utils.pagination import (
+    DEFAULT_READ_CAPACITY_BUDGET,
+    MAX_READ_CAPACITY_BUDGET,
+    parse_capacity_budget,
+    key_from_item,
+    query_fill_page
+)
+
+
+def make_item(n):
+    """Build a minimal GSI1 task item."""
+    return {
+        "PK": "WORKSPACE#ws-1",
+        "SK": f"TASK#task-{n}",
+        "GSI1PK": "WORKSPACE#ws-1",
+        "GSI1SK": f"STATUS#TODO#PRIORITY#HIGH#TASK#task-{n}",
+        "title": f"Task {n}"
+    }
+
+
+def query_response(items, last_key=None, capacity=1.0, scanned=None):
+    """Build a DynamoDB query response."""
+    response = {
+        "Items": items,
+        "Count": len(items),
+        "ScannedCount": scanned if scanned is not None else len(items),
+        "ConsumedCapacity": {"TableName": "Tasks", "CapacityUnits": capacity}
+    }
+    if last_key:
+        response["LastEvaluatedKey"] = last_key
+    return response
+
+
+def test_parse_capacity_budget():
+    """Test parsing the read capacity budget."""
+    assert parse_capacity_budget(None) == DEFAULT_READ_CAPACITY_BUDGET
+    assert parse_capacity_budget("not-a-number") == DEFAULT_READ_CAPACITY_BUDGET
+    assert parse_capacity_budget("0") == DEFAULT_READ_CAPACITY_BUDGET
+    assert parse_capacity_budget("10") == 10
+    assert parse_capacity_budget("100000") == MAX_READ_CAPACITY_BUDGET
+
+
+def test_key_from_item():
+    """Test rebuilding a resume key from an item."""
+    item = make_item(1)
+
+    assert key_from_item(item) == {"PK": item["PK"], "SK": item["SK"]}
+    assert key_from_item(item, "GSI1") == {
+        "PK": item["PK"],
+        "SK": item["SK"],
+        "GSI1PK": item["GSI1PK"],
+        "GSI1SK": item["GSI1SK"]
+    }
+
+
+def test_query_fill_page_follows_last_evaluated_key():
+    """Test that sparse pages are filled by following LastEvaluatedKey."""
+    table = MagicMock()
+    table.query.side_effect = [
+        query_response([make_item(1)], last_key={"PK": "a"}, scanned=100),
+        query_response([], last_key={"PK": "b"}, scanned=100),
+        query_response([make_item(2), make_item(3)], scanned=40),
+    ]
+
+    items, last_key, stats = query_fill_page(
+        table, {"IndexName": "GSI1", "FilterExpression": "x"}, page_size=5
+    )
+
+    assert [i["SK"] for i in items] == ["TASK#task-1", "TASK#task-2", "TASK#task-3"]
+    assert last_key is None
+    assert stats == {"query_count": 3, "scanned_count": 240, "consumed_capacity": 3.0}
+
+    # Each follow-up query resumes where the previous one stopped
+    calls = table.query.call_args_list
+    assert "ExclusiveStartKey" not in calls[0].kwargs
+    assert calls[1].kwargs["ExclusiveStartKey"] == {"PK": "a"}
+    assert calls[2].kwargs["ExclusiveStartKey"] == {"PK": "b"}
+    assert calls[0].kwargs["ReturnConsumedCapacity"] == "TOTAL"
+
+
+def test_query_fill_page_trims_overshoot():
+    """Test that read-ahead results are trimmed and resumed after the last kept item."""
+    table = MagicMock()
+    table.query.return_value = query_response(
+        [make_item(n) for n in range(5)], last_key={"PK": "end"}
+    )
+
+    items, last_key, stats = query_fill_page(
+        table, {"IndexName": "GSI1", "FilterExpression": "x"}, page_size=3
+    )
+
+    assert len(items) == 3
+    assert last_key == key_from_item(make_item(2), "GSI1")
+    assert stats["query_count"] == 1
+
+
+def test_query_fill_page_stops_at_capacity_budget():
+    """Test that querying stops once the capacity budget is spent."""
+    table = MagicMock()
+    table.query.return_value = query_response([], last_key={"PK": "more"}, capacity=4.0)
+
+    items, last_key, stats = query_fill_page(
+        table, {"IndexName": "GSI1", "FilterExpression": "x"}, page_size=20, capacity_budget=10
+    )
+
+    assert items == []
+    assert last_key == {"PK": "more"}
+    assert stats["query_count"] == 3
+    assert stats["consumed_capacity"] == 12.0
+
+
+def test_query_fill_page_without_filter_reads_exact_page():
+    """Test that unfiltered queries do not read ahead."""
+    table = MagicMock()
+    table.query.return_value = query_response([make_item(1), make_item(2)], last_key={"PK": "x"})
+
+    items, last_key, stats = query_fill_page(table, {"IndexName": "GSI1"}, page_size=2)
+
+    assert len(items) == 2
+    assert last_key == {"PK": "x"}
+    assert table.query.call_args.kwargs["Limit"] == 2
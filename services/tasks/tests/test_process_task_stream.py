@@ -0,0 +1,44 @@
+"""Tests for the process_task_stream Lambda function."""
+
+import pytest
+from unittest.mock import patch
+from boto3.dynamodb.types import TypeSerializer
+from ..functions.task_workers.process_task_stream import process_task_stream
+from ..functions.task_workers.process_task_stream.process_task_stream import handler
+from ..functions.shared.utils.task_counters import get_task_counts
+from ..functions.shared.utils.task_history import query_task_history
+
+_serializer = TypeSerializer()
+
+
+def insert_record(task, sequence_number):
+    """Build a stream record for a created task."""
+    return {"eventName": "INSERT", "dynamodb": {
+        "Keys": {"PK": {"S": task["PK"]}, "SK": {"S": task["SK"]}},
+        "NewImage": {attr: _serializer.serialize(value) for attr, value in task.items()},
+        "SequenceNumber": str(sequence_number)
+    }}
+
+
+def test_process_task_stream(tasks_table, sample_task, lambda_context):
+    """Test that one batch reaches every stream processor."""
+    stats = handler({"Records": [insert_record(sample_task, 1)]}, lambda_context)
+    
+    assert stats["records"] == 1
+    assert stats["history"] == {"records": 1, "entries": 1}
+    assert stats["cascade"]["tasks"] == 0
+    assert stats["counters"] == {"workspaces": 1, "folded": 1}
+    entries, _ = query_task_history(tasks_table, sample_task["workspace_id"], sample_task["task_id"], 10)
+    assert [entry["action"] for entry in entries] == ["CREATED"]
+    assert get_task_counts(tasks_table, sample_task["workspace_id"])["total"] == 1
+
+
+def test_process_task_stream_fails_batch(tasks_table, sample_task, lambda_context):
+    """Test that a failing processor fails the batch so the stream retries it."""
+    def fail(records):
+        raise RuntimeError("Failed to write history entries")
+    
+    processors = (("history", fail),) + process_task_stream.STREAM_PROCESSORS[1:]
+    with patch.object(process_task_stream, "STREAM_PROCESSORS", processors):
+        with pytest.raises(RuntimeError):
+            handler({"Records": [insert_record(sample_task, 1)]}, lambda_context)
@@ -0,0 +1,42 @@
+"""Tests for the purge_workspace_tasks Lambda function."""
+
+from ..functions.task_workers.purge_workspace_tasks.purge_workspace_tasks import handler
+from ..functions.shared.utils.task_counters import apply_counter_deltas
+from ..functions.shared.utils.task_dependencies import build_link_items
+
+
+def workspace_record(event_name, workspace_id, entity_type="WORKSPACE"):
+    """Build a minimal accounts table stream record for a workspace."""
+    return {"eventName": event_name, "dynamodb": {"OldImage": {
+        "workspace_id": {"S": workspace_id},
+        "entity_type": {"S": entity_type}
+    }}}
+
+
+def test_purge_workspace_tasks(tasks_table, sample_task, lambda_context):
+    """Test that a purged workspace's partition of the tasks table is deleted."""
+    workspace_id = sample_task["workspace_id"]
+    tasks_table.put_item(Item=sample_task)
+    for i in range(30):
+        tasks_table.put_item(Item={**sample_task, "SK": f"TASK#task-{i:03}", "task_id": f"task-{i:03}"})
+    for item in build_link_items(workspace_id, "task-001", "task-002", "user-123"):
+        tasks_table.put_item(Item=item)
+    apply_counter_deltas(tasks_table, workspace_id, {"TOTAL": 31})
+    # Another workspace's tasks are kept
+    tasks_table.put_item(Item={**sample_task, "PK": "WORKSPACE#other", "workspace_id": "other"})
+    
+    event = {"Records": [
+        workspace_record("REMOVE", workspace_id),
+        # Workspace updates and other entities are ignored
+        workspace_record("MODIFY", "other"),
+        workspace_record("REMOVE", "other", entity_type="MEMBER")
+    ]}
+    
+    stats = handler(event, lambda_context)
+    assert stats["workspaces"] == 1
+    assert stats["items"] >= 34
+    remaining = tasks_table.scan()["Items"]
+    assert [item["PK"] for item in remaining] == ["WORKSPACE#other"]
+    
+    # A redelivered batch finds nothing left to delete
+    assert handler(event, lambda_context) == {"workspaces": 1, "items": 0}
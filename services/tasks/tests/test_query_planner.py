@@ -0,0 +1,242 @@
+"""Tests for the task query planner."""
+
+from boto3.dynamodb.conditions import ConditionExpressionBuilder
+from ..functions.shared.utils.query_planner import (
+    plan_task_query,
+    parse_sort,
+    parse_due_date_range,
+    parse_created_range,
+    add_projection
+)
+from ..functions.shared.utils import query_planner
+
+
+def key_condition_values(query_args):
+    """Render a planned key condition and return its values."""
+    expression = ConditionExpressionBuilder().build_expression(
+        query_args["KeyConditionExpression"], is_key_condition=True
+    )
+    return sorted(expression.attribute_value_placeholders.values())
+
+
+def test_plan_all_tasks():
+    """Test planning a query with no filters."""
+    query_args = plan_task_query("ws-1", {})
+
+    assert query_args["IndexName"] == "GSI1"
+    assert key_condition_values(query_args) == ["WORKSPACE#ws-1"]
+    assert "FilterExpression" not in query_args
+
+
+def test_plan_status_and_priority():
+    """Test that status and priority become a single GSI1 key prefix."""
+    query_args = plan_task_query("ws-1", {"status": "todo", "priority": "urgent"})
+
+    assert query_args["IndexName"] == "GSI1"
+    assert key_condition_values(query_args) == [
+        "STATUS#TODO#PRIORITY#4#",
+        "WORKSPACE#ws-1"
+    ]
+    assert "FilterExpression" not in query_args
+
+
+def test_plan_priority_only():
+    """Test that a priority filter is served by the priority index."""
+    query_args = plan_task_query("ws-1", {"priority": "HIGH"})
+
+    assert query_args["IndexName"] == "GSI3"
+    assert key_condition_values(query_args) == ["PRIORITY#3#", "WORKSPACE#ws-1"]
+    assert "FilterExpression" not in query_args
+
+
+def test_plan_assignee_with_priority():
+    """Test that priority is filtered when querying by assignee."""
+    query_args = plan_task_query("ws-1", {"assignee_id": "user-1", "priority": "LOW"})
+
+    assert query_args["IndexName"] == "GSI2"
+    assert key_condition_values(query_args) == ["ASSIGNEE#user-1#", "WORKSPACE#ws-1"]
+    assert query_args["FilterExpression"] == "#priority = :priority"
+    assert query_args["ExpressionAttributeValues"][":priority"] == "LOW"
+
+
+def test_plan_assignee_and_status():
+    """Test that assignee and status become a single GSI2 key prefix."""
+    query_args = plan_task_query("ws-1", {"assignee_id": "user-1", "status": "in_progress"})
+
+    assert query_args["IndexName"] == "GSI2"
+    assert key_condition_values(query_args) == [
+        "ASSIGNEE#user-1#STATUS#IN_PROGRESS#",
+        "WORKSPACE#ws-1"
+    ]
+    assert "FilterExpression" not in query_args
+
+
+def test_plan_assignee_and_due_date_range():
+    """Test that an assignee's due date range is a GSI7 key condition."""
+    query_args = plan_task_query(
+        "ws-1", {"assignee_id": "user-1"}, due_range=("2023-03-01", "2023-03-07")
+    )
+
+    assert query_args["IndexName"] == "GSI7"
+    assert key_condition_values(query_args) == [
+        "ASSIGNEE#user-1#DUE#2023-03-01",
+        "ASSIGNEE#user-1#DUE#2023-03-07#~",
+        "WORKSPACE#ws-1"
+    ]
+    assert "FilterExpression" not in query_args
+
+
+def test_plan_assignee_sorted_by_due_date():
+    """Test that an assignee's tasks sorted by due date read GSI7."""
+    query_args = plan_task_query("ws-1", {"assignee_id": "user-1"}, sort=("due_date", False))
+
+    assert query_args["IndexName"] == "GSI7"
+    assert key_condition_values(query_args) == ["ASSIGNEE#user-1#", "WORKSPACE#ws-1"]
+    assert "FilterExpression" not in query_args
+
+
+def test_plan_invalid_values_are_ignored():
+    """Test that unknown status and priority values do not narrow the query."""
+    query_args = plan_task_query("ws-1", {"status": "NOPE", "priority": "NOPE"})
+
+    assert query_args["IndexName"] == "GSI1"
+    assert key_condition_values(query_args) == ["WORKSPACE#ws-1"]
+
+
+def test_parse_sort():
+    """Test parsing the sort parameter."""
+    assert parse_sort(None) == (None, None)
+    assert parse_sort("due_date") == (("due_date", False), None)
+    assert parse_sort("-priority") == (("priority", True), None)
+
+    sort, error = parse_sort("title")
+    assert sort is None
+    assert "Invalid sort value" in error
+
+
+def test_plan_sort_by_priority_within_status():
+    """Test that a status column sorted by priority is a single GSI1 query."""
+    query_args = plan_task_query("ws-1", {"status": "TODO"}, sort=("priority", True))
+
+    assert query_args["IndexName"] == "GSI1"
+    assert query_args["ScanIndexForward"] is False
+    assert key_condition_values(query_args) == ["STATUS#TODO#", "WORKSPACE#ws-1"]
+    assert "FilterExpression" not in query_args
+
+
+def test_plan_sort_by_field_indexes():
+    """Test that each sort field reads its own index."""
+    for field, index_name in [("priority", "GSI3"), ("due_date", "GSI4"),
+                              ("created_at", "GSI5"), ("updated_at", "GSI6")]:
+        query_args = plan_task_query("ws-1", {}, sort=(field, False))
+        assert query_args["IndexName"] == index_name
+        assert query_args["ScanIndexForward"] is True
+        assert key_condition_values(query_args) == ["WORKSPACE#ws-1"]
+
+
+def test_plan_sort_filters_unserved_fields():
+    """Test that filters the sort index cannot serve become filter expressions."""
+    query_args = plan_task_query(
+        "ws-1", {"status": "DONE", "assignee_id": "user-1"}, sort=("updated_at", True)
+    )
+
+    assert query_args["IndexName"] == "GSI6"
+    assert query_args["FilterExpression"] == "#status = :status AND #assignee_id = :assignee_id"
+    assert query_args["ExpressionAttributeValues"] == {":status": "DONE", ":assignee_id": "user-1"}
+
+
+def test_parse_due_date_range():
+    """Test parsing the due date range parameters."""
+    assert parse_due_date_range({}) == (None, None)
+    assert parse_due_date_range({"due_date_start": "2023-03-01"}) == (("2023-03-01", None), None)
+    assert parse_due_date_range(
+        {"due_date_start": "2023-03-01", "due_date_end": "2023-03-07"}
+    ) == (("2023-03-01", "2023-03-07"), None)
+
+    due_range, error = parse_due_date_range({"due_date_start": "next week"})
+    assert due_range is None
+    assert "Invalid due_date_start" in error
+
+    due_range, error = parse_due_date_range({"due_date_start": "2023-03-07", "due_date_end": "2023-03-01"})
+    assert due_range is None
+    assert "must not be after" in error
+
+
+def test_plan_due_date_range():
+    """Test that a due date range is a GSI4 key condition, not a filter."""
+    query_args = plan_task_query(
+        "ws-1", {"status": "TODO"}, due_range=("2023-03-01", "2023-03-07")
+    )
+
+    assert query_args["IndexName"] == "GSI4"
+    assert key_condition_values(query_args) == [
+        "DUE#2023-03-01",
+        "DUE#2023-03-07#~",
+        "WORKSPACE#ws-1"
+    ]
+    assert query_args["FilterExpression"] == "#status = :status"
+
+
+def test_plan_due_date_range_with_other_sort():
+    """Test that a due date range falls back to filters under another sort order."""
+    query_args = plan_task_query(
+        "ws-1", {}, sort=("created_at", True), due_range=("2023-03-01", None)
+    )
+
+    assert query_args["IndexName"] == "GSI5"
+    assert query_args["FilterExpression"] == "#due_date >= :due_date_start"
+    assert query_args["ExpressionAttributeValues"] == {":due_date_start": "2023-03-01"}
+
+
+def test_parse_created_range():
+    """Test parsing the creation window parameters into created_at's form."""
+    assert parse_created_range({}) == (None, None)
+    assert parse_created_range({"created_start": "2026-10-01"}) == (("2026-10-01", None), None)
+    assert parse_created_range(
+        {"created_start": "2026-10-01T12:00:00+02:00", "created_end": "2026-10-02T00:00:00Z"}
+    ) == (("2026-10-01T10:00:00", "2026-10-02T00:00:00"), None)
+
+    created_range, error = parse_created_range({"created_end": "last week"})
+    assert created_range is None
+    assert "Invalid created_end" in error
+
+
+def test_plan_created_range_on_table_keys(monkeypatch):
+    """Test that windows after the switch to time-ordered IDs read the table, newest first."""
+    monkeypatch.setattr(query_planner, "TIME_ORDERED_IDS_SINCE", "2026-10-01")
+    query_args = plan_task_query(
+        "ws-1", {"status": "TODO"}, created_range=("2026-10-17", "2026-10-17")
+    )
+
+    assert "IndexName" not in query_args
+    assert query_args["ScanIndexForward"] is False
+    assert key_condition_values(query_args) == [
+        "TASK#task-01a14728-8018",
+        "TASK#task-01a14c4e-e3e8~",
+        "WORKSPACE#ws-1"
+    ]
+    assert query_args["FilterExpression"] == (
+        "#status = :status AND #created_at >= :created_start AND #created_at <= :created_end "
+        "AND attribute_not_exists(deleted_at)"
+    )
+    assert query_args["ExpressionAttributeValues"][":created_end"] == "2026-10-17~"
+
+
+def test_plan_created_range_before_time_ordered_ids(monkeypatch):
+    """Test that earlier windows, which may hold uuid4 IDs, read GSI5."""
+    monkeypatch.setattr(query_planner, "TIME_ORDERED_IDS_SINCE", "2026-10-01")
+    query_args = plan_task_query("ws-1", {}, sort=("created_at", False), created_range=("2026-09-01", None))
+
+    assert query_args["IndexName"] == "GSI5"
+    assert query_args["ScanIndexForward"] is True
+    assert key_condition_values(query_args) == ["CREATED#2026-09-01", "CREATED#~", "WORKSPACE#ws-1"]
+    assert "FilterExpression" not in query_args
+
+
+def test_add_projection_keeps_filter_names_and_resume_keys():
+    """Test that projections merge with filter names and read the index keys."""
+    query_args = add_projection(plan_task_query("ws-1", {"priority": "LOW", "tag": "x"}), ["task_id", "status"])
+
+    assert query_args["ProjectionExpression"] == "#task_id, #status, #PK, #SK, #GSI3PK, #GSI3SK"
+    assert query_args["ExpressionAttributeNames"]["#tags"] == "tags"
+    assert query_args["ExpressionAttributeNames"]["#GSI3SK"] == "GSI3SK"
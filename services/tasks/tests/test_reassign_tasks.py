@@ -0,0 +1,122 @@
+"""Tests for bulk reassignment jobs."""
+
+import json
+from unittest.mock import patch
+from ..functions.task_operations.start_reassignment import start_reassignment
+from ..functions.task_operations.get_reassignment import get_reassignment
+from ..functions.task_workers.reassign_tasks import reassign_tasks
+from ..functions.shared.models.task_models import create_task_item
+from ..functions.shared.utils.reassignment_jobs import create_job_item, get_job
+from ..functions.shared.utils.task_counters import get_task_counts
+
+
+def save_tasks(tasks_table, count, assignee_id):
+    """Save counted tasks assigned to one user in the test workspace."""
+    tasks = []
+    for i in range(count):
+        task = create_task_item(
+            workspace_id="test-workspace-123",
+            account_id="test-account-123",
+            title=f"Handover task {i}",
+            status="TODO",
+            assignee_id=assignee_id,
+            creator_id="user-123",
+            creator_email="user@example.com",
+            due_date="2024-07-01T00:00:00Z" if i % 2 else None
+        )
+        tasks_table.put_item(Item=task)
+        tasks.append(task)
+    return tasks
+
+
+def test_start_reassignment(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that starting a reassignment records the job and invokes the worker."""
+    authorize(start_reassignment)
+    event = api_gateway_event_template.copy()
+    event["httpMethod"] = "POST"
+    event["pathParameters"] = {"workspaceId": "test-workspace-123"}
+    event["body"] = json.dumps({"from_assignee_id": "user-1", "to_assignee_id": "user-2"})
+    
+    with patch.object(start_reassignment, "lambda_client") as lambda_client:
+        response = start_reassignment.handler(event, lambda_context)
+    
+    assert response["statusCode"] == 202
+    job = json.loads(response["body"])["job"]
+    assert job["status"] == "PENDING"
+    assert response["headers"]["Location"] == f"/workspaces/test-workspace-123/reassignments/{job['job_id']}"
+    assert get_job(tasks_table, "test-workspace-123", job["job_id"])["from_assignee_id"] == "user-1"
+    
+    invoke_args = lambda_client.invoke.call_args.kwargs
+    assert invoke_args["InvocationType"] == "Event"
+    assert json.loads(invoke_args["Payload"]) == {"workspace_id": "test-workspace-123", "job_id": job["job_id"]}
+    
+    # Reassigning a user to themselves is rejected
+    event["body"] = json.dumps({"from_assignee_id": "user-1", "to_assignee_id": "user-1"})
+    assert start_reassignment.handler(event, lambda_context)["statusCode"] == 400
+
+
+def test_reassign_tasks(api_gateway_event_template, tasks_table, lambda_context, authorize, fold_task_stream):
+    """Test a job walking several pages of a user's tasks."""
+    tasks = save_tasks(tasks_table, 7, "user-1")
+    save_tasks(tasks_table, 2, "user-3")
+    job = create_job_item("test-workspace-123", "user-1", "user-2", "user-123")
+    tasks_table.put_item(Item=job)
+    
+    with patch.object(reassign_tasks, "PAGE_SIZE", 3):
+        result = reassign_tasks.handler({"workspace_id": "test-workspace-123", "job_id": job["job_id"]}, lambda_context)
+    
+    assert result == {"status": "COMPLETED"}
+    
+    stored = tasks_table.get_item(Key={"PK": tasks[1]["PK"], "SK": tasks[1]["SK"]})["Item"]
+    assert stored["assignee_id"] == "user-2"
+    assert stored["version"] == 2
+    assert stored["GSI2SK"] == f"ASSIGNEE#user-2#STATUS#TODO#TASK#{tasks[1]['task_id']}"
+    assert stored["GSI7SK"] == f"ASSIGNEE#user-2#DUE#2024-07-01T00:00:00Z#TASK#{tasks[1]['task_id']}"
+    
+    fold_task_stream()
+    counts = get_task_counts(tasks_table, "test-workspace-123")
+    assert counts["by_assignee"].get("user-1", 0) == 0
+    assert counts["by_assignee"]["user-2"] == 7
+    assert counts["by_assignee"]["user-3"] == 2
+    
+    # The status endpoint reports the finished job
+    authorize(get_reassignment)
+    event = api_gateway_event_template.copy()
+    event["pathParameters"] = {"workspaceId": "test-workspace-123", "jobId": job["job_id"]}
+    response = get_reassignment.handler(event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    status = json.loads(response["body"])["job"]
+    assert status["status"] == "COMPLETED"
+    assert status["processed"] == 7
+    assert status["reassigned"] == 7
+    assert "last_evaluated_key" not in status
+
+
+def test_reassign_tasks_skips_changed_tasks(tasks_table, lambda_context):
+    """Test that tasks changed since the index was read are left alone."""
+    tasks = save_tasks(tasks_table, 2, "user-1")
+    job = create_job_item("test-workspace-123", "user-1", None, "user-123")
+    tasks_table.put_item(Item=job)
+    
+    # Another writer reassigns a task after the page is read
+    page = reassign_tasks.query_assigned_page(tasks_table, job, 10)
+    tasks_table.update_item(
+        Key={"PK": tasks[0]["PK"], "SK": tasks[0]["SK"]},
+        UpdateExpression="SET assignee_id = :assignee_id",
+        ExpressionAttributeValues={":assignee_id": "user-3"}
+    )
+    
+    with patch.object(reassign_tasks, "query_assigned_page", return_value=page):
+        result = reassign_tasks.handler({"workspace_id": "test-workspace-123", "job_id": job["job_id"]}, lambda_context)
+    
+    assert result == {"status": "COMPLETED"}
+    
+    stored = get_job(tasks_table, "test-workspace-123", job["job_id"])
+    assert stored["reassigned"] == 1
+    assert stored["skipped"] == 1
+    
+    assert tasks_table.get_item(Key={"PK": tasks[0]["PK"], "SK": tasks[0]["SK"]})["Item"]["assignee_id"] == "user-3"
+    unassigned = tasks_table.get_item(Key={"PK": tasks[1]["PK"], "SK": tasks[1]["SK"]})["Item"]
+    assert unassigned["assignee_id"] is None
+    assert "GSI2SK" not in unassigned
@@ -0,0 +1,40 @@
+"""Tests for the reconcile_task_counts Lambda function."""
+
+from unittest.mock import patch
+from ..functions.task_workers.reconcile_task_counts import reconcile_task_counts
+from ..functions.task_workers.reconcile_task_counts.reconcile_task_counts import handler
+from ..functions.shared.utils.task_counters import apply_counter_deltas, get_task_counts
+
+
+def test_reconcile_task_counts(tasks_table, accounts_table, sample_task, lambda_context):
+    """Test that the scheduled run recounts every quiet active workspace."""
+    tasks_table.put_item(Item=sample_task)
+    apply_counter_deltas(tasks_table, sample_task["workspace_id"], {"TOTAL": 5})
+    # Deleted workspaces are not listed
+    accounts_table.put_item(Item={
+        "PK": "ACCOUNT#test-account-123", "SK": "WORKSPACE#ws-deleted",
+        "workspace_id": "ws-deleted", "entity_type": "WORKSPACE", "status": "DELETED"
+    })
+    
+    assert handler({}, lambda_context) == {"workspaces": 1, "reconciled": 1}
+    assert get_task_counts(tasks_table, sample_task["workspace_id"])["total"] == 1
+    
+    # A workspace written within the quiet period waits for the next run
+    tasks_table.put_item(Item={**sample_task, "updated_at": "2999-01-01T00:00:00"})
+    apply_counter_deltas(tasks_table, sample_task["workspace_id"], {"TOTAL": 5})
+    assert handler({"workspace_id": sample_task["workspace_id"]}, lambda_context) == {"workspaces": 1, "reconciled": 0}
+    assert get_task_counts(tasks_table, sample_task["workspace_id"])["total"] == 6
+
+
+def test_reconcile_task_counts_continues(tasks_table, lambda_context):
+    """Test that a run short of time carries on in a new invocation."""
+    pages = iter([(["ws-0"], {"PK": "ACCOUNT#test-account-123", "SK": "WORKSPACE#ws-0"}), (["ws-1"], None)])
+    with patch.object(reconcile_task_counts, "active_workspaces_page", side_effect=lambda key: next(pages)), \
+         patch.object(reconcile_task_counts, "lambda_client") as lambda_client, \
+         patch.object(reconcile_task_counts, "MIN_REMAINING_TIME_MS", 10 ** 9):
+        result = handler({}, lambda_context)
+    
+    assert result["workspaces"] == 1
+    assert result["exclusive_start_key"] == {"PK": "ACCOUNT#test-account-123", "SK": "WORKSPACE#ws-0"}
+    lambda_client.invoke.assert_called_once()
+    assert lambda_client.invoke.call_args.kwargs["InvocationType"] == "Event"
@@ -0,0 +1,76 @@
+"""Tests for the restore_task Lambda function."""
+
+import json
+import time
+from boto3.dynamodb.conditions import Key
+from ..functions.task_operations.delete_task import delete_task
+from ..functions.task_operations.restore_task import restore_task
+from ..functions.task_operations.get_task import get_task
+from ..functions.shared.utils.task_counters import get_task_counts
+
+
+def task_event(api_gateway_event_template, task, method):
+    """Build an API Gateway event addressed to one task."""
+    event = api_gateway_event_template.copy()
+    event["httpMethod"] = method
+    event["pathParameters"] = {"workspaceId": task["workspace_id"], "taskId": task["task_id"]}
+    return event
+
+
+def board_task_ids(tasks_table, workspace_id):
+    """Read the task IDs in the workspace's status index."""
+    response = tasks_table.query(
+        IndexName="GSI1",
+        KeyConditionExpression=Key("GSI1PK").eq(f"WORKSPACE#{workspace_id}")
+    )
+    return [item["task_id"] for item in response["Items"]]
+
+
+def test_delete_and_restore_task(api_gateway_event_template, tasks_table, sample_task, lambda_context, authorize,
+                                 fold_task_stream):
+    """Test that a deleted task leaves the indexes and comes back on restore."""
+    for module in (delete_task, restore_task, get_task):
+        authorize(module)
+    workspace_id = sample_task["workspace_id"]
+    tasks_table.put_item(Item=sample_task)
+    
+    response = delete_task.handler(task_event(api_gateway_event_template, sample_task, "DELETE"), lambda_context)
+    assert response["statusCode"] == 200
+    assert "restorable_until" in json.loads(response["body"])
+    
+    # The tombstone is hidden from reads, indexes and counts
+    assert get_task.handler(task_event(api_gateway_event_template, sample_task, "GET"), lambda_context)["statusCode"] == 404
+    assert board_task_ids(tasks_table, workspace_id) == []
+    fold_task_stream()
+    assert get_task_counts(tasks_table, workspace_id)["total"] == 0
+    tombstone = tasks_table.get_item(Key={"PK": sample_task["PK"], "SK": sample_task["SK"]})["Item"]
+    assert tombstone["deleted_by"] == "user-123"
+    assert tombstone["expires_at"] > time.time()
+    
+    response = restore_task.handler(task_event(api_gateway_event_template, sample_task, "POST"), lambda_context)
+    
+    assert response["statusCode"] == 200
+    restored = json.loads(response["body"])["task"]
+    assert restored["task_id"] == sample_task["task_id"]
+    assert response["headers"]["ETag"] == f'"{restored["version"]}"'
+    
+    stored = tasks_table.get_item(Key={"PK": sample_task["PK"], "SK": sample_task["SK"]})["Item"]
+    assert "deleted_at" not in stored
+    assert "expires_at" not in stored
+    assert stored["GSI2SK"] == f"ASSIGNEE#user-456#STATUS#BACKLOG#TASK#{sample_task['task_id']}"
+    assert board_task_ids(tasks_table, workspace_id) == [sample_task["task_id"]]
+    fold_task_stream()
+    assert get_task_counts(tasks_table, workspace_id)["by_status"]["BACKLOG"] == 1
+    
+    # A live task has nothing to restore
+    assert restore_task.handler(task_event(api_gateway_event_template, sample_task, "POST"), lambda_context)["statusCode"] == 404
+
+
+def test_restore_task_after_retention(api_gateway_event_template, tasks_table, sample_task, lambda_context, authorize):
+    """Test that a tombstone past its retention window cannot be restored."""
+    authorize(restore_task)
+    tasks_table.put_item(Item={**sample_task, "deleted_at": "2023-01-03T00:00:00Z", "expires_at": int(time.time()) - 60})
+    
+    response = restore_task.handler(task_event(api_gateway_event_template, sample_task, "POST"), lambda_context)
+    
+    assert response["statusCode"] == 404
@@ -0,0 +1,89 @@
+"""Tests for the tag index helpers."""
+
+from ..functions.shared.models.task_models import create_task_item
+from ..functions.shared.utils.tag_index import (
+    sync_task_tags,
+    query_tagged_tasks,
+    list_tag_counts
+)
+
+
+def create_tagged_task(tasks_table, tags, status="TODO", workspace_id="ws-1"):
+    """Save a task and index its tags."""
+    task = create_task_item(
+        workspace_id=workspace_id,
+        account_id="acc-1",
+        title=f"Tagged {'/'.join(tags)}",
+        status=status,
+        creator_id="user-1",
+        creator_email="user@example.com",
+        tags=tags
+    )
+    tasks_table.put_item(Item=task)
+    sync_task_tags(tasks_table, workspace_id, task["task_id"], new_tags=tags)
+    return task
+
+
+def test_query_tagged_tasks(tasks_table):
+    """Test that a tag query returns only the tasks carrying the tag."""
+    bug = create_tagged_task(tasks_table, ["bug", "ui"])
+    create_tagged_task(tasks_table, ["feature"])
+    done_bug = create_tagged_task(tasks_table, ["bug"], status="DONE")
+
+    tasks, last_key, _ = query_tagged_tasks(tasks_table, "ws-1", "bug", {}, page_size=10)
+    assert sorted(t["task_id"] for t in tasks) == sorted([bug["task_id"], done_bug["task_id"]])
+    assert last_key is None
+
+    # Attribute filters apply to the tagged tasks
+    tasks, _, _ = query_tagged_tasks(tasks_table, "ws-1", "bug", {"status": "done"}, page_size=10)
+    assert [t["task_id"] for t in tasks] == [done_bug["task_id"]]
+
+
+def test_query_tagged_tasks_pagination(tasks_table):
+    """Test paging through a tag's tasks."""
+    for _ in range(3):
+        create_tagged_task(tasks_table, ["bug"])
+
+    first, last_key, _ = query_tagged_tasks(tasks_table, "ws-1", "bug", {}, page_size=2)
+    assert len(first) == 2
+    assert last_key is not None
+
+    second, last_key, _ = query_tagged_tasks(tasks_table, "ws-1", "bug", {}, page_size=2,
+                                          exclusive_start_key=last_key)
+    assert len(second) == 1
+    assert {t["task_id"] for t in first}.isdisjoint(t["task_id"] for t in second)
+
+
+def test_sync_task_tags_moves_references_and_counts(tasks_table):
+    """Test that retagging and deleting a task keep references and counters in step."""
+    task = create_tagged_task(tasks_table, ["bug", "ui"])
+    create_tagged_task(tasks_table, ["bug"])
+
+    assert list_tag_counts(tasks_table, "ws-1") == [
+        {"tag": "bug", "count": 2},
+        {"tag": "ui", "count": 1}
+    ]
+
+    # Retag: ui -> backend
+    sync_task_tags(tasks_table, "ws-1", task["task_id"], ["bug", "ui"], ["bug", "backend"])
+    tasks, _, _ = query_tagged_tasks(tasks_table, "ws-1", "ui", {}, page_size=10)
+    assert tasks == []
+    tasks, _, _ = query_tagged_tasks(tasks_table, "ws-1", "backend", {}, page_size=10)
+    assert [t["task_id"] for t in tasks] == [task["task_id"]]
+
+    # Delete: drops the remaining references
+    sync_task_tags(tasks_table, "ws-1", task["task_id"], old_tags=["bug", "backend"])
+    assert list_tag_counts(tasks_table, "ws-1") == [{"tag": "bug", "count": 1}]
+
+
+def test_list_tag_counts_prefix_and_limit(tasks_table):
+    """Test autocomplete by tag prefix, most used first."""
+    create_tagged_task(tasks_table, ["backend", "bug"])
+    create_tagged_task(tasks_table, ["bug", "docs"])
+    create_tagged_task(tasks_table, ["bug", "backend"], workspace_id="ws-2")
+
+    assert list_tag_counts(tasks_table, "ws-1", prefix="b") == [
+        {"tag": "bug", "count": 2},
+        {"tag": "backend", "count": 1}
+    ]
+    assert list_tag_counts(tasks_table, "ws-1", limit=1) == [{"tag": "bug", "count": 2}]
@@ -0,0 +1,120 @@
+"""Tests for the per-workspace task counters."""
+
+from ..functions.shared.utils import task_counters
+from ..functions.shared.utils.task_counters import (
+    counter_deltas,
+    apply_counter_deltas,
+    get_task_counts,
+    reconcile_task_counts,
+    stream_position
+)
+
+
+def make_task(status="TODO", priority="HIGH", assignee_id=None):
+    """Build the counted fields of a task."""
+    task = {"status": status, "priority": priority}
+    if assignee_id:
+        task["assignee_id"] = assignee_id
+    return task
+
+
+def test_counter_deltas():
+    """Test counter changes for creating, moving and deleting a task."""
+    assert counter_deltas(new_task=make_task(assignee_id="u-1")) == {
+        "TOTAL": 1, "STATUS#TODO": 1, "PRIORITY#HIGH": 1, "ASSIGNEE#u-1": 1
+    }
+
+    # Only the buckets that change are touched
+    assert counter_deltas(make_task(), make_task(status="DONE")) == {
+        "STATUS#TODO": -1, "STATUS#DONE": 1
+    }
+    assert counter_deltas(make_task(assignee_id="u-1"), make_task(assignee_id="u-2")) == {
+        "ASSIGNEE#u-1": -1, "ASSIGNEE#u-2": 1
+    }
+    assert counter_deltas(make_task(), make_task()) == {}
+
+    assert counter_deltas(old_task=make_task()) == {
+        "TOTAL": -1, "STATUS#TODO": -1, "PRIORITY#HIGH": -1
+    }
+
+
+def test_apply_counter_deltas(tasks_table):
+    """Test that counter changes accumulate on the counts item."""
+    apply_counter_deltas(tasks_table, "ws-1", counter_deltas(new_task=make_task(assignee_id="u-1")))
+    apply_counter_deltas(tasks_table, "ws-1", counter_deltas(new_task=make_task(priority="URGENT")))
+    apply_counter_deltas(tasks_table, "ws-1", counter_deltas(make_task(priority="URGENT"),
+                                                             make_task(status="IN_PROGRESS", priority="URGENT")))
+
+    counts = get_task_counts(tasks_table, "ws-1")
+    assert counts["total"] == 2
+    assert counts["by_status"] == {"BACKLOG": 0, "TODO": 1, "IN_PROGRESS": 1, "DONE": 0}
+    assert counts["by_priority"] == {"LOW": 0, "MEDIUM": 0, "HIGH": 1, "URGENT": 1}
+    assert counts["by_assignee"] == {"u-1": 1}
+
+
+def test_reconcile_task_counts(tasks_table, sample_task):
+    """Test that reconciling replaces drifted counters with a fresh count."""
+    tasks_table.put_item(Item=sample_task)
+
+    # Drift: a task counted twice and a stale assignee bucket
+    apply_counter_deltas(tasks_table, sample_task["workspace_id"], {"TOTAL": 2, "ASSIGNEE#gone": 1})
+
+    reconcile_task_counts(tasks_table, sample_task["workspace_id"])
+
+    counts = get_task_counts(tasks_table, sample_task["workspace_id"])
+    assert counts["total"] == 1
+    assert counts["by_status"]["BACKLOG"] == 1
+    assert counts["by_assignee"] == {"user-456": 1}
+
+
+def test_reconcile_task_counts_concurrent_change(tasks_table, sample_task, monkeypatch):
+    """Test that a counter change made during a recount is not overwritten."""
+    tasks_table.put_item(Item=sample_task)
+    workspace_id = sample_task["workspace_id"]
+
+    # A task is created and counted right after the first recount read the tasks
+    count_tasks = task_counters.count_tasks
+    def count_then_create(table, counted_workspace_id):
+        counted = count_tasks(table, counted_workspace_id)
+        if not count_then_create.created:
+            new_task = {**sample_task, "SK": "TASK#task-new", "task_id": "task-new"}
+            tasks_table.put_item(Item=new_task)
+            apply_counter_deltas(tasks_table, workspace_id, counter_deltas(new_task=new_task))
+            count_then_create.created = True
+        return counted
+    count_then_create.created = False
+    monkeypatch.setattr(task_counters, "count_tasks", count_then_create)
+
+    assert reconcile_task_counts(tasks_table, workspace_id)["TOTAL"] == 2
+    assert get_task_counts(tasks_table, workspace_id)["total"] == 2
+
+
+def test_apply_counter_deltas_once_per_position(tasks_table):
+    """Test that changes folded from stream positions already counted are skipped."""
+    first, last = stream_position("100"), stream_position("250")
+    assert apply_counter_deltas(tasks_table, "ws-1", {"TOTAL": 3}, (first, last))
+
+    # A retried batch, or one half of it, starts at or before the last folded position
+    assert not apply_counter_deltas(tasks_table, "ws-1", {"TOTAL": 3}, (first, last))
+    assert not apply_counter_deltas(tasks_table, "ws-1", {"TOTAL": 1}, (stream_position("200"), last))
+    assert apply_counter_deltas(tasks_table, "ws-1", {"TOTAL": 1}, (stream_position("1000"), stream_position("1000")))
+
+    assert get_task_counts(tasks_table, "ws-1")["total"] == 4
+    # Positions compare in order whatever their length
+    assert stream_position("99") < stream_position("100")
+
+
+def test_reconcile_task_counts_skips_recent_changes(tasks_table, sample_task):
+    """Test that a workspace with changes the stream may not have folded is not recounted."""
+    tasks_table.put_item(Item=sample_task)
+    workspace_id = sample_task["workspace_id"]
+    apply_counter_deltas(tasks_table, workspace_id, {"TOTAL": 5}, (stream_position("100"), stream_position("100")))
+
+    # The task was written on 2023-01-02
+    assert reconcile_task_counts(tasks_table, workspace_id, "2023-01-01T00:00:00") is None
+    assert get_task_counts(tasks_table, workspace_id)["total"] == 5
+
+    assert reconcile_task_counts(tasks_table, workspace_id, "2023-01-03T00:00:00")["TOTAL"] == 1
+    stored = tasks_table.get_item(Key={"PK": f"WORKSPACE#{workspace_id}", "SK": "COUNTS"})["Item"]
+    assert stored["TOTAL"] == 1
+    assert stored["stream_position"] == stream_position("100")
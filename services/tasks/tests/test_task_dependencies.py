@@ -0,0 +1,167 @@
+"""Tests for blocked-by links and the dependency plan."""
+
+import json
+import pytest
+from unittest.mock import patch
+from ..functions.task_operations.add_blocker import add_blocker
+from ..functions.task_operations.remove_blocker import remove_blocker
+from ..functions.task_operations.get_dependency_plan import get_dependency_plan
+from ..functions.task_operations.delete_task import delete_task
+from ..functions.shared.models.task_models import create_task_item
+from ..functions.shared.utils import task_dependencies
+from ..functions.shared.utils.task_dependencies import compute_plan, creates_cycle, get_graph_version
+
+
+def save_tasks(tasks_table, count):
+    """Save tasks in the test workspace, returning their IDs."""
+    task_ids = []
+    for i in range(count):
+        task = create_task_item(
+            workspace_id="test-workspace-123",
+            account_id="test-account-123",
+            title=f"Release step {i}",
+            creator_id="user-123",
+            creator_email="user@example.com"
+        )
+        tasks_table.put_item(Item=task)
+        task_ids.append(task["task_id"])
+    return task_ids
+
+
+def block(api_gateway_event_template, lambda_context, task_id, blocker_id):
+    """Mark a task as blocked by another through the API."""
+    event = api_gateway_event_template.copy()
+    event["httpMethod"] = "POST"
+    event["pathParameters"] = {"workspaceId": "test-workspace-123", "taskId": task_id}
+    event["body"] = json.dumps({"blocker_id": blocker_id})
+    return add_blocker.handler(event, lambda_context)
+
+
+def get_plan(api_gateway_event_template, lambda_context):
+    """Read the workspace's dependency plan through the API."""
+    event = api_gateway_event_template.copy()
+    event["pathParameters"] = {"workspaceId": "test-workspace-123"}
+    response = get_dependency_plan.handler(event, lambda_context)
+    assert response["statusCode"] == 200
+    return json.loads(response["body"])
+
+
+def test_compute_plan():
+    """Test topological order and critical path over a small graph."""
+    # a -> b -> d, a -> c, e -> d: the longest chain is a, b, d
+    plan = compute_plan([("a", "b"), ("a", "c"), ("b", "d"), ("e", "d")])
+    position = {task_id: index for index, task_id in enumerate(plan["order"])}
+    assert sorted(plan["order"]) == ["a", "b", "c", "d", "e"]
+    assert position["a"] < position["b"] < position["d"]
+    assert position["e"] < position["d"]
+    assert plan["critical_path"] == ["a", "b", "d"]
+    assert plan["blocked_by"] == {"b": ["a"], "c": ["a"], "d": ["b", "e"]}
+    
+    assert compute_plan([]) == {"order": [], "critical_path": [], "blocked_by": {}}
+    with pytest.raises(ValueError):
+        compute_plan([("a", "b"), ("b", "a")])
+
+
+def test_add_blocker(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that links are stored both ways and cycles are rejected."""
+    authorize(add_blocker)
+    a, b, c, d = save_tasks(tasks_table, 4)
+    
+    response = block(api_gateway_event_template, lambda_context, b, a)
+    assert response["statusCode"] == 201
+    assert json.loads(response["body"])["dependency"]["blocker_id"] == a
+    assert block(api_gateway_event_template, lambda_context, c, b)["statusCode"] == 201
+    assert get_graph_version(tasks_table, "test-workspace-123") == 2
+    
+    # a holds up c through b, so a cannot wait on c
+    response = block(api_gateway_event_template, lambda_context, a, c)
+    assert response["statusCode"] == 409
+    assert "cycle" in json.loads(response["body"])["message"]
+    
+    # The cycle search only reads the tasks downstream of the blocked task
+    client = tasks_table.meta.client
+    with patch.object(client, "query", wraps=client.query) as query:
+        assert not creates_cycle(tasks_table, "test-workspace-123", d, c)
+    assert query.call_count == 1
+    
+    # Duplicate links, self links and missing tasks are rejected
+    assert block(api_gateway_event_template, lambda_context, b, a)["statusCode"] == 409
+    assert block(api_gateway_event_template, lambda_context, b, b)["statusCode"] == 400
+    assert block(api_gateway_event_template, lambda_context, b, "task-missing")["statusCode"] == 404
+    assert get_graph_version(tasks_table, "test-workspace-123") == 2
+
+
+def test_add_blocker_rechecks_changed_graph(tasks_table):
+    """Test that a link checked against a stale graph version is checked again."""
+    a, b = save_tasks(tasks_table, 2)
+    
+    # Another link lands between the version read and the write
+    tasks_table.put_item(Item={"PK": "WORKSPACE#test-workspace-123", "SK": "DEPGRAPH#VERSION", "graph_version": 1})
+    versions = iter([0, 1])
+    with patch.object(task_dependencies, "get_graph_version", side_effect=lambda *args: next(versions)):
+        link, error = task_dependencies.add_link(tasks_table, "test-workspace-123", b, a, "user-123")
+    
+    assert error is None
+    assert link["task_id"] == b
+    assert get_graph_version(tasks_table, "test-workspace-123") == 2
+
+
+def test_dependency_plan(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that the plan is cached until a link changes."""
+    for module in (add_blocker, remove_blocker, get_dependency_plan):
+        authorize(module)
+    a, b, c, d = save_tasks(tasks_table, 4)
+    for task_id, blocker_id in ((b, a), (c, b), (d, a)):
+        assert block(api_gateway_event_template, lambda_context, task_id, blocker_id)["statusCode"] == 201
+    
+    plan = get_plan(api_gateway_event_template, lambda_context)
+    assert plan["graph_version"] == 3
+    assert plan["cached"] is False
+    assert plan["critical_path"] == [a, b, c]
+    assert plan["order"][0] == a
+    assert plan["blocked"] == {b: [a], c: [b], d: [a]}
+    
+    # Unchanged graphs are served from the cache without reading the links
+    with patch.object(task_dependencies, "read_graph_links") as read_graph_links:
+        cached = get_plan(api_gateway_event_template, lambda_context)
+    read_graph_links.assert_not_called()
+    assert cached["cached"] is True
+    assert cached["critical_path"] == plan["critical_path"]
+    
+    # Removing a link invalidates the plan
+    event = api_gateway_event_template.copy()
+    event["httpMethod"] = "DELETE"
+    event["pathParameters"] = {"workspaceId": "test-workspace-123", "taskId": c, "blockerId": b}
+    assert remove_blocker.handler(event, lambda_context)["statusCode"] == 200
+    assert remove_blocker.handler(event, lambda_context)["statusCode"] == 404
+    
+    plan = get_plan(api_gateway_event_template, lambda_context)
+    assert plan["graph_version"] == 4
+    assert plan["cached"] is False
+    assert len(plan["critical_path"]) == 2
+    assert c not in plan["order"]
+
+
+def test_deleted_blocker_leaves_plan(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that deleting a blocker removes it and its links from the plan."""
+    for module in (add_blocker, get_dependency_plan, delete_task):
+        authorize(module)
+    a, b, c = save_tasks(tasks_table, 3)
+    for task_id, blocker_id in ((b, a), (c, b)):
+        assert block(api_gateway_event_template, lambda_context, task_id, blocker_id)["statusCode"] == 201
+    assert get_plan(api_gateway_event_template, lambda_context)["critical_path"] == [a, b, c]
+    
+    event = api_gateway_event_template.copy()
+    event["httpMethod"] = "DELETE"
+    event["pathParameters"] = {"workspaceId": "test-workspace-123", "taskId": a}
+    assert delete_task.handler(event, lambda_context)["statusCode"] == 200
+    
+    plan = get_plan(api_gateway_event_template, lambda_context)
+    assert plan["graph_version"] == 3
+    assert plan["cached"] is False
+    assert a not in plan["order"]
+    assert plan["critical_path"] == [b, c]
+    assert plan["blocked"] == {c: [b]}
+    
+    # The deleted task cannot be linked again
+    assert block(api_gateway_event_template, lambda_context, c, a)["statusCode"] != 201
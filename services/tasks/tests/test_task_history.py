@@ -0,0 +1,128 @@
+"""Tests for task history recorded from the table stream."""
+
+import json
+from boto3.dynamodb.types import TypeSerializer
+from ..functions.task_workers.record_task_history.record_task_history import process_records as record_history
+from ..functions.task_operations.get_task_history import get_task_history
+from ..functions.shared.models.task_models import create_task_item, apply_task_update
+from ..functions.shared.utils.task_history import build_history_item
+
+_serializer = TypeSerializer()
+
+
+def stream_record(event_name, old_task, new_task, sequence_number):
+    """Build a stream record with old and new images of a task."""
+    images = {}
+    for name, task in (("OldImage", old_task), ("NewImage", new_task)):
+        if task:
+            images[name] = {attr: _serializer.serialize(value) for attr, value in task.items()}
+    return {"eventName": event_name, "dynamodb": {"SequenceNumber": str(sequence_number), **images}}
+
+
+def new_task():
+    """Build a task item in the test workspace."""
+    return create_task_item(
+        workspace_id="test-workspace-123",
+        account_id="test-account-123",
+        title="Fix login",
+        status="TODO",
+        creator_id="user-123",
+        creator_email="user@example.com"
+    )
+
+
+def test_build_history_item():
+    """Test which stream records become history entries."""
+    task = new_task()
+    
+    created = build_history_item(stream_record("INSERT", None, task, 100))
+    assert created["action"] == "CREATED"
+    assert created["actor"] == "user-123"
+    assert created["PK"] == f"WORKSPACE#test-workspace-123#TASK#{task['task_id']}"
+    assert created["SK"] == f"HISTORY#{task['created_at']}#100"
+    assert created["changes"]["status"] == {"from": None, "to": "TODO"}
+    
+    # Status and assignee changes record the acting user and both values
+    updated = apply_task_update(task, {
+        "status": "IN_PROGRESS", "assignee_id": "user-456", "updated_by": "user-789"
+    }, "2024-05-01T10:00:00Z")
+    entry = build_history_item(stream_record("MODIFY", task, updated, 200))
+    assert entry["action"] == "UPDATED"
+    assert entry["actor"] == "user-789"
+    assert entry["version"] == 2
+    assert entry["changes"] == {
+        "status": {"from": "TODO", "to": "IN_PROGRESS"},
+        "assignee_id": {"from": None, "to": "user-456"}
+    }
+    
+    # Long text is cut short
+    long_description = apply_task_update(task, {"description": "x" * 500, "updated_by": "user-123"}, "2024-05-01T11:00:00Z")
+    entry = build_history_item(stream_record("MODIFY", task, long_description, 250))
+    assert len(entry["changes"]["description"]["to"]) == 203
+    
+    # A move within a column and a write that keeps the version are not history
+    moved = apply_task_update(task, {"rank": "V", "updated_by": "user-123"}, "2024-05-01T12:00:00Z")
+    assert build_history_item(stream_record("MODIFY", task, moved, 300)) is None
+    assert build_history_item(stream_record("MODIFY", task, {**task, "GSI9SK": "PATH#x"}, 400)) is None
+    
+    deleted = {**updated, "deleted_at": "2024-05-02T00:00:00Z", "deleted_by": "user-456", "version": 3}
+    entry = build_history_item(stream_record("MODIFY", updated, deleted, 500))
+    assert (entry["action"], entry["actor"], entry["changes"]) == ("DELETED", "user-456", {})
+    
+    restored = {**updated, "updated_by": "user-123", "version": 4}
+    assert build_history_item(stream_record("MODIFY", deleted, restored, 600))["action"] == "RESTORED"
+    
+    # Purges and other items are ignored
+    assert build_history_item(stream_record("REMOVE", deleted, None, 700)) is None
+    assert build_history_item(stream_record("INSERT", None, {**created}, 800)) is None
+
+
+def test_task_history(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test recording a task's changes and paging through them newest first."""
+    authorize(get_task_history)
+    task = {**new_task(), "created_at": "2024-04-30T00:00:00Z"}
+    tasks_table.put_item(Item=task)
+    records = [stream_record("INSERT", None, task, 1)]
+    current = task
+    for i, status in enumerate(["IN_PROGRESS", "DONE", "TODO"]):
+        updated = apply_task_update(current, {"status": status, "updated_by": "user-123"}, f"2024-05-0{i + 1}T00:00:00Z")
+        records.append(stream_record("MODIFY", current, updated, i + 2))
+        current = updated
+    
+    assert record_history(records) == {"records": 4, "entries": 4}
+    # Redelivered records overwrite their own entries
+    record_history(records[-1:])
+    
+    event = api_gateway_event_template.copy()
+    event["pathParameters"] = {"workspaceId": "test-workspace-123", "taskId": task["task_id"]}
+    response = get_task_history.handler(event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert [entry["action"] for entry in body["history"]] == ["UPDATED", "UPDATED", "UPDATED", "CREATED"]
+    assert [entry["changes"]["status"]["to"] for entry in body["history"]] == ["TODO", "DONE", "IN_PROGRESS", "TODO"]
+    assert body["history"][0]["changes"]["status"]["from"] == "DONE"
+    assert "next_token" not in body
+    
+    # Pages continue from the cursor until every entry is read
+    event["queryStringParameters"] = {"limit": "3"}
+    body = json.loads(get_task_history.handler(event, lambda_context)["body"])
+    versions = [entry["version"] for entry in body["history"]]
+    event["queryStringParameters"] = {"limit": "3", "next_token": body["next_token"]}
+    body = json.loads(get_task_history.handler(event, lambda_context)["body"])
+    versions += [entry["version"] for entry in body["history"]]
+    assert sorted(versions) == [1, 2, 3, 4]
+    
+    # Cursors only resume the task they were issued for
+    event["pathParameters"]["taskId"] = "task-other"
+    assert get_task_history.handler(event, lambda_context)["statusCode"] == 400
+    
+    # A deleted task's history is hidden until it is restored
+    event["pathParameters"]["taskId"] = task["task_id"]
+    event["queryStringParameters"] = None
+    tasks_table.update_item(
+        Key={"PK": task["PK"], "SK": task["SK"]},
+        UpdateExpression="SET deleted_at = :now",
+        ExpressionAttributeValues={":now": "2024-05-05T00:00:00Z"}
+    )
+    assert get_task_history.handler(event, lambda_context)["statusCode"] == 404
@@ -1,12 +1,27 @@
 """Tests for the task models module."""
 
+import uuid
 import pytest
 from ..functions.shared.models.task_models import (
     generate_id,
+    time_ordered_uuid,
+    time_ordered_id_prefix,
     get_timestamp,
     create_task_item,
     validate_task_input,
-    prepare_update_expression
+    prepare_update_expression,
+    build_index_keys,
+    diff_index_keys,
+    due_date_key_range,
+    parse_fields,
+    build_projection,
+    select_fields,
+    index_key_read_fields,
+    prepare_conditional_update,
+    timestamp_rank,
+    rank_between,
+    ranks_after,
+    spread_ranks
 )
 
 
@@ -22,6 +37,19 @@ def test_generate_id():
     assert task_id.startswith("custom-")
 
 
+def test_generate_id_time_ordered():
+    """Test that IDs are UUIDv7s that sort by creation time."""
+    earlier = time_ordered_uuid(1760000000000000000)
+    later = time_ordered_uuid(1760000000000001000)
+    
+    assert earlier < later
+    assert uuid.UUID(earlier).version == 7
+    assert earlier.startswith(time_ordered_id_prefix(1760000000000))
+    
+    # The sub-millisecond fraction orders IDs within a millisecond
+    assert time_ordered_uuid(1760000000000000000) < time_ordered_uuid(1760000000000000500)
+
+
 def test_get_timestamp():
     """Test timestamp generation."""
     timestamp = get_timestamp()
@@ -62,7 +90,7 @@ def test_create_task_item():
     
     # Check GSI1 format
     assert task["GSI1PK"] == f"WORKSPACE#workspace-123"
-    assert task["GSI1SK"].startswith("STATUS#BACKLOG#PRIORITY#MEDIUM#TASK#")
+    assert task["GSI1SK"].startswith("STATUS#BACKLOG#PRIORITY#2#TASK#")
     
     # Check optional fields are not present
     assert "description" not in task
@@ -99,10 +127,14 @@ def test_create_task_item():
     
     # Check GSI updates for assignee
     assert task["GSI2PK"] == f"WORKSPACE#workspace-123"
-    assert task["GSI2SK"].startswith("ASSIGNEE#user-123#TASK#")
+    assert task["GSI2SK"].startswith("ASSIGNEE#user-123#STATUS#TODO#TASK#")
     
     # Check GSI1 changes for status/priority
-    assert task["GSI1SK"].startswith("STATUS#TODO#PRIORITY#HIGH#TASK#")
+    assert task["GSI1SK"].startswith("STATUS#TODO#PRIORITY#3#TASK#")
+    
+    # Check GSI3 orders by priority rank
+    assert task["GSI3PK"] == f"WORKSPACE#workspace-123"
+    assert task["GSI3SK"].startswith("PRIORITY#3#TASK#")
 
 
 def test_validate_task_input():
@@ -222,7 +254,7 @@ def test_prepare_update_expression():
     # Check GSI1SK is updated
     assert "#GSI1SK = :gsi1sk" in update_expr
     assert ":gsi1sk" in expr_values
-    assert expr_values[":gsi1sk"].startswith("STATUS#IN_PROGRESS#PRIORITY#HIGH#TASK#task-123")
+    assert expr_values[":gsi1sk"].startswith("STATUS#IN_PROGRESS#PRIORITY#3#TASK#task-123")
     assert "#GSI1SK" in expr_names
     assert expr_names["#GSI1SK"] == "GSI1SK"
     
@@ -240,7 +272,7 @@ def test_prepare_update_expression():
     assert ":gsi2pk" in expr_values
     assert ":gsi2sk" in expr_values
     assert expr_values[":gsi2pk"] == "WORKSPACE#workspace-123"
-    assert expr_values[":gsi2sk"].startswith("ASSIGNEE#new-assignee#TASK#task-123")
+    assert expr_values[":gsi2sk"].startswith("ASSIGNEE#new-assignee#STATUS#BACKLOG#TASK#task-123")
     assert "#GSI2PK" in expr_names
     assert "#GSI2SK" in expr_names
     assert expr_names["#GSI2PK"] == "GSI2PK"
@@ -262,4 +294,279 @@ def test_prepare_update_expression():
     update_expr, expr_values, expr_names = prepare_update_expression(update_data)
     
     # Check GSI2 keys are removed
-    assert "REMOVE GSI2PK, GSI2SK" in update_expr 
\ No newline at end of file
+    assert "REMOVE GSI2PK, GSI2SK" in update_expr
+
+
+def test_build_index_keys():
+    """Test building GSI keys from task fields."""
+    task = {
+        "task_id": "task-123",
+        "workspace_id": "workspace-123",
+        "status": "TODO",
+        "priority": "URGENT",
+        "created_at": "2023-01-01T00:00:00",
+        "updated_at": "2023-01-02T00:00:00"
+    }
+    
+    keys = build_index_keys(task)
+    assert keys == {
+        "GSI1PK": "WORKSPACE#workspace-123",
+        "GSI1SK": "STATUS#TODO#PRIORITY#4#TASK#task-123",
+        "GSI3PK": "WORKSPACE#workspace-123",
+        "GSI3SK": "PRIORITY#4#TASK#task-123",
+        "GSI4PK": "WORKSPACE#workspace-123",
+        "GSI4SK": "DUE#NONE#TASK#task-123",
+        "GSI5PK": "WORKSPACE#workspace-123",
+        "GSI5SK": "CREATED#2023-01-01T00:00:00#TASK#task-123",
+        "GSI6PK": "WORKSPACE#workspace-123",
+        "GSI6SK": "UPDATED#2023-01-02T00:00:00#TASK#task-123",
+        "GSI8PK": "WORKSPACE#workspace-123",
+        "GSI8SK": f"STATUS#TODO#RANK#{timestamp_rank('2023-01-01T00:00:00')}#TASK#task-123",
+        "GSI9PK": "WORKSPACE#workspace-123",
+        "GSI9SK": "PATH#task-123"
+    }
+    
+    # Assigned tasks are also keyed on GSI2 and GSI7, dated tasks sort by due date
+    task["assignee_id"] = "user-456"
+    task["due_date"] = "2023-03-01"
+    keys = build_index_keys(task)
+    assert keys["GSI2PK"] == "WORKSPACE#workspace-123"
+    assert keys["GSI2SK"] == "ASSIGNEE#user-456#STATUS#TODO#TASK#task-123"
+    assert keys["GSI4SK"] == "DUE#2023-03-01#TASK#task-123"
+    assert keys["GSI7PK"] == "WORKSPACE#workspace-123"
+    assert keys["GSI7SK"] == "ASSIGNEE#user-456#DUE#2023-03-01#TASK#task-123"
+    
+    # A moved task's rank replaces its creation order
+    task["rank"] = "V"
+    assert build_index_keys(task)["GSI8SK"] == "STATUS#TODO#RANK#V#TASK#task-123"
+
+
+def test_rank_between():
+    """Test that ranks fall between their neighbours and stay short."""
+    assert rank_between(None, None) == "V"
+    assert "V" < rank_between("V", None)
+    assert rank_between(None, "V") < "V"
+    assert "V" < rank_between("V", "W") < "W"
+    assert "A1" < rank_between("A1", "A2") < "A2"
+    
+    # Repeated moves into the same gap add a digit at a time
+    low, high = "V", "W"
+    for _ in range(20):
+        rank = rank_between(low, high)
+        assert low < rank < high
+        assert not rank.endswith("0")
+        high = rank
+    assert len(high) < 10
+    
+    with pytest.raises(ValueError):
+        rank_between("W", "V")
+    
+    # Cards added below the last one step a digit at a time
+    assert rank_between("V", None) == "W"
+    assert rank_between("z", None) == "zV"
+    rank = None
+    for _ in range(100):
+        next_rank = rank_between(rank, None)
+        assert rank is None or rank < next_rank
+        rank = next_rank
+    assert len(rank) <= 4
+    
+    # Creation times keep their order as ranks
+    assert timestamp_rank("2023-01-01T00:00:00") < timestamp_rank("2023-01-01T00:00:00.000001")
+    assert timestamp_rank("2023-01-01T00:00:00Z") == timestamp_rank("2023-01-01T00:00:00")
+
+
+def test_ranks_after():
+    """Test that tasks added together get short ranks after the last card, in order."""
+    assert ranks_after("V", 1) == [rank_between("V", None)]
+    
+    ranks = ranks_after("V", 1000)
+    assert ranks == sorted(ranks)
+    assert len(set(ranks)) == 1000
+    assert "V" < ranks[0]
+    assert max(len(rank) for rank in ranks) <= 4
+
+
+def test_spread_ranks():
+    """Test that a rebalance spreads a column over short, ordered ranks."""
+    ranks = spread_ranks(500)
+    assert ranks == sorted(ranks)
+    assert len(set(ranks)) == 500
+    assert max(len(rank) for rank in ranks) <= 3
+    assert all(not rank.endswith("0") for rank in ranks)
+
+
+def test_due_date_key_range():
+    """Test that due date ranges include both end dates and exclude undated tasks."""
+    low, high = due_date_key_range("2023-03-01", "2023-03-07")
+    assert low == "DUE#2023-03-01"
+    assert high == "DUE#2023-03-07#~"
+    
+    def due_key(due_date):
+        return build_index_keys({"task_id": "t", "workspace_id": "w", "due_date": due_date})["GSI4SK"]
+    
+    assert low <= due_key("2023-03-01") <= high
+    assert low <= due_key("2023-03-07") <= high
+    assert not low <= due_key("2023-03-08") <= high
+    
+    # Open-ended ranges still skip tasks without a due date
+    low, high = due_date_key_range(start="2023-03-01")
+    assert low <= due_key("2099-01-01") <= high
+    assert not low <= due_key(None) <= high
+
+
+def test_priority_ranks_sort_by_urgency():
+    """Test that priority sort keys order by urgency."""
+    keys = [
+        build_index_keys({"task_id": "t", "workspace_id": "w", "status": "TODO", "priority": p})["GSI1SK"]
+        for p in ["URGENT", "LOW", "HIGH", "MEDIUM"]
+    ]
+    assert [k.split("#")[3] for k in sorted(keys)] == ["1", "2", "3", "4"]
+
+
+def test_diff_index_keys():
+    """Test comparing stored GSI keys with the current layout."""
+    task = {
+        "task_id": "task-123",
+        "workspace_id": "workspace-123",
+        "status": "TODO",
+        "priority": "LOW",
+        "GSI1PK": "WORKSPACE#workspace-123",
+        "GSI1SK": "STATUS#TODO#PRIORITY#LOW#TASK#task-123",
+        "GSI2PK": "WORKSPACE#workspace-123",
+        "GSI2SK": "ASSIGNEE#user-456#TASK#task-123"
+    }
+    
+    # Legacy item: name-encoded priority, no GSI3/GSI4 keys, assignee keys without an assignee
+    keys_to_set, keys_to_remove = diff_index_keys(task, build_index_keys(task))
+    assert keys_to_set == {
+        "GSI1SK": "STATUS#TODO#PRIORITY#1#TASK#task-123",
+        "GSI3PK": "WORKSPACE#workspace-123",
+        "GSI3SK": "PRIORITY#1#TASK#task-123",
+        "GSI4PK": "WORKSPACE#workspace-123",
+        "GSI4SK": "DUE#NONE#TASK#task-123",
+        "GSI9PK": "WORKSPACE#workspace-123",
+        "GSI9SK": "PATH#task-123"
+    }
+    assert keys_to_remove == ["GSI2PK", "GSI2SK"]
+    
+    # Up-to-date item has nothing to change
+    current = {**task, "assignee_id": "user-456", **build_index_keys({**task, "assignee_id": "user-456"})}
+    assert diff_index_keys(current, build_index_keys(current)) == ({}, [])
+
+
+def test_prepare_update_expression_priority_rank():
+    """Test that priority changes move the task on the priority index."""
+    existing_task = {
+        "task_id": "task-123",
+        "workspace_id": "workspace-123",
+        "status": "TODO",
+        "priority": "LOW",
+        "created_at": "2023-01-01T00:00:00",
+        "updated_at": "2023-01-01T00:00:00"
+    }
+    existing_task.update(build_index_keys(existing_task))
+    
+    update_expr, expr_values, expr_names = prepare_update_expression({
+        "priority": "URGENT",
+        "_existing_task": existing_task
+    })
+    
+    assert expr_values[":gsi1sk"] == "STATUS#TODO#PRIORITY#4#TASK#task-123"
+    assert expr_values[":gsi3sk"] == "PRIORITY#4#TASK#task-123"
+    
+    # The update time index always moves, unchanged keys are not rewritten
+    assert expr_values[":gsi6sk"] == f"UPDATED#{expr_values[':updated_at']}#TASK#task-123"
+    assert ":gsi1pk" not in expr_values
+    assert ":gsi4sk" not in expr_values
+    assert ":gsi5sk" not in expr_values
+
+
+def test_parse_fields():
+    """Test parsing the fields parameter against the task schema."""
+    assert parse_fields(None) == (None, None)
+    assert parse_fields("title, status,title") == (["task_id", "title", "status"], None)
+    
+    fields, error = parse_fields("title,PK")
+    assert fields is None
+    assert "Invalid field: PK" in error
+
+
+def test_build_projection_and_select_fields():
+    """Test projecting and trimming tasks to selected fields."""
+    projection, names = build_projection(["task_id", "status"])
+    assert projection == "#task_id, #status"
+    assert names == {"#task_id": "task_id", "#status": "status"}
+    
+    task = {"task_id": "t-1", "status": "TODO", "PK": "WORKSPACE#w", "description": "long"}
+    assert select_fields(task, ["task_id", "status", "assignee_id"]) == {"task_id": "t-1", "status": "TODO"}
+
+
+def test_index_key_read_fields():
+    """Test which stored fields an update needs to rebuild its index keys."""
+    # Plain field edits and full index inputs need no read
+    assert index_key_read_fields({"title": "New", "tags": ["a"]}) == []
+    assert index_key_read_fields({"status": "DONE", "priority": "LOW", "assignee_id": "u-1", "due_date": None, "rank": "V"}) == []
+    
+    # A status change needs the priority, the assignee and the column rank
+    assert index_key_read_fields({"status": "DONE"}) == ["priority", "assignee_id", "rank", "created_at"]
+    
+    # A move sets the rank itself
+    assert index_key_read_fields({"status": "DONE", "rank": "V"}) == ["priority", "assignee_id"]
+    
+    # Unassigning removes the assignee keys, reassigning rebuilds them
+    assert index_key_read_fields({"assignee_id": None}) == []
+    assert index_key_read_fields({"assignee_id": "u-1"}) == ["status", "due_date"]
+    
+    # Fields an update cannot write move no index, a stray tree_path keeps the task in its tree
+    assert index_key_read_fields({"title": "New", "tree_path": "x", "created_at": "2020-01-01"}) == []
+    assert index_key_read_fields({"status": "DONE", "created_at": "2020-01-01"}) == ["priority", "assignee_id", "rank", "created_at"]
+    update_expr, values, _, _ = prepare_conditional_update("workspace-123", "task-123", {"title": "New", "tree_path": "x"})
+    assert ":gsi9sk" not in values and "tree_path" not in update_expr
+
+
+def test_prepare_conditional_update():
+    """Test that a conditional update only moves the indexes its fields feed."""
+    update_expr, values, names, condition = prepare_conditional_update(
+        "workspace-123", "task-123", {"title": "New title"}
+    )
+    
+    assert "#title = :title" in update_expr
+    assert values[":gsi6sk"] == f"UPDATED#{values[':updated_at']}#TASK#task-123"
+    assert ":gsi1sk" not in values
+    assert condition == "attribute_exists(PK) AND attribute_not_exists(deleted_at)"
+    
+    # Status change built from the stored priority, assignee and rank, and conditional on them
+    update_expr, values, names, condition = prepare_conditional_update(
+        "workspace-123", "task-123", {"status": "DONE"},
+        {"priority": "HIGH", "assignee_id": "u-1", "rank": "V", "created_at": "2023-01-01T00:00:00"}
+    )
+    
+    assert values[":gsi1sk"] == "STATUS#DONE#PRIORITY#3#TASK#task-123"
+    assert values[":gsi2sk"] == "ASSIGNEE#u-1#STATUS#DONE#TASK#task-123"
+    assert values[":gsi8sk"] == "STATUS#DONE#RANK#V#TASK#task-123"
+    assert ":gsi3sk" not in values
+    assert condition == ("attribute_exists(PK) AND attribute_not_exists(deleted_at) AND #priority = :current_priority"
+                         " AND #assignee_id = :current_assignee_id AND #rank = :current_rank"
+                         " AND #created_at = :current_created_at")
+    
+    # Unassigning removes the sparse assignee keys
+    update_expr, values, names, condition = prepare_conditional_update(
+        "workspace-123", "task-123", {"assignee_id": None}
+    )
+    
+    assert update_expr.endswith(" REMOVE GSI2PK, GSI2SK, GSI7PK, GSI7SK")
+    assert condition == "attribute_exists(PK) AND attribute_not_exists(deleted_at)"
+    
+    # An expected version adds a version check, version 0 being a task without one
+    _, values, _, condition = prepare_conditional_update(
+        "workspace-123", "task-123", {"title": "New title"}, expected_version=2
+    )
+    assert condition == "attribute_exists(PK) AND attribute_not_exists(deleted_at) AND #version = :expected_version"
+    assert values[":expected_version"] == 2
+    
+    _, _, _, condition = prepare_conditional_update(
+        "workspace-123", "task-123", {"title": "New title"}, expected_version=0
+    )
+    assert condition == "attribute_exists(PK) AND attribute_not_exists(deleted_at) AND attribute_not_exists(#version)"
+
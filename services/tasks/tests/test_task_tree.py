@@ -0,0 +1,243 @@
+"""Tests for subtask trees and reparenting."""
+
+import json
+from unittest.mock import patch
+from ..functions.task_operations.create_task import create_task
+from ..functions.task_operations.get_task_tree import get_task_tree
+from ..functions.task_operations.set_task_parent import set_task_parent
+from ..functions.task_operations.bulk_create_tasks import bulk_create_tasks
+from ..functions.task_operations.update_task import update_task
+from ..functions.task_operations.delete_task import delete_task
+from ..functions.task_operations.restore_task import restore_task
+
+
+def create(api_gateway_event_template, lambda_context, title, parent_id=None):
+    """Create a task through the API, as a subtask when parent_id is given."""
+    body = {"title": title}
+    if parent_id:
+        body["parent_id"] = parent_id
+    event = api_gateway_event_template.copy()
+    event["httpMethod"] = "POST"
+    event["pathParameters"] = {"workspaceId": "test-workspace-123"}
+    event["body"] = json.dumps(body)
+    response = create_task.handler(event, lambda_context)
+    assert response["statusCode"] == 201
+    return json.loads(response["body"])["task"]["task_id"]
+
+
+def task_event(api_gateway_event_template, task_id, body=None):
+    """Build a request for one task."""
+    event = api_gateway_event_template.copy()
+    event["pathParameters"] = {"workspaceId": "test-workspace-123", "taskId": task_id}
+    if body is not None:
+        event["body"] = json.dumps(body)
+    return event
+
+
+def get_tree(api_gateway_event_template, lambda_context, task_id):
+    """Read a task's tree through the API."""
+    response = get_task_tree.handler(task_event(api_gateway_event_template, task_id), lambda_context)
+    assert response["statusCode"] == 200
+    return json.loads(response["body"])["task"]
+
+
+def test_get_task_tree(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that a subtree comes back nested with rolled-up progress."""
+    for module in (create_task, get_task_tree, update_task):
+        authorize(module)
+    epic = create(api_gateway_event_template, lambda_context, "Epic")
+    story = create(api_gateway_event_template, lambda_context, "Story", epic)
+    first = create(api_gateway_event_template, lambda_context, "Subtask 1", story)
+    create(api_gateway_event_template, lambda_context, "Subtask 2", story)
+    create(api_gateway_event_template, lambda_context, "Other epic")
+    
+    event = task_event(api_gateway_event_template, first, {"title": "Subtask 1", "status": "DONE"})
+    event["httpMethod"] = "PUT"
+    assert update_task.handler(event, lambda_context)["statusCode"] == 200
+    
+    tree = get_tree(api_gateway_event_template, lambda_context, epic)
+    assert tree["title"] == "Epic"
+    assert tree["rollup"] == {"subtasks": 1, "descendants": 3, "done": 1, "progress": 0.3333}
+    
+    story_node = tree["subtasks"][0]
+    assert story_node["parent_id"] == epic
+    assert [node["title"] for node in story_node["subtasks"]] == ["Subtask 1", "Subtask 2"]
+    assert story_node["rollup"] == {"subtasks": 2, "descendants": 2, "done": 1, "progress": 0.5}
+    assert story_node["subtasks"][0]["rollup"]["progress"] is None
+    
+    # A subtree read starts at any level
+    assert get_tree(api_gateway_event_template, lambda_context, story)["rollup"]["descendants"] == 2
+    
+    # Subtasks nest at most MAX_TASK_DEPTH levels deep
+    parent = first
+    for level in range(2):
+        parent = create(api_gateway_event_template, lambda_context, f"Level {level + 4}", parent)
+    event = api_gateway_event_template.copy()
+    event["httpMethod"] = "POST"
+    event["pathParameters"] = {"workspaceId": "test-workspace-123"}
+    event["body"] = json.dumps({"title": "Too deep", "parent_id": parent})
+    assert create_task.handler(event, lambda_context)["statusCode"] == 400
+    
+    # Missing parents and trees are not found
+    event["body"] = json.dumps({"title": "Orphan", "parent_id": "task-missing"})
+    assert create_task.handler(event, lambda_context)["statusCode"] == 400
+    response = get_task_tree.handler(task_event(api_gateway_event_template, "task-missing"), lambda_context)
+    assert response["statusCode"] == 404
+
+
+def test_set_task_parent(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that reparenting moves the whole subtree and rejects cycles."""
+    for module in (create_task, get_task_tree, set_task_parent):
+        authorize(module)
+    first_epic = create(api_gateway_event_template, lambda_context, "First epic")
+    second_epic = create(api_gateway_event_template, lambda_context, "Second epic")
+    story = create(api_gateway_event_template, lambda_context, "Story", first_epic)
+    subtask = create(api_gateway_event_template, lambda_context, "Subtask", story)
+    
+    # Move the story and its subtask to the other epic
+    event = task_event(api_gateway_event_template, story, {"parent_id": second_epic})
+    event["httpMethod"] = "PUT"
+    event["headers"] = {**event.get("headers", {}), "If-Match": '"1"'}
+    response = set_task_parent.handler(event, lambda_context)
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["task"]["parent_id"] == second_epic
+    assert response["headers"]["ETag"] == '"2"'
+    
+    assert get_tree(api_gateway_event_template, lambda_context, first_epic)["subtasks"] == []
+    tree = get_tree(api_gateway_event_template, lambda_context, second_epic)
+    assert tree["rollup"]["descendants"] == 2
+    assert tree["subtasks"][0]["subtasks"][0]["task_id"] == subtask
+    stored = tasks_table.get_item(Key={"PK": "WORKSPACE#test-workspace-123", "SK": f"TASK#{subtask}"})["Item"]
+    assert stored["GSI9SK"] == f"PATH#{second_epic}#{story}#{subtask}"
+    
+    # The old ETag no longer matches
+    assert set_task_parent.handler(event, lambda_context)["statusCode"] == 412
+    
+    # A task cannot move under its own subtask
+    event = task_event(api_gateway_event_template, second_epic, {"parent_id": subtask})
+    event["httpMethod"] = "PUT"
+    assert set_task_parent.handler(event, lambda_context)["statusCode"] == 400
+    
+    # null makes the story top-level
+    event = task_event(api_gateway_event_template, story, {"parent_id": None})
+    event["httpMethod"] = "PUT"
+    response = set_task_parent.handler(event, lambda_context)
+    assert response["statusCode"] == 200
+    assert "parent_id" not in json.loads(response["body"])["task"]
+    assert get_tree(api_gateway_event_template, lambda_context, story)["rollup"]["descendants"] == 1
+    assert get_tree(api_gateway_event_template, lambda_context, second_epic)["subtasks"] == []
+
+
+def test_bulk_create_rejects_subtasks(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that bulk imports report subtasks as invalid."""
+    authorize(bulk_create_tasks)
+    event = api_gateway_event_template.copy()
+    event["httpMethod"] = "POST"
+    event["pathParameters"] = {"workspaceId": "test-workspace-123"}
+    event["body"] = json.dumps({"tasks": [{"title": "Top-level"}, {"title": "Subtask", "parent_id": "task-1"}]})
+    
+    response = bulk_create_tasks.handler(event, lambda_context)
+    
+    results = json.loads(response["body"])["results"]
+    assert [result["status"] for result in results] == ["created", "invalid"]
+
+
+def test_set_task_parent_concurrent_parent_move(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that a move is cancelled when its new parent moves under the subtree first."""
+    for module in (create_task, set_task_parent):
+        authorize(module)
+    first_epic = create(api_gateway_event_template, lambda_context, "First epic")
+    second_epic = create(api_gateway_event_template, lambda_context, "Second epic")
+    
+    # Another request moves the second epic under the first after the cycle check
+    query_subtree = set_task_parent.query_subtree
+    
+    def move_parent_then_query(table, workspace_id, tree_path):
+        tasks_table.update_item(
+            Key={"PK": "WORKSPACE#test-workspace-123", "SK": f"TASK#{second_epic}"},
+            UpdateExpression="SET tree_path = :tree_path, parent_id = :parent_id",
+            ExpressionAttributeValues={":tree_path": f"{first_epic}#{second_epic}", ":parent_id": first_epic}
+        )
+        return query_subtree(table, workspace_id, tree_path)
+    
+    event = task_event(api_gateway_event_template, first_epic, {"parent_id": second_epic})
+    event["httpMethod"] = "PUT"
+    with patch.object(set_task_parent, "query_subtree", side_effect=move_parent_then_query):
+        response = set_task_parent.handler(event, lambda_context)
+    
+    assert response["statusCode"] == 409
+    stored = tasks_table.get_item(Key={"PK": "WORKSPACE#test-workspace-123", "SK": f"TASK#{first_epic}"})["Item"]
+    assert "parent_id" not in stored
+
+
+def stored_task(tasks_table, task_id):
+    """Read a task item straight from the table."""
+    return tasks_table.get_item(Key={"PK": "WORKSPACE#test-workspace-123", "SK": f"TASK#{task_id}"})["Item"]
+
+
+def test_set_task_parent_waits_for_index(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that a move is refused while GSI9 is missing a counted subtask."""
+    for module in (create_task, set_task_parent, delete_task):
+        authorize(module)
+    first_epic = create(api_gateway_event_template, lambda_context, "First epic")
+    second_epic = create(api_gateway_event_template, lambda_context, "Second epic")
+    story = create(api_gateway_event_template, lambda_context, "Story", first_epic)
+    subtask = create(api_gateway_event_template, lambda_context, "Subtask", story)
+    assert stored_task(tasks_table, first_epic)["subtask_count"] == 1
+    assert stored_task(tasks_table, story)["subtask_count"] == 1
+    
+    # The index has not caught up with the subtask yet
+    query_subtree = set_task_parent.query_subtree
+    
+    def query_without_subtask(table, workspace_id, tree_path):
+        return [task for task in query_subtree(table, workspace_id, tree_path) if task["task_id"] != subtask]
+    
+    event = task_event(api_gateway_event_template, story, {"parent_id": second_epic})
+    event["httpMethod"] = "PUT"
+    with patch.object(set_task_parent, "query_subtree", side_effect=query_without_subtask):
+        assert set_task_parent.handler(event, lambda_context)["statusCode"] == 409
+    assert stored_task(tasks_table, story)["parent_id"] == first_epic
+    
+    # Once it has, the move goes ahead and the story changes parents' counts
+    assert set_task_parent.handler(event, lambda_context)["statusCode"] == 200
+    assert stored_task(tasks_table, subtask)["tree_path"] == f"{second_epic}#{story}#{subtask}"
+    assert stored_task(tasks_table, first_epic)["subtask_count"] == 0
+    assert stored_task(tasks_table, second_epic)["subtask_count"] == 1
+    
+    # A deleted subtask no longer counts
+    delete_event = task_event(api_gateway_event_template, subtask)
+    delete_event["httpMethod"] = "DELETE"
+    assert delete_task.handler(delete_event, lambda_context)["statusCode"] == 200
+    assert stored_task(tasks_table, story)["subtask_count"] == 0
+
+
+def test_restore_subtask_after_parent_moved(api_gateway_event_template, tasks_table, lambda_context, authorize):
+    """Test that a restored subtask goes back under its parent's current path."""
+    for module in (create_task, get_task_tree, set_task_parent, delete_task, restore_task):
+        authorize(module)
+    first_epic = create(api_gateway_event_template, lambda_context, "First epic")
+    second_epic = create(api_gateway_event_template, lambda_context, "Second epic")
+    story = create(api_gateway_event_template, lambda_context, "Story", first_epic)
+    subtask = create(api_gateway_event_template, lambda_context, "Subtask", story)
+    
+    event = task_event(api_gateway_event_template, subtask)
+    event["httpMethod"] = "DELETE"
+    assert delete_task.handler(event, lambda_context)["statusCode"] == 200
+    
+    # The story moves while its subtask is deleted
+    event = task_event(api_gateway_event_template, story, {"parent_id": second_epic})
+    event["httpMethod"] = "PUT"
+    assert set_task_parent.handler(event, lambda_context)["statusCode"] == 200
+    
+    event = task_event(api_gateway_event_template, subtask)
+    event["httpMethod"] = "POST"
+    response = restore_task.handler(event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["task"]["parent_id"] == story
+    stored = stored_task(tasks_table, subtask)
+    assert stored["tree_path"] == f"{second_epic}#{story}#{subtask}"
+    assert stored["GSI9SK"] == f"PATH#{second_epic}#{story}#{subtask}"
+    assert stored_task(tasks_table, story)["subtask_count"] == 1
+    tree = get_tree(api_gateway_event_template, lambda_context, second_epic)
+    assert tree["subtasks"][0]["subtasks"][0]["task_id"] == subtask
@@ -0,0 +1,89 @@
+"""Tests for the conditional task write helpers."""
+
+from unittest.mock import patch
+from ..functions.shared.models.task_models import create_task_item
+from ..functions.shared.utils.task_writes import update_task_item
+
+
+def save_task(tasks_table, **fields):
+    """Save a task in workspace ws-1."""
+    task = create_task_item(
+        workspace_id="ws-1",
+        account_id="acc-1",
+        title="Original",
+        creator_id="user-1",
+        creator_email="user@example.com",
+        **fields
+    )
+    tasks_table.put_item(Item=task)
+    return task
+
+
+def test_update_task_item_without_read(tasks_table):
+    """Test that a plain field edit is a single write."""
+    task = save_task(tasks_table, tags=["a"])
+    
+    with patch.object(tasks_table, "get_item", wraps=tasks_table.get_item) as get_item:
+        old_task, updated_task = update_task_item(tasks_table, "ws-1", task["task_id"],
+                                                  {"title": "Renamed", "tags": ["b"]})
+    
+    get_item.assert_not_called()
+    assert old_task["title"] == "Original"
+    assert updated_task["title"] == "Renamed"
+    assert updated_task["tags"] == ["b"]
+    
+    stored = tasks_table.get_item(Key={"PK": task["PK"], "SK": task["SK"]})["Item"]
+    assert stored["title"] == "Renamed"
+    assert stored["GSI6SK"] == f"UPDATED#{updated_task['updated_at']}#TASK#{task['task_id']}"
+
+
+def test_update_task_item_status_change(tasks_table):
+    """Test that a status change rebuilds its keys from the stored priority and assignee."""
+    task = save_task(tasks_table, priority="URGENT", assignee_id="user-2", status="TODO")
+    
+    old_task, updated_task = update_task_item(tasks_table, "ws-1", task["task_id"], {"status": "DONE"})
+    
+    assert old_task["status"] == "TODO"
+    assert updated_task["status"] == "DONE"
+    
+    stored = tasks_table.get_item(Key={"PK": task["PK"], "SK": task["SK"]})["Item"]
+    assert stored["GSI1SK"] == f"STATUS#DONE#PRIORITY#4#TASK#{task['task_id']}"
+    assert stored["GSI2SK"] == f"ASSIGNEE#user-2#STATUS#DONE#TASK#{task['task_id']}"
+    assert stored["GSI3SK"] == task["GSI3SK"]
+
+
+def test_update_task_item_unassign(tasks_table):
+    """Test that unassigning a task takes it out of the assignee indexes."""
+    task = save_task(tasks_table, assignee_id="user-2")
+    
+    update_task_item(tasks_table, "ws-1", task["task_id"], {"assignee_id": None})
+    
+    stored = tasks_table.get_item(Key={"PK": task["PK"], "SK": task["SK"]})["Item"]
+    assert "GSI2SK" not in stored
+    assert "GSI7SK" not in stored
+
+
+def test_update_task_item_not_found(tasks_table):
+    """Test that updating a missing task creates nothing."""
+    assert update_task_item(tasks_table, "ws-1", "task-missing", {"title": "Ghost"}) == (None, None)
+    assert update_task_item(tasks_table, "ws-1", "task-missing", {"status": "DONE"}) == (None, None)
+    
+    assert "Item" not in tasks_table.get_item(Key={"PK": "WORKSPACE#ws-1", "SK": "TASK#task-missing"})
+
+
+def test_update_task_item_expected_version(tasks_table):
+    """Test that an expected version guards the write and every write bumps it."""
+    task = save_task(tasks_table, priority="HIGH")
+    
+    _, updated_task = update_task_item(tasks_table, "ws-1", task["task_id"], {"title": "v2"}, expected_version=1)
+    assert updated_task["version"] == 2
+    
+    # Stale versions are refused, with or without a read for index keys
+    assert update_task_item(tasks_table, "ws-1", task["task_id"], {"title": "v3"}, expected_version=1) == (None, None)
+    assert update_task_item(tasks_table, "ws-1", task["task_id"], {"status": "DONE"}, expected_version=1) == (None, None)
+    
+    stored = tasks_table.get_item(Key={"PK": task["PK"], "SK": task["SK"]})["Item"]
+    assert stored["title"] == "v2"
+    assert stored["status"] == task["status"]
+    assert stored["version"] == 2
+
@@ -53,7 +53,7 @@ def test_update_task_success(update_task_event, populated_tasks_table, sample_ta
     assert saved_task["priority"] == "URGENT"
     
     # Verify indexes were updated
-    assert saved_task["GSI1SK"].startswith("STATUS#IN_PROGRESS#PRIORITY#URGENT")
+    assert saved_task["GSI1SK"].startswith("STATUS#IN_PROGRESS#PRIORITY#4#")
 
 
 def test_update_task_not_found(update_task_event, tasks_table):
@@ -230,4 +230,27 @@ def test_update_task_no_workspace_access(update_task_event):
         assert response["statusCode"] == 403
         body = json.loads(response["body"])
         assert "message" in body
-        assert "Access denied" in body["message"] 
\ No newline at end of file
+        assert "Access denied" in body["message"] 
+
+def test_update_task_if_match(update_task_event, populated_tasks_table, sample_task, lambda_context, authorize):
+    """Test that If-Match only lets the version the client read be overwritten."""
+    from ..functions.task_operations.update_task import update_task
+    authorize(update_task)
+    
+    # The fixture task predates versioning, so it is version 0
+    update_task_event["headers"]["If-Match"] = '"0"'
+    response = handler(update_task_event, lambda_context)
+    
+    assert response["statusCode"] == 200
+    assert response["headers"]["ETag"] == '"1"'
+    assert json.loads(response["body"])["task"]["version"] == 1
+    
+    # Replaying the same If-Match is a conflict, answered with the current task
+    response = handler(update_task_event, lambda_context)
+    
+    assert response["statusCode"] == 412
+    assert response["headers"]["ETag"] == '"1"'
+    assert json.loads(response["body"])["task"]["title"] == "Updated Task Title"
+    
+    update_task_event["headers"]["If-Match"] = "not-an-etag"
+    assert handler(update_task_event, lambda_context)["statusCode"] == 400
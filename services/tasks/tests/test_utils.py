@@ -4,12 +4,16 @@ import json
 import decimal
 from unittest.mock import patch, MagicMock
 import pytest
+from ..functions.shared.utils import utils
 from ..functions.shared.utils.utils import (
     DecimalEncoder,
     get_user_from_event,
     build_response,
     get_task_by_id,
-    validate_workspace_access
+    find_task_by_id,
+    validate_workspace_access,
+    parse_if_match,
+    task_etag
 )
 
 
@@ -127,7 +131,7 @@ def test_build_response():
     assert body["items"][1]["price"] == 5.99
 
 
-@patch("functions.shared.utils.utils.tasks_table")
+@patch.object(utils, "tasks_table")
 def test_get_task_by_id(mock_table):
     """Test retrieving a task by ID."""
     # Setup mock response
@@ -154,7 +158,8 @@ def test_get_task_by_id(mock_table):
         Key={
             "PK": "WORKSPACE#workspace-123",
             "SK": "TASK#task-123"
-        }
+        },
+        ConsistentRead=True
     )
     
     # Test task not found
@@ -163,7 +168,53 @@ def test_get_task_by_id(mock_table):
     assert task is None
 
 
-@patch("functions.shared.utils.utils.accounts_table")
+@patch.object(utils, "tasks_table")
+def test_get_task_by_id_with_fields(mock_table):
+    """Test retrieving only selected fields of a task."""
+    mock_table.get_item.return_value = {"Item": {"task_id": "task-123", "title": "Test Task"}}
+    
+    task = get_task_by_id("workspace-123", "task-123", ["task_id", "title"])
+    
+    assert task == {"task_id": "task-123", "title": "Test Task"}
+    mock_table.get_item.assert_called_once_with(
+        Key={
+            "PK": "WORKSPACE#workspace-123",
+            "SK": "TASK#task-123"
+        },
+        ConsistentRead=True,
+        ProjectionExpression="#task_id, #title, #deleted_at",
+        ExpressionAttributeNames={"#task_id": "task_id", "#title": "title", "#deleted_at": "deleted_at"}
+    )
+
+
+@patch.object(utils, "tasks_table")
+def test_find_task_by_id(mock_table):
+    """Test finding a task by ID alone through the task ID index."""
+    mock_table.query.return_value = {
+        "Items": [
+            {"PK": "WORKSPACE#workspace-123", "SK": "TAG#urgent#TASK#task-123", "task_id": "task-123"},
+            {"PK": "WORKSPACE#workspace-123", "SK": "TASK#task-123", "task_id": "task-123"}
+        ]
+    }
+    mock_table.get_item.return_value = {"Item": {"task_id": "task-123", "workspace_id": "workspace-123"}}
+    
+    task = find_task_by_id("task-123")
+    
+    assert task["workspace_id"] == "workspace-123"
+    mock_table.get_item.assert_called_once_with(
+        Key={
+            "PK": "WORKSPACE#workspace-123",
+            "SK": "TASK#task-123"
+        },
+        ConsistentRead=True
+    )
+    
+    # Test task not found
+    mock_table.query.return_value = {"Items": []}
+    assert find_task_by_id("non-existent") is None
+
+
+@patch.object(utils, "accounts_table")
 def test_validate_workspace_access(mock_table):
     """Test workspace access validation."""
     # Setup mock response for valid access
@@ -208,4 +259,23 @@ def test_validate_workspace_access(mock_table):
     mock_table.get_item.return_value = {"Item": mock_item}
     has_access, error = validate_workspace_access("different-account", "workspace-123")
     assert has_access is False
-    assert "no access" in error.lower() 
\ No newline at end of file
+    assert "no access" in error.lower() 
+
+
+def test_parse_if_match():
+    """Test parsing If-Match into the expected task version."""
+    assert parse_if_match({"headers": {"If-Match": '"3"'}}) == (3, None)
+    assert parse_if_match({"headers": {"if-match": '"0"'}}) == (0, None)
+    assert parse_if_match({"headers": {"If-Match": "*"}}) == (None, None)
+    assert parse_if_match({"headers": None}) == (None, None)
+    
+    version, error = parse_if_match({"headers": {"If-Match": 'W/"3"'}})
+    assert version is None
+    assert "Invalid If-Match header" in error
+
+
+def test_task_etag():
+    """Test that a task's ETag is its quoted version."""
+    assert task_etag({"version": decimal.Decimal("4")}) == '"4"'
+    assert task_etag({}) == '"0"'
+
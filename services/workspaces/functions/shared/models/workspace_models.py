@@ -0,0 +1,141 @@
+"""Data models for Workspace Service."""
+
+import os
+import time
+import uuid
+from datetime import datetime
+from typing import List, Dict, Optional, Any
+
+# Days a deleted workspace can be restored before TTL purges it
+WORKSPACE_RETENTION_DAYS = 30
+
+def generate_id(prefix="ws-"):
+    """Generate a unique workspace ID with optional prefix.
+    
+    The UUID part is a UUIDv7, Unix milliseconds followed by random bits, so
+    workspace IDs sort by creation time.
+    """
+    data = bytearray((time.time_ns() // 1000000).to_bytes(6, "big") + os.urandom(10))
+    data[6] = 0x70 | data[6] & 0x0F  # version 7
+    data[8] = 0x80 | data[8] & 0x3F  # RFC 4122 variant
+    return f"{prefix}{uuid.UUID(bytes=bytes(data))}"
+
+def get_timestamp():
+    """Get current timestamp in ISO format."""
+    return datetime.utcnow().isoformat()
+
+def account_index_keys(account_id: str, workspace_id: str) -> Dict[str, str]:
+    """Get the GSI2 keys that list a workspace under its account.
+    
+    Only active workspaces carry them, so the account listing never reads
+    tombstones or deactivated workspaces.
+    """
+    return {"GSI2PK": f"ACCOUNT#{account_id}", "GSI2SK": f"WORKSPACE#{workspace_id}"}
+
+def create_workspace_item(account_id: str, workspace_name: str, owner_id: str, owner_email: str) -> Dict[str, Any]:
+    """Create a DynamoDB item for a new workspace."""
+    workspace_id = generate_id()
+    timestamp = get_timestamp()
+    
+    return {
+        "PK": f"ACCOUNT#{account_id}",
+        "SK": f"WORKSPACE#{workspace_id}",
+        "workspace_id": workspace_id,
+        "workspace_name": workspace_name,
+        "owner_id": owner_id,
+        "account_id": account_id,
+        "status": "ACTIVE",
+        "created_at": timestamp,
+        "updated_at": timestamp,
+        "entity_type": "WORKSPACE",
+        "GSI1PK": f"USER#{owner_id}",
+        "GSI1SK": f"WORKSPACE#{workspace_id}",
+        **account_index_keys(account_id, workspace_id)
+    }
+
+def create_workspace_user_role_item(
+    account_id: str, 
+    workspace_id: str, 
+    user_id: str, 
+    email: str, 
+    role: str
+) -> Dict[str, Any]:
+    """Create a DynamoDB item for a user role in a workspace."""
+    timestamp = get_timestamp()
+    
+    return {
+        "PK": f"WORKSPACE#{workspace_id}",
+        "SK": f"USER#{user_id}",
+        "account_id": account_id,
+        "workspace_id": workspace_id,
+        "user_id": user_id,
+        "email": email,
+        "role": role,
+        "created_at": timestamp,
+        "updated_at": timestamp,
+        "entity_type": "USER_ROLE",
+        "GSI1PK": f"USER#{user_id}",
+        "GSI1SK": f"WORKSPACE#{workspace_id}"
+    }
+
+def validate_workspace_input(workspace_data: Dict[str, Any]) -> tuple[bool, Optional[str]]:
+    """Validate workspace creation input."""
+    required_fields = ["workspace_name", "account_id"]
+    
+    for field in required_fields:
+        if field not in workspace_data or not workspace_data[field]:
+            return False, f"Missing required field: {field}"
+    
+    return True, None
+
+def is_deleted(workspace: Optional[Dict[str, Any]]) -> bool:
+    """Check whether a workspace item is a soft-delete tombstone."""
+    return bool(workspace) and "deleted_at" in workspace
+
+def prepare_soft_delete(deleted_by: str) -> Dict[str, Any]:
+    """Build the update arguments that turn a workspace into a tombstone.
+    
+    The tombstone leaves GSI1 and GSI2 and gets an expires_at TTL, so DynamoDB
+    purges it once the retention window has passed.
+    """
+    timestamp = get_timestamp()
+    expires_at = int(time.time()) + WORKSPACE_RETENTION_DAYS * 24 * 60 * 60
+    
+    return {
+        "UpdateExpression": "SET #status = :status, deleted_at = :deleted_at, deleted_by = :deleted_by, "
+                            "expires_at = :expires_at, updated_at = :updated_at REMOVE GSI1PK, GSI1SK, GSI2PK, GSI2SK",
+        "ConditionExpression": "attribute_exists(PK) AND attribute_not_exists(deleted_at)",
+        "ExpressionAttributeNames": {"#status": "status"},
+        "ExpressionAttributeValues": {
+            ":status": "DELETED",
+            ":deleted_at": timestamp,
+            ":deleted_by": deleted_by,
+            ":expires_at": expires_at,
+            ":updated_at": timestamp
+        }
+    }
+
+def prepare_restore(workspace: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the update arguments that bring a tombstoned workspace back.
+    
+    The update only applies to the tombstone that was read, so a restore
+    racing another restore or the purge fails its condition.
+    """
+    account_keys = account_index_keys(workspace["account_id"], workspace["workspace_id"])
+    
+    return {
+        "UpdateExpression": "SET #status = :status, GSI1PK = :gsi1pk, GSI1SK = :gsi1sk, "
+                            "GSI2PK = :gsi2pk, GSI2SK = :gsi2sk, updated_at = :updated_at "
+                            "REMOVE deleted_at, deleted_by, expires_at",
+        "ConditionExpression": "deleted_at = :deleted_at",
+        "ExpressionAttributeNames": {"#status": "status"},
+        "ExpressionAttributeValues": {
+            ":status": "ACTIVE",
+            ":gsi1pk": f"USER#{workspace['owner_id']}",
+            ":gsi1sk": f"WORKSPACE#{workspace['workspace_id']}",
+            ":gsi2pk": account_keys["GSI2PK"],
+            ":gsi2sk": account_keys["GSI2SK"],
+            ":updated_at": get_timestamp(),
+            ":deleted_at": workspace["deleted_at"]
+        }
+    }
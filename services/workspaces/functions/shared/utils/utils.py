@@ -2,8 +2,10 @@
 
 import json
 import os
+import time
 import boto3
 from aws_lambda_powertools import Logger
+from ..models.workspace_models import is_deleted
 
 # Initialize shared resources
 logger = Logger()
@@ -52,7 +54,7 @@ def build_response(status_code, body):
     }
 
 def get_workspace_by_id(workspace_id):
-    """Get workspace details by ID."""
+    """Get workspace details by ID. Deleted workspaces are not returned."""
     try:
         response = accounts_table.query(
             IndexName="WorkspaceIdIndex",
@@ -62,11 +64,34 @@ def get_workspace_by_id(workspace_id):
             }
         )
         
-        items = response.get("Items", [])
+        items = [item for item in response.get("Items", []) if not is_deleted(item)]
         if not items:
             return None
         
         return items[0]
     except Exception as e:
         logger.error(f"Error retrieving workspace: {str(e)}")
-        return None 
\ No newline at end of file
+        return None
+
+def get_deleted_workspace(workspace_id):
+    """Get a deleted workspace's tombstone while it can still be restored.
+    
+    DynamoDB TTL purges expired items lazily, so tombstones past expires_at
+    are treated as gone even if they are still stored.
+    """
+    try:
+        response = accounts_table.query(
+            IndexName="WorkspaceIdIndex",
+            KeyConditionExpression="workspace_id = :workspace_id",
+            ExpressionAttributeValues={
+                ":workspace_id": workspace_id
+            }
+        )
+    except Exception as e:
+        logger.error(f"Error retrieving deleted workspace: {str(e)}")
+        return None
+    
+    for item in response.get("Items", []):
+        if item.get("entity_type") == "WORKSPACE" and is_deleted(item) and item["expires_at"] > time.time():
+            return item
+    return None 
\ No newline at end of file
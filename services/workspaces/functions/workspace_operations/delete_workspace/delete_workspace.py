@@ -1,11 +1,17 @@
-"""Lambda function for deleting (deactivating) workspaces."""
+"""Lambda function for deleting workspaces."""
 
 import json
 from datetime import datetime
+from botocore.exceptions import ClientError
 from ...shared.utils.utils import build_response, get_user_from_event, get_workspace_by_id, accounts_table, logger
+from ...shared.models.workspace_models import prepare_soft_delete
 
 def handler(event, context):
-    """Handle workspace deletion (deactivation) requests."""
+    """Handle workspace deletion requests.
+    
+    The workspace is kept as a tombstone that can be restored until its
+    expires_at TTL, after which DynamoDB purges it.
+    """
     try:
         # Get workspace_id from path parameters
         workspace_id = event.get("pathParameters", {}).get("workspaceId")
@@ -22,27 +28,31 @@ def handler(event, context):
         
         account_id = workspace["account_id"]
         
-        # Mark workspace as inactive rather than deleting
-        accounts_table.update_item(
-            Key={
-                "PK": f"ACCOUNT#{account_id}",
-                "SK": f"WORKSPACE#{workspace_id}"
-            },
-            UpdateExpression="SET status = :status, updated_at = :updated_at",
-            ExpressionAttributeValues={
-                ":status": "INACTIVE",
-                ":updated_at": datetime.utcnow().isoformat()
-            }
-        )
+        # Tombstone the workspace, unless another request deleted it meanwhile
+        update_args = prepare_soft_delete(user["user_id"])
+        try:
+            accounts_table.update_item(
+                Key={
+                    "PK": f"ACCOUNT#{account_id}",
+                    "SK": f"WORKSPACE#{workspace_id}"
+                },
+                **update_args
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+            return build_response(404, {"error": "Workspace not found"})
         
-        logger.info(f"Workspace marked as inactive: {workspace_id}")
+        logger.info(f"Workspace deleted: {workspace_id}")
         
+        expires_at = update_args["ExpressionAttributeValues"][":expires_at"]
         return build_response(200, {
-            "message": "Workspace marked as inactive",
+            "message": "Workspace deleted",
             "workspace_id": workspace_id,
-            "account_id": account_id
+            "account_id": account_id,
+            "restorable_until": datetime.utcfromtimestamp(expires_at).isoformat()
         })
     
     except Exception as e:
-        logger.error(f"Error deactivating workspace: {str(e)}")
-        return build_response(500, {"error": "Failed to deactivate workspace"}) 
\ No newline at end of file
+        logger.error(f"Error deleting workspace: {str(e)}")
+        return build_response(500, {"error": "Failed to delete workspace"})
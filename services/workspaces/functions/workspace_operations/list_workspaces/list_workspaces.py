@@ -2,6 +2,7 @@
 
 import json
 from ...shared.utils.utils import build_response, get_user_from_event, accounts_table, logger
+from ...shared.utils.cursor import build_cursor_scope, encode_cursor, decode_cursor
 
 def handler(event, context):
     """Handle workspace listing requests."""
@@ -14,29 +15,55 @@ def handler(event, context):
         # Get user from the event
         user = get_user_from_event(event)
         
-        # Query workspaces for the account
-        response = accounts_table.query(
-            KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
-            ExpressionAttributeValues={
+        query_params = event.get("queryStringParameters") or {}
+        # GSI2 only holds active workspaces, so every page is full and tombstones are never read
+        query_args = {
+            "IndexName": "GSI2",
+            "KeyConditionExpression": "GSI2PK = :pk AND begins_with(GSI2SK, :sk_prefix)",
+            "ExpressionAttributeValues": {
                 ":pk": f"ACCOUNT#{account_id}",
                 ":sk_prefix": "WORKSPACE#"
             }
-        )
+        }
+        
+        # Set the page size
+        if "limit" in query_params:
+            try:
+                query_args["Limit"] = min(max(int(query_params["limit"]), 1), 100)
+            except ValueError:
+                return build_response(400, {"error": "Invalid limit parameter"})
+        
+        # Cursors only resume listings of the same account
+        cursor_scope = build_cursor_scope("workspaces", account_id)
+        if query_params.get("next_token"):
+            exclusive_start_key, cursor_error = decode_cursor(query_params["next_token"], cursor_scope)
+            if cursor_error:
+                return build_response(400, {"error": cursor_error})
+            query_args["ExclusiveStartKey"] = exclusive_start_key
+        
+        # Query workspaces for the account
+        response = accounts_table.query(**query_args)
         
         # Extract workspace details
-        workspaces = []
-        for item in response.get("Items", []):
-            if item.get("entity_type") == "WORKSPACE" and item.get("status") == "ACTIVE":
-                workspaces.append({
-                    "workspace_id": item["workspace_id"],
-                    "workspace_name": item["workspace_name"],
-                    "account_id": item["account_id"],
-                    "owner_id": item["owner_id"],
-                    "status": item["status"],
-                    "created_at": item["created_at"]
-                })
-        
-        return build_response(200, {"workspaces": workspaces})
+        workspaces = [
+            {
+                "workspace_id": item["workspace_id"],
+                "workspace_name": item["workspace_name"],
+                "account_id": item["account_id"],
+                "owner_id": item["owner_id"],
+                "status": item["status"],
+                "created_at": item["created_at"]
+            }
+            for item in response.get("Items", [])
+        ]
+        
+        result = {"workspaces": workspaces}
+        
+        # Add pagination token if more results exist
+        if "LastEvaluatedKey" in response:
+            result["next_token"] = encode_cursor(response["LastEvaluatedKey"], cursor_scope)
+        
+        return build_response(200, result)
     
     except Exception as e:
         logger.error(f"Error listing workspaces: {str(e)}")
@@ -0,0 +1,50 @@
+"""Lambda function for restoring deleted workspaces."""
+
+import json
+from botocore.exceptions import ClientError
+from ...shared.utils.utils import build_response, get_user_from_event, get_deleted_workspace, accounts_table, logger
+from ...shared.models.workspace_models import prepare_restore
+
+def handler(event, context):
+    """Handle workspace restore requests within the retention window."""
+    try:
+        # Get workspace_id from path parameters
+        workspace_id = event.get("pathParameters", {}).get("workspaceId")
+        if not workspace_id:
+            return build_response(400, {"error": "Missing workspaceId parameter"})
+        
+        # Get user from the event
+        user = get_user_from_event(event)
+        
+        # Only tombstones still inside the retention window can be restored
+        workspace = get_deleted_workspace(workspace_id)
+        if not workspace:
+            return build_response(404, {"error": "No deleted workspace to restore"})
+        
+        account_id = workspace["account_id"]
+        
+        # Bring the workspace back into the user index
+        try:
+            accounts_table.update_item(
+                Key={
+                    "PK": f"ACCOUNT#{account_id}",
+                    "SK": f"WORKSPACE#{workspace_id}"
+                },
+                **prepare_restore(workspace)
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+            return build_response(409, {"error": "Workspace was restored or purged meanwhile"})
+        
+        logger.info(f"Workspace restored: {workspace_id}")
+        
+        return build_response(200, {
+            "message": "Workspace restored",
+            "workspace_id": workspace_id,
+            "account_id": account_id
+        })
+    
+    except Exception as e:
+        logger.error(f"Error restoring workspace: {str(e)}")
+        return build_response(500, {"error": "Failed to restore workspace"})
@@ -2,7 +2,9 @@
 
 import json
 from datetime import datetime
+from botocore.exceptions import ClientError
 from ...shared.utils.utils import build_response, get_user_from_event, get_workspace_by_id, accounts_table, logger
+from ...shared.models.workspace_models import account_index_keys
 
 def handler(event, context):
     """Handle workspace update requests."""
@@ -46,15 +48,30 @@ def handler(event, context):
         update_expression += "updated_at = :updated_at"
         expression_attribute_values[":updated_at"] = datetime.utcnow().isoformat()
         
-        # Update workspace in DynamoDB
-        accounts_table.update_item(
-            Key={
-                "PK": f"ACCOUNT#{account_id}",
-                "SK": f"WORKSPACE#{workspace_id}"
-            },
-            UpdateExpression=update_expression,
-            ExpressionAttributeValues=expression_attribute_values
-        )
+        # Only active workspaces are listed under their account
+        if body.get("status") == "ACTIVE":
+            account_keys = account_index_keys(account_id, workspace_id)
+            update_expression += ", GSI2PK = :gsi2pk, GSI2SK = :gsi2sk"
+            expression_attribute_values[":gsi2pk"] = account_keys["GSI2PK"]
+            expression_attribute_values[":gsi2sk"] = account_keys["GSI2SK"]
+        elif body.get("status"):
+            update_expression += " REMOVE GSI2PK, GSI2SK"
+        
+        # Update workspace in DynamoDB, unless it was deleted meanwhile
+        try:
+            accounts_table.update_item(
+                Key={
+                    "PK": f"ACCOUNT#{account_id}",
+                    "SK": f"WORKSPACE#{workspace_id}"
+                },
+                UpdateExpression=update_expression,
+                ConditionExpression="attribute_exists(PK) AND attribute_not_exists(deleted_at)",
+                ExpressionAttributeValues=expression_attribute_values
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+            return build_response(404, {"error": "Workspace not found"})
         
         logger.info(f"Workspace updated: {workspace_id}")
         
@@ -0,0 +1,69 @@
+"""Lambda function to add GSI2 keys to workspaces written before the account index existed."""
+
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+from ...shared.utils.utils import accounts_table, logger
+from ...shared.models.workspace_models import account_index_keys
+
+# Stop reading new pages when less time than this remains in the invocation
+MIN_REMAINING_TIME_MS = 10000
+
+def backfill_workspace(workspace):
+    """List an active workspace under its account, unless it changed since it was read."""
+    account_keys = account_index_keys(workspace["account_id"], workspace["workspace_id"])
+    accounts_table.update_item(
+        Key={"PK": workspace["PK"], "SK": workspace["SK"]},
+        UpdateExpression="SET GSI2PK = :gsi2pk, GSI2SK = :gsi2sk",
+        ConditionExpression="#status = :active AND attribute_not_exists(deleted_at)",
+        ExpressionAttributeNames={"#status": "status"},
+        ExpressionAttributeValues={
+            ":gsi2pk": account_keys["GSI2PK"],
+            ":gsi2sk": account_keys["GSI2SK"],
+            ":active": "ACTIVE"
+        }
+    )
+
+def handler(event, context):
+    """Handle a backfill run.
+    
+    Scans for active workspaces without GSI2 keys. Returns last_evaluated_key
+    when the run stops early so the next invocation can resume from it.
+    """
+    event = event or {}
+    logger.info("Backfill account index request received")
+    
+    scan_args = {
+        "FilterExpression": Attr("entity_type").eq("WORKSPACE") & Attr("status").eq("ACTIVE") &
+                            Attr("deleted_at").not_exists() & Attr("GSI2PK").not_exists()
+    }
+    if event.get("exclusive_start_key"):
+        scan_args["ExclusiveStartKey"] = event["exclusive_start_key"]
+    
+    stats = {"updated": 0, "conflicts": 0}
+    last_evaluated_key = None
+    
+    while True:
+        response = accounts_table.scan(**scan_args)
+        
+        for workspace in response.get("Items", []):
+            try:
+                backfill_workspace(workspace)
+                stats["updated"] += 1
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise
+                stats["conflicts"] += 1
+        
+        last_evaluated_key = response.get("LastEvaluatedKey")
+        if not last_evaluated_key or context.get_remaining_time_in_millis() < MIN_REMAINING_TIME_MS:
+            break
+        
+        scan_args["ExclusiveStartKey"] = last_evaluated_key
+    
+    logger.info("Backfill account index run finished", extra=stats)
+    
+    result = dict(stats)
+    if last_evaluated_key:
+        result["last_evaluated_key"] = last_evaluated_key
+    
+    return result
@@ -4,6 +4,13 @@ import os
 import pytest
 from unittest.mock import MagicMock
 
+# Set environment variables for testing, before the handlers create their clients
+os.environ["ACCOUNTS_TABLE"] = "AccountsTable-Test"
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+# Cursors are only signed with a configured secret
+os.environ["CURSOR_SECRET"] = "test-cursor-secret"
+
 # Mock responses for DynamoDB operations
 @pytest.fixture
 def mock_workspace_item():
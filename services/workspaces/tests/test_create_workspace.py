@@ -12,8 +12,8 @@ from services.workspaces.functions.workspace_operations.create_workspace.create_
 def test_create_workspace_success(test_case, mock_user, mock_account_item, mock_create_event):
     """Test successful workspace creation."""
     # Setup
-    with patch('services.workspaces.functions.shared.utils.utils.get_user_from_event') as mock_get_user:
-        with patch('services.workspaces.functions.shared.utils.utils.accounts_table') as mock_accounts_table:
+    with patch('services.workspaces.functions.workspace_operations.create_workspace.create_workspace.get_user_from_event') as mock_get_user:
+        with patch('services.workspaces.functions.workspace_operations.create_workspace.create_workspace.accounts_table') as mock_accounts_table:
             # Configure mocks
             mock_get_user.return_value = mock_user
             mock_accounts_table.get_item.return_value = {"Item": mock_account_item}
@@ -41,7 +41,7 @@ def test_create_workspace_success(test_case, mock_user, mock_account_item, mock_
 def test_create_workspace_missing_params(test_case, mock_user, mock_create_event):
     """Test workspace creation with missing parameters."""
     # Setup
-    with patch('services.workspaces.functions.shared.utils.utils.get_user_from_event') as mock_get_user:
+    with patch('services.workspaces.functions.workspace_operations.create_workspace.create_workspace.get_user_from_event') as mock_get_user:
         # Configure mocks
         mock_get_user.return_value = mock_user
         
@@ -58,8 +58,8 @@ def test_create_workspace_missing_params(test_case, mock_user, mock_create_event
 def test_create_workspace_account_not_found(mock_user, mock_create_event):
     """Test workspace creation with non-existent account."""
     # Setup
-    with patch('services.workspaces.functions.shared.utils.utils.get_user_from_event') as mock_get_user:
-        with patch('services.workspaces.functions.shared.utils.utils.accounts_table') as mock_accounts_table:
+    with patch('services.workspaces.functions.workspace_operations.create_workspace.create_workspace.get_user_from_event') as mock_get_user:
+        with patch('services.workspaces.functions.workspace_operations.create_workspace.create_workspace.accounts_table') as mock_accounts_table:
             # Configure mocks
             mock_get_user.return_value = mock_user
             mock_accounts_table.get_item.return_value = {}
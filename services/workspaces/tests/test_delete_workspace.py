@@ -10,11 +10,11 @@ from services.workspaces.functions.workspace_operations.delete_workspace.delete_
     {"description": "Successful workspace deletion", "status_code": 200},
 ])
 def test_delete_workspace_success(test_case, mock_user, mock_workspace_item, mock_delete_event):
-    """Test successful workspace deactivation."""
+    """Test successful workspace soft delete."""
     # Setup
-    with patch('services.workspaces.functions.shared.utils.utils.get_user_from_event') as mock_get_user:
-        with patch('services.workspaces.functions.shared.utils.utils.get_workspace_by_id') as mock_get_workspace:
-            with patch('services.workspaces.functions.shared.utils.utils.accounts_table') as mock_accounts_table:
+    with patch('services.workspaces.functions.workspace_operations.delete_workspace.delete_workspace.get_user_from_event') as mock_get_user:
+        with patch('services.workspaces.functions.workspace_operations.delete_workspace.delete_workspace.get_workspace_by_id') as mock_get_workspace:
+            with patch('services.workspaces.functions.workspace_operations.delete_workspace.delete_workspace.accounts_table') as mock_accounts_table:
                 # Configure mocks
                 mock_get_user.return_value = mock_user
                 mock_get_workspace.return_value = mock_workspace_item
@@ -25,14 +25,18 @@ def test_delete_workspace_success(test_case, mock_user, mock_workspace_item, moc
                 # Assert response
                 assert response["statusCode"] == test_case["status_code"]
                 
-                # Verify DynamoDB update was called
+                # Verify the workspace was tombstoned out of the user and account indexes with a TTL
                 mock_accounts_table.update_item.assert_called_once()
+                update_args = mock_accounts_table.update_item.call_args.kwargs
+                assert "REMOVE GSI1PK, GSI1SK, GSI2PK, GSI2SK" in update_args["UpdateExpression"]
+                assert ":expires_at" in update_args["ExpressionAttributeValues"]
                 
                 # Parse response body
                 body = json.loads(response["body"])
-                assert body["message"] == "Workspace marked as inactive"
+                assert body["message"] == "Workspace deleted"
                 assert body["workspace_id"] == mock_workspace_item["workspace_id"]
                 assert body["account_id"] == mock_workspace_item["account_id"]
+                assert "restorable_until" in body
 
 def test_delete_workspace_missing_id():
     """Test deletion with missing workspace ID."""
@@ -52,8 +56,8 @@ def test_delete_workspace_missing_id():
 def test_delete_workspace_not_found(mock_user, mock_delete_event):
     """Test deletion with non-existent workspace."""
     # Setup
-    with patch('services.workspaces.functions.shared.utils.utils.get_user_from_event') as mock_get_user:
-        with patch('services.workspaces.functions.shared.utils.utils.get_workspace_by_id') as mock_get_workspace:
+    with patch('services.workspaces.functions.workspace_operations.delete_workspace.delete_workspace.get_user_from_event') as mock_get_user:
+        with patch('services.workspaces.functions.workspace_operations.delete_workspace.delete_workspace.get_workspace_by_id') as mock_get_workspace:
             # Configure mocks
             mock_get_user.return_value = mock_user
             mock_get_workspace.return_value = None
@@ -71,9 +75,9 @@ def test_delete_workspace_not_found(mock_user, mock_delete_event):
 def test_delete_workspace_exception(mock_user, mock_workspace_item, mock_delete_event):
     """Test error handling in delete function."""
     # Setup
-    with patch('services.workspaces.functions.shared.utils.utils.get_user_from_event') as mock_get_user:
-        with patch('services.workspaces.functions.shared.utils.utils.get_workspace_by_id') as mock_get_workspace:
-            with patch('services.workspaces.functions.shared.utils.utils.accounts_table') as mock_accounts_table:
+    with patch('services.workspaces.functions.workspace_operations.delete_workspace.delete_workspace.get_user_from_event') as mock_get_user:
+        with patch('services.workspaces.functions.workspace_operations.delete_workspace.delete_workspace.get_workspace_by_id') as mock_get_workspace:
+            with patch('services.workspaces.functions.workspace_operations.delete_workspace.delete_workspace.accounts_table') as mock_accounts_table:
                 # Configure mocks
                 mock_get_user.return_value = mock_user
                 mock_get_workspace.return_value = mock_workspace_item
@@ -87,7 +91,7 @@ def test_delete_workspace_exception(mock_user, mock_workspace_item, mock_delete_
                 
                 # Parse response body
                 body = json.loads(response["body"])
-                assert body["error"] == "Failed to deactivate workspace"
+                assert body["error"] == "Failed to delete workspace"
 
 
 if __name__ == "__main__":
@@ -12,8 +12,8 @@ from services.workspaces.functions.workspace_operations.get_workspace.get_worksp
 def test_get_workspace_success(test_case, mock_user, mock_workspace_item, mock_get_event):
     """Test successful workspace retrieval."""
     # Setup
-    with patch('services.workspaces.functions.shared.utils.utils.get_user_from_event') as mock_get_user:
-        with patch('services.workspaces.functions.shared.utils.utils.get_workspace_by_id') as mock_get_workspace:
+    with patch('services.workspaces.functions.workspace_operations.get_workspace.get_workspace.get_user_from_event') as mock_get_user:
+        with patch('services.workspaces.functions.workspace_operations.get_workspace.get_workspace.get_workspace_by_id') as mock_get_workspace:
             # Configure mocks
             mock_get_user.return_value = mock_user
             mock_get_workspace.return_value = mock_workspace_item
@@ -33,7 +33,7 @@ def test_get_workspace_success(test_case, mock_user, mock_workspace_item, mock_g
 def test_get_workspace_missing_id(mock_user):
     """Test workspace retrieval with missing workspace ID."""
     # Setup
-    with patch('services.workspaces.functions.shared.utils.utils.get_user_from_event') as mock_get_user:
+    with patch('services.workspaces.functions.workspace_operations.get_workspace.get_workspace.get_user_from_event') as mock_get_user:
         # Configure mocks
         mock_get_user.return_value = mock_user
         
@@ -53,8 +53,8 @@ def test_get_workspace_missing_id(mock_user):
 def test_get_workspace_not_found(mock_user, mock_get_event):
     """Test workspace retrieval with non-existent workspace."""
     # Setup
-    with patch('services.workspaces.functions.shared.utils.utils.get_user_from_event') as mock_get_user:
-        with patch('services.workspaces.functions.shared.utils.utils.get_workspace_by_id') as mock_get_workspace:
+    with patch('services.workspaces.functions.workspace_operations.get_workspace.get_workspace.get_user_from_event') as mock_get_user:
+        with patch('services.workspaces.functions.workspace_operations.get_workspace.get_workspace.get_workspace_by_id') as mock_get_workspace:
             # Configure mocks
             mock_get_user.return_value = mock_user
             mock_get_workspace.return_value = None
@@ -72,8 +72,8 @@ def test_get_workspace_not_found(mock_user, mock_get_event):
 def test_get_workspace_exception(mock_user, mock_get_event):
     """Test error handling in get workspace function."""
     # Setup
-    with patch('services.workspaces.functions.shared.utils.utils.get_user_from_event') as mock_get_user:
-        with patch('services.workspaces.functions.shared.utils.utils.get_workspace_by_id') as mock_get_workspace:
+    with patch('services.workspaces.functions.workspace_operations.get_workspace.get_workspace.get_user_from_event') as mock_get_user:
+        with patch('services.workspaces.functions.workspace_operations.get_workspace.get_workspace.get_workspace_by_id') as mock_get_workspace:
             # Configure mocks
             mock_get_user.return_value = mock_user
             mock_get_workspace.side_effect = Exception("Test exception")
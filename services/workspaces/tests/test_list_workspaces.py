@@ -13,8 +13,8 @@ from services.workspaces.functions.workspace_operations.list_workspaces.list_wor
 def test_list_workspaces_success(test_case, mock_user, mock_workspace_item, mock_list_event):
     """Test successful workspace listing."""
     # Setup
-    with patch('services.workspaces.functions.shared.utils.utils.get_user_from_event') as mock_get_user:
-        with patch('services.workspaces.functions.shared.utils.utils.accounts_table') as mock_accounts_table:
+    with patch('services.workspaces.functions.workspace_operations.list_workspaces.list_workspaces.get_user_from_event') as mock_get_user:
+        with patch('services.workspaces.functions.workspace_operations.list_workspaces.list_workspaces.accounts_table') as mock_accounts_table:
             # Configure mocks
             mock_get_user.return_value = mock_user
             
@@ -67,8 +67,8 @@ def test_list_workspaces_missing_account_id():
 def test_list_workspaces_exception(mock_user, mock_list_event):
     """Test error handling in list function."""
     # Setup
-    with patch('services.workspaces.functions.shared.utils.utils.get_user_from_event') as mock_get_user:
-        with patch('services.workspaces.functions.shared.utils.utils.accounts_table') as mock_accounts_table:
+    with patch('services.workspaces.functions.workspace_operations.list_workspaces.list_workspaces.get_user_from_event') as mock_get_user:
+        with patch('services.workspaces.functions.workspace_operations.list_workspaces.list_workspaces.accounts_table') as mock_accounts_table:
             # Configure mocks
             mock_get_user.return_value = mock_user
             mock_accounts_table.query.side_effect = Exception("Test exception")
@@ -83,46 +83,22 @@ def test_list_workspaces_exception(mock_user, mock_list_event):
             body = json.loads(response["body"])
             assert body["error"] == "Failed to list workspaces"
 
-def test_list_workspaces_inactive_filtered(mock_user, mock_list_event):
-    """Test that inactive workspaces are filtered out."""
+def test_list_workspaces_reads_active_index(mock_user, mock_workspace_item, mock_list_event):
+    """Test that workspaces are listed from the sparse index of active workspaces."""
     # Setup
-    with patch('services.workspaces.functions.shared.utils.utils.get_user_from_event') as mock_get_user:
-        with patch('services.workspaces.functions.shared.utils.utils.accounts_table') as mock_accounts_table:
+    with patch('services.workspaces.functions.workspace_operations.list_workspaces.list_workspaces.get_user_from_event') as mock_get_user:
+        with patch('services.workspaces.functions.workspace_operations.list_workspaces.list_workspaces.accounts_table') as mock_accounts_table:
             # Configure mocks
             mock_get_user.return_value = mock_user
-            
-            # Create mock items with both active and inactive workspaces
-            items = [
-                {
-                    "PK": "ACCOUNT#test-account-id",
-                    "SK": "WORKSPACE#test-workspace-1",
-                    "workspace_id": "test-workspace-1",
-                    "workspace_name": "Active Workspace",
-                    "owner_id": "test-user-id",
-                    "account_id": "test-account-id",
-                    "status": "ACTIVE",
-                    "created_at": "2023-01-01T00:00:00.000Z",
-                    "entity_type": "WORKSPACE"
-                },
-                {
-                    "PK": "ACCOUNT#test-account-id",
-                    "SK": "WORKSPACE#test-workspace-2",
-                    "workspace_id": "test-workspace-2",
-                    "workspace_name": "Inactive Workspace",
-                    "owner_id": "test-user-id",
-                    "account_id": "test-account-id",
-                    "status": "INACTIVE",
-                    "created_at": "2023-01-01T00:00:00.000Z",
-                    "entity_type": "WORKSPACE"
-                },
-                {
-                    "PK": "ACCOUNT#test-account-id",
-                    "SK": "USER#test-user-id",
-                    "entity_type": "USER_ROLE"  # This should be filtered out too
+            mock_accounts_table.query.return_value = {
+                "Items": [mock_workspace_item],
+                "LastEvaluatedKey": {
+                    "PK": mock_workspace_item["PK"],
+                    "SK": mock_workspace_item["SK"],
+                    "GSI2PK": "ACCOUNT#test-account-id",
+                    "GSI2SK": mock_workspace_item["SK"]
                 }
-            ]
-            
-            mock_accounts_table.query.return_value = {"Items": items}
+            }
             
             # Call the handler
             response = handler(mock_list_event, {})
@@ -130,12 +106,16 @@ def test_list_workspaces_inactive_filtered(mock_user, mock_list_event):
             # Assert response
             assert response["statusCode"] == 200
             
+            # Tombstones carry no GSI2 keys, so the query never reads them
+            query_args = mock_accounts_table.query.call_args.kwargs
+            assert query_args["IndexName"] == "GSI2"
+            assert query_args["KeyConditionExpression"].startswith("GSI2PK = :pk")
+            assert query_args["ExpressionAttributeValues"][":pk"] == "ACCOUNT#test-account-id"
+            
             # Parse response body
             body = json.loads(response["body"])
-            assert len(body["workspaces"]) == 1
-            assert body["workspaces"][0]["workspace_id"] == "test-workspace-1"
-            assert body["workspaces"][0]["status"] == "ACTIVE"
-
+            assert [workspace["workspace_id"] for workspace in body["workspaces"]] == ["test-workspace-id"]
+            assert "next_token" in body
 
 if __name__ == "__main__":
     pytest.main() 
\ No newline at end of file
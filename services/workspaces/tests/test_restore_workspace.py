@@ -0,0 +1,53 @@
+"""Tests for the restore_workspace Lambda function."""
+
+import json
+import pytest
+from unittest.mock import patch
+
+from services.workspaces.functions.workspace_operations.restore_workspace.restore_workspace import handler
+
+def test_restore_workspace(mock_user, mock_workspace_item):
+    """Test restoring a deleted workspace within its retention window."""
+    tombstone = {**mock_workspace_item, "status": "DELETED", "deleted_at": "2023-01-02T00:00:00", "expires_at": 4102444800}
+    tombstone.pop("GSI1PK")
+    tombstone.pop("GSI1SK")
+    
+    with patch('services.workspaces.functions.workspace_operations.restore_workspace.restore_workspace.get_user_from_event') as mock_get_user:
+        with patch('services.workspaces.functions.workspace_operations.restore_workspace.restore_workspace.get_deleted_workspace') as mock_get_deleted:
+            with patch('services.workspaces.functions.workspace_operations.restore_workspace.restore_workspace.accounts_table') as mock_accounts_table:
+                # Configure mocks
+                mock_get_user.return_value = mock_user
+                mock_get_deleted.return_value = tombstone
+                
+                # Call the handler
+                response = handler({"pathParameters": {"workspaceId": "test-workspace-id"}}, {})
+                
+                # Assert response
+                assert response["statusCode"] == 200
+                assert json.loads(response["body"])["message"] == "Workspace restored"
+                
+                # The user and account index keys are rebuilt, only if the tombstone is unchanged
+                update_args = mock_accounts_table.update_item.call_args.kwargs
+                assert update_args["ExpressionAttributeValues"][":gsi1pk"] == "USER#test-user-id"
+                assert update_args["ExpressionAttributeValues"][":gsi2pk"] == "ACCOUNT#test-account-id"
+                assert update_args["ConditionExpression"] == "deleted_at = :deleted_at"
+
+def test_restore_workspace_not_deleted(mock_user):
+    """Test that only tombstones inside the retention window are restored."""
+    with patch('services.workspaces.functions.workspace_operations.restore_workspace.restore_workspace.get_user_from_event') as mock_get_user:
+        with patch('services.workspaces.functions.workspace_operations.restore_workspace.restore_workspace.get_deleted_workspace') as mock_get_deleted:
+            with patch('services.workspaces.functions.workspace_operations.restore_workspace.restore_workspace.accounts_table') as mock_accounts_table:
+                # Configure mocks
+                mock_get_user.return_value = mock_user
+                mock_get_deleted.return_value = None
+                
+                # Call the handler
+                response = handler({"pathParameters": {"workspaceId": "test-workspace-id"}}, {})
+                
+                # Assert response
+                assert response["statusCode"] == 404
+                mock_accounts_table.update_item.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main()
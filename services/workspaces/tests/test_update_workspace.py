@@ -15,9 +15,9 @@ from services.workspaces.functions.workspace_operations.update_workspace.update_
 def test_update_workspace_success(test_case, mock_user, mock_workspace_item, mock_update_event):
     """Test successful workspace updates."""
     # Setup
-    with patch('services.workspaces.functions.shared.utils.utils.get_user_from_event') as mock_get_user:
-        with patch('services.workspaces.functions.shared.utils.utils.get_workspace_by_id') as mock_get_workspace:
-            with patch('services.workspaces.functions.shared.utils.utils.accounts_table') as mock_accounts_table:
+    with patch('services.workspaces.functions.workspace_operations.update_workspace.update_workspace.get_user_from_event') as mock_get_user:
+        with patch('services.workspaces.functions.workspace_operations.update_workspace.update_workspace.get_workspace_by_id') as mock_get_workspace:
+            with patch('services.workspaces.functions.workspace_operations.update_workspace.update_workspace.accounts_table') as mock_accounts_table:
                 # Configure mocks
                 mock_get_user.return_value = mock_user
                 mock_get_workspace.return_value = mock_workspace_item
@@ -41,6 +41,26 @@ def test_update_workspace_success(test_case, mock_user, mock_workspace_item, moc
                 assert body["workspace_id"] == mock_workspace_item["workspace_id"]
                 assert body["account_id"] == mock_workspace_item["account_id"]
 
+def test_update_workspace_status_moves_account_index(mock_user, mock_workspace_item, mock_update_event):
+    """Test that only active workspaces stay in the account's workspace index."""
+    with patch('services.workspaces.functions.workspace_operations.update_workspace.update_workspace.get_user_from_event') as mock_get_user:
+        with patch('services.workspaces.functions.workspace_operations.update_workspace.update_workspace.get_workspace_by_id') as mock_get_workspace:
+            with patch('services.workspaces.functions.workspace_operations.update_workspace.update_workspace.accounts_table') as mock_accounts_table:
+                # Configure mocks
+                mock_get_user.return_value = mock_user
+                mock_get_workspace.return_value = mock_workspace_item
+                
+                event = {**mock_update_event, "body": '{"status": "INACTIVE"}'}
+                assert handler(event, {})["statusCode"] == 200
+                update_args = mock_accounts_table.update_item.call_args.kwargs
+                assert update_args["UpdateExpression"].endswith(" REMOVE GSI2PK, GSI2SK")
+                assert "attribute_not_exists(deleted_at)" in update_args["ConditionExpression"]
+                
+                event = {**mock_update_event, "body": '{"status": "ACTIVE"}'}
+                assert handler(event, {})["statusCode"] == 200
+                update_args = mock_accounts_table.update_item.call_args.kwargs
+                assert update_args["ExpressionAttributeValues"][":gsi2pk"] == "ACCOUNT#test-account-id"
+
 def test_update_workspace_missing_id():
     """Test update with missing workspace ID."""
     # Create test event with missing workspace ID
@@ -59,8 +79,8 @@ def test_update_workspace_missing_id():
 def test_update_workspace_empty_body(mock_user, mock_workspace_item):
     """Test update with empty request body."""
     # Setup
-    with patch('services.workspaces.functions.shared.utils.utils.get_user_from_event') as mock_get_user:
-        with patch('services.workspaces.functions.shared.utils.utils.get_workspace_by_id') as mock_get_workspace:
+    with patch('services.workspaces.functions.workspace_operations.update_workspace.update_workspace.get_user_from_event') as mock_get_user:
+        with patch('services.workspaces.functions.workspace_operations.update_workspace.update_workspace.get_workspace_by_id') as mock_get_workspace:
             # Configure mocks
             mock_get_user.return_value = mock_user
             mock_get_workspace.return_value = mock_workspace_item
@@ -81,8 +101,8 @@ def test_update_workspace_empty_body(mock_user, mock_workspace_item):
 def test_update_workspace_not_found(mock_user, mock_update_event):
     """Test update with non-existent workspace."""
     # Setup
-    with patch('services.workspaces.functions.shared.utils.utils.get_user_from_event') as mock_get_user:
-        with patch('services.workspaces.functions.shared.utils.utils.get_workspace_by_id') as mock_get_workspace:
+    with patch('services.workspaces.functions.workspace_operations.update_workspace.update_workspace.get_user_from_event') as mock_get_user:
+        with patch('services.workspaces.functions.workspace_operations.update_workspace.update_workspace.get_workspace_by_id') as mock_get_workspace:
             # Configure mocks
             mock_get_user.return_value = mock_user
             mock_get_workspace.return_value = None
@@ -100,9 +120,9 @@ def test_update_workspace_not_found(mock_user, mock_update_event):
 def test_update_workspace_exception(mock_user, mock_workspace_item, mock_update_event):
     """Test error handling in update function."""
     # Setup
-    with patch('services.workspaces.functions.shared.utils.utils.get_user_from_event') as mock_get_user:
-        with patch('services.workspaces.functions.shared.utils.utils.get_workspace_by_id') as mock_get_workspace:
-            with patch('services.workspaces.functions.shared.utils.utils.accounts_table') as mock_accounts_table:
+    with patch('services.workspaces.functions.workspace_operations.update_workspace.update_workspace.get_user_from_event') as mock_get_user:
+        with patch('services.workspaces.functions.workspace_operations.update_workspace.update_workspace.get_workspace_by_id') as mock_get_workspace:
+            with patch('services.workspaces.functions.workspace_operations.update_workspace.update_workspace.accounts_table') as mock_accounts_table:
                 # Configure mocks
                 mock_get_user.return_value = mock_user
                 mock_get_workspace.return_value = mock_workspace_item
@@ -52,6 +52,8 @@ def test_create_workspace_item():
     assert workspace_item["entity_type"] == "WORKSPACE"
     assert workspace_item["GSI1PK"] == f"USER#{owner_id}"
     assert "GSI1SK" in workspace_item
+    assert workspace_item["GSI2PK"] == f"ACCOUNT#{account_id}"
+    assert workspace_item["GSI2SK"] == workspace_item["SK"]
 
 def test_create_workspace_user_role_item():
     """Test user role item creation."""